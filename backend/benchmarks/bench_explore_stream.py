@@ -0,0 +1,117 @@
+"""
+explore-start-leaf 스트리밍 벤치마크: 큰 트리(기본 50000 노드, fan-out 20)를 SQLite 저장소로
+한 번에 만든 응답(max_nodes 지정 bounded) vs stream=true 의 첫 바이트까지 시간 / 전체 시간 / 최대 메모리.
+
+    cd backend && python -m benchmarks.bench_explore_stream [--nodes 50000] [--width 20]
+
+외부 서비스 없이 임시 SQLite 파일로 실행 (데이터는 /v1/import로 적재). 라우터가 보내는 bytes를
+서비스에서 바로 소비해서 측정 (TestClient는 스트리밍 응답도 끝까지 모은 뒤 돌려줌). 두 본문이 같은지도 확인.
+메모리는 따로 한 번 더 돌려 잰 tracemalloc 최대값 (응답 생성 중 Python 할당, 보낸 chunk는 바로 버림).
+"""
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from devaccountbook_backend.api.responses import TreeJSONResponse
+from devaccountbook_backend.api.v1.account_entries_router import router as items_router
+from devaccountbook_backend.api.v1.import_router import router as import_router
+from devaccountbook_backend.db.migrations import migrate_sqlite
+from devaccountbook_backend.db.sqlite import connect_sqlite
+from devaccountbook_backend.repositories.repository_factory import get_account_entry_repository, \
+    get_account_entry_repository_opener
+from devaccountbook_backend.repositories.sqlite_account_entry_repo import SqliteAccountEntryRepository
+from devaccountbook_backend.services.account_entry_import import import_entry_id
+from devaccountbook_backend.services.account_entry_service import AccountEntryService
+
+
+def make_client(path: str) -> TestClient:
+    conn = connect_sqlite(path)
+    migrate_sqlite(conn)
+    conn.close()
+
+    app = FastAPI()
+    app.include_router(items_router, prefix="/v1")
+    app.include_router(import_router, prefix="/v1")
+
+    def _override():
+        conn = connect_sqlite(path)
+        try:
+            yield SqliteAccountEntryRepository(conn)
+        finally:
+            conn.close()
+
+    app.dependency_overrides[get_account_entry_repository] = _override
+    app.dependency_overrides[get_account_entry_repository_opener] = lambda: contextmanager(_override)
+    return TestClient(app)
+
+
+def load_tree(client: TestClient, n: int, width: int) -> str:
+    lines = [json.dumps({"type": "entry", "id": str(i), "title": f"entry {i}", "desc": "description " * 4,
+                         "tags": ["a", "b"]}) for i in range(n)]
+    lines += [json.dumps({"type": "relation", "fromId": str((i - 1) // width), "toId": str(i), "kind": "RELATES_TO"})
+              for i in range(1, n)]
+    client.post("/v1/import?job=bench&chunk_size=10000", content="\n".join(lines)).raise_for_status()
+    return import_entry_id("bench", "0")
+
+
+def buffered(svc: AccountEntryService, root: str, n: int) -> Iterator[bytes]:
+    result = svc.explore_bounded(root, max_nodes=n)
+    yield TreeJSONResponse(result.tree).body
+
+
+def streamed(svc: AccountEntryService, root: str, n: int) -> Iterator[bytes]:
+    plan = svc.explore_plan(root, max_nodes=n)
+    yield from svc.explore_json_chunks(plan)
+
+
+def measure(body: Iterator[bytes]) -> tuple[float, float, int]:
+    started = time.perf_counter()
+    first = None
+    size = 0
+    for chunk in body:
+        if first is None:
+            first = time.perf_counter() - started
+        size += len(chunk)
+    return first, time.perf_counter() - started, size
+
+
+def peak_memory(body: Iterator[bytes]) -> int:
+    tracemalloc.start()
+    for _ in body:
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=50000)
+    parser.add_argument("--width", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/bench.db"
+        root = load_tree(make_client(path), args.nodes, args.width)
+        conn = connect_sqlite(path)
+        svc = AccountEntryService(SqliteAccountEntryRepository(conn))
+        assert b"".join(buffered(svc, root, args.nodes)) == b"".join(streamed(svc, root, args.nodes)), \
+            "response bodies differ"
+        print(f"{'mode':<10} {'nodes':>7} {'first byte ms':>14} {'total ms':>9} {'peak MB':>8} {'body MB':>8}")
+        for mode, body in (("buffered", buffered), ("stream", streamed)):
+            first, total, size = measure(body(svc, root, args.nodes))
+            peak = peak_memory(body(svc, root, args.nodes))
+            print(f"{mode:<10} {args.nodes:>7} {first * 1e3:>14.1f} {total * 1e3:>9.1f} "
+                  f"{peak / 2 ** 20:>8.1f} {size / 2 ** 20:>8.1f}")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
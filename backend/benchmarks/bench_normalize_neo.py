@@ -0,0 +1,91 @@
+"""
+관계 props 정규화 벤치마크: get_relations 결과(기본 10000 관계)의 props → Python 표준 타입 비용.
+
+    cd backend && python -m benchmarks.bench_normalize_neo [--relations 10000] [--repeat 7]
+
+- before: 값마다 isinstance 재귀 + list/dict 항상 복사, 행마다 AccountEntryRelationDTO 검증
+- after : 타입별 변환 함수 캐시 + 바뀐 값이 없으면 복사 없음, normalize_neo_rows로 결과 전체를 한 번에,
+          AccountEntryRelationsDTO 검증 한 번 (cypher.to_relations)
+props 모양: datetime 몇 개가 섞인 평평한 맵 / 표준 타입만 있는 맵. 행은 bolt 레코드와 같은 형태로 만들어
+DB 없이 실행. 두 경로 결과가 같은지도 확인.
+"""
+import argparse
+import timeit
+
+from neo4j.time import DateTime as NeoDateTime, Date as NeoDate, Time as NeoTime, Duration as NeoDuration
+
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryRelationDTO, AccountEntryRelationsDTO
+from devaccountbook_backend.repositories import account_entry_cypher as cypher
+from devaccountbook_backend.repositories.normalize_neo import normalize_neo_rows
+
+
+def temporal_rows(n: int) -> list[dict]:
+    return [{"kind": "RELATES_TO", "from_id": "root", "to_id": f"id-{i}",
+             "props": {"note": f"note {i}", "weight": i % 7, "createdAt": NeoDateTime(2025, 1, 1, 0, 0, i % 60),
+                       "updatedAt": NeoDateTime(2025, 1, 2, 0, 0, i % 60)}} for i in range(n)]
+
+
+def native_rows(n: int) -> list[dict]:
+    return [{"kind": "RELATES_TO", "from_id": "root", "to_id": f"id-{i}",
+             "props": {"note": f"note {i}", "weight": i % 7, "tags": ["a", "b"]}} for i in range(n)]
+
+
+def normalize_before(v):
+    if isinstance(v, (NeoDateTime, NeoDate, NeoTime, NeoDuration)):
+        return v.to_native()
+    if isinstance(v, list):
+        return [normalize_before(x) for x in v]
+    if isinstance(v, dict):
+        return {k: normalize_before(x) for k, x in v.items()}
+    return v
+
+
+def props_before(rows) -> list[dict]:
+    return [normalize_before(row["props"] or {}) for row in rows]
+
+
+def props_after(rows) -> list[dict]:
+    return normalize_neo_rows(rows)
+
+
+def relations_before(rows) -> AccountEntryRelationsDTO:
+    to_relation = lambda rows: [
+        AccountEntryRelationDTO.model_validate({
+            "kind": row["kind"], "from_id": row["from_id"], "to_id": row["to_id"],
+            "props": normalize_before(row["props"] or {}),
+        })
+        for row in rows
+    ]
+    half = len(rows) // 2
+    return AccountEntryRelationsDTO.model_validate(
+        {"outgoing": to_relation(rows[:half]), "incoming": to_relation(rows[half:])})
+
+
+def relations_after(rows) -> AccountEntryRelationsDTO:
+    half = len(rows) // 2
+    return cypher.to_relations(rows[:half], rows[half:])
+
+
+def per_row_us(fn, rows, repeat: int) -> float:
+    best = min(timeit.Timer(lambda: fn(rows)).repeat(repeat, 1))
+    return best / len(rows) * 1e6
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--relations", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<22} {'rows':>6} {'before us/row':>14} {'after us/row':>13} {'speedup':>8}")
+    for shape, rows in (("temporal", temporal_rows(args.relations)), ("native", native_rows(args.relations))):
+        for step, before, after in (("props", props_before, props_after),
+                                    ("to_relations", relations_before, relations_after)):
+            assert before(rows) == after(rows), f"{shape}/{step}: results differ"
+            b = per_row_us(before, rows, args.repeat)
+            a = per_row_us(after, rows, args.repeat)
+            print(f"{shape + ' ' + step:<22} {len(rows):>6} {b:>14.2f} {a:>13.2f} {b / a:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+SQLite 전이 폐쇄 삭제 벤치마크: delete_relation / delete_entry 한 번에 드는 폐쇄 갱신 비용을 그래프 크기별로.
+
+    cd backend && python -m benchmarks.bench_reach_delete [--sizes 500,1000,2000] [--shapes tree,diamond,hub]
+
+- before: 간선을 지운 뒤 from과 그 조상 전체의 폐쇄 행을 지우고 재귀 CTE로 다시 계산
+- after : 잃을 수 있는 (from의 조상 + from) x (from이 더는 닿지 못하는 to 쪽 노드) 쌍만 지우고 다시 유도
+          (repo._reach_remove, 엔트리 삭제는 간선마다 같은 방식)
+대상: leaf로 들어가는 간선, mid에서 나가는 간선, mid 엔트리 삭제. 매번 같은 상태에서 재도록 측정 후 되돌림.
+두 방식의 결과 폐쇄(영향받는 조상 행)가 같은지도 확인. 그래프는 benchmarks.graphs (chain은 폐쇄가 n^2이라 기본 제외).
+"""
+import argparse
+import json
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+from benchmarks.graphs import BenchGraph, generate, load_graph
+from devaccountbook_backend.db.migrations import migrate_sqlite
+from devaccountbook_backend.db.sqlite import connect_sqlite
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeImportDTO, AccountEntryRelationOpDTO
+from devaccountbook_backend.repositories.sqlite_account_entry_repo import SqliteAccountEntryRepository
+from devaccountbook_backend.schemas.common_enum import RelKind, RelationOp
+
+
+def rebuild_unlink(repo: SqliteAccountEntryRepository, from_id: str, to_id: str) -> None:
+    with repo._write():
+        repo.c.execute("DELETE FROM account_entry_relation WHERE from_id = ? AND kind = 'RELATES_TO' AND to_id = ?",
+                       (from_id, to_id))
+        repo._reach_rebuild([from_id, *repo._reach_ids(from_id, reverse=True)])
+
+
+def rebuild_delete_entry(repo: SqliteAccountEntryRepository, entry_id: str) -> None:
+    with repo._write():
+        ancestors = repo._reach_ids(entry_id, reverse=True)
+        repo.c.execute("DELETE FROM account_entry WHERE id = ?", (entry_id,))
+        repo._reach_rebuild(ancestors)
+
+
+def incremental_unlink(repo: SqliteAccountEntryRepository, from_id: str, to_id: str) -> None:
+    with repo._write():
+        repo._unlink(from_id, to_id, RelKind.RELATES_TO)
+
+
+def incremental_delete_entry(repo: SqliteAccountEntryRepository, entry_id: str) -> None:
+    repo.delete_entry(entry_id)
+
+
+def _snapshot(repo: SqliteAccountEntryRepository, ancestors: List[str]) -> List[Tuple[str, str]]:
+    return repo.c.execute(
+        "SELECT ancestor, descendant FROM account_entry_reach WHERE ancestor IN (SELECT value FROM json_each(?)) "
+        "ORDER BY ancestor, descendant", (json.dumps(ancestors),)).fetchall()
+
+
+def _restore_edges(repo: SqliteAccountEntryRepository, edges: List[Tuple[str, str]]) -> None:
+    repo.apply_relation_ops([AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=a, to_id=b,
+                                                       kind=RelKind.RELATES_TO, props={"note": "bench"})
+                             for a, b in edges])
+
+
+def _incident(repo: SqliteAccountEntryRepository, entry_id: str) -> List[Tuple[str, str]]:
+    rows = repo.c.execute(
+        "SELECT from_id, to_id FROM account_entry_relation WHERE kind = 'RELATES_TO' AND (from_id = ? OR to_id = ?)",
+        (entry_id, entry_id)).fetchall()
+    return [(r[0], r[1]) for r in rows]
+
+
+def run_case(repo: SqliteAccountEntryRepository, graph: BenchGraph, op: str, target, fn: Callable,
+             repeat: int) -> Tuple[float, list, int]:
+    # 측정 → 결과 폐쇄 기록 → 원상복구, repeat번 중 최솟값 (lost = 실제로 없어진 폐쇄 행 수)
+    best = float("inf")
+    after, lost = None, 0
+    for _ in range(repeat):
+        if op == "entry":
+            entry = graph.entries[[e["id"] for e in graph.entries].index(target)]
+            edges = _incident(repo, target)
+            ancestors = repo._reach_ids(target, reverse=True)
+            before = len(_snapshot(repo, [target, *ancestors]))
+            started = time.perf_counter()
+            fn(repo, target)
+            best = min(best, time.perf_counter() - started)
+            after = _snapshot(repo, ancestors)
+            lost = before - len(after)
+            repo.import_entries([AccountEntryNodeImportDTO(**entry)])
+            _restore_edges(repo, edges)
+        else:
+            from_id, to_id = target
+            ancestors = [from_id, *repo._reach_ids(from_id, reverse=True)]
+            before = len(_snapshot(repo, ancestors))
+            started = time.perf_counter()
+            fn(repo, from_id, to_id)
+            best = min(best, time.perf_counter() - started)
+            after = _snapshot(repo, ancestors)
+            lost = before - len(after)
+            _restore_edges(repo, [target])
+    return best, after, lost
+
+
+def targets(graph: BenchGraph) -> list:
+    mid_out = next(e for e in graph.edges if e[0] == graph.mid) if any(e[0] == graph.mid for e in graph.edges) \
+        else graph.edges[len(graph.edges) // 2]
+    into_leaf = next(e for e in reversed(graph.edges) if e[1] == graph.leaf)
+    return [("edge->leaf", "edge", into_leaf), ("edge mid", "edge", mid_out), ("entry mid", "entry", graph.mid)]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="500,1000,2000")
+    parser.add_argument("--shapes", default="tree,diamond,hub")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'graph':<14} {'case':<11} {'closure':>9} {'lost':>7} {'before ms':>10} {'after ms':>9} {'speedup':>8}")
+    for shape in args.shapes.split(","):
+        for n in map(int, args.sizes.split(",")):
+            graph = generate(shape, n)
+            with tempfile.TemporaryDirectory() as tmp:
+                conn = connect_sqlite(f"{tmp}/bench.db")
+                migrate_sqlite(conn)
+                repo = SqliteAccountEntryRepository(conn)
+                load_graph(repo, graph)
+                rows = conn.execute("SELECT count(*) FROM account_entry_reach").fetchone()[0]
+                for name, op, target in targets(graph):
+                    slow, fast = (rebuild_unlink, incremental_unlink) if op == "edge" else \
+                        (rebuild_delete_entry, incremental_delete_entry)
+                    before, expected, _ = run_case(repo, graph, op, target, slow, args.repeat)
+                    after, actual, lost = run_case(repo, graph, op, target, fast, args.repeat)
+                    assert expected == actual, f"closure differs: {graph.name} {name}"
+                    print(f"{graph.name:<14} {name:<11} {rows:>9} {lost:>7} {before * 1e3:>10.2f} {after * 1e3:>9.2f} "
+                          f"{before / after:>7.1f}x")
+                conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+조회 경로 마이크로벤치마크: 한 페이지(기본 200행)를 저장소 행 → 응답 bytes로 만드는 행당 비용.
+
+    cd backend && python -m benchmarks.bench_read_path [--rows 200] [--repeat 7]
+
+- before: AccountEntryNode 검증 → model_dump → AccountEntryOut 재검증 → jsonable_encoder → json.dumps
+- after : AccountEntryNode 검증 → model_construct → FastJSONResponse (pydantic-core)
+- 관계 목록도 같은 방식 (AccountEntryRelationsDTO → RelationList)
+저장소 행은 bolt 레코드와 같은 형태(neo4j.time.DateTime 포함)로 만들어 DB 없이 실행.
+두 경로의 응답 본문이 같은지도 확인.
+"""
+import argparse
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from neo4j.time import DateTime
+from starlette.responses import JSONResponse
+
+from devaccountbook_backend.api.responses import FastJSONResponse
+from devaccountbook_backend.repositories import account_entry_cypher as cypher
+from devaccountbook_backend.schemas.account_entry_schemas import AccountEntryOut, RelationList
+from devaccountbook_backend.services import account_entry_mapper as mapper
+
+
+def entry_rows(n: int) -> list[dict]:
+    return [{"n": {"id": f"id-{i}", "title": f"title {i}", "desc": "description " * 4, "tags": ["a", "b", "c"],
+                   "createdAt": DateTime(2025, 1, 1, 0, 0, i % 60, 123456000)}} for i in range(n)]
+
+
+def relation_rows(n: int) -> list[dict]:
+    return [{"kind": "RELATES_TO", "from_id": "root", "to_id": f"id-{i}",
+             "props": {"note": "n", "createdAt": DateTime(2025, 1, 1, 0, 0, i % 60)}} for i in range(n)]
+
+
+def entries_before(rows) -> bytes:
+    items = [AccountEntryOut.model_validate(e.model_dump()) for e in cypher.to_entries(rows)]
+    return JSONResponse(jsonable_encoder(items)).body
+
+
+def entries_after(rows) -> bytes:
+    return FastJSONResponse([mapper.to_out(e) for e in cypher.to_entries(rows)]).body
+
+
+def relations_before(rows) -> bytes:
+    relations = cypher.to_relations(rows[:len(rows) // 2], rows[len(rows) // 2:])
+    return JSONResponse(jsonable_encoder(RelationList.model_validate(relations.model_dump()))).body
+
+
+def relations_after(rows) -> bytes:
+    relations = cypher.to_relations(rows[:len(rows) // 2], rows[len(rows) // 2:])
+    return FastJSONResponse(mapper.to_relation_list(relations)).body
+
+
+def per_row_us(fn, rows, repeat: int, number: int) -> float:
+    best = min(timeit.Timer(lambda: fn(rows)).repeat(repeat, number))
+    return best / number / len(rows) * 1e6
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    cases = [
+        ("entries", entry_rows(args.rows), entries_before, entries_after),
+        ("relations", relation_rows(args.rows), relations_before, relations_after),
+    ]
+    print(f"{'case':<10} {'rows':>5} {'before us/row':>14} {'after us/row':>13} {'speedup':>8}")
+    for name, rows, before, after in cases:
+        assert before(rows) == after(rows), f"{name}: response bodies differ"
+        b = per_row_us(before, rows, args.repeat, args.number)
+        a = per_row_us(after, rows, args.repeat, args.number)
+        print(f"{name:<10} {len(rows):>5} {b:>14.2f} {a:>13.2f} {b / a:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+트리 변환 + 직렬화 벤치마크: chain / fan-out / diamond 모양별 노드당 비용.
+
+    cd backend && python -m benchmarks.bench_tree_convert [--nodes 10000] [--repeat 5]
+
+- json-tree (apoc.paths.toJsonTree 결과 형태)
+  - before: 재귀 변환 + 노드마다 AccountEntryTreeNodeDTO 검증 → FastJSONResponse
+  - after : convert_account_entry_tree_node (명시적 스택, 자식 없이 노드별 생성 후 children에 추가)
+            → TreeJSONResponse (pydantic-core 한 번, 중첩 한계를 넘으면 encode_tree)
+- edge-list (SQLite/그래프 인덱스 경로): build_account_entry_tree → TreeJSONResponse (같은 노드 생성, after만)
+before가 recursion limit / 직렬화 깊이 한계에 걸리면 fail로 표시.
+"""
+import argparse
+import timeit
+
+from devaccountbook_backend.api.responses import FastJSONResponse, TreeJSONResponse
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryTreeNodeDTO, convert_account_entry_tree_node
+from devaccountbook_backend.repositories.tree_builder import build_account_entry_tree
+
+
+def _props(i: int) -> dict:
+    return {"id": f"id-{i}", "title": f"title {i}", "desc": None, "tags": ["a", "b"]}
+
+
+def chain(n: int) -> tuple[dict, dict, list]:
+    nodes = {f"id-{i}": _props(i) for i in range(n)}
+    edges = [(f"id-{i}", f"id-{i + 1}") for i in range(n - 1)]
+    root = data = dict(nodes["id-0"])
+    for i in range(1, n):
+        data["relates_to"] = [dict(nodes[f"id-{i}"])]
+        data = data["relates_to"][0]
+    return root, nodes, edges
+
+
+def fan_out(n: int, width: int = 10) -> tuple[dict, dict, list]:
+    nodes = {f"id-{i}": _props(i) for i in range(n)}
+    edges = [(f"id-{(i - 1) // width}", f"id-{i}") for i in range(1, n)]
+    json_nodes = {k: dict(v) for k, v in nodes.items()}
+    for parent, child in edges:
+        json_nodes[parent].setdefault("relates_to", []).append(json_nodes[child])
+    return json_nodes["id-0"], nodes, edges
+
+
+def diamond(n: int) -> tuple[dict, dict, list]:
+    # a → {b, c} → d → {e, f} → g ... toJsonTree는 합류 노드 아래를 경로마다 반복 (노드 수 n 근처까지)
+    k = 0
+    while 3 * 2 ** (k + 1) <= n:
+        k += 1
+    nodes = {f"id-{i}": _props(i) for i in range(3 * k + 1)}
+    edges = []
+    for d in range(k):
+        top, left, right, bottom = 3 * d, 3 * d + 1, 3 * d + 2, 3 * d + 3
+        edges += [(f"id-{top}", f"id-{left}"), (f"id-{top}", f"id-{right}"),
+                  (f"id-{left}", f"id-{bottom}"), (f"id-{right}", f"id-{bottom}")]
+    adjacency: dict[str, list[str]] = {}
+    for parent, child in edges:
+        adjacency.setdefault(parent, []).append(child)
+    built: dict[str, dict] = {}
+    for i in range(3 * k, -1, -1):
+        node_id = f"id-{i}"
+        built[node_id] = dict(nodes[node_id])
+        if node_id in adjacency:
+            built[node_id]["relates_to"] = [built[c] for c in adjacency[node_id]]
+    return built["id-0"], nodes, edges
+
+
+def convert_before(input_data: dict) -> AccountEntryTreeNodeDTO:
+    children = [convert_before(child) for child in input_data.get("relates_to", [])]
+    return AccountEntryTreeNodeDTO(id=input_data.get("id"), title=input_data.get("title"),
+                                   desc=input_data.get("desc"), tags=input_data.get("tags") or [],
+                                   children=children)
+
+
+def json_tree_before(root: dict) -> bytes:
+    return FastJSONResponse(convert_before(root)).body
+
+
+def json_tree_after(root: dict) -> bytes:
+    return TreeJSONResponse(convert_account_entry_tree_node(root)).body
+
+
+def edge_list_after(nodes: dict, edges: list) -> bytes:
+    return TreeJSONResponse(build_account_entry_tree("id-0", nodes, edges).tree).body
+
+
+def per_node_us(fn, node_count: int, repeat: int) -> str:
+    try:
+        fn()
+    except (RecursionError, ValueError) as e:
+        return f"fail ({type(e).__name__})"
+    best = min(timeit.Timer(fn).repeat(repeat, 1))
+    return f"{best / node_count * 1e6:.2f}"
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    shapes = [("chain-200", chain(200)), (f"chain-{args.nodes}", chain(args.nodes)),
+              ("fan-out", fan_out(args.nodes)), ("diamond", diamond(args.nodes))]
+    print(f"{'shape':<12} {'tree nodes':>10} {'json before':>22} {'json after':>11} {'edge-list after':>16}"
+          "   (us/node)")
+    for name, (root, nodes, edges) in shapes:
+        body = json_tree_after(root)
+        tree_nodes = body.count(b'"children":[')
+        before = per_node_us(lambda: json_tree_before(root), tree_nodes, args.repeat)
+        if not before.startswith("fail"):
+            assert json_tree_before(root) == body, f"{name}: response bodies differ"
+        after = per_node_us(lambda: json_tree_after(root), tree_nodes, args.repeat)
+        edge_nodes = edge_list_after(nodes, edges).count(b'"children":[')
+        edge = per_node_us(lambda: edge_list_after(nodes, edges), edge_nodes, args.repeat)
+        print(f"{name:<12} {tree_nodes:>10} {before:>22} {after:>11} {edge:>16}")
+
+
+if __name__ == "__main__":
+    main()
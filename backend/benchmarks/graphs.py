@@ -0,0 +1,93 @@
+"""
+벤치마크용 결정적 그래프 생성기 (같은 shape/n/seed면 항상 같은 엔트리·관계).
+
+- chain  : 0 → 1 → … → n-1 (깊이 n, 재귀/중첩 한계 확인용)
+- tree   : 균형 트리, 부모 (i-1)//width (기본 fan-out 4)
+- diamond: a → {b, c} → d → {e, f} → g … 다이아몬드를 쌓은 DAG. 노드는 n 근처지만
+           root에서 leaf까지 경로가 2^(n/3)개 → 경로 단위로 펼치는 탐색의 폭발 확인용
+- hub    : 0 → 모든 노드, 2.. → 1 (나가는/들어오는 간선이 몰린 노드 두 개)
+
+관계는 모두 RELATES_TO (props.note). id는 "bench-<shape>-<i>".
+"""
+import random
+from dataclasses import dataclass
+from typing import Iterator, List, Sequence, Tuple
+
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeImportDTO, AccountEntryRelationOpDTO
+from devaccountbook_backend.repositories.account_entry_repo_base import AccountEntryRepositoryBase
+from devaccountbook_backend.schemas.common_enum import RelKind, RelationOp
+
+SHAPES = ("chain", "tree", "diamond", "hub")
+TAGS = tuple(f"tag{i:02d}" for i in range(20))
+WORDS = ("ledger", "invoice", "budget", "payment", "refund", "salary", "rent", "travel", "server", "license",
+         "coffee", "book", "course", "hardware", "domain", "hosting", "tax", "bonus", "loan", "deposit")
+
+
+@dataclass
+class BenchGraph:
+    shape: str
+    n: int
+    seed: int
+    entries: List[dict]
+    edges: List[Tuple[str, str]]
+    root: str  # 트리 탐색 시작 (정방향)
+    leaf: str  # 가장 깊은 쪽 끝 (역방향 탐색 / 도달성 확인)
+    hub: str  # 관계가 가장 많은 노드
+    mid: str  # 단건 조회/수정 대상
+
+    @property
+    def name(self) -> str:
+        return f"{self.shape}-{self.n}"
+
+
+def entry_id(shape: str, i: int) -> str:
+    return f"bench-{shape}-{i}"
+
+
+def _edges(shape: str, n: int, width: int) -> Tuple[int, List[Tuple[int, int]], int, int]:
+    # (실제 노드 수, 간선, leaf, hub)
+    if shape == "chain":
+        return n, [(i, i + 1) for i in range(n - 1)], n - 1, 0
+    if shape == "tree":
+        return n, [((i - 1) // width, i) for i in range(1, n)], n - 1, 0
+    if shape == "diamond":
+        k = max((n - 1) // 3, 1)
+        edges = []
+        for d in range(k):
+            top, left, right, bottom = 3 * d, 3 * d + 1, 3 * d + 2, 3 * d + 3
+            edges += [(top, left), (top, right), (left, bottom), (right, bottom)]
+        return 3 * k + 1, edges, 3 * k, 0
+    if shape == "hub":
+        return n, [(0, i) for i in range(1, n)] + [(i, 1) for i in range(2, n)], n - 1, 0
+    raise ValueError(f"unknown shape: {shape}")
+
+
+def generate(shape: str, n: int, *, seed: int = 0, width: int = 4) -> BenchGraph:
+    rng = random.Random(f"{shape}:{n}:{seed}")
+    count, edges, leaf, hub = _edges(shape, n, width)
+    entries = [{
+        "id": entry_id(shape, i),
+        "title": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}",
+        "desc": " ".join(rng.choices(WORDS, k=8)),
+        "tags": sorted(rng.sample(TAGS, rng.randint(1, 3))),
+    } for i in range(count)]
+    return BenchGraph(shape=shape, n=count, seed=seed, entries=entries,
+                      edges=[(entry_id(shape, a), entry_id(shape, b)) for a, b in edges],
+                      root=entry_id(shape, 0), leaf=entry_id(shape, leaf), hub=entry_id(shape, hub),
+                      mid=entry_id(shape, count // 2))
+
+
+def _chunks(items: Sequence, size: int) -> Iterator[Sequence]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def load_graph(repo: AccountEntryRepositoryBase, graph: BenchGraph, *, chunk_size: int = 5000) -> None:
+    """import_entries / apply_relation_ops로 적재 (두 저장소 백엔드 공통, 같은 id가 있으면 건너뜀)."""
+    for chunk in _chunks(graph.entries, chunk_size):
+        repo.import_entries([AccountEntryNodeImportDTO(**e) for e in chunk], chunk_size=chunk_size)
+    for chunk in _chunks(graph.edges, chunk_size):
+        repo.apply_relation_ops([
+            AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=a, to_id=b, kind=RelKind.RELATES_TO,
+                                      props={"note": "bench"})
+            for a, b in chunk], chunk_size=chunk_size)
@@ -0,0 +1,206 @@
+"""
+벤치마크 시나리오: AccountEntryRepositoryBase 메서드마다 repo.*, 라우터 엔드포인트마다 api.* 하나 이상.
+
+- run(bench, arg)만 측정, setup(bench, i)은 반복마다 측정 밖에서 실행하고 반환값을 run에 넘김
+- 쓰기 시나리오(writes=True)는 읽기 시나리오를 모두 돌린 뒤 실행 (읽기 결과가 그래프 크기 그대로이도록)
+- max_n: 결과 크기가 노드 수의 제곱인 조회(페이지 없이 전체 forest)처럼 큰 그래프에서 건너뛸 것
+"""
+import itertools
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi.testclient import TestClient
+
+from benchmarks.graphs import TAGS, WORDS, BenchGraph
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryCursorDTO, AccountEntryNodeCreateDTO, \
+    AccountEntryNodeImportDTO, AccountEntryNodePatchDTO, AccountEntryRelationCreateDTO, \
+    AccountEntryRelationDeleteDTO, AccountEntryRelationOpDTO
+from devaccountbook_backend.repositories.account_entry_repo_base import AccountEntryRepositoryBase
+from devaccountbook_backend.schemas.common_enum import RelKind, RelationOp
+
+# 목록/배치 시나리오 한 번의 크기
+PAGE = 50
+BATCH = 100
+TREE_MAX_NODES = 10000
+
+
+@dataclass
+class Bench:
+    """시나리오 실행 상태 (그래프 하나 동안 유지)."""
+    repo: AccountEntryRepositoryBase
+    client: TestClient
+    graph: BenchGraph
+    _seq: itertools.count = field(default_factory=itertools.count)
+    _once: Dict[str, Any] = field(default_factory=dict)
+
+    def new_id(self, prefix: str) -> str:
+        return f"bench-{prefix}-{next(self._seq)}"
+
+    def once(self, key: str, fn: Callable[[], Any]) -> Any:
+        if key not in self._once:
+            self._once[key] = fn()
+        return self._once[key]
+
+    def new_entries(self, count: int) -> List[str]:
+        ids = [self.new_id("w") for _ in range(count)]
+        self.repo.import_entries([AccountEntryNodeImportDTO(id=i, title=i) for i in ids])
+        return ids
+
+    def get(self, url: str, **params) -> bytes:
+        resp = self.client.get(url, params=params)
+        resp.raise_for_status()
+        return resp.content
+
+    def send(self, method: str, url: str, **kwargs) -> bytes:
+        resp = self.client.request(method, url, **kwargs)
+        resp.raise_for_status()
+        return resp.content
+
+
+@dataclass
+class Scenario:
+    name: str
+    run: Callable[[Bench, Any], Any]
+    setup: Optional[Callable[[Bench, int], Any]] = None
+    writes: bool = False
+    max_n: Optional[int] = None
+
+
+def _first_cursor(b: Bench) -> AccountEntryCursorDTO:
+    return b.repo.get_entries_after(limit=PAGE).next_cursor
+
+
+def _first_cursor_header(b: Bench) -> str:
+    resp = b.client.get("/v1/account-entries", params={"limit": PAGE, "after": ""})
+    resp.raise_for_status()
+    return resp.headers["X-Next-Cursor"]
+
+
+def _link(from_id: str, to_id: str) -> AccountEntryRelationOpDTO:
+    return AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=from_id, to_id=to_id, kind=RelKind.RELATES_TO)
+
+
+def _with_relation(b: Bench, _: int) -> str:
+    (to_id,) = b.new_entries(1)
+    b.repo.apply_relation_ops([_link(b.graph.mid, to_id)])
+    return to_id
+
+
+def _import_body(b: Bench, _: int) -> str:
+    return "\n".join(json.dumps({"type": "entry", "id": b.new_id("imp"), "title": "imported"}) for _ in range(BATCH))
+
+
+REPO_SCENARIOS = [
+    Scenario("repo.get_entries", lambda b, _: b.repo.get_entries(limit=PAGE)),
+    Scenario("repo.get_entries[tag]", lambda b, _: b.repo.get_entries(limit=PAGE, tags=[TAGS[0]])),
+    Scenario("repo.get_entries_counted", lambda b, _: b.repo.get_entries_counted(limit=PAGE)),
+    Scenario("repo.get_entries_after", lambda b, cursor: b.repo.get_entries_after(limit=PAGE, after=cursor),
+             setup=lambda b, _: b.once("cursor", lambda: _first_cursor(b))),
+    Scenario("repo.get_tag_counts", lambda b, _: b.repo.get_tag_counts()),
+    Scenario("repo.search_entries", lambda b, _: b.repo.search_entries([WORDS[0]])),
+    Scenario("repo.get_sheet", lambda b, _: b.repo.get_sheet(limit=PAGE)),
+    Scenario("repo.count_entries", lambda b, _: b.repo.count_entries()),
+    Scenario("repo.get_entry", lambda b, _: b.repo.get_entry(b.graph.mid)),
+    Scenario("repo.get_relations", lambda b, _: b.repo.get_relations(b.graph.hub)),
+    Scenario("repo.get_entry_tree", lambda b, _: b.repo.get_entry_tree(b.graph.root)),
+    Scenario("repo.get_entry_tree_reverse", lambda b, _: b.repo.get_entry_tree_reverse(b.graph.leaf)),
+    Scenario("repo.get_entry_tree_bounded",
+             lambda b, _: b.repo.get_entry_tree_bounded(b.graph.root, max_nodes=TREE_MAX_NODES)),
+    Scenario("repo.get_entry_tree_plan",
+             lambda b, _: b.repo.get_entry_tree_plan(b.graph.root, max_nodes=TREE_MAX_NODES)),
+    Scenario("repo.get_tree_nodes", lambda b, _: b.repo.get_tree_nodes([e["id"] for e in b.graph.entries[:1000]])),
+    Scenario("repo.get_entry_forest[roots]", lambda b, _: b.repo.get_entry_forest(roots_only=True)),
+    Scenario("repo.get_entry_forest_reverse[roots]", lambda b, _: b.repo.get_entry_forest_reverse(roots_only=True)),
+    Scenario("repo.get_entry_forest[page]", lambda b, _: b.repo.get_entry_forest(limit=PAGE)),
+    Scenario("repo.get_entry_forest", lambda b, _: b.repo.get_entry_forest(), max_n=1000),
+    Scenario("repo.get_reachable", lambda b, _: b.repo.get_reachable(b.graph.root)),
+    Scenario("repo.get_reachable[reverse]", lambda b, _: b.repo.get_reachable(b.graph.leaf, reverse=True)),
+    Scenario("repo.is_reachable", lambda b, _: b.repo.is_reachable(b.graph.root, b.graph.leaf)),
+    Scenario("repo.export_rows", lambda b, _: sum(1 for _ in b.repo.export_rows())),
+    # 쓰기
+    Scenario("repo.create_entry", lambda b, _: b.repo.create_entry(AccountEntryNodeCreateDTO(title="created")),
+             writes=True),
+    Scenario("repo.create_entries",
+             lambda b, _: b.repo.create_entries([AccountEntryNodeCreateDTO(title="created")] * BATCH), writes=True),
+    Scenario("repo.import_entries", lambda b, entries: b.repo.import_entries(entries), writes=True,
+             setup=lambda b, _: [AccountEntryNodeImportDTO(id=b.new_id("imp"), title="imported")
+                                 for _ in range(BATCH)]),
+    Scenario("repo.update_entry",
+             lambda b, i: b.repo.update_entry(b.graph.mid, AccountEntryNodePatchDTO(title=f"updated {i}")),
+             setup=lambda b, i: i, writes=True),
+    Scenario("repo.delete_entry", lambda b, entry_id: b.repo.delete_entry(entry_id), writes=True,
+             setup=lambda b, _: b.new_entries(1)[0]),
+    Scenario("repo.add_relation", lambda b, to_id: b.repo.add_relation(AccountEntryRelationCreateDTO(
+        from_id=b.graph.mid, to_id=to_id, kind=RelKind.RELATES_TO)), writes=True,
+             setup=lambda b, _: b.new_entries(1)[0]),
+    Scenario("repo.apply_relation_ops", lambda b, ops: b.repo.apply_relation_ops(ops), writes=True,
+             setup=lambda b, _: [_link(b.graph.mid, to_id) for to_id in b.new_entries(BATCH)]),
+    Scenario("repo.delete_relation", lambda b, to_id: b.repo.delete_relation(AccountEntryRelationDeleteDTO(
+        from_id=b.graph.mid, to_id=to_id, kind=RelKind.RELATES_TO)), setup=_with_relation, writes=True),
+]
+
+API_SCENARIOS = [
+    Scenario("api.GET /account-entries", lambda b, _: b.get("/v1/account-entries", limit=PAGE)),
+    Scenario("api.GET /account-entries?tag", lambda b, _: b.get("/v1/account-entries", limit=PAGE, tag=TAGS[0])),
+    Scenario("api.GET /account-entries?with_total",
+             lambda b, _: b.get("/v1/account-entries", limit=PAGE, with_total="true")),
+    Scenario("api.GET /account-entries?after", lambda b, cursor: b.get("/v1/account-entries", limit=PAGE, after=cursor),
+             setup=lambda b, _: b.once("cursor-header", lambda: _first_cursor_header(b))),
+    Scenario("api.GET /account-entries/search", lambda b, _: b.get("/v1/account-entries/search", q=WORDS[0])),
+    Scenario("api.GET /account-entries/sheet", lambda b, _: b.get("/v1/account-entries/sheet", limit=PAGE)),
+    Scenario("api.GET /account-entries/count", lambda b, _: b.get("/v1/account-entries/count")),
+    Scenario("api.GET /account-entries/forest?roots_only",
+             lambda b, _: b.get("/v1/account-entries/forest", roots_only="true")),
+    Scenario("api.GET /account-entries/forest-reverse?roots_only",
+             lambda b, _: b.get("/v1/account-entries/forest-reverse", roots_only="true")),
+    Scenario("api.GET /account-entries/forest", lambda b, _: b.get("/v1/account-entries/forest", limit=PAGE)),
+    Scenario("api.GET /account-entries/{id}", lambda b, _: b.get(f"/v1/account-entries/{b.graph.mid}")),
+    Scenario("api.GET /account-entries/{id}/relations",
+             lambda b, _: b.get(f"/v1/account-entries/{b.graph.hub}/relations")),
+    Scenario("api.GET /explore-start-leaf",
+             lambda b, _: b.get(f"/v1/account-entries/{b.graph.root}/explore-start-leaf")),
+    Scenario("api.GET /explore-start-leaf?max_nodes",
+             lambda b, _: b.get(f"/v1/account-entries/{b.graph.root}/explore-start-leaf", max_nodes=TREE_MAX_NODES)),
+    Scenario("api.GET /explore-start-leaf?stream",
+             lambda b, _: b.get(f"/v1/account-entries/{b.graph.root}/explore-start-leaf", stream="true",
+                                max_nodes=TREE_MAX_NODES)),
+    Scenario("api.GET /explore-start-leaf-reverse",
+             lambda b, _: b.get(f"/v1/account-entries/{b.graph.leaf}/explore-start-leaf-reverse")),
+    Scenario("api.GET /account-entries/{id}/descendants",
+             lambda b, _: b.get(f"/v1/account-entries/{b.graph.root}/descendants")),
+    Scenario("api.GET /account-entries/{id}/ancestors",
+             lambda b, _: b.get(f"/v1/account-entries/{b.graph.leaf}/ancestors")),
+    Scenario("api.GET /account-entries/{from}/reaches/{to}",
+             lambda b, _: b.get(f"/v1/account-entries/{b.graph.root}/reaches/{b.graph.leaf}")),
+    Scenario("api.GET /tags", lambda b, _: b.get("/v1/tags")),
+    Scenario("api.GET /export.ndjson", lambda b, _: b.get("/v1/export.ndjson")),
+    # 쓰기
+    Scenario("api.POST /account-entries",
+             lambda b, _: b.send("POST", "/v1/account-entries", json={"title": "created"}), writes=True),
+    Scenario("api.POST /account-entries:batch",
+             lambda b, _: b.send("POST", "/v1/account-entries:batch", json={"items": [{"title": "created"}] * BATCH}),
+             writes=True),
+    Scenario("api.PATCH /account-entries/{id}",
+             lambda b, i: b.send("PATCH", f"/v1/account-entries/{b.graph.mid}", json={"title": f"updated {i}"}),
+             setup=lambda b, i: i, writes=True),
+    Scenario("api.DELETE /account-entries/{id}",
+             lambda b, entry_id: b.send("DELETE", f"/v1/account-entries/{entry_id}"), writes=True,
+             setup=lambda b, _: b.new_entries(1)[0]),
+    Scenario("api.POST /account-entries/{from}/relations",
+             lambda b, to_id: b.send("POST", f"/v1/account-entries/{b.graph.mid}/relations",
+                                     json={"toId": to_id, "kind": "RELATES_TO"}), writes=True,
+             setup=lambda b, _: b.new_entries(1)[0]),
+    Scenario("api.DELETE /account-entries/{from}/relations/{kind}/{to}",
+             lambda b, to_id: b.send("DELETE", f"/v1/account-entries/{b.graph.mid}/relations/RELATES_TO/{to_id}"),
+             setup=_with_relation, writes=True),
+    Scenario("api.POST /relations:batch",
+             lambda b, to_ids: b.send("POST", "/v1/relations:batch", json={"items": [
+                 {"op": "link", "fromId": b.graph.mid, "toId": to_id, "kind": "RELATES_TO"} for to_id in to_ids]}),
+             setup=lambda b, _: b.new_entries(BATCH), writes=True),
+    Scenario("api.POST /import",
+             lambda b, body: b.send("POST", "/v1/import", params={"job": "bench"}, content=body),
+             setup=_import_body, writes=True),
+]
+
+SCENARIOS = REPO_SCENARIOS + API_SCENARIOS
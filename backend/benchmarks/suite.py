@@ -0,0 +1,376 @@
+"""
+저장소/API 벤치마크 스위트: 생성 그래프(benchmarks.graphs)마다 모든 시나리오(benchmarks.scenarios)를 실행해
+중앙값/p95를 JSON으로 저장하고, 저장해 둔 기준(baseline)과 비교.
+
+    cd backend && python -m benchmarks.suite --sizes 1000,10000 --out bench.json
+    python -m benchmarks.suite --sizes 1000,10000 --baseline bench-baseline.json       # 회귀가 있으면 exit 1
+    python -m benchmarks.suite --sizes 1000 --save-baseline bench-baseline.json
+    NEO4J_URI=bolt://localhost:7687 python -m benchmarks.suite --backend neo4j [--graph-index]
+
+- sqlite(기본): 그래프마다 임시 SQLite 파일 (외부 서비스 없이 실행되는 기준 백엔드)
+- neo4j: Settings의 NEO4J_URI/USER/PASSWORD. 비어 있는 전용 DB에서만 실행 (그래프마다 AccountEntry를 모두 지움).
+  트랜잭션마다 --timeout을 걸어 경로 폭발 쿼리(diamond의 get_entry_tree 등)는 서버에서 끊고 timeout으로 기록
+- 시나리오마다 warm-up 1회 후 --repeat회 또는 --budget초까지 반복. 한 번이 --timeout을 넘으면 timeout
+  (SQLite는 실행 중인 문장을 interrupt). 그래프 적재가 --load-timeout을 넘으면 그 그래프의 시나리오 모두 timeout
+- api.* 는 동기 라우터 + 같은 저장소를 TestClient로 호출 (트리/관계 캐시는 끔: 반복 호출이 캐시만 재지 않도록)
+- 비교: (시나리오, 그래프)별 중앙값이 기준보다 --threshold 비율 이상 그리고 --min-delta-ms 이상 느려지거나
+  ok였던 시나리오가 timeout/error가 되면 회귀
+"""
+import argparse
+import json
+import platform
+import re
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Sequence
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from neo4j import GraphDatabase, Query, basic_auth, unit_of_work
+
+from benchmarks.graphs import SHAPES, BenchGraph, generate, load_graph
+from benchmarks.scenarios import SCENARIOS, Bench, Scenario
+from devaccountbook_backend.api.responses import FastJSONResponse
+from devaccountbook_backend.api.v1 import account_entries_router, relations_router, tags_router, export_router, \
+    import_router
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.db.migrations import migrate_sqlite
+from devaccountbook_backend.db.sqlite import connect_sqlite
+from devaccountbook_backend.repositories.account_entry_repo import AccountEntryRepository
+from devaccountbook_backend.repositories.account_entry_repo_base import AccountEntryRepositoryBase
+from devaccountbook_backend.repositories.graph_index import AccountEntryGraphIndex, load_graph_index
+from devaccountbook_backend.repositories.repository_factory import get_account_entry_repository, \
+    get_account_entry_repository_opener
+from devaccountbook_backend.repositories.sqlite_account_entry_repo import SqliteAccountEntryRepository
+from devaccountbook_backend.services.account_entry_service import AccountEntryService, get_account_entry_service
+
+STATUS_RANK = {"ok": 0, "skipped": 0, "timeout": 1, "error": 2}
+
+
+# --- 백엔드 ---
+
+class SqliteBackend:
+    name = "sqlite"
+
+    def __init__(self, args) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self._count = 0
+        self._conns: set[sqlite3.Connection] = set()
+        self.path = ""
+
+    def reset(self) -> None:
+        self._count += 1
+        self.path = f"{self._tmp.name}/bench-{self._count}.db"
+        conn = connect_sqlite(self.path)
+        try:
+            migrate_sqlite(conn)
+        finally:
+            conn.close()
+
+    def loaded(self) -> None:
+        pass
+
+    @contextmanager
+    def open_repo(self) -> Iterator[AccountEntryRepositoryBase]:
+        conn = connect_sqlite(self.path)
+        self._conns.add(conn)
+        try:
+            yield SqliteAccountEntryRepository(conn)
+        finally:
+            self._conns.discard(conn)
+            conn.close()
+
+    @contextmanager
+    def deadline(self, seconds: float) -> Iterator[None]:
+        # 시간이 지나면 열린 커넥션의 실행 중인 문장을 끊음 (sqlite3.OperationalError: interrupted)
+        timer = threading.Timer(seconds, lambda: [conn.interrupt() for conn in list(self._conns)])
+        timer.start()
+        try:
+            yield
+        finally:
+            timer.cancel()
+
+    def close(self) -> None:
+        self._tmp.cleanup()
+
+
+class _TimeoutSession:
+    """Neo4j 세션 래퍼: 저장소가 여는 트랜잭션마다 timeout (초과하면 서버가 쿼리를 끊음)."""
+
+    def __init__(self, session, timeout: float) -> None:
+        self._s = session
+        self._timeout = timeout
+
+    def _unit(self, fn):
+        @unit_of_work(timeout=self._timeout)
+        def work(tx, *args, **kwargs):
+            return fn(tx, *args, **kwargs)
+        return work
+
+    def execute_read(self, fn, *args, **kwargs):
+        return self._s.execute_read(self._unit(fn), *args, **kwargs)
+
+    def execute_write(self, fn, *args, **kwargs):
+        return self._s.execute_write(self._unit(fn), *args, **kwargs)
+
+    def begin_transaction(self, *args, **kwargs):
+        kwargs.setdefault("timeout", self._timeout)
+        return self._s.begin_transaction(*args, **kwargs)
+
+    def run(self, query, *args, **kwargs):
+        return self._s.run(Query(query, timeout=self._timeout) if isinstance(query, str) else query, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._s, name)
+
+
+class Neo4jBackend:
+    name = "neo4j"
+
+    def __init__(self, args) -> None:
+        self.timeout = args.timeout
+        self.graph_index = args.graph_index
+        self.index = None
+        self.driver = GraphDatabase.driver(settings.neo4j_uri,
+                                           auth=basic_auth(settings.neo4j_user, settings.neo4j_password))
+        with self.driver.session() as session:
+            count = session.run("MATCH (n:AccountEntry) RETURN count(n) AS c").single()["c"]
+        if count and not args.force:
+            self.driver.close()
+            raise SystemExit(f"neo4j database has {count} AccountEntry nodes; use an empty dedicated database "
+                             "(or --force to delete them)")
+
+    def reset(self) -> None:
+        with self.driver.session() as session:
+            session.run("MATCH (n:AccountEntry) CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS") \
+                .consume()
+            with self.open_repo() as repo:
+                repo.bootstrap()
+        self.index = None
+
+    def loaded(self) -> None:
+        # 적재가 끝난 뒤 인덱스를 만들어야 쓰기 경로(add_relation 등)가 인덱스를 갱신
+        if self.graph_index:
+            index = AccountEntryGraphIndex(True)
+            with self.driver.session() as session:
+                load_graph_index(session, index)
+            self.index = index
+
+    @contextmanager
+    def open_repo(self) -> Iterator[AccountEntryRepositoryBase]:
+        with self.driver.session() as session:
+            yield AccountEntryRepository(_TimeoutSession(session, self.timeout), self.index)
+
+    def deadline(self, seconds: float):
+        # 트랜잭션 timeout(_TimeoutSession)으로 서버가 끊음
+        return nullcontext()
+
+    def close(self) -> None:
+        try:
+            self.reset()
+        finally:
+            self.driver.close()
+
+
+BACKENDS = {"sqlite": SqliteBackend, "neo4j": Neo4jBackend}
+
+
+def make_client(open_repo) -> TestClient:
+    app = FastAPI(default_response_class=FastJSONResponse)
+    for module in (account_entries_router, relations_router, tags_router, export_router, import_router):
+        app.include_router(module.router, prefix="/v1")
+
+    def repo_dependency():
+        with open_repo() as repo:
+            yield repo
+
+    def service_dependency(repo: AccountEntryRepositoryBase = Depends(get_account_entry_repository)):
+        return AccountEntryService(repo)
+
+    app.dependency_overrides[get_account_entry_repository] = repo_dependency
+    app.dependency_overrides[get_account_entry_repository_opener] = lambda: open_repo
+    app.dependency_overrides[get_account_entry_service] = service_dependency
+    return TestClient(app)
+
+
+# --- 측정 ---
+
+def _failure(e: BaseException) -> str:
+    # interrupt는 SQLite가 트랜잭션을 이미 롤백해서 저장소의 ROLLBACK이 다른 오류로 덮을 수 있음 → 원인까지 확인
+    while e is not None:
+        if isinstance(e, sqlite3.OperationalError) and "interrupted" in str(e):
+            return "timeout"
+        if "TransactionTimedOut" in (getattr(e, "code", None) or ""):
+            return "timeout"
+        e = e.__cause__ or e.__context__
+    return "error"
+
+
+def measure(backend, scenario: Scenario, bench: Bench, *, repeat: int, budget: float, timeout: float) -> dict:
+    if scenario.max_n is not None and bench.graph.n > scenario.max_n:
+        return {"status": "skipped", "runs": 0}
+    samples: List[float] = []
+    started = time.perf_counter()
+    # 0번째는 warm-up (결과에서 제외, 단 timeout 판정에는 사용)
+    for i in range(repeat + 1):
+        try:
+            with backend.deadline(timeout):
+                arg = scenario.setup(bench, i) if scenario.setup else None
+                t0 = time.perf_counter()
+                scenario.run(bench, arg)
+                elapsed = time.perf_counter() - t0
+        except Exception as e:
+            return {"status": _failure(e), "runs": len(samples), "message": f"{type(e).__name__}: {e}"[:300]}
+        if elapsed > timeout:
+            return {"status": "timeout", "runs": len(samples), "message": f"one run took {elapsed:.1f}s"}
+        if i > 0:
+            samples.append(elapsed * 1e3)
+        if i > 0 and time.perf_counter() - started > budget:
+            break
+    if not samples:
+        samples = [elapsed * 1e3]
+    ordered = sorted(samples)
+    return {"status": "ok", "runs": len(samples), "min_ms": round(ordered[0], 3),
+            "median_ms": round(statistics.median(ordered), 3),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3)}
+
+
+def run_graph(backend, graph: BenchGraph, scenarios: Sequence[Scenario], args, out=sys.stderr) -> List[dict]:
+    backend.reset()
+    t0 = time.perf_counter()
+    try:
+        with backend.deadline(args.load_timeout), backend.open_repo() as repo:
+            load_graph(repo, graph)
+    except Exception as e:
+        # 적재부터 못 끝내는 크기 (예: SQLite 전이 폐쇄가 n^2인 긴 chain) → 모든 시나리오를 timeout/error로
+        status = _failure(e)
+        print(f"{graph.name}: load {status} after {time.perf_counter() - t0:.1f}s ({type(e).__name__})", file=out)
+        return [{"scenario": s.name, "graph": graph.name, "shape": graph.shape, "n": graph.n, "status": status,
+                 "runs": 0, "message": f"load: {type(e).__name__}: {e}"[:300]} for s in scenarios]
+    backend.loaded()
+    print(f"{graph.name}: loaded {graph.n} entries / {len(graph.edges)} relations "
+          f"in {time.perf_counter() - t0:.1f}s", file=out)
+
+    results = []
+    client = make_client(backend.open_repo)
+    with backend.open_repo() as repo:
+        bench = Bench(repo=repo, client=client, graph=graph)
+        # 읽기 먼저, 쓰기는 뒤에
+        for scenario in sorted(scenarios, key=lambda s: s.writes):
+            result = measure(backend, scenario, bench, repeat=args.repeat, budget=args.budget, timeout=args.timeout)
+            results.append({"scenario": scenario.name, "graph": graph.name, "shape": graph.shape, "n": graph.n,
+                            **result})
+            print(f"  {scenario.name:<58} {_cell(result):>14}", file=out)
+    return results
+
+
+def _cell(result: Optional[dict]) -> str:
+    if result is None:
+        return "-"
+    if result["status"] != "ok":
+        return result["status"]
+    return f"{result['median_ms']:.2f} ms"
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# --- 기준 비교 ---
+
+def compare(current: dict, baseline: dict, *, threshold: float, min_delta_ms: float) -> List[dict]:
+    """current/baseline 결과 JSON → (시나리오, 그래프)별 비교 행. regression=True면 회귀."""
+    base = {(r["scenario"], r["graph"]): r for r in baseline["results"]}
+    rows = []
+    for r in current["results"]:
+        b = base.get((r["scenario"], r["graph"]))
+        if b is None or "skipped" in (r["status"], b["status"]):
+            continue
+        row = {"scenario": r["scenario"], "graph": r["graph"], "base": b, "current": r, "ratio": None,
+               "regression": STATUS_RANK[r["status"]] > STATUS_RANK[b["status"]]}
+        if r["status"] == b["status"] == "ok":
+            row["ratio"] = r["median_ms"] / max(b["median_ms"], 1e-6)
+            row["regression"] = (r["median_ms"] > b["median_ms"] * (1 + threshold)
+                                 and r["median_ms"] - b["median_ms"] >= min_delta_ms)
+        rows.append(row)
+    return rows
+
+
+def print_comparison(rows: List[dict], out=sys.stdout) -> None:
+    print(f"{'scenario':<58} {'graph':<14} {'baseline':>12} {'current':>12} {'ratio':>7}", file=out)
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        mark = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['scenario']:<58} {row['graph']:<14} {_cell(row['base']):>12} {_cell(row['current']):>12} "
+              f"{ratio:>7}{mark}", file=out)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="sqlite")
+    parser.add_argument("--graph-index", action="store_true", help="neo4j: use the in-memory graph index")
+    parser.add_argument("--force", action="store_true", help="neo4j: run even if the database is not empty")
+    parser.add_argument("--shapes", default=",".join(SHAPES))
+    parser.add_argument("--sizes", default="1000", help="comma separated node counts (1000 … 1000000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", default=None, help="regex on scenario names (e.g. '^repo\\.' or 'tree')")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=2.0, help="seconds per scenario (after warm-up)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds per single run / transaction")
+    parser.add_argument("--load-timeout", type=float, default=600.0, help="seconds to load one graph")
+    parser.add_argument("--out", default=None, help="write results JSON here")
+    parser.add_argument("--baseline", default=None, help="compare with this results JSON (exit 1 on regression)")
+    parser.add_argument("--save-baseline", default=None, help="also write results JSON as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown ratio (0.25 = +25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore slowdowns smaller than this")
+    args = parser.parse_args(argv)
+
+    shapes = [s for s in args.shapes.split(",") if s]
+    sizes = [int(n) for n in args.sizes.split(",") if n]
+    scenarios = [s for s in SCENARIOS if args.only is None or re.search(args.only, s.name)]
+
+    backend = BACKENDS[args.backend](args)
+    results = []
+    try:
+        for shape in shapes:
+            for n in sizes:
+                results += run_graph(backend, generate(shape, n, seed=args.seed), scenarios, args)
+    finally:
+        backend.close()
+
+    report = {
+        "meta": {"backend": args.backend, "graph_index": args.graph_index, "seed": args.seed,
+                 "shapes": shapes, "sizes": sizes, "repeat": args.repeat, "git": _git_revision(),
+                 "python": platform.python_version(), "platform": platform.platform(),
+                 "created": datetime.now(timezone.utc).isoformat(timespec="seconds")},
+        "results": results,
+    }
+    for path in filter(None, (args.out, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+    if args.baseline is None:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline["meta"].get("backend") != args.backend:
+        print(f"warning: baseline backend is {baseline['meta'].get('backend')}", file=sys.stderr)
+    rows = compare(report, baseline, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+    print_comparison(rows)
+    regressions = sum(row["regression"] for row in rows)
+    print(f"{regressions} regression(s) in {len(rows)} comparisons")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import hashlib
+from typing import Any, Mapping, Optional, Type
+
+from fastapi import Request, Response
+from starlette.responses import JSONResponse
+
+from devaccountbook_backend.api.responses import FastJSONResponse
+
+# 브라우저/React Query가 저장한 응답을 매번 If-None-Match로 재검증하도록
+CACHE_CONTROL = "no-cache"
+
+
+def content_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match는 약한 비교 (W/ 접두어 무시)
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(etag: str, headers: Optional[Mapping[str, str]] = None) -> Response:
+    return Response(status_code=304, headers={**(headers or {}), "ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def json_with_etag(request: Request, data: Any, headers: Optional[Mapping[str, str]] = None,
+                   etag: Optional[str] = None, response_class: Type[JSONResponse] = FastJSONResponse) -> Response:
+    """
+    etag가 없으면 응답 본문 + headers(X-Total-Count 등) 지문으로 ETag 생성. 같으면 본문 없이 304 (gzip/전송 생략).
+    data는 response_model과 같은 형태여야 함 (response_model 검증 없이 response_class로 한 번에 직렬화)
+    """
+    response = response_class(data)
+    etag = etag or content_etag(response.body + repr(sorted((headers or {}).items())).encode())
+    if etag_matches(request, etag):
+        return not_modified(etag, headers)
+    response.headers.update({**(headers or {}), "ETag": etag, "Cache-Control": CACHE_CONTROL})
+    return response
+
+
+def cached_not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """조회 전에 확인: 캐시 version 기준 etag가 If-None-Match와 같으면 304 (조회/직렬화 생략), 아니면 None."""
+    if etag is not None and etag_matches(request, etag):
+        return not_modified(etag)
+    return None
@@ -0,0 +1,68 @@
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from pydantic_core import PydanticSerializationError, to_json
+from starlette.responses import JSONResponse
+
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryTreeNodeDTO
+from devaccountbook_backend.utils.tree_json_util import tree_node_head, tree_node_tail
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    pydantic-core(Rust) 직렬화 응답: 모델/리스트/dict를 jsonable_encoder → json.dumps 거치지 않고 바로 bytes로.
+    별칭(camelCase)·datetime 형식이 jsonable_encoder와 같아서 본문(=본문 지문 ETag)도 같음.
+    모르는 타입만 jsonable_encoder로 처리.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, fallback=jsonable_encoder)
+
+
+_END = object()
+
+
+def encode_tree(content: AccountEntryTreeNodeDTO | list[AccountEntryTreeNodeDTO | None] | None) -> bytes:
+    """
+    트리(또는 트리 목록, 항목은 None 가능) → JSON bytes. 명시적 스택이라 깊이 제한 없음
+    (pydantic-core는 중첩 250단계 안팎에서 실패). 본문은 FastJSONResponse와 같음.
+    """
+    if content is None:
+        return b"null"
+    as_list = isinstance(content, list)
+    out: list[bytes] = [b"["] if as_list else []
+    # (남은 형제 iterator, 형제를 다 쓴 뒤 닫는 bytes)
+    stack = [(iter(content if as_list else (content,)), b"]" if as_list else b"")]
+    first = True
+    while stack:
+        siblings, tail = stack[-1]
+        node = next(siblings, _END)
+        if node is _END:
+            stack.pop()
+            out.append(tail)
+            first = False
+            continue
+        if not first:
+            out.append(b",")
+        if node is None:
+            out.append(b"null")
+            first = False
+            continue
+        out.append(tree_node_head(node.id, {"title": node.title, "desc": node.desc, "tags": node.tags}))
+        mark = "cycle" if node.cycle else "revisit" if node.revisit else None
+        stack.append((iter(node.children), tree_node_tail(mark)))
+        first = True
+    return b"".join(out)
+
+
+class TreeJSONResponse(FastJSONResponse):
+    """
+    트리 응답 (explore / forest). 보통은 FastJSONResponse와 같이 한 번에 직렬화하고,
+    pydantic-core 중첩 한계를 넘는 깊은 트리만 encode_tree로 다시 직렬화.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return super().render(content)
+        except PydanticSerializationError:
+            return encode_tree(content)
@@ -0,0 +1,91 @@
+# account_entries_router / async_account_entries_router 공통: 쿼리 파라미터 해석 + 응답/헤더/ETag 조립 (I/O 없음)
+# 두 라우터는 서비스 호출(동기 / await)만 각자 수행
+from typing import AsyncIterable, Callable, Iterable, List, Mapping, Optional
+
+from fastapi import HTTPException, Request, Response
+from fastapi.params import Query
+from starlette.responses import StreamingResponse
+
+from devaccountbook_backend.api.etag import CACHE_CONTROL, json_with_etag
+from devaccountbook_backend.api.responses import TreeJSONResponse
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryTreeNodeDTO, AccountEntryTreePlanDTO, \
+    AccountEntryTreeResultDTO
+from devaccountbook_backend.schemas.account_entry_schemas import AccountEntryPageOut, TagMatch
+
+
+# 목록: ?limit=50&offset=0 | ?limit=50&after=<cursor>, 태그 필터 ?tag=a&tag=b&match=any|all, ?with_total=true
+class EntryListQuery:
+    def __init__(self,
+                 limit: int = Query(50, ge=1, le=200),
+                 offset: int = Query(0, ge=0),
+                 after: Optional[str] = Query(None),
+                 tag: List[str] = Query([]),
+                 match: TagMatch = Query(TagMatch.ANY),
+                 with_total: bool = Query(False)):
+        self.limit, self.offset, self.after = limit, offset, after
+        self.tag, self.match, self.with_total = tag, match, with_total
+
+    # 커서도 전체 수도 없으면 목록만 (X-Next-Cursor / X-Total-Count 없음)
+    @property
+    def plain(self) -> bool:
+        return self.after is None and not self.with_total
+
+
+# explore: max_depth / max_nodes 중 하나라도 주면 bounded 탐색, stream=true면 같은 본문을 StreamingResponse로
+class ExploreQuery:
+    def __init__(self,
+                 max_depth: Optional[int] = Query(None, ge=0),
+                 max_nodes: Optional[int] = Query(None, ge=1),
+                 stream: bool = Query(False)):
+        self.max_depth, self.max_nodes, self.stream = max_depth, max_nodes, stream
+
+    @property
+    def bounded(self) -> bool:
+        return self.max_depth is not None or self.max_nodes is not None
+
+
+# forest: ?roots_only=true&limit=50&offset=0
+class ForestQuery:
+    def __init__(self,
+                 roots_only: bool = Query(False),
+                 limit: int = Query(50, ge=1, le=200),
+                 offset: int = Query(0, ge=0)):
+        self.roots_only, self.limit, self.offset = roots_only, limit, offset
+
+
+def page_headers(page: AccountEntryPageOut) -> Optional[dict]:
+    headers = {}
+    if page.next_cursor:
+        headers["X-Next-Cursor"] = page.next_cursor
+    if page.total is not None:
+        headers["X-Total-Count"] = str(page.total)
+    return headers or None
+
+
+def _truncated_headers(truncated: bool) -> dict:
+    return {"X-Tree-Truncated": "true" if truncated else "false"}
+
+
+# 스트리밍 아닌 explore 응답: bounded면 결과(없으면 404) + X-Tree-Truncated, 아니면 트리 (연결이 없으면 null)
+def explore_json(request: Request, query: ExploreQuery,
+                 found: AccountEntryTreeResultDTO | AccountEntryTreeNodeDTO | None, etag: Optional[str]) -> Response:
+    if not query.bounded:
+        return json_with_etag(request, found, etag=etag, response_class=TreeJSONResponse)
+    if found is None:
+        raise HTTPException(404, "Item not found")
+    return json_with_etag(request, found.tree, _truncated_headers(found.truncated), etag=etag,
+                          response_class=TreeJSONResponse)
+
+
+# stream=true: 골격(plan)으로 상태 코드/헤더를 먼저 정하고 본문은 body(plan)이 만든 chunk를 흘려보냄
+# 본문/헤더/상태 코드는 stream 없는 같은 URL과 같음 (골격이 없으면 bounded는 404, 아니면 null)
+def explore_stream(request: Request, query: ExploreQuery, plan: AccountEntryTreePlanDTO | None, etag: Optional[str],
+                   body: Callable[[AccountEntryTreePlanDTO], Iterable[bytes] | AsyncIterable[bytes]]) -> Response:
+    if plan is None:
+        if query.bounded:
+            raise HTTPException(404, "Item not found")
+        return json_with_etag(request, None, etag=etag, response_class=TreeJSONResponse)
+    headers: Mapping[str, str] = _truncated_headers(plan.truncated) if query.bounded else {}
+    if etag is not None:
+        headers = {**headers, "ETag": etag, "Cache-Control": CACHE_CONTROL}
+    return StreamingResponse(body(plan), media_type="application/json", headers=headers)
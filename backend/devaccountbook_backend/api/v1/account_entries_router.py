@@ -1,16 +1,23 @@
-from typing import List
+from typing import List, Optional
 
 # 서비스 생략 버전: repo를 가져오려면 아래를 사용
 # from devaccountbook_backend.repositories.item_repo import ItemRepository
 # from devaccountbook_backend.db.neo import get_neo4j_session
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.params import Query
-
+from devaccountbook_backend.api.etag import json_with_etag, cached_not_modified
+from devaccountbook_backend.api.responses import TreeJSONResponse
+from devaccountbook_backend.api.v1.account_entries_common import EntryListQuery, ExploreQuery, ForestQuery, \
+    page_headers, explore_json, explore_stream
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryTreeNodeDTO
+from devaccountbook_backend.repositories.repository_factory import get_account_entry_repository_opener
 from devaccountbook_backend.schemas.account_entry_schemas import (
     AccountEntryCreate, AccountEntryPatch, AccountEntryOut,
     RelationCreate, RelationOut, RelationList, RelKind
 )
-from devaccountbook_backend.schemas.account_entry_schemas import CountOut, RelationProps
+from devaccountbook_backend.schemas.account_entry_schemas import CountOut, RelationProps, SheetRowOut, \
+    AccountEntryBatchCreate, AccountEntryBatchCreateOut, ReachOut, ReachableOut, \
+    AccountEntrySearchHitOut
 from devaccountbook_backend.services.account_entry_service import (
     AccountEntryService
 )
@@ -21,23 +28,117 @@ router = APIRouter(prefix="/account-entries", tags=["items"])
 
 # 전체
 # GET /v1/account-entries?limit=50&offset=0
+# GET /v1/account-entries?limit=50&after=<cursor>  (keyset, after= 빈 값이면 첫 페이지)
+# keyset 모드에서는 다음 페이지 커서를 X-Next-Cursor 헤더로 반환
+# 태그 필터: ?tag=a&tag=b (match=any: 하나라도 / match=all: 모두), 두 모드 모두 적용
+# with_total=true면 필터에 맞는 전체 수를 X-Total-Count 헤더로 반환 (목록과 같은 읽기 트랜잭션)
 @router.get("", response_model=List[AccountEntryOut])
 def list_account_entries(
-        limit: int = Query(50, ge=1, le=200),
-        offset: int = Query(0, ge=0),
+        request: Request,
+        query: EntryListQuery = Depends(),
         service: AccountEntryService = Depends(get_account_entry_service),
 ):
-    account_entry_out_list = service.list(limit=limit, offset=offset)
-    return account_entry_out_list
+    if query.plain:
+        account_entry_out_list = service.list(limit=query.limit, offset=query.offset, tags=query.tag,
+                                              tag_match=query.match)
+        return json_with_etag(request, account_entry_out_list)
+    if query.after is None:
+        page = service.list_counted(limit=query.limit, offset=query.offset, tags=query.tag, tag_match=query.match)
+    else:
+        try:
+            page = service.list_after(limit=query.limit, after=query.after, tags=query.tag, tag_match=query.match,
+                                      with_total=query.with_total)
+        except ValueError:
+            raise HTTPException(400, "Invalid cursor")
+    return json_with_etag(request, page.items, page_headers(page))
 
 
+# max_depth / max_nodes 중 하나라도 주면 bounded 탐색 (잘렸으면 X-Tree-Truncated: true)
+# stream=true면 같은 인자의 응답과 같은 본문을 StreamingResponse로 (골격만 먼저 읽고 노드 속성은 batch_chunk_size개씩)
+# ETag: 트리 캐시가 켜져 있으면 graph version 기준 (304면 조회/직렬화 생략), 아니면 본문 지문
 @router.get("/{start_account_entry_id}/explore-start-leaf")
-def get_start_to_end_node(start_account_entry_id: str, svc: AccountEntryService = Depends(get_account_entry_service)):
-    return svc.get_start_to_end_node(start_account_entry_id)
+def get_start_to_end_node(start_account_entry_id: str,
+                          request: Request,
+                          query: ExploreQuery = Depends(),
+                          svc: AccountEntryService = Depends(get_account_entry_service),
+                          open_repo=Depends(get_account_entry_repository_opener)):
+    return _explore(svc, open_repo, request, start_account_entry_id, False, query)
+
 
 @router.get("/{start_account_entry_id}/explore-start-leaf-reverse")
-def get_start_to_end_node_reverse(start_account_entry_id: str, svc: AccountEntryService = Depends(get_account_entry_service)):
-    return svc.get_start_to_end_node_reverse(start_account_entry_id)
+def get_start_to_end_node_reverse(start_account_entry_id: str,
+                                  request: Request,
+                                  query: ExploreQuery = Depends(),
+                                  svc: AccountEntryService = Depends(get_account_entry_service),
+                                  open_repo=Depends(get_account_entry_repository_opener)):
+    return _explore(svc, open_repo, request, start_account_entry_id, True, query)
+
+
+# 스트리밍 본문에서는 저장소를 생성기 안에서 다시 열고 닫음 (요청 의존성은 응답 전에 닫히므로)
+def _explore(svc: AccountEntryService, open_repo, request: Request, start_id: str, reverse: bool,
+             query: ExploreQuery) -> Response:
+    etag = svc.explore_etag(start_id, reverse=reverse, bounded=query.bounded, max_depth=query.max_depth,
+                            max_nodes=query.max_nodes)
+    if (cached := cached_not_modified(request, etag)) is not None:
+        return cached
+    if query.stream:
+        plan = svc.explore_plan(start_id, reverse=reverse, max_depth=query.max_depth, max_nodes=query.max_nodes)
+
+        def body(plan):
+            with open_repo() as repo:
+                yield from AccountEntryService(repo).explore_json_chunks(plan)
+
+        return explore_stream(request, query, plan, etag, body)
+    if query.bounded:
+        found = svc.explore_bounded(start_id, reverse=reverse, max_depth=query.max_depth, max_nodes=query.max_nodes)
+    elif reverse:
+        found = svc.get_start_to_end_node_reverse(start_id)
+    else:
+        found = svc.get_start_to_end_node(start_id)
+    return explore_json(request, query, found, etag)
+
+
+# 검색: GET /v1/account-entries/search?q=...&limit=20&offset=0
+# title/desc/tags 전문 검색 (단어 접두어 일치, 여러 단어는 OR), 관련도 순 + 검색어 위치(highlights)
+@router.get("/search", response_model=List[AccountEntrySearchHitOut])
+def search_account_entries(
+        request: Request,
+        q: str = Query(..., min_length=1, max_length=200),
+        limit: int = Query(20, ge=1, le=100),
+        offset: int = Query(0, ge=0),
+        service: AccountEntryService = Depends(get_account_entry_service),
+):
+    return json_with_etag(request, service.search(q, limit=limit, offset=offset))
+
+
+# 시트: GET /v1/account-entries/sheet?limit=50&offset=0
+@router.get("/sheet", response_model=List[SheetRowOut])
+def get_sheet(
+        limit: int = Query(50, ge=1, le=200),
+        offset: int = Query(0, ge=0),
+        service: AccountEntryService = Depends(get_account_entry_service),
+):
+    return service.sheet(limit=limit, offset=offset)
+
+
+# 전체 트리: GET /v1/account-entries/forest?roots_only=true&limit=50&offset=0
+# 시작 노드(최신순) 한 페이지의 트리만 (목록 조회와 같은 페이지 크기), 다음 페이지는 offset으로
+# 항목마다 explore-start-leaf와 같은 트리 (연결된 RELATES_TO가 없는 시작 노드는 null)
+# (response_model 재검증 없이 TreeJSONResponse로 직렬화 → 깊은 체인도 응답 가능)
+@router.get("/forest", response_model=List[Optional[AccountEntryTreeNodeDTO]])
+def get_forest(
+        query: ForestQuery = Depends(),
+        svc: AccountEntryService = Depends(get_account_entry_service),
+):
+    return TreeJSONResponse(svc.get_forest(roots_only=query.roots_only, limit=query.limit, offset=query.offset))
+
+
+@router.get("/forest-reverse", response_model=List[Optional[AccountEntryTreeNodeDTO]])
+def get_forest_reverse(
+        query: ForestQuery = Depends(),
+        svc: AccountEntryService = Depends(get_account_entry_service),
+):
+    return TreeJSONResponse(svc.get_forest_reverse(roots_only=query.roots_only, limit=query.limit, offset=query.offset))
 
 
 @router.get("/count", response_model=CountOut)
@@ -55,11 +156,19 @@ def create_account_entry(payload: AccountEntryCreate, svc: AccountEntryService =
     return account_entry_out
 
 
+# 배치 생성: POST /v1/account-entries:batch
+@router.post(":batch", response_model=AccountEntryBatchCreateOut, status_code=status.HTTP_201_CREATED)
+def create_account_entries_batch(payload: AccountEntryBatchCreate,
+                                 svc: AccountEntryService = Depends(get_account_entry_service)):
+    return AccountEntryBatchCreateOut(ids=svc.create_many(payload.items))
+
+
 @router.get("/{account_entry_id}", response_model=AccountEntryOut)
-def get_account_entry(account_entry_id: str, svc: AccountEntryService = Depends(get_account_entry_service)):
+def get_account_entry(account_entry_id: str, request: Request,
+                      svc: AccountEntryService = Depends(get_account_entry_service)):
     account_entry_out = svc.get(account_entry_id)
     if not account_entry_out: raise HTTPException(404, "Item not found")
-    return account_entry_out
+    return json_with_etag(request, account_entry_out)
 
 
 @router.patch("/{account_entry_id}", response_model=AccountEntryOut)
@@ -89,10 +198,14 @@ def create_relation(
 @router.get("/{account_entry_id}/relations", response_model=RelationList)
 def list_relations(
         account_entry_id: str,
+        request: Request,
         service: AccountEntryService = Depends(get_account_entry_service),
 ):
+    etag = service.list_links_etag(account_entry_id)
+    if (cached := cached_not_modified(request, etag)) is not None:
+        return cached
     relation_list = service.list_links(account_entry_id)
-    return relation_list
+    return json_with_etag(request, relation_list, etag=etag)
 
 
 # 관계 삭제: DELETE /account-entries/{from_id}/relations/{kind}/{to_id}
@@ -106,3 +219,42 @@ def delete_relation(
     cnt = service.unlink(from_id, to_id, kind)
     if cnt == 0:
         raise HTTPException(404, "Relation not found")
+
+
+# 도달 가능성 (RELATES_TO 전이 폐쇄)
+# GET /account-entries/{id}/descendants?limit=1000  → 후손 id (id 순, limit까지) + 전체 수
+# GET /account-entries/{id}/ancestors?limit=1000
+# GET /account-entries/{from_id}/reaches/{to_id}     → from_id에서 to_id에 닿는지
+@router.get("/{account_entry_id}/descendants", response_model=ReachOut)
+def list_descendants(
+        account_entry_id: str,
+        request: Request,
+        limit: int = Query(1000, ge=1, le=10000),
+        service: AccountEntryService = Depends(get_account_entry_service),
+):
+    reach = service.descendants(account_entry_id, limit=limit)
+    if reach is None:
+        raise HTTPException(404, "Item not found")
+    return json_with_etag(request, reach)
+
+
+@router.get("/{account_entry_id}/ancestors", response_model=ReachOut)
+def list_ancestors(
+        account_entry_id: str,
+        request: Request,
+        limit: int = Query(1000, ge=1, le=10000),
+        service: AccountEntryService = Depends(get_account_entry_service),
+):
+    reach = service.ancestors(account_entry_id, limit=limit)
+    if reach is None:
+        raise HTTPException(404, "Item not found")
+    return json_with_etag(request, reach)
+
+
+@router.get("/{from_id}/reaches/{to_id}", response_model=ReachableOut)
+def get_reaches(
+        from_id: str,
+        to_id: str,
+        service: AccountEntryService = Depends(get_account_entry_service),
+):
+    return service.reaches(from_id, to_id)
@@ -0,0 +1,262 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.params import Query
+
+from devaccountbook_backend.api.etag import json_with_etag, cached_not_modified
+from devaccountbook_backend.api.responses import TreeJSONResponse
+from devaccountbook_backend.api.v1.account_entries_common import EntryListQuery, ExploreQuery, ForestQuery, \
+    page_headers, explore_json, explore_stream
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryTreeNodeDTO
+from devaccountbook_backend.repositories.async_account_entry_repo import get_async_account_entry_repo_opener
+from devaccountbook_backend.schemas.account_entry_schemas import (
+    AccountEntryCreate, AccountEntryPatch, AccountEntryOut,
+    RelationCreate, RelationOut, RelationList, RelKind
+)
+from devaccountbook_backend.schemas.account_entry_schemas import CountOut, RelationProps, SheetRowOut, \
+    AccountEntryBatchCreate, AccountEntryBatchCreateOut, ReachOut, ReachableOut, \
+    AccountEntrySearchHitOut
+from devaccountbook_backend.services.async_account_entry_service import AsyncAccountEntryService, \
+    get_async_account_entry_service
+
+# account_entries_router와 같은 경로/응답. NEO4J_ASYNC=true일 때 main에서 대신 등록
+router = APIRouter(prefix="/account-entries", tags=["items"])
+
+
+# 전체
+# GET /v1/account-entries?limit=50&offset=0
+# GET /v1/account-entries?limit=50&after=<cursor>  (keyset, after= 빈 값이면 첫 페이지)
+# keyset 모드에서는 다음 페이지 커서를 X-Next-Cursor 헤더로 반환
+# 태그 필터: ?tag=a&tag=b (match=any: 하나라도 / match=all: 모두), 두 모드 모두 적용
+# with_total=true면 필터에 맞는 전체 수를 X-Total-Count 헤더로 반환 (목록과 같은 읽기 트랜잭션)
+@router.get("", response_model=List[AccountEntryOut])
+async def list_account_entries(
+        request: Request,
+        query: EntryListQuery = Depends(),
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    if query.plain:
+        account_entry_out_list = await service.list(limit=query.limit, offset=query.offset, tags=query.tag,
+                                                    tag_match=query.match)
+        return json_with_etag(request, account_entry_out_list)
+    if query.after is None:
+        page = await service.list_counted(limit=query.limit, offset=query.offset, tags=query.tag, tag_match=query.match)
+    else:
+        try:
+            page = await service.list_after(limit=query.limit, after=query.after, tags=query.tag, tag_match=query.match,
+                                            with_total=query.with_total)
+        except ValueError:
+            raise HTTPException(400, "Invalid cursor")
+    return json_with_etag(request, page.items, page_headers(page))
+
+
+# max_depth / max_nodes 중 하나라도 주면 bounded 탐색 (잘렸으면 X-Tree-Truncated: true)
+# stream=true면 같은 인자의 응답과 같은 본문을 StreamingResponse로 (골격만 먼저 읽고 노드 속성은 batch_chunk_size개씩)
+# ETag: 트리 캐시가 켜져 있으면 graph version 기준 (304면 조회/직렬화 생략), 아니면 본문 지문
+@router.get("/{start_account_entry_id}/explore-start-leaf")
+async def get_start_to_end_node(start_account_entry_id: str,
+                                request: Request,
+                                query: ExploreQuery = Depends(),
+                                svc: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+                                open_repo=Depends(get_async_account_entry_repo_opener)):
+    return await _explore(svc, open_repo, request, start_account_entry_id, False, query)
+
+
+@router.get("/{start_account_entry_id}/explore-start-leaf-reverse")
+async def get_start_to_end_node_reverse(start_account_entry_id: str,
+                                        request: Request,
+                                        query: ExploreQuery = Depends(),
+                                        svc: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+                                        open_repo=Depends(get_async_account_entry_repo_opener)):
+    return await _explore(svc, open_repo, request, start_account_entry_id, True, query)
+
+
+# 스트리밍 본문에서는 저장소를 생성기 안에서 다시 열고 닫음 (요청 의존성은 응답 전에 닫히므로)
+async def _explore(svc: AsyncAccountEntryService, open_repo, request: Request, start_id: str, reverse: bool,
+                   query: ExploreQuery) -> Response:
+    etag = svc.explore_etag(start_id, reverse=reverse, bounded=query.bounded, max_depth=query.max_depth,
+                            max_nodes=query.max_nodes)
+    if (cached := cached_not_modified(request, etag)) is not None:
+        return cached
+    if query.stream:
+        plan = await svc.explore_plan(start_id, reverse=reverse, max_depth=query.max_depth, max_nodes=query.max_nodes)
+
+        async def body(plan):
+            async with open_repo() as repo:
+                async for chunk in AsyncAccountEntryService(repo).explore_json_chunks(plan):
+                    yield chunk
+
+        return explore_stream(request, query, plan, etag, body)
+    if query.bounded:
+        found = await svc.explore_bounded(start_id, reverse=reverse, max_depth=query.max_depth,
+                                          max_nodes=query.max_nodes)
+    elif reverse:
+        found = await svc.get_start_to_end_node_reverse(start_id)
+    else:
+        found = await svc.get_start_to_end_node(start_id)
+    return explore_json(request, query, found, etag)
+
+
+# 검색: GET /v1/account-entries/search?q=...&limit=20&offset=0
+# title/desc/tags 전문 검색 (단어 접두어 일치, 여러 단어는 OR), 관련도 순 + 검색어 위치(highlights)
+@router.get("/search", response_model=List[AccountEntrySearchHitOut])
+async def search_account_entries(
+        request: Request,
+        q: str = Query(..., min_length=1, max_length=200),
+        limit: int = Query(20, ge=1, le=100),
+        offset: int = Query(0, ge=0),
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    return json_with_etag(request, await service.search(q, limit=limit, offset=offset))
+
+
+# 시트: GET /v1/account-entries/sheet?limit=50&offset=0
+@router.get("/sheet", response_model=List[SheetRowOut])
+async def get_sheet(
+        limit: int = Query(50, ge=1, le=200),
+        offset: int = Query(0, ge=0),
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    return await service.sheet(limit=limit, offset=offset)
+
+
+# 전체 트리: GET /v1/account-entries/forest?roots_only=true&limit=50&offset=0
+# 시작 노드(최신순) 한 페이지의 트리만 (목록 조회와 같은 페이지 크기), 다음 페이지는 offset으로
+# 항목마다 explore-start-leaf와 같은 트리 (연결된 RELATES_TO가 없는 시작 노드는 null)
+# (response_model 재검증 없이 TreeJSONResponse로 직렬화 → 깊은 체인도 응답 가능)
+@router.get("/forest", response_model=List[Optional[AccountEntryTreeNodeDTO]])
+async def get_forest(
+        query: ForestQuery = Depends(),
+        svc: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    return TreeJSONResponse(await svc.get_forest(roots_only=query.roots_only, limit=query.limit, offset=query.offset))
+
+
+@router.get("/forest-reverse", response_model=List[Optional[AccountEntryTreeNodeDTO]])
+async def get_forest_reverse(
+        query: ForestQuery = Depends(),
+        svc: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    return TreeJSONResponse(await svc.get_forest_reverse(roots_only=query.roots_only, limit=query.limit,
+                                                         offset=query.offset))
+
+
+@router.get("/count", response_model=CountOut)
+async def count_account_entries(
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    return CountOut(total=await service.count())
+
+
+# CRUD
+@router.post("", response_model=AccountEntryOut, status_code=status.HTTP_201_CREATED)
+async def create_account_entry(payload: AccountEntryCreate,
+                               svc: AsyncAccountEntryService = Depends(get_async_account_entry_service)):
+    new_id = await svc.create(payload)
+    account_entry_out = await svc.get(new_id)
+    return account_entry_out
+
+
+# 배치 생성: POST /v1/account-entries:batch
+@router.post(":batch", response_model=AccountEntryBatchCreateOut, status_code=status.HTTP_201_CREATED)
+async def create_account_entries_batch(payload: AccountEntryBatchCreate,
+                                       svc: AsyncAccountEntryService = Depends(get_async_account_entry_service)):
+    return AccountEntryBatchCreateOut(ids=await svc.create_many(payload.items))
+
+
+@router.get("/{account_entry_id}", response_model=AccountEntryOut)
+async def get_account_entry(account_entry_id: str, request: Request,
+                            svc: AsyncAccountEntryService = Depends(get_async_account_entry_service)):
+    account_entry_out = await svc.get(account_entry_id)
+    if not account_entry_out: raise HTTPException(404, "Item not found")
+    return json_with_etag(request, account_entry_out)
+
+
+@router.patch("/{account_entry_id}", response_model=AccountEntryOut)
+async def patch_account_entry(account_entry_id: str, patch: AccountEntryPatch,
+                              svc: AsyncAccountEntryService = Depends(get_async_account_entry_service)):
+    if not await svc.patch(account_entry_id, patch): raise HTTPException(400, "No valid fields to update")
+    return await svc.get(account_entry_id)
+
+
+@router.delete("/{account_entry_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_account_entry(account_entry_id: str,
+                               svc: AsyncAccountEntryService = Depends(get_async_account_entry_service)):
+    if not await svc.delete(account_entry_id): raise HTTPException(404, "Item not found")
+
+
+# 관계 생성: POST /account-entries/{from_id}/relations
+@router.post("/{from_id}/relations", status_code=status.HTTP_201_CREATED, response_model=RelationOut)
+async def create_relation(
+        from_id: str,
+        payload: RelationCreate,
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    await service.link(from_id, payload)
+    return RelationOut(from_id=from_id, to_id=payload.to_id, kind=payload.kind, props=RelationProps())
+
+
+# 관계 목록: GET /account-entries/{account_entry_id}/relations
+@router.get("/{account_entry_id}/relations", response_model=RelationList)
+async def list_relations(
+        account_entry_id: str,
+        request: Request,
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    etag = service.list_links_etag(account_entry_id)
+    if (cached := cached_not_modified(request, etag)) is not None:
+        return cached
+    relation_list = await service.list_links(account_entry_id)
+    return json_with_etag(request, relation_list, etag=etag)
+
+
+# 관계 삭제: DELETE /account-entries/{from_id}/relations/{kind}/{to_id}
+@router.delete("/{from_id}/relations/{kind}/{to_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_relation(
+        from_id: str,
+        kind: RelKind,
+        to_id: str,
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    cnt = await service.unlink(from_id, to_id, kind)
+    if cnt == 0:
+        raise HTTPException(404, "Relation not found")
+
+
+# 도달 가능성 (RELATES_TO 전이 폐쇄)
+# GET /account-entries/{id}/descendants?limit=1000  → 후손 id (id 순, limit까지) + 전체 수
+# GET /account-entries/{id}/ancestors?limit=1000
+# GET /account-entries/{from_id}/reaches/{to_id}     → from_id에서 to_id에 닿는지
+@router.get("/{account_entry_id}/descendants", response_model=ReachOut)
+async def list_descendants(
+        account_entry_id: str,
+        request: Request,
+        limit: int = Query(1000, ge=1, le=10000),
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    reach = await service.descendants(account_entry_id, limit=limit)
+    if reach is None:
+        raise HTTPException(404, "Item not found")
+    return json_with_etag(request, reach)
+
+
+@router.get("/{account_entry_id}/ancestors", response_model=ReachOut)
+async def list_ancestors(
+        account_entry_id: str,
+        request: Request,
+        limit: int = Query(1000, ge=1, le=10000),
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    reach = await service.ancestors(account_entry_id, limit=limit)
+    if reach is None:
+        raise HTTPException(404, "Item not found")
+    return json_with_etag(request, reach)
+
+
+@router.get("/{from_id}/reaches/{to_id}", response_model=ReachableOut)
+async def get_reaches(
+        from_id: str,
+        to_id: str,
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    return await service.reaches(from_id, to_id)
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+from starlette.responses import StreamingResponse
+
+from devaccountbook_backend.repositories.async_account_entry_repo import get_async_account_entry_repo_opener
+from devaccountbook_backend.services.async_account_entry_service import AsyncAccountEntryService
+from devaccountbook_backend.utils.ndjson_util import NDJSON_MEDIA_TYPE
+
+router = APIRouter(tags=["export"])
+
+
+# 전체 내보내기: GET /v1/export.ndjson (형식은 export_router와 같음)
+@router.get("/export.ndjson")
+async def export_ndjson(open_repo=Depends(get_async_account_entry_repo_opener)):
+    async def body():
+        async with open_repo() as repo:
+            async for chunk in AsyncAccountEntryService(repo).export_ndjson():
+                yield chunk
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE,
+                             headers={"Content-Disposition": 'attachment; filename="devaccountbook.ndjson"'})
@@ -0,0 +1,36 @@
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.params import Query
+
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.schemas.account_entry_schemas import ImportResultOut, ImportFormat
+from devaccountbook_backend.services.account_entry_import import AccountEntryImport
+from devaccountbook_backend.services.async_account_entry_service import AsyncAccountEntryService, \
+    get_async_account_entry_service
+from devaccountbook_backend.utils.ndjson_util import aiter_lines, LineTooLongError
+
+router = APIRouter(tags=["import"])
+
+
+# 가져오기: POST /v1/import (형식/재개 방식은 import_router와 같음)
+@router.post("/import", response_model=ImportResultOut)
+async def import_rows(
+        request: Request,
+        job: Optional[str] = Query(None, min_length=1, max_length=200),
+        fmt: ImportFormat = Query(ImportFormat.NDJSON, alias="format"),
+        chunk_size: Optional[int] = Query(None, ge=1, le=100000),
+        line_offset: int = Query(0, ge=0),
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    state = AccountEntryImport(job or str(uuid.uuid4()), fmt, chunk_size=chunk_size or settings.import_chunk_size,
+                               line_offset=line_offset)
+    try:
+        async for line in aiter_lines(request.stream()):
+            if state.feed(line):
+                await service.import_chunk(state)
+    except LineTooLongError as e:
+        raise HTTPException(413, str(e))
+    await service.import_chunk(state)
+    return state.result()
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends
+
+from devaccountbook_backend.schemas.account_entry_schemas import RelationBatch, RelationBatchOut
+from devaccountbook_backend.services.async_account_entry_service import AsyncAccountEntryService, \
+    get_async_account_entry_service
+
+router = APIRouter(prefix="/relations", tags=["relations"])
+
+
+# 관계 배치: POST /v1/relations:batch
+# link/unlink 혼합 가능, 결과는 요청 순서대로
+@router.post(":batch", response_model=RelationBatchOut)
+async def batch_relations(
+        payload: RelationBatch,
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    return await service.batch_links(payload.items)
@@ -0,0 +1,21 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.params import Query
+
+from devaccountbook_backend.api.etag import json_with_etag
+from devaccountbook_backend.schemas.account_entry_schemas import TagCountOut
+from devaccountbook_backend.services.async_account_entry_service import AsyncAccountEntryService, \
+    get_async_account_entry_service
+
+router = APIRouter(prefix="/tags", tags=["tags"])
+
+
+# 태그 facet: GET /v1/tags?limit=100 → 태그별 엔트리 수 (많은 순, 같으면 이름 순)
+@router.get("", response_model=List[TagCountOut])
+async def list_tags(
+        request: Request,
+        limit: int = Query(100, ge=1, le=1000),
+        service: AsyncAccountEntryService = Depends(get_async_account_entry_service),
+):
+    return json_with_etag(request, await service.tag_counts(limit=limit))
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+from starlette.responses import StreamingResponse
+
+from devaccountbook_backend.repositories.repository_factory import get_account_entry_repository_opener
+from devaccountbook_backend.services.account_entry_service import AccountEntryService
+from devaccountbook_backend.utils.ndjson_util import NDJSON_MEDIA_TYPE
+
+router = APIRouter(tags=["export"])
+
+
+# 전체 내보내기: GET /v1/export.ndjson
+# 한 줄에 하나: {"type":"entry",...} 전부 → {"type":"relation","fromId","toId","kind","props"} 전부
+# 저장소는 본문 생성기 안에서 열고 닫음 (요청 의존성은 스트리밍 전에 닫힘)
+@router.get("/export.ndjson")
+def export_ndjson(open_repo=Depends(get_account_entry_repository_opener)):
+    def body():
+        with open_repo() as repo:
+            yield from AccountEntryService(repo).export_ndjson()
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE,
+                             headers={"Content-Disposition": 'attachment; filename="devaccountbook.ndjson"'})
@@ -0,0 +1,38 @@
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.params import Query
+from starlette.concurrency import run_in_threadpool
+
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.schemas.account_entry_schemas import ImportResultOut, ImportFormat
+from devaccountbook_backend.services.account_entry_import import AccountEntryImport
+from devaccountbook_backend.services.account_entry_service import AccountEntryService, get_account_entry_service
+from devaccountbook_backend.utils.ndjson_util import aiter_lines, LineTooLongError
+
+router = APIRouter(tags=["import"])
+
+
+# 가져오기: POST /v1/import?job=<id>&format=ndjson|csv (본문: export.ndjson 형식 또는 CSV)
+# 본문을 줄 단위로 읽으면서 chunk_size 행마다 한 쓰기 트랜잭션 (저장소 호출은 스레드풀)
+# 실패하면 같은 job으로 남은 부분을 다시 보내면 이어짐 (CLI: python -m devaccountbook_backend.cli.import_file)
+@router.post("/import", response_model=ImportResultOut)
+async def import_rows(
+        request: Request,
+        job: Optional[str] = Query(None, min_length=1, max_length=200),
+        fmt: ImportFormat = Query(ImportFormat.NDJSON, alias="format"),
+        chunk_size: Optional[int] = Query(None, ge=1, le=100000),
+        line_offset: int = Query(0, ge=0),
+        service: AccountEntryService = Depends(get_account_entry_service),
+):
+    state = AccountEntryImport(job or str(uuid.uuid4()), fmt, chunk_size=chunk_size or settings.import_chunk_size,
+                               line_offset=line_offset)
+    try:
+        async for line in aiter_lines(request.stream()):
+            if state.feed(line):
+                await run_in_threadpool(service.import_chunk, state)
+    except LineTooLongError as e:
+        raise HTTPException(413, str(e))
+    await run_in_threadpool(service.import_chunk, state)
+    return state.result()
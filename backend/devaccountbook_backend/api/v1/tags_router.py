@@ -0,0 +1,23 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.params import Query
+
+from devaccountbook_backend.api.etag import json_with_etag
+from devaccountbook_backend.schemas.account_entry_schemas import TagCountOut
+from devaccountbook_backend.services.account_entry_service import (
+    AccountEntryService
+)
+from devaccountbook_backend.services.account_entry_service import get_account_entry_service
+
+router = APIRouter(prefix="/tags", tags=["tags"])
+
+
+# 태그 facet: GET /v1/tags?limit=100 → 태그별 엔트리 수 (많은 순, 같으면 이름 순)
+@router.get("", response_model=List[TagCountOut])
+def list_tags(
+        request: Request,
+        limit: int = Query(100, ge=1, le=1000),
+        service: AccountEntryService = Depends(get_account_entry_service),
+):
+    return json_with_etag(request, service.tag_counts(limit=limit))
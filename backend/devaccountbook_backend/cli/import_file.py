@@ -0,0 +1,140 @@
+"""
+NDJSON/CSV 파일을 POST /v1/import로 나눠 보내는 CLI (서버를 거치므로 그래프 인덱스/캐시도 함께 갱신).
+
+    python -m devaccountbook_backend.cli.import_file ledger.ndjson --url http://127.0.0.1:8000
+    python -m devaccountbook_backend.cli.import_file ledger.csv --format csv --batch-lines 20000
+
+- 파일을 한 줄씩 읽어 batch_lines 줄마다 요청 하나로 스트리밍 (파일 전체를 메모리에 두지 않음)
+- 요청이 성공할 때마다 <파일>.import.json 체크포인트(job, 바이트 위치, 줄 번호, 누적 결과)를 기록
+  → 중간에 끊기면 같은 명령을 다시 실행해 마지막 성공 batch 다음부터 이어서 보냄
+  (같은 job이라 일부만 기록된 batch를 다시 보내도 중복 생성 없음), 끝나면 체크포인트 삭제
+- CSV는 batch마다 첫 줄(헤더)을 다시 붙여 보냄
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from typing import BinaryIO, Iterator, Optional, TextIO
+
+import httpx
+
+_TOTAL_KEYS = ("entriesCreated", "entriesExisting", "relationsLinked", "relationsFailed", "errorCount")
+
+
+class _Batch:
+    """f의 현재 위치부터 최대 limit 줄 (header가 있으면 맨 앞에 붙임)."""
+
+    def __init__(self, f: BinaryIO, limit: int, header: Optional[bytes] = None) -> None:
+        self.f = f
+        self.limit = limit
+        self.header = header
+        self.lines = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.header is not None:
+            yield self.header
+        while self.lines < self.limit:
+            line = self.f.readline()
+            if not line:
+                return
+            self.lines += 1
+            yield line if line.endswith(b"\n") else line + b"\n"
+
+
+def _load_checkpoint(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_checkpoint(path: str, state: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def run_import(client: httpx.Client, path: str, *, fmt: str = "ndjson", job: Optional[str] = None,
+               batch_lines: int = 50000, chunk_size: Optional[int] = None, checkpoint: Optional[str] = None,
+               retries: int = 3, out: TextIO = sys.stderr) -> dict:
+    """파일 전체를 가져오고 누적 결과(job, lines, 각 건수, errors 일부)를 반환. client는 base_url이 서버 주소."""
+    checkpoint = checkpoint or path + ".import.json"
+    state = _load_checkpoint(checkpoint)
+    if state is None:
+        state = {"job": job or str(uuid.uuid4()), "offset": 0, "line": 0, "errors": [],
+                 **{k: 0 for k in _TOTAL_KEYS}}
+    elif job is not None and job != state["job"]:
+        raise SystemExit(f"checkpoint {checkpoint} belongs to job {state['job']} (delete it to start over)")
+    else:
+        print(f"resuming job {state['job']} at line {state['line']}", file=out)
+
+    size = os.path.getsize(path)
+    started, start_line = time.perf_counter(), state["line"]
+    with open(path, "rb") as f:
+        header = f.readline() if fmt == "csv" else None
+        while state["offset"] < size:
+            # CSV의 이어지는 batch는 본문 1줄이 헤더 사본 → 줄 번호를 하나 당겨서 파일 기준으로 맞춤
+            resend_header = header if fmt == "csv" and state["offset"] > 0 else None
+            params = {"job": state["job"], "format": fmt,
+                      "line_offset": state["line"] - (1 if resend_header is not None else 0)}
+            if chunk_size:
+                params["chunk_size"] = chunk_size
+            for attempt in range(retries + 1):
+                f.seek(state["offset"])
+                batch = _Batch(f, batch_lines, resend_header)
+                try:
+                    resp = client.post("/v1/import", params=params, content=iter(batch))
+                    resp.raise_for_status()
+                    break
+                except httpx.HTTPError as e:
+                    # 4xx는 다시 보내도 같음 → 바로 중단 (체크포인트는 마지막 성공 batch)
+                    rejected = isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500
+                    if rejected or attempt == retries:
+                        raise
+                    print(f"batch at line {state['line']} failed ({e}), retrying", file=out)
+                    time.sleep(min(2 ** attempt, 30))
+            result = resp.json()
+            state["offset"] = f.tell()
+            state["line"] += batch.lines
+            for k in _TOTAL_KEYS:
+                state[k] += result[k]
+            state["errors"] = (state["errors"] + result["errors"])[:100]
+            _save_checkpoint(checkpoint, state)
+            elapsed = time.perf_counter() - started
+            print(f"line {state['line']} ({state['offset'] * 100 // max(size, 1)}%): "
+                  f"+{state['entriesCreated']} entries, +{state['relationsLinked']} relations, "
+                  f"{state['errorCount']} errors, {(state['line'] - start_line) / max(elapsed, 1e-9):.0f} lines/s",
+                  file=out)
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    return {"job": state["job"], "lines": state["line"], "errors": state["errors"],
+            **{k: state[k] for k in _TOTAL_KEYS}}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import NDJSON/CSV into DevAccountBook via /v1/import")
+    parser.add_argument("path")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default=None, help="default: by file extension")
+    parser.add_argument("--job", default=None, help="job id (default: new, or the one in the checkpoint)")
+    parser.add_argument("--batch-lines", type=int, default=50000, help="lines per request")
+    parser.add_argument("--chunk-size", type=int, default=None, help="rows per server transaction")
+    parser.add_argument("--checkpoint", default=None, help="default: <path>.import.json")
+    parser.add_argument("--retries", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    with httpx.Client(base_url=args.url, timeout=None) as client:
+        summary = run_import(client, args.path, fmt=fmt, job=args.job, batch_lines=args.batch_lines,
+                             chunk_size=args.chunk_size, checkpoint=args.checkpoint, retries=args.retries)
+    for error in summary["errors"]:
+        print(f"line {error['line']}: {error['message']}", file=sys.stderr)
+    print(json.dumps({k: v for k, v in summary.items() if k != "errors"}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
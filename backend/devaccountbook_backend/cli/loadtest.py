@@ -0,0 +1,290 @@
+"""
+HTTP 부하 생성기: 가상 사용자 N명이 목록/조회/관계/explore/검색/쓰기 요청을 섞어 보내고
+엔드포인트별 처리량, p50/p95/p99 지연, 오류율을 보고.
+
+    python -m devaccountbook_backend.cli.loadtest --url http://127.0.0.1:8000 --concurrency 1,8,32 --duration 20
+    python -m devaccountbook_backend.cli.loadtest --concurrency 16 --out load.json      # 프로세스 안 + 임시 SQLite
+
+- --url이 있으면 소켓으로 (run_server.py 등 떠 있는 서버), 없으면 main.app을 프로세스 안에서
+  httpx.ASGITransport로 호출 (lifespan 포함, 외부 서비스 없이 --storage sqlite 임시 파일이 기본)
+- 시작 전에 --seed-entries개 엔트리(fan-out 4 RELATES_TO 트리)를 /v1/import로 넣고 그 id를 대상으로 씀
+  (0이면 GET /v1/account-entries로 기존 id를 가져옴)
+- 닫힌 루프: 사용자마다 응답을 받은 뒤 --think-ms 쉬고 다음 요청. --concurrency 1,8,32처럼 주면 단계별로 반복
+  → 동시 사용자 수에 따른 처리량/지연 변화를 한 번에 확인. 각 단계 처음 --warmup초는 집계에서 제외
+- 쓰기는 새 엔트리 생성 / 제목 수정 / INFLUENCES 관계 추가 (RELATES_TO 트리 모양은 유지해 explore 지연이 단계마다 비교 가능)
+- 프로세스 안 모드는 부하 생성기와 서버가 같은 CPU를 쓰고 네트워크/HTTP 파싱 비용이 빠짐 → 용량 판단은 --url로
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, TextIO
+
+import httpx
+
+from devaccountbook_backend.services.account_entry_import import import_entry_id
+
+WORDS = ("ledger", "invoice", "budget", "payment", "refund", "salary", "rent", "travel", "server", "license",
+         "coffee", "book", "course", "hardware", "domain", "hosting", "tax", "bonus", "loan", "deposit")
+DEFAULT_MIX = "list=25,get=25,relations=15,explore=15,search=5,create=5,patch=5,link=5"
+SEED_FAN_OUT = 4
+
+
+@dataclass
+class LoadState:
+    """사용자들이 공유하는 대상 id (생성한 엔트리도 추가)."""
+    ids: List[str]
+    explore_max_nodes: int = 500
+
+
+# 작업: (client, state, rng) → 응답. 이름이 보고서의 엔드포인트 행
+Operation = Callable[[httpx.AsyncClient, LoadState, random.Random], Awaitable[httpx.Response]]
+
+
+async def _list(c: httpx.AsyncClient, s: LoadState, r: random.Random) -> httpx.Response:
+    return await c.get("/v1/account-entries", params={"limit": 50, "offset": r.choice((0, 0, 0, 50, 100))})
+
+
+async def _get(c: httpx.AsyncClient, s: LoadState, r: random.Random) -> httpx.Response:
+    return await c.get(f"/v1/account-entries/{r.choice(s.ids)}")
+
+
+async def _relations(c: httpx.AsyncClient, s: LoadState, r: random.Random) -> httpx.Response:
+    return await c.get(f"/v1/account-entries/{r.choice(s.ids)}/relations")
+
+
+async def _explore(c: httpx.AsyncClient, s: LoadState, r: random.Random) -> httpx.Response:
+    return await c.get(f"/v1/account-entries/{r.choice(s.ids)}/explore-start-leaf",
+                       params={"max_nodes": s.explore_max_nodes})
+
+
+async def _search(c: httpx.AsyncClient, s: LoadState, r: random.Random) -> httpx.Response:
+    return await c.get("/v1/account-entries/search", params={"q": r.choice(WORDS)})
+
+
+async def _create(c: httpx.AsyncClient, s: LoadState, r: random.Random) -> httpx.Response:
+    resp = await c.post("/v1/account-entries", json={"title": f"{r.choice(WORDS)} load", "tags": ["load"]})
+    if resp.status_code == 201:
+        s.ids.append(resp.json()["id"])
+    return resp
+
+
+async def _patch(c: httpx.AsyncClient, s: LoadState, r: random.Random) -> httpx.Response:
+    return await c.patch(f"/v1/account-entries/{r.choice(s.ids)}", json={"desc": f"load {r.random():.6f}"})
+
+
+async def _link(c: httpx.AsyncClient, s: LoadState, r: random.Random) -> httpx.Response:
+    from_id, to_id = r.sample(s.ids, 2)
+    return await c.post(f"/v1/account-entries/{from_id}/relations", json={"toId": to_id, "kind": "INFLUENCES"})
+
+
+OPERATIONS: Dict[str, tuple[str, Operation]] = {
+    "list": ("GET /account-entries", _list),
+    "get": ("GET /account-entries/{id}", _get),
+    "relations": ("GET /account-entries/{id}/relations", _relations),
+    "explore": ("GET /account-entries/{id}/explore-start-leaf", _explore),
+    "search": ("GET /account-entries/search", _search),
+    "create": ("POST /account-entries", _create),
+    "patch": ("PATCH /account-entries/{id}", _patch),
+    "link": ("POST /account-entries/{id}/relations", _link),
+}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """"list=25,get=25,..." → {작업: 가중치} (0인 항목은 제외)."""
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"unknown operation: {name} (choose from {', '.join(OPERATIONS)})")
+        if float(weight or 1) > 0:
+            mix[name] = float(weight or 1)
+    if not mix:
+        raise ValueError("empty mix")
+    return mix
+
+
+def percentile(ordered: Sequence[float], q: float) -> float:
+    # nearest-rank (ordered는 정렬된 값)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered) / 100) - 1))]
+
+
+@dataclass
+class _Stats:
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Counter = field(default_factory=Counter)
+    statuses: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+
+    def record(self, endpoint: str, seconds: float, status: str, ok: bool) -> None:
+        self.latencies[endpoint].append(seconds * 1e3)
+        self.statuses[endpoint][status] += 1
+        if not ok:
+            self.errors[endpoint] += 1
+
+
+def _summary(latencies: List[float], errors: int, seconds: float, statuses: Counter) -> dict:
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count, "errors": errors, "error_rate": round(errors / count, 4) if count else 0.0,
+        "rps": round(count / seconds, 1) if seconds > 0 else 0.0,
+        "p50_ms": round(percentile(ordered, 50), 2), "p95_ms": round(percentile(ordered, 95), 2),
+        "p99_ms": round(percentile(ordered, 99), 2), "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+async def _user(client: httpx.AsyncClient, state: LoadState, mix: Dict[str, float], rng: random.Random,
+                stats: _Stats, measure_from: float, stop_at: float, think: float) -> None:
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < stop_at:
+        endpoint, op = OPERATIONS[rng.choices(names, weights)[0]]
+        started = time.perf_counter()
+        try:
+            resp = await op(client, state, rng)
+            status, ok = str(resp.status_code), resp.status_code < 400
+        except httpx.HTTPError as e:
+            status, ok = type(e).__name__, False
+        if started >= measure_from:
+            stats.record(endpoint, time.perf_counter() - started, status, ok)
+        if think:
+            await asyncio.sleep(think)
+
+
+async def run_load(client: httpx.AsyncClient, state: LoadState, *, concurrency: int, duration: float,
+                   mix: Optional[Dict[str, float]] = None, warmup: float = 0.0, think_ms: float = 0.0,
+                   seed: int = 0) -> dict:
+    """동시 사용자 concurrency명으로 warmup + duration초 동안 부하 → 단계 결과 (total + 엔드포인트별)."""
+    mix = mix or parse_mix(DEFAULT_MIX)
+    stats = _Stats()
+    start = time.perf_counter()
+    measure_from, stop_at = start + warmup, start + warmup + duration
+    await asyncio.gather(*(
+        _user(client, state, mix, random.Random(seed * 100003 + i), stats, measure_from, stop_at, think_ms / 1e3)
+        for i in range(concurrency)))
+    # 마지막 응답이 stop_at을 넘겨 끝날 수 있으므로 실제 측정 구간으로 나눔
+    seconds = max(time.perf_counter() - measure_from, 1e-9)
+    all_latencies = [x for v in stats.latencies.values() for x in v]
+    all_statuses = sum(stats.statuses.values(), Counter())
+    return {
+        "concurrency": concurrency, "seconds": round(seconds, 3),
+        "total": _summary(all_latencies, sum(stats.errors.values()), seconds, all_statuses),
+        "endpoints": {name: _summary(stats.latencies[name], stats.errors[name], seconds, stats.statuses[name])
+                      for name in sorted(stats.latencies)},
+    }
+
+
+def seed_lines(count: int, rng: random.Random) -> List[str]:
+    """엔트리 count개 + fan-out SEED_FAN_OUT RELATES_TO 트리 (import NDJSON 행)."""
+    lines = [json.dumps({"type": "entry", "id": str(i), "title": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}",
+                         "desc": " ".join(rng.choices(WORDS, k=6)), "tags": rng.sample(WORDS[:8], 2)})
+             for i in range(count)]
+    lines += [json.dumps({"type": "relation", "fromId": str((i - 1) // SEED_FAN_OUT), "toId": str(i),
+                          "kind": "RELATES_TO"}) for i in range(1, count)]
+    return lines
+
+
+async def prepare_state(client: httpx.AsyncClient, *, seed_entries: int, seed: int = 0,
+                        explore_max_nodes: int = 500, out: TextIO = sys.stderr) -> LoadState:
+    if seed_entries <= 0:
+        resp = await client.get("/v1/account-entries", params={"limit": 200})
+        resp.raise_for_status()
+        ids = [e["id"] for e in resp.json()]
+        if len(ids) < 2:
+            raise SystemExit("need at least 2 existing entries (or use --seed-entries)")
+        return LoadState(ids, explore_max_nodes)
+
+    job = f"loadtest-{seed}-{seed_entries}"
+    started = time.perf_counter()
+    resp = await client.post("/v1/import", params={"job": job},
+                             content="\n".join(seed_lines(seed_entries, random.Random(seed))))
+    resp.raise_for_status()
+    print(f"seeded {seed_entries} entries in {time.perf_counter() - started:.1f}s (job {job})", file=out)
+    return LoadState([import_entry_id(job, str(i)) for i in range(seed_entries)], explore_max_nodes)
+
+
+@asynccontextmanager
+async def in_process_client(storage: str, sqlite_path: Optional[str]) -> AsyncIterator[httpx.AsyncClient]:
+    """main.app을 lifespan과 함께 띄우고 ASGITransport로 호출하는 클라이언트."""
+    from devaccountbook_backend.core.config import settings
+    settings.storage_backend = storage
+    with tempfile.TemporaryDirectory() as tmp:
+        if storage == "sqlite":
+            settings.sqlite_path = sqlite_path or os.path.join(tmp, "loadtest.db")
+        # 라우터 선택이 import 시점의 settings를 따르므로 설정 후 import
+        from devaccountbook_backend.main import app
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+                yield client
+
+
+def print_step(step: dict, out: TextIO = sys.stdout) -> None:
+    total = step["total"]
+    print(f"\nconcurrency {step['concurrency']}: {total['requests']} requests in {step['seconds']:.1f}s "
+          f"({total['rps']} req/s), errors {total['error_rate'] * 100:.2f}%", file=out)
+    print(f"{'endpoint':<46} {'count':>7} {'req/s':>8} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}",
+          file=out)
+    for name, s in [*step["endpoints"].items(), ("total", total)]:
+        print(f"{name:<46} {s['requests']:>7} {s['rps']:>8.1f} {s['error_rate'] * 100:>6.2f} {s['p50_ms']:>8.2f} "
+              f"{s['p95_ms']:>8.2f} {s['p99_ms']:>8.2f} {s['max_ms']:>8.2f}", file=out)
+
+
+async def _main(args) -> dict:
+    mix = parse_mix(args.mix)
+    steps = [int(c) for c in args.concurrency.split(",") if c]
+    if args.url:
+        limits = httpx.Limits(max_connections=max(steps), max_keepalive_connections=max(steps))
+        client_cm = httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limits)
+    else:
+        client_cm = in_process_client(args.storage, args.sqlite_path)
+    async with client_cm as client:
+        state = await prepare_state(client, seed_entries=args.seed_entries, seed=args.seed,
+                                    explore_max_nodes=args.explore_max_nodes)
+        results = []
+        for concurrency in steps:
+            step = await run_load(client, state, concurrency=concurrency, duration=args.duration, mix=mix,
+                                  warmup=args.warmup, think_ms=args.think_ms, seed=args.seed)
+            print_step(step)
+            results.append(step)
+    return {"meta": {"target": args.url or f"in-process ({args.storage})", "mix": mix, "duration": args.duration,
+                     "warmup": args.warmup, "think_ms": args.think_ms, "seed_entries": args.seed_entries},
+            "steps": results}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="HTTP load test for the DevAccountBook API")
+    parser.add_argument("--url", default=None, help="server base URL (default: run main.app in-process)")
+    parser.add_argument("--storage", choices=["sqlite", "neo4j"], default="sqlite", help="in-process storage backend")
+    parser.add_argument("--sqlite-path", default=None, help="in-process sqlite file (default: temporary)")
+    parser.add_argument("--concurrency", default="8", help="virtual users; comma separated for steps (1,8,32)")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per step")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds at the start of each step")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="pause after each response per user")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"operation weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--seed-entries", type=int, default=2000, help="entries to import first (0: use existing)")
+    parser.add_argument("--explore-max-nodes", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30.0, help="request timeout (--url)")
+    parser.add_argument("--out", default=None, help="write the report JSON here")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_main(args))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
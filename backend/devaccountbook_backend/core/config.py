@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
@@ -7,10 +8,48 @@ load_dotenv()
 
 
 class Settings(BaseModel):
+    # 저장소 백엔드: "neo4j" | "sqlite" (sqlite는 외부 서버 없이 로컬 파일 사용)
+    storage_backend: str = os.getenv("STORAGE_BACKEND", "neo4j")
+    sqlite_path: str = os.getenv("SQLITE_PATH", "devaccountbook.db")
     neo4j_uri: str = os.getenv("NEO4J_URI", "bolt://localhost:7687")
     neo4j_user: str = os.getenv("NEO4J_USER", "neo4j")
     neo4j_password: str = os.getenv("NEO4J_PASSWORD", "neo4jneo4j")
+    # 커넥션 풀 (시간 단위: 초). liveness 값이 비어 있으면 드라이버 기본값(검사 안 함)
+    neo4j_max_connection_pool_size: int = int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "100"))
+    neo4j_connection_acquisition_timeout: float = float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60"))
+    neo4j_max_connection_lifetime: float = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+    neo4j_liveness_check_timeout: Optional[float] = (
+        float(os.environ["NEO4J_LIVENESS_CHECK_TIMEOUT"]) if os.getenv("NEO4J_LIVENESS_CHECK_TIMEOUT") else None
+    )
+    # lifespan에서 미리 열어둘 커넥션 수 (verify_connectivity 후)
+    neo4j_pool_min_size: int = int(os.getenv("NEO4J_POOL_MIN_SIZE", "0"))
+    # true면 AsyncGraphDatabase + async 라우트 (neo4j 백엔드 전용, false면 기존 동기 경로)
+    neo4j_async: bool = os.getenv("NEO4J_ASYNC", "false").lower() == "true"
     cors_origins: list[str] = [o for o in os.getenv("API_CORS_ORIGINS", "").split(",") if o] or ["*"]
+    # 배치 쓰기 시 UNWIND 한 번에 보내는 행 수
+    batch_chunk_size: int = int(os.getenv("BATCH_CHUNK_SIZE", "1000"))
+    # 가져오기에서 한 쓰기 트랜잭션에 담는 행 수 (요청의 chunk_size로 바꿀 수 있음)
+    import_chunk_size: int = int(os.getenv("IMPORT_CHUNK_SIZE", "5000"))
+    # bounded 트리 탐색에서 max_nodes 미지정 시 노드 상한
+    tree_max_nodes: int = int(os.getenv("TREE_MAX_NODES", "10000"))
+    # 메모리 그래프 인덱스 (단일 프로세스 배포 전용: 다른 프로세스의 쓰기는 반영되지 않음)
+    # 트리(깊이 제한 없는 explore 포함), 관계, 도달 여부를 메모리에서 처리 → 켜고 꺼도 응답 모양은 같음
+    graph_index_enabled: bool = os.getenv("GRAPH_INDEX_ENABLED", "false").lower() == "true"
+    # 그래프 인덱스에 RELATES_TO 전이 폐쇄도 유지 (메모리 = 도달 가능한 쌍 수, false면 조회 시 BFS)
+    graph_reach_index_enabled: bool = os.getenv("GRAPH_REACH_INDEX_ENABLED", "true").lower() == "true"
+    # 트리/관계 조회 캐시 항목 수 (0이면 비활성화, 기본 0). 쓰기마다 전체 무효화
+    # 단일 프로세스 배포 전용: 다른 프로세스의 쓰기는 version을 올리지 않아 오래된 결과/ETag가 남음 (graph_index_enabled와 같음)
+    graph_cache_size: int = int(os.getenv("GRAPH_CACHE_SIZE", "0"))
+
+    def neo4j_driver_config(self) -> dict:
+        config = {
+            "max_connection_pool_size": self.neo4j_max_connection_pool_size,
+            "connection_acquisition_timeout": self.neo4j_connection_acquisition_timeout,
+            "max_connection_lifetime": self.neo4j_max_connection_lifetime,
+        }
+        if self.neo4j_liveness_check_timeout is not None:
+            config["liveness_check_timeout"] = self.neo4j_liveness_check_timeout
+        return config
 
 
 settings = Settings()
@@ -0,0 +1,26 @@
+from typing import Callable, Iterable, List, Tuple
+
+# (이름, 타입, 설명, 값) - Prometheus text exposition 형식으로 출력
+Sample = Tuple[str, str, str, float]
+
+_collectors: List[Callable[[], Iterable[Sample]]] = []
+
+
+def register_collector(collector: Callable[[], Iterable[Sample]]) -> None:
+    if collector not in _collectors:
+        _collectors.append(collector)
+
+
+def unregister_collector(collector: Callable[[], Iterable[Sample]]) -> None:
+    if collector in _collectors:
+        _collectors.remove(collector)
+
+
+def render_metrics() -> str:
+    lines = []
+    for collector in list(_collectors):
+        for name, kind, help_text, value in collector():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,58 @@
+from typing import Optional
+
+from neo4j import AsyncGraphDatabase, basic_auth, AsyncDriver
+
+from devaccountbook_backend.core.metrics import register_collector, unregister_collector
+from .pool_metrics import PoolMetrics, instrument_pool, pool_snapshot, pool_samples
+
+async_driver = None  # type: Optional[AsyncDriver]
+pool_metrics = PoolMetrics()
+
+
+def init_async_driver(uri: str, user: str, password: str, **config):
+    # config: 풀 설정 (Settings.neo4j_driver_config 참고)
+    global async_driver, pool_metrics
+    async_driver = AsyncGraphDatabase.driver(uri, auth=basic_auth(user, password), **config)
+    pool_metrics = PoolMetrics()
+    instrument_pool(async_driver, pool_metrics)
+    register_collector(_collect)
+
+
+async def warm_up_async_driver(min_connections: int = 0):
+    # 연결 확인 + 커넥션 min_connections개를 동시에 열어 풀에 채워둠 (첫 요청의 핸드셰이크 비용 제거)
+    d = get_async_driver()
+    await d.verify_connectivity()
+    opened = []
+    try:
+        for _ in range(min_connections):
+            session = d.session()
+            opened.append(session)
+            tx = await session.begin_transaction()
+            opened.append(tx)
+            await (await tx.run("RETURN 1")).consume()
+    finally:
+        for resource in reversed(opened):
+            await resource.close()
+
+
+async def close_async_driver():
+    global async_driver
+    unregister_collector(_collect)
+    if async_driver:
+        await async_driver.close()
+        async_driver = None
+
+
+def get_async_driver() -> AsyncDriver:
+    global async_driver
+    if async_driver is None:
+        raise RuntimeError("Neo4j async driver not initialized")
+    return async_driver
+
+
+def get_async_pool_stats() -> dict:
+    return pool_snapshot(get_async_driver(), pool_metrics)
+
+
+def _collect():
+    return pool_samples(get_async_pool_stats()) if async_driver is not None else []
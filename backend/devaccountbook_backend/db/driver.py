@@ -2,16 +2,42 @@ from typing import Optional
 
 from neo4j import GraphDatabase, basic_auth, Driver
 
-driver = None  # type: Optional[Driver]
-
+from devaccountbook_backend.core.metrics import register_collector, unregister_collector
+from .pool_metrics import PoolMetrics, instrument_pool, pool_snapshot, pool_samples
 
-def init_driver(uri: str, user: str, password: str):
-    global driver
-    driver = GraphDatabase.driver(uri, auth=basic_auth(user, password))
+driver = None  # type: Optional[Driver]
+pool_metrics = PoolMetrics()
+
+
+def init_driver(uri: str, user: str, password: str, **config):
+    # config: 풀 설정 (Settings.neo4j_driver_config 참고)
+    global driver, pool_metrics
+    driver = GraphDatabase.driver(uri, auth=basic_auth(user, password), **config)
+    pool_metrics = PoolMetrics()
+    instrument_pool(driver, pool_metrics)
+    register_collector(_collect)
+
+
+def warm_up_driver(min_connections: int = 0):
+    # 연결 확인 + 커넥션 min_connections개를 동시에 열어 풀에 채워둠 (첫 요청의 핸드셰이크 비용 제거)
+    d = get_driver()
+    d.verify_connectivity()
+    opened = []
+    try:
+        for _ in range(min_connections):
+            session = d.session()
+            opened.append(session)
+            tx = session.begin_transaction()
+            opened.append(tx)
+            tx.run("RETURN 1").consume()
+    finally:
+        for resource in reversed(opened):
+            resource.close()
 
 
 def close_driver():
     global driver
+    unregister_collector(_collect)
     if driver:
         driver.close()
         driver = None
@@ -22,3 +48,11 @@ def get_driver() -> Driver:
     if driver is None:
         raise RuntimeError("Neo4j driver not initialized")
     return driver
+
+
+def get_pool_stats() -> dict:
+    return pool_snapshot(get_driver(), pool_metrics)
+
+
+def _collect():
+    return pool_samples(get_pool_stats()) if driver is not None else []
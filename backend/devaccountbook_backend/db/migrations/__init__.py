@@ -0,0 +1,5 @@
+from .migration import Migration
+from .neo4j_migrations import NEO4J_MIGRATIONS, migrate_neo4j, migrate_neo4j_async
+from .sqlite_migrations import SQLITE_MIGRATIONS, migrate_sqlite
+
+__all__ = ["Migration", "NEO4J_MIGRATIONS", "migrate_neo4j", "migrate_neo4j_async", "SQLITE_MIGRATIONS", "migrate_sqlite"]
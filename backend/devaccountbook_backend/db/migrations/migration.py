@@ -0,0 +1,20 @@
+from typing import Sequence
+
+from pydantic import BaseModel, ConfigDict
+
+
+class Migration(BaseModel):
+    """
+    스키마 버전 1개 = 순서대로 실행할 DDL 묶음.
+    - version은 1부터 증가, 이미 적용된 버전은 다시 실행하지 않음
+    - 적용된 migration은 수정하지 말고 새 버전을 추가할 것
+    """
+    model_config = ConfigDict(frozen=True)
+
+    version: int
+    description: str
+    statements: Sequence[str]
+
+
+def pending(migrations: Sequence[Migration], applied: set[int]) -> list[Migration]:
+    return sorted((m for m in migrations if m.version not in applied), key=lambda m: m.version)
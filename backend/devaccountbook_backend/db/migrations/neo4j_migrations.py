@@ -0,0 +1,101 @@
+import logging
+from typing import List
+
+from neo4j import Session, AsyncSession
+
+from .migration import Migration, pending
+
+logger = logging.getLogger(__name__)
+
+# 데이터 backfill을 한 트랜잭션에 몰지 않도록 나눠 커밋하는 행 수 (CALL { ... } IN TRANSACTIONS)
+BACKFILL_BATCH_ROWS = 1000
+
+# 적용 기록: (:SchemaMigration {version, description, appliedAt})
+NEO4J_MIGRATIONS: List[Migration] = [
+    Migration(version=1, description="unique ids", statements=[
+        "CREATE CONSTRAINT schema_migration_version IF NOT EXISTS FOR (m:SchemaMigration) REQUIRE m.version IS UNIQUE",
+        "CREATE CONSTRAINT account_entry_id IF NOT EXISTS FOR (n:AccountEntry) REQUIRE n.id IS UNIQUE",
+    ]),
+    Migration(version=2, description="createdAt/updatedAt range indexes", statements=[
+        "CREATE RANGE INDEX account_entry_created_at IF NOT EXISTS FOR (n:AccountEntry) ON (n.createdAt)",
+        "CREATE RANGE INDEX account_entry_updated_at IF NOT EXISTS FOR (n:AccountEntry) ON (n.updatedAt)",
+    ]),
+    Migration(version=3, description="full-text index on title/desc", statements=[
+        "CREATE FULLTEXT INDEX account_entry_text IF NOT EXISTS FOR (n:AccountEntry) ON EACH [n.title, n.desc]",
+    ]),
+    # 태그 필터/집계용 정규화: (:AccountEntry)-[:TAGGED]->(:Tag {name}) (이후 생성/수정 쿼리가 유지)
+    # backfill은 엔트리 BACKFILL_BATCH_ROWS개씩 커밋 (대량 데이터에서 트랜잭션 메모리 한도 회피, MERGE라 재실행 안전)
+    Migration(version=4, description="normalized tags", statements=[
+        "CREATE CONSTRAINT tag_name IF NOT EXISTS FOR (t:Tag) REQUIRE t.name IS UNIQUE",
+        f"""
+        MATCH (n:AccountEntry) WHERE size(coalesce(n.tags, [])) > 0
+        CALL {{
+            WITH n
+            UNWIND n.tags AS name
+            MERGE (t:Tag {{name: name}})
+            MERGE (n)-[:TAGGED]->(t)
+        }} IN TRANSACTIONS OF {BACKFILL_BATCH_ROWS} ROWS
+        """,
+    ]),
+    # 검색: 엔트리 title/desc(v3 account_entry_text) + 태그 이름
+    Migration(version=5, description="full-text index on tag names", statements=[
+        "CREATE FULLTEXT INDEX tag_name_text IF NOT EXISTS FOR (t:Tag) ON EACH [t.name]",
+    ]),
+]
+
+
+Q_APPLIED = "MATCH (m:SchemaMigration) RETURN m.version AS version"
+Q_RECORD = """
+MERGE (m:SchemaMigration {version: $version})
+ON CREATE SET m.description = $description, m.appliedAt = datetime()
+"""
+
+
+# CALL { ... } IN TRANSACTIONS는 관리 트랜잭션(execute_write) 안에서 실행할 수 없어 auto-commit(session.run)
+def _auto_commit(statement: str) -> bool:
+    return "IN TRANSACTIONS" in statement
+
+
+def _applied_versions(session: Session) -> set[int]:
+    return {row["version"] for row in session.execute_read(lambda tx: list(tx.run(Q_APPLIED)))}
+
+
+def migrate_neo4j(session: Session, migrations: List[Migration] = NEO4J_MIGRATIONS) -> List[int]:
+    """
+    미적용 버전만 순서대로 실행하고 적용한 버전 목록을 반환.
+    - Neo4j는 스키마 변경과 데이터 쓰기를 한 트랜잭션에 섞을 수 없어 문장마다 별도 트랜잭션
+    - 모든 DDL이 IF NOT EXISTS라 여러 프로세스가 동시에 올라와도 안전 (기록은 MERGE)
+    - 배치 backfill(IN TRANSACTIONS)은 auto-commit으로 실행 (드라이버 재시도 없음, 실패 시 다음 기동에서 재실행)
+    """
+    applied = []
+    for m in pending(migrations, _applied_versions(session)):
+        for statement in m.statements:
+            if _auto_commit(statement):
+                session.run(statement).consume()
+            else:
+                session.execute_write(lambda tx: tx.run(statement).consume())
+        session.execute_write(lambda tx: tx.run(Q_RECORD, version=m.version, description=m.description).consume())
+        logger.info("neo4j schema migration %d applied: %s", m.version, m.description)
+        applied.append(m.version)
+    return applied
+
+
+# 비동기 드라이버용 (동작은 migrate_neo4j와 동일)
+async def migrate_neo4j_async(session: AsyncSession, migrations: List[Migration] = NEO4J_MIGRATIONS) -> List[int]:
+    async def read_applied(tx):
+        return {row["version"] async for row in await tx.run(Q_APPLIED)}
+
+    async def run(tx, statement, **params):
+        await (await tx.run(statement, **params)).consume()
+
+    applied = []
+    for m in pending(migrations, await session.execute_read(read_applied)):
+        for statement in m.statements:
+            if _auto_commit(statement):
+                await (await session.run(statement)).consume()
+            else:
+                await session.execute_write(run, statement)
+        await session.execute_write(run, Q_RECORD, version=m.version, description=m.description)
+        logger.info("neo4j schema migration %d applied: %s", m.version, m.description)
+        applied.append(m.version)
+    return applied
@@ -0,0 +1,160 @@
+import logging
+import sqlite3
+from typing import List
+
+from .migration import Migration, pending
+
+logger = logging.getLogger(__name__)
+
+# desc는 SQL 예약어라 컬럼명은 description
+SQLITE_MIGRATIONS: List[Migration] = [
+    Migration(version=1, description="entries and relations", statements=[
+        """
+        CREATE TABLE IF NOT EXISTS account_entry (
+            id          TEXT PRIMARY KEY,
+            title       TEXT NOT NULL,
+            description TEXT,
+            tags        TEXT NOT NULL DEFAULT '[]',
+            created_at  TEXT NOT NULL,
+            updated_at  TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS account_entry_created_at ON account_entry (created_at DESC, id DESC)",
+        """
+        CREATE TABLE IF NOT EXISTS account_entry_relation (
+            from_id TEXT NOT NULL REFERENCES account_entry (id) ON DELETE CASCADE,
+            kind    TEXT NOT NULL,
+            to_id   TEXT NOT NULL REFERENCES account_entry (id) ON DELETE CASCADE,
+            props   TEXT NOT NULL DEFAULT '{}',
+            PRIMARY KEY (from_id, kind, to_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS account_entry_relation_to ON account_entry_relation (to_id, kind, from_id)",
+    ]),
+    Migration(version=2, description="updated_at index", statements=[
+        "CREATE INDEX IF NOT EXISTS account_entry_updated_at ON account_entry (updated_at)",
+    ]),
+    # RELATES_TO 전이 폐쇄: 길이 1 이상 경로로 ancestor → descendant 도달 (저장소가 관계 쓰기마다 갱신)
+    Migration(version=3, description="RELATES_TO reachability closure", statements=[
+        """
+        CREATE TABLE IF NOT EXISTS account_entry_reach (
+            ancestor   TEXT NOT NULL REFERENCES account_entry (id) ON DELETE CASCADE,
+            descendant TEXT NOT NULL REFERENCES account_entry (id) ON DELETE CASCADE,
+            PRIMARY KEY (ancestor, descendant)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS account_entry_reach_descendant ON account_entry_reach (descendant, ancestor)",
+        """
+        INSERT OR IGNORE INTO account_entry_reach (ancestor, descendant)
+        WITH RECURSIVE reach(root, id) AS (
+            SELECT from_id, to_id FROM account_entry_relation WHERE kind = 'RELATES_TO'
+            UNION
+            SELECT reach.root, r.to_id FROM reach JOIN account_entry_relation r ON r.from_id = reach.id
+            WHERE r.kind = 'RELATES_TO'
+        )
+        SELECT root, id FROM reach
+        """,
+    ]),
+    # 태그 필터/집계용 정규화 (tags JSON 컬럼은 응답용으로 유지, 저장소가 쓰기마다 함께 갱신)
+    Migration(version=4, description="normalized tags", statements=[
+        """
+        CREATE TABLE IF NOT EXISTS account_entry_tag (
+            tag      TEXT NOT NULL,
+            entry_id TEXT NOT NULL REFERENCES account_entry (id) ON DELETE CASCADE,
+            PRIMARY KEY (tag, entry_id)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS account_entry_tag_entry ON account_entry_tag (entry_id)",
+        """
+        INSERT OR IGNORE INTO account_entry_tag (tag, entry_id)
+        SELECT t.value, e.id FROM account_entry e, json_each(e.tags) t
+        """,
+    ]),
+    # 검색: account_entry를 content로 하는 FTS5 (트리거가 쓰기마다 동기화, tags는 JSON 문자열 그대로 토큰화)
+    Migration(version=5, description="full-text search", statements=[
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS account_entry_fts USING fts5(
+            title, description, tags, content='account_entry', content_rowid='rowid'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS account_entry_fts_insert AFTER INSERT ON account_entry BEGIN
+            INSERT INTO account_entry_fts (rowid, title, description, tags)
+            VALUES (new.rowid, new.title, new.description, new.tags);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS account_entry_fts_delete AFTER DELETE ON account_entry BEGIN
+            INSERT INTO account_entry_fts (account_entry_fts, rowid, title, description, tags)
+            VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS account_entry_fts_update AFTER UPDATE ON account_entry BEGIN
+            INSERT INTO account_entry_fts (account_entry_fts, rowid, title, description, tags)
+            VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+            INSERT INTO account_entry_fts (rowid, title, description, tags)
+            VALUES (new.rowid, new.title, new.description, new.tags);
+        END
+        """,
+        "INSERT INTO account_entry_fts (account_entry_fts) VALUES ('rebuild')",
+    ]),
+    # 전체 개수: count(*) 스캔 대신 트리거가 쓰기마다 유지하는 카운터 행
+    Migration(version=6, description="entry counter", statements=[
+        """
+        CREATE TABLE IF NOT EXISTS account_entry_counter (
+            name  TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        ) WITHOUT ROWID
+        """,
+        """
+        INSERT OR REPLACE INTO account_entry_counter (name, value)
+        SELECT 'entries', count(*) FROM account_entry
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS account_entry_count_insert AFTER INSERT ON account_entry BEGIN
+            UPDATE account_entry_counter SET value = value + 1 WHERE name = 'entries';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS account_entry_count_delete AFTER DELETE ON account_entry BEGIN
+            UPDATE account_entry_counter SET value = value - 1 WHERE name = 'entries';
+        END
+        """,
+    ]),
+]
+
+
+def migrate_sqlite(conn: sqlite3.Connection, migrations: List[Migration] = SQLITE_MIGRATIONS) -> List[int]:
+    """
+    미적용 버전만 순서대로 실행하고 적용한 버전 목록을 반환.
+    - 버전마다 BEGIN IMMEDIATE 트랜잭션 (SQLite DDL은 트랜잭션 지원 → 실패 시 버전 단위 롤백)
+    - 적용 기록은 schema_migration 테이블
+    """
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS schema_migration ("
+        "version INTEGER PRIMARY KEY, description TEXT NOT NULL, applied_at TEXT NOT NULL)"
+    )
+    done = {row[0] for row in conn.execute("SELECT version FROM schema_migration")}
+    applied = []
+    for m in pending(migrations, done):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 프로세스가 먼저 적용했을 수 있으므로 쓰기 잠금을 잡은 뒤 확인
+            if conn.execute("SELECT 1 FROM schema_migration WHERE version = ?", (m.version,)).fetchone():
+                conn.execute("COMMIT")
+                continue
+            for statement in m.statements:
+                conn.execute(statement)
+            conn.execute(
+                "INSERT INTO schema_migration (version, description, applied_at) "
+                "VALUES (?, ?, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))",
+                (m.version, m.description),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        logger.info("sqlite schema migration %d applied: %s", m.version, m.description)
+        applied.append(m.version)
+    return applied
@@ -1,5 +1,6 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
+from .async_driver import get_async_driver
 from .driver import get_driver
 
 
@@ -8,3 +9,10 @@ def get_neo4j_session() -> Generator:
     driver = get_driver()
     with driver.session() as session:  # type: ignore[attr-defined]
         yield session
+
+
+async def get_neo4j_async_session() -> AsyncGenerator:
+    # 요청 단위 비동기 세션 (자동 close)
+    driver = get_async_driver()
+    async with driver.session() as session:
+        yield session
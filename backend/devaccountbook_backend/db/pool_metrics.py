@@ -0,0 +1,100 @@
+import inspect
+import threading
+import time
+from functools import wraps
+
+
+class PoolMetrics:
+    """
+    Neo4j 커넥션 풀 통계.
+    - 획득 대기 시간: 드라이버 풀의 acquire를 감싸서 측정 (instrument_pool)
+    - in-use/idle: 드라이버 풀의 현재 커넥션 목록에서 계산 (pool_snapshot)
+    드라이버 공개 API에는 풀 통계가 없어 내부 속성(_pool)을 읽음 → 없으면 0으로 보고
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.acquire_failures = 0
+        self.acquire_wait_seconds_total = 0.0
+        self.acquire_wait_seconds_max = 0.0
+
+    def observe(self, seconds: float, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self.acquisitions += 1
+            else:
+                self.acquire_failures += 1
+            self.acquire_wait_seconds_total += seconds
+            self.acquire_wait_seconds_max = max(self.acquire_wait_seconds_max, seconds)
+
+
+def instrument_pool(driver, metrics: PoolMetrics) -> bool:
+    # 동기/비동기 드라이버 모두 지원. 풀을 찾지 못하면 False
+    pool = getattr(driver, "_pool", None)
+    acquire = getattr(pool, "acquire", None)
+    if acquire is None:
+        return False
+
+    if inspect.iscoroutinefunction(acquire):
+        @wraps(acquire)
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            ok = False
+            try:
+                connection = await acquire(*args, **kwargs)
+                ok = True
+                return connection
+            finally:
+                metrics.observe(time.perf_counter() - started, ok)
+    else:
+        @wraps(acquire)
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            ok = False
+            try:
+                connection = acquire(*args, **kwargs)
+                ok = True
+                return connection
+            finally:
+                metrics.observe(time.perf_counter() - started, ok)
+
+    pool.acquire = timed
+    return True
+
+
+def pool_snapshot(driver, metrics: PoolMetrics) -> dict:
+    in_use = idle = 0
+    pool = getattr(driver, "_pool", None)
+    for connections in list(getattr(pool, "connections", {}).values()):
+        for connection in list(connections):
+            if getattr(connection, "in_use", False):
+                in_use += 1
+            else:
+                idle += 1
+    max_size = getattr(getattr(pool, "pool_config", None), "max_connection_pool_size", 0)
+    return {
+        "in_use": in_use,
+        "idle": idle,
+        "max_size": max_size,
+        "acquisitions": metrics.acquisitions,
+        "acquire_failures": metrics.acquire_failures,
+        "acquire_wait_seconds_total": metrics.acquire_wait_seconds_total,
+        "acquire_wait_seconds_max": metrics.acquire_wait_seconds_max,
+    }
+
+
+def pool_samples(snapshot: dict) -> list:
+    return [
+        ("neo4j_pool_connections_in_use", "gauge", "Connections currently checked out", snapshot["in_use"]),
+        ("neo4j_pool_connections_idle", "gauge", "Idle connections kept in the pool", snapshot["idle"]),
+        ("neo4j_pool_max_size", "gauge", "Configured max connection pool size", snapshot["max_size"]),
+        ("neo4j_pool_acquisitions_total", "counter", "Successful connection acquisitions",
+         snapshot["acquisitions"]),
+        ("neo4j_pool_acquire_failures_total", "counter", "Failed or timed out connection acquisitions",
+         snapshot["acquire_failures"]),
+        ("neo4j_pool_acquire_wait_seconds_total", "counter", "Total time spent waiting for a connection",
+         snapshot["acquire_wait_seconds_total"]),
+        ("neo4j_pool_acquire_wait_seconds_max", "gauge", "Longest wait for a connection",
+         snapshot["acquire_wait_seconds_max"]),
+    ]
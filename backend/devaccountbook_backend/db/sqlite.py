@@ -0,0 +1,36 @@
+import sqlite3
+from typing import Generator, Optional
+
+database_path = None  # type: Optional[str]
+
+
+def connect_sqlite(path: str) -> sqlite3.Connection:
+    # 트랜잭션은 저장소에서 BEGIN/COMMIT으로 직접 관리 (isolation_level=None)
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA busy_timeout = 5000")
+    return conn
+
+
+def init_sqlite(path: str):
+    global database_path
+    database_path = path
+
+
+def close_sqlite():
+    global database_path
+    database_path = None
+
+
+def get_sqlite_connection() -> Generator:
+    # 요청 단위 커넥션 (자동 close)
+    if database_path is None:
+        raise RuntimeError("SQLite database not initialized")
+    conn = connect_sqlite(database_path)
+    try:
+        yield conn
+    finally:
+        conn.close()
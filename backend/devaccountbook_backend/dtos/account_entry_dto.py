@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from devaccountbook_backend.schemas.common_enum import RelKind
+from devaccountbook_backend.models.account_entry_domain import AccountEntryNode
+from devaccountbook_backend.schemas.common_enum import RelKind, RelationOp
 
 
 class AccountEntryNodeCreateDTO(BaseModel):
@@ -17,6 +18,11 @@ class AccountEntryNodeCreateDTO(BaseModel):
     tags: List[str] = Field(default_factory=list)
 
 
+class AccountEntryNodeImportDTO(AccountEntryNodeCreateDTO):
+    """가져오기용 생성 DTO: id를 호출하는 쪽이 정함 (같은 id가 이미 있으면 건너뜀)."""
+    id: str
+
+
 class AccountEntryNodePatchDTO(BaseModel):
     """부분 수정용 DTO (입력). 기존 ALLOWED_KEYS를 대체합니다."""
     model_config = ConfigDict(extra="forbid")
@@ -26,6 +32,23 @@ class AccountEntryNodePatchDTO(BaseModel):
     tags: Optional[List[str]] = None
 
 
+class AccountEntryCursorDTO(BaseModel):
+    """keyset 페이지네이션 위치 (createdAt 문자열은 나노초 정밀도 유지)."""
+    model_config = ConfigDict(extra="forbid")
+
+    created_at: str
+    id: str
+
+
+class AccountEntryPageDTO(BaseModel):
+    """페이지 결과. 마지막 페이지(또는 offset 모드)면 next_cursor는 None, total은 요청했을 때만."""
+    model_config = ConfigDict(extra="forbid")
+
+    items: List[AccountEntryNode]
+    next_cursor: Optional[AccountEntryCursorDTO] = None
+    total: Optional[int] = None
+
+
 class AccountEntryRelationPropsDTO(BaseModel):
     """
     관계에 붙는 추가 속성 컨테이너.
@@ -65,6 +88,17 @@ class AccountEntryRelationDeleteDTO(BaseModel):
     kind: RelKind
 
 
+class AccountEntryRelationOpDTO(BaseModel):
+    """배치 관계 작업 한 건 (link: MERGE + props, unlink: DELETE)."""
+    model_config = ConfigDict(extra="forbid")
+
+    op: RelationOp
+    from_id: str
+    to_id: str
+    kind: RelKind
+    props: AccountEntryRelationPropsDTO = Field(default_factory=AccountEntryRelationPropsDTO)
+
+
 class AccountEntryRelationsDTO(BaseModel):
     """outgoing / incoming 관계 목록 래퍼."""
     model_config = ConfigDict(extra="forbid")
@@ -85,26 +119,104 @@ class AccountEntryTreeNodeDTO(BaseModel):
     desc: Optional[str] = None
     tags: List[str] = Field(default_factory=list)
     children: List["AccountEntryTreeNodeDTO"] = Field(default_factory=list)
+    # bounded 탐색 전용 표시: 조상으로 되돌아가는 간선 / 이미 다른 위치에서 펼친 노드 (둘 다 children 비움)
+    cycle: bool = False
+    revisit: bool = False
 
 
 AccountEntryTreeNodeDTO.model_rebuild()
 
 
-def convert_account_entry_tree_node(input_data: dict):
-    id_data = input_data.get("id")
-    title = input_data.get("title")
-    desc = input_data.get("desc")
-    tags = input_data.get("tags") or []
-    children = []
-    if "relates_to" in input_data.keys():
-        for child in input_data["relates_to"]:
-            children.append(convert_account_entry_tree_node(child))
-    return (
-        AccountEntryTreeNodeDTO(
-            id=id_data,
-            title=title,
-            desc=desc,
-            tags=tags,
-            children=children,
-        )
+class AccountEntryTreeResultDTO(BaseModel):
+    """bounded 탐색 결과. 깊이/노드 상한으로 잘렸으면 truncated=True."""
+    model_config = ConfigDict(extra="forbid")
+
+    tree: AccountEntryTreeNodeDTO
+    truncated: bool = False
+    node_count: int = 0
+
+
+class AccountEntryTreePlanDTO(BaseModel):
+    """
+    트리 골격 (id만, 노드 속성 없음). children[id]는 그 노드를 펼친 자리의 자식 (child_id, mark) 목록,
+    mark는 None / "cycle" / "revisit" (표시 노드는 펼치지 않음). 스트리밍 explore가 본문 전에 모양을 정함.
+    paths=True면 toJsonTree 모양: children[id]는 인접 리스트이고 노드를 닿는 위치마다 펼침 (cycle은 걸으며 표시).
+    """
+    model_config = ConfigDict(extra="forbid")
+
+    root_id: str
+    children: Dict[str, List[Tuple[str, Optional[str]]]] = Field(default_factory=dict)
+    truncated: bool = False
+    node_count: int = 0
+    paths: bool = False
+
+
+class AccountEntrySearchHitDTO(BaseModel):
+    """검색 결과 한 건 (score가 클수록 관련도 높음)."""
+    model_config = ConfigDict(extra="forbid")
+
+    node: AccountEntryNode
+    score: float
+
+
+class AccountEntryTagCountDTO(BaseModel):
+    """태그별 엔트리 수."""
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    count: int
+
+
+class AccountEntryReachDTO(BaseModel):
+    """RELATES_TO 후손(reverse면 조상). ids는 id 순으로 limit까지, count는 전체 수 (자기 자신 제외)."""
+    model_config = ConfigDict(extra="forbid")
+
+    entry_id: str
+    reverse: bool = False
+    count: int
+    ids: List[str] = Field(default_factory=list)
+
+
+class AccountEntrySheetLinkDTO(BaseModel):
+    """시트용 나가는 관계 + 연결된 노드."""
+    model_config = ConfigDict(extra="forbid")
+
+    kind: RelKind
+    node: AccountEntryNode
+
+
+class AccountEntrySheetItemDTO(BaseModel):
+    """시트용 노드 + 나가는 관계 목록."""
+    model_config = ConfigDict(extra="forbid")
+
+    node: AccountEntryNode
+    links: List[AccountEntrySheetLinkDTO] = Field(default_factory=list)
+
+
+def make_account_entry_tree_node(node_id: str, props: Mapping, *, cycle: bool = False,
+                                 revisit: bool = False) -> AccountEntryTreeNodeDTO:
+    """
+    저장소에서 읽은 값으로 트리 노드 생성 (children은 비워 두고 호출 측이 채움).
+    자식 없이 만드는 생성자 검증은 pydantic-core 한 번이라 model_construct보다 빠름 (노드 수만큼 호출되는 경로).
+    """
+    return AccountEntryTreeNodeDTO(
+        id=node_id,
+        title=props.get("title"),
+        desc=props.get("desc"),
+        tags=list(props.get("tags") or ()),
+        cycle=cycle,
+        revisit=revisit,
     )
+
+
+def convert_account_entry_tree_node(input_data: dict) -> AccountEntryTreeNodeDTO:
+    """apoc.paths.toJsonTree 맵(relates_to 중첩) → 트리. 명시적 스택이라 긴 체인도 recursion limit 없음."""
+    root = make_account_entry_tree_node(input_data.get("id"), input_data)
+    stack = [(input_data, root)]
+    while stack:
+        data, node = stack.pop()
+        for child_data in data.get("relates_to") or ():
+            child = make_account_entry_tree_node(child_data.get("id"), child_data)
+            node.children.append(child)
+            stack.append((child_data, child))
+    return root
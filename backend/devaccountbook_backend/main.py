@@ -6,33 +6,90 @@ from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles  # ✅ 추가
 
-from devaccountbook_backend.api.v1.account_entries_router import router as items_router
+from devaccountbook_backend.api.responses import FastJSONResponse
+from devaccountbook_backend.api.v1 import account_entries_router, async_account_entries_router, relations_router, \
+    async_relations_router, tags_router, async_tags_router, export_router, async_export_router, \
+    import_router, async_import_router
 from devaccountbook_backend.core.config import settings
-from devaccountbook_backend.db.driver import init_driver, close_driver
+from devaccountbook_backend.core.metrics import render_metrics
+from devaccountbook_backend.db.async_driver import init_async_driver, close_async_driver, get_async_driver, \
+    warm_up_async_driver
+from devaccountbook_backend.db.driver import init_driver, close_driver, get_driver, warm_up_driver
+from devaccountbook_backend.db.migrations import migrate_neo4j, migrate_neo4j_async, migrate_sqlite
+from devaccountbook_backend.db.sqlite import init_sqlite, close_sqlite, connect_sqlite
+from devaccountbook_backend.repositories.graph_index import init_graph_index, init_graph_index_async, \
+    close_graph_index
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    init_driver(settings.neo4j_uri, settings.neo4j_user, settings.neo4j_password)
+    if settings.storage_backend == "sqlite":
+        init_sqlite(settings.sqlite_path)
+        conn = connect_sqlite(settings.sqlite_path)
+        try:
+            migrate_sqlite(conn)
+        finally:
+            conn.close()
+        try:
+            yield
+        finally:
+            close_sqlite()
+        return
+
+    if settings.neo4j_async:
+        init_async_driver(settings.neo4j_uri, settings.neo4j_user, settings.neo4j_password,
+                          **settings.neo4j_driver_config())
+        await warm_up_async_driver(settings.neo4j_pool_min_size)
+        async with get_async_driver().session() as session:
+            await migrate_neo4j_async(session)
+            if settings.graph_index_enabled:
+                await init_graph_index_async(session, settings.graph_reach_index_enabled)
+        try:
+            yield
+        finally:
+            close_graph_index()
+            await close_async_driver()
+        return
+
+    init_driver(settings.neo4j_uri, settings.neo4j_user, settings.neo4j_password, **settings.neo4j_driver_config())
+    warm_up_driver(settings.neo4j_pool_min_size)
+    with get_driver().session() as session:
+        migrate_neo4j(session)
+        if settings.graph_index_enabled:
+            init_graph_index(session, settings.graph_reach_index_enabled)
     try:
         yield
     finally:
+        close_graph_index()
         close_driver()
 
-app = FastAPI(title="DevAccountBook API", version="0.1.0", lifespan=lifespan)
+# response_model 라우트의 최종 직렬화도 pydantic-core로 (json.dumps 대신)
+app = FastAPI(title="DevAccountBook API", version="0.1.0", lifespan=lifespan, default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
-    allow_credentials=True, allow_methods=["*"], allow_headers=["*"]
+    allow_credentials=True, allow_methods=["*"], allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Tree-Truncated", "ETag", "X-Total-Count"]
 )
 app.add_middleware(GZipMiddleware, minimum_size=512)
 
-# API
-app.include_router(items_router, prefix="/v1")
+# API (NEO4J_ASYNC=true면 같은 경로의 async 라우트 사용)
+if settings.neo4j_async and settings.storage_backend == "neo4j":
+    app.include_router(async_account_entries_router.router, prefix="/v1")
+    app.include_router(async_relations_router.router, prefix="/v1")
+    app.include_router(async_tags_router.router, prefix="/v1")
+    app.include_router(async_export_router.router, prefix="/v1")
+    app.include_router(async_import_router.router, prefix="/v1")
+else:
+    app.include_router(account_entries_router.router, prefix="/v1")
+    app.include_router(relations_router.router, prefix="/v1")
+    app.include_router(tags_router.router, prefix="/v1")
+    app.include_router(export_router.router, prefix="/v1")
+    app.include_router(import_router.router, prefix="/v1")
 
 # STATIC 파일 배포
 def resource_path(*parts: str) -> Path:
@@ -45,8 +102,9 @@ def resource_path(*parts: str) -> Path:
 static_dir = resource_path("static")
 
 # 정적 파일 서빙 (Vite base를 /static/로 맞출 예정)
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
-app.mount("/assets", StaticFiles(directory=str(static_dir / "assets")), name="assets")
+# 프론트 빌드가 없어도(API만 쓰는 개발/부하 테스트) import되도록 디렉터리 확인은 요청 시점으로
+app.mount("/static", StaticFiles(directory=str(static_dir), check_dir=False), name="static")
+app.mount("/assets", StaticFiles(directory=str(static_dir / "assets"), check_dir=False), name="assets")
 # 루트: index.html
 @app.get("/", include_in_schema=False)
 def serve_index():
@@ -55,12 +113,17 @@ def serve_index():
         return FileResponse(index)
     return {"ok": True}
 
+# 운영 지표 (Prometheus text format): 커넥션 풀 등
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 # SPA 라우팅 fallback (API/정적·문서 경로는 제외)
 @app.get("/{full_path:path}", include_in_schema=False)
 def spa_fallback(full_path: str):
     # API/정적/헬스체크/문서 엔드포인트는 통과
     if full_path.startswith((
-        "v1/", "static/", "assets/", "healthz",
+        "v1/", "static/", "assets/", "healthz", "metrics",
         "docs", "redoc", "openapi.json"
     )):
         raise HTTPException(status_code=404)
@@ -6,6 +6,11 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
+try:
+    from neo4j.time import DateTime as Neo4jDateTime
+except ImportError:  # SQLite 전용 배포
+    Neo4jDateTime = None
+
 
 # 이미 프로젝트에 있는 Enum
 
@@ -30,11 +35,7 @@ class AccountEntryNode(BaseModel):
         # None 허용
         if v is None:
             return None
-        try:
-            # neo4j.time.DateTime 객체면 .to_native()로 변환
-            from neo4j.time import DateTime as Neo4jDateTime
-            if isinstance(v, Neo4jDateTime):
-                return v.to_native()  # timezone-aware datetime(UTC)
-        except Exception:
-            pass
+        # neo4j.time.DateTime 객체면 .to_native()로 변환 (import는 모듈 로드 때 한 번, 행마다 하지 않음)
+        if Neo4jDateTime is not None and isinstance(v, Neo4jDateTime):
+            return v.to_native()  # timezone-aware datetime(UTC)
         return v
@@ -0,0 +1,511 @@
+# Neo4j 저장소 공통 Cypher + 결과 변환 (동기 AccountEntryRepository / 비동기 AsyncAccountEntryRepository 공용)
+from typing import List, Sequence
+
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryRelationsDTO, \
+    AccountEntryTreeNodeDTO, AccountEntrySheetItemDTO, AccountEntryCursorDTO, \
+    AccountEntryPageDTO, AccountEntryRelationOpDTO, AccountEntryTreeResultDTO, AccountEntryReachDTO, \
+    AccountEntryTagCountDTO, AccountEntrySearchHitDTO, AccountEntryTreePlanDTO
+from devaccountbook_backend.models.account_entry_domain import AccountEntryNode
+from devaccountbook_backend.repositories.normalize_neo import normalize_neo, normalize_neo_rows
+from devaccountbook_backend.repositories.tree_builder import build_account_entry_tree, plan_account_entry_tree, \
+    build_account_entry_forest, build_account_entry_path_tree, plan_account_entry_path_tree
+from devaccountbook_backend.schemas.common_enum import RelKind, RelationOp, TagMatch
+
+#  집계 함수
+Q_ENTRIES = """
+MATCH (n:AccountEntry)
+RETURN n
+ORDER BY coalesce(n.createdAt, datetime({epochSeconds:0})) DESC
+SKIP $offset
+LIMIT $limit
+"""
+
+# keyset 페이지네이션: (createdAt DESC, id DESC) 기준으로 after 다음부터 조회
+# createdAt 인덱스를 타도록 coalesce 없이 정렬 (createdAt 없는 노드는 제외)
+Q_ENTRIES_FIRST = """
+MATCH (n:AccountEntry)
+WHERE n.createdAt IS NOT NULL
+RETURN n, toString(n.createdAt) AS created_at
+ORDER BY n.createdAt DESC, n.id DESC
+LIMIT $limit
+"""
+
+Q_ENTRIES_AFTER = """
+MATCH (n:AccountEntry)
+WHERE n.createdAt <= datetime($created_at)
+  AND (n.createdAt < datetime($created_at) OR n.id < $id)
+RETURN n, toString(n.createdAt) AS created_at
+ORDER BY n.createdAt DESC, n.id DESC
+LIMIT $limit
+"""
+
+# 엔트리 페이지 + 각 엔트리의 나가는 관계/이웃 노드를 한 번의 쿼리로 조회
+Q_SHEET = """
+MATCH (n:AccountEntry)
+WITH n
+ORDER BY coalesce(n.createdAt, datetime({epochSeconds:0})) DESC
+SKIP $offset
+LIMIT $limit
+CALL {
+    WITH n
+    OPTIONAL MATCH (n)-[r]->(m:AccountEntry)
+    WITH r, m
+    ORDER BY type(r), m.id
+    RETURN collect(CASE WHEN r IS NULL THEN null ELSE {kind: type(r), node: m} END) AS links
+}
+RETURN n, links
+"""
+
+# 라벨 전체 개수는 count store에서 바로 읽음 (쓰기가 유지하는 카운터, 스캔 없음)
+Q_COUNT = "MATCH (n:AccountEntry) RETURN count(n) AS cnt"
+
+# 태그 필터: (:Tag {name}) 노드에서 TAGGED를 거슬러 시작 → AccountEntry 라벨 전체 스캔 없음
+# all이면 요청한 태그를 모두 가진 엔트리만 ($required = 서로 다른 태그 수)
+_TAGGED = """
+MATCH (t:Tag) WHERE t.name IN $tags
+MATCH (n:AccountEntry)-[:TAGGED]->(t)
+WITH n, count(DISTINCT t) AS hits
+WHERE $match = 'any' OR hits = $required
+"""
+
+Q_COUNT_TAGGED = _TAGGED + "RETURN count(n) AS cnt"
+
+Q_ENTRIES_TAGGED = _TAGGED + """
+RETURN n
+ORDER BY coalesce(n.createdAt, datetime({epochSeconds:0})) DESC
+SKIP $offset
+LIMIT $limit
+"""
+
+Q_ENTRIES_TAGGED_FIRST = _TAGGED + """
+WITH n WHERE n.createdAt IS NOT NULL
+RETURN n, toString(n.createdAt) AS created_at
+ORDER BY n.createdAt DESC, n.id DESC
+LIMIT $limit
+"""
+
+Q_ENTRIES_TAGGED_AFTER = _TAGGED + """
+WITH n
+WHERE n.createdAt <= datetime($created_at)
+  AND (n.createdAt < datetime($created_at) OR n.id < $id)
+RETURN n, toString(n.createdAt) AS created_at
+ORDER BY n.createdAt DESC, n.id DESC
+LIMIT $limit
+"""
+
+# 검색: 엔트리 title/desc 색인과 태그 이름 색인 결과를 엔트리별로 합산해 정렬
+# (여러 검색어는 OR, 더 많이/정확히 맞을수록 score가 큼)
+Q_SEARCH = """
+CALL {
+    CALL db.index.fulltext.queryNodes('account_entry_text', $query) YIELD node, score
+    RETURN node AS n, score
+    UNION ALL
+    CALL db.index.fulltext.queryNodes('tag_name_text', $query) YIELD node, score
+    MATCH (n:AccountEntry)-[:TAGGED]->(node)
+    RETURN n, score
+}
+WITH n, sum(score) AS score
+RETURN n, score
+ORDER BY score DESC, n.id
+SKIP $offset
+LIMIT $limit
+"""
+
+# 태그별 엔트리 수 (TAGGED 차수 조회라 엔트리를 읽지 않음). 엔트리가 모두 지워진 태그는 제외
+Q_TAGS = """
+MATCH (t:Tag)
+WITH t.name AS name, COUNT { (t)<-[:TAGGED]-() } AS cnt
+WHERE cnt > 0
+RETURN name, cnt
+ORDER BY cnt DESC, name
+LIMIT $limit
+"""
+
+# n.tags → (:Tag)<-[:TAGGED]- 동기화 (생성/수정 쿼리 안에서 같은 트랜잭션으로)
+_SYNC_TAGS = """
+CALL {
+    WITH n
+    MATCH (n)-[r:TAGGED]->(t:Tag)
+    WHERE NOT t.name IN coalesce(n.tags, [])
+    DELETE r
+}
+CALL {
+    WITH n
+    UNWIND coalesce(n.tags, []) AS name
+    MERGE (t:Tag {name: name})
+    MERGE (n)-[:TAGGED]->(t)
+}
+"""
+
+# CRUD
+Q_CREATE = """
+CREATE (n:AccountEntry {id:$id, title:$title, desc:$desc, tags:$tags, createdAt:datetime()})
+WITH n
+""" + _SYNC_TAGS + """
+RETURN n.id AS id
+"""
+
+Q_CREATE_MANY = """
+UNWIND $rows AS row
+CREATE (n:AccountEntry {id:row.id, title:row.title, desc:row.desc, tags:row.tags, createdAt:datetime()})
+WITH n
+""" + _SYNC_TAGS
+
+# 가져오기: 없는 id만 생성 (재전송해도 중복 없음), 생성된 id 반환
+Q_IMPORT_MANY = """
+UNWIND $rows AS row
+OPTIONAL MATCH (e:AccountEntry {id:row.id})
+WITH row WHERE e IS NULL
+CREATE (n:AccountEntry {id:row.id, title:row.title, desc:row.desc, tags:row.tags, createdAt:datetime()})
+WITH n
+""" + _SYNC_TAGS + """
+RETURN n.id AS id
+"""
+
+Q_GET = "MATCH (n:AccountEntry {id:$id}) RETURN n"
+
+Q_UPDATE = """
+MATCH (n:AccountEntry {id:$id})
+SET n += $props, n.updatedAt = datetime()
+WITH n
+""" + _SYNC_TAGS + """
+RETURN n.id AS id
+"""
+
+Q_DELETE = "MATCH (n:AccountEntry {id:$id}) DETACH DELETE n"
+
+# --- 관계 목록 조회 (outgoing / incoming) ---
+Q_RELATIONS_OUT = """
+MATCH (a:AccountEntry {id:$id})-[r]->(b:AccountEntry)
+RETURN type(r) AS kind, a.id AS from_id, b.id AS to_id, properties(r) AS props
+ORDER BY kind, to_id
+"""
+
+Q_RELATIONS_IN = """
+MATCH (a:AccountEntry)-[r]->(b:AccountEntry {id:$id})
+RETURN type(r) AS kind, a.id AS from_id, b.id AS to_id, properties(r) AS props
+ORDER BY kind, from_id
+"""
+
+# 내보내기 (정렬 없이 스트리밍 → 서버/클라이언트 모두 메모리 일정, 관계는 엔트리 사이 간선만)
+Q_EXPORT_ENTRIES = """
+MATCH (n:AccountEntry)
+RETURN n.id AS id, n.title AS title, n.desc AS desc, n.tags AS tags,
+       toString(n.createdAt) AS created_at, toString(n.updatedAt) AS updated_at
+"""
+
+Q_EXPORT_RELATIONS = """
+MATCH (a:AccountEntry)-[r]->(b:AccountEntry)
+RETURN a.id AS from_id, type(r) AS kind, b.id AS to_id, properties(r) AS props
+"""
+
+# Function
+# 도달 가능 노드 (그래프 인덱스가 없을 때): subgraphNodes는 노드마다 한 번만 방문 → 경로 수와 무관
+# minLevel 1이라 시작 노드는 제외. 시작 노드가 없으면 행 없음
+Q_REACHABLE = """
+MATCH (n:AccountEntry {id:$id})
+CALL {
+    WITH n
+    CALL apoc.path.subgraphNodes(n, {relationshipFilter: $rel_filter, labelFilter: '+AccountEntry', minLevel: 1})
+    YIELD node
+    RETURN apoc.coll.sort(collect(node.id)) AS ids
+}
+RETURN size(ids) AS cnt, ids[..coalesce($limit, size(ids))] AS ids
+"""
+
+# 도달 여부: NODE_GLOBAL 탐색이 도착 노드를 만나면 종료 (limit 1)
+Q_REACHES = """
+MATCH (a:AccountEntry {id:$from_id}), (b:AccountEntry {id:$to_id})
+CALL {
+    WITH a, b
+    CALL apoc.path.expandConfig(a, {
+        relationshipFilter: 'RELATES_TO>', labelFilter: '+AccountEntry',
+        terminatorNodes: [b], uniqueness: 'NODE_GLOBAL', limit: 1
+    }) YIELD path
+    RETURN count(path) > 0 AS found
+}
+RETURN a = b OR found AS reachable
+"""
+
+
+# 검색어 단어 → Lucene 쿼리 (정확히 일치하면 가중치 2배, 접두어 일치 포함)
+def lucene_query(terms: Sequence[str]) -> str:
+    return " ".join(f"{t}^2 {t}*" for t in terms)
+
+
+def tagged_params(tags: Sequence[str], tag_match: TagMatch) -> dict:
+    return {"tags": list(tags), "match": tag_match.value, "required": len(set(tags))}
+
+
+# 목록 쿼리 선택 (태그가 있으면 Tag 노드에서 시작하는 쿼리) → (쿼리, limit 외 파라미터)
+def q_entries(tags: Sequence[str], tag_match: TagMatch) -> tuple[str, dict]:
+    if not tags:
+        return Q_ENTRIES, {}
+    return Q_ENTRIES_TAGGED, tagged_params(tags, tag_match)
+
+
+def q_count(tags: Sequence[str], tag_match: TagMatch) -> tuple[str, dict]:
+    if not tags:
+        return Q_COUNT, {}
+    return Q_COUNT_TAGGED, tagged_params(tags, tag_match)
+
+
+def q_entries_after(after: AccountEntryCursorDTO | None, tags: Sequence[str],
+                    tag_match: TagMatch) -> tuple[str, dict]:
+    params = {} if after is None else {"created_at": after.created_at, "id": after.id}
+    if not tags:
+        return (Q_ENTRIES_FIRST if after is None else Q_ENTRIES_AFTER), params
+    params.update(tagged_params(tags, tag_match))
+    return (Q_ENTRIES_TAGGED_FIRST if after is None else Q_ENTRIES_TAGGED_AFTER), params
+
+
+def reachable_params(entry_id: str, *, reverse: bool, limit: int | None) -> dict:
+    return {"id": entry_id, "rel_filter": "<RELATES_TO" if reverse else "RELATES_TO>", "limit": limit}
+
+
+# 관계 타입은 파라미터 바인딩 불가 → Enum 기반 f-string 삽입(화이트리스트)
+def q_add_relation(kind: RelKind) -> str:
+    return f"""
+    MATCH (a:AccountEntry {{id:$from_id}}), (b:AccountEntry {{id:$to_id}})
+    MERGE (a)-[r:{kind.value}]->(b)
+    ON CREATE SET r.createdAt = datetime()
+    SET r += $props
+    RETURN r
+    """
+
+
+def q_delete_relation(kind: RelKind) -> str:
+    return f"""
+    MATCH (a:AccountEntry {{id:$from_id}})-[r:{kind.value}]->(b:AccountEntry {{id:$to_id}})
+    DELETE r
+    RETURN count(*) AS cnt
+    """
+
+
+def q_relation_op(op: RelationOp, kind: RelKind) -> str:
+    if op == RelationOp.LINK:
+        return f"""
+        UNWIND $rows AS row
+        MATCH (a:AccountEntry {{id:row.from_id}}), (b:AccountEntry {{id:row.to_id}})
+        MERGE (a)-[r:{kind.value}]->(b)
+        ON CREATE SET r.createdAt = datetime()
+        SET r += row.props
+        RETURN row.idx AS idx, properties(r) AS props
+        """
+    return f"""
+    UNWIND $rows AS row
+    MATCH (a:AccountEntry {{id:row.from_id}})-[r:{kind.value}]->(b:AccountEntry {{id:row.to_id}})
+    DELETE r
+    RETURN DISTINCT row.idx AS idx, null AS props
+    """
+
+
+# bounded 탐색: 경로 전체를 나열하지 않고 도달 가능한 노드/간선 집합을 한 번만 조회
+# - apoc.path.subgraphNodes (BFS, 노드 중복 방문 없음)로 max_depth / max_nodes 이내 노드 수집
+# - 수집된 노드에서 나가는 RELATES_TO 간선을 함께 반환 → 트리 조립은 tree_builder
+# ids_only=True: 스트리밍 explore용 골격 (노드 속성은 Q_TREE_NODES로 나눠 읽음)
+# max_nodes가 null이면 상한 없음 (깊이 제한 없는 explore의 노드/간선 수집)
+def q_tree_bounded(reverse: bool, *, ids_only: bool = False) -> str:
+    nodes = "[n IN nodes | n.id] AS ids" if ids_only else "[n IN nodes | n {.id, .title, .desc, .tags}] AS nodes"
+    if reverse:
+        edge_pattern = "(a)<-[:RELATES_TO]-(b:AccountEntry)"
+    else:
+        edge_pattern = "(a)-[:RELATES_TO]->(b:AccountEntry)"
+    return f"""
+    MATCH (root:AccountEntry {{id:$id}})
+    CALL apoc.path.subgraphNodes(root, {{
+        relationshipFilter: $rel_filter, labelFilter: '+AccountEntry', maxLevel: $max_level, limit: $limit
+    }}) YIELD node
+    WITH collect(node) AS nodes
+    WITH CASE WHEN $max_nodes IS NULL THEN nodes ELSE nodes[..$max_nodes] END AS nodes,
+         size(nodes) > coalesce($max_nodes, size(nodes)) AS capped
+    CALL {{
+        WITH nodes
+        UNWIND nodes AS a
+        MATCH {edge_pattern}
+        WITH a, b
+        ORDER BY a.id, b.id
+        RETURN collect([a.id, b.id]) AS edges
+    }}
+    RETURN {nodes}, edges, capped
+    """
+
+
+# 전체 트리 (forest): 시작 노드 한 페이지를 고른 뒤 apoc.path.subgraphNodes 한 번으로 모든 시작 노드에서 닿는
+# 노드를 (노드당 한 번) 모아 그 노드들의 RELATES_TO 간선과 함께 반환 → 시작 노드별 트리 조립은 tree_builder
+# roots_only: 정방향은 들어오는, 역방향은 나가는 RELATES_TO가 없는 노드만 시작 노드로 사용
+def q_forest(reverse: bool, *, limited: bool) -> str:
+    if reverse:
+        root_filter = "NOT EXISTS { MATCH (root)-[:RELATES_TO]->(:AccountEntry) }"
+        edge_pattern = "(a)<-[:RELATES_TO]-(b:AccountEntry)"
+    else:
+        root_filter = "NOT EXISTS { MATCH (:AccountEntry)-[:RELATES_TO]->(root) }"
+        edge_pattern = "(a)-[:RELATES_TO]->(b:AccountEntry)"
+    page = "SKIP $offset LIMIT $limit" if limited else "SKIP $offset"
+    return f"""
+    MATCH (root:AccountEntry)
+    WHERE NOT $roots_only OR {root_filter}
+    WITH root
+    ORDER BY coalesce(root.createdAt, datetime({{epochSeconds:0}})) DESC, root.id DESC
+    {page}
+    WITH collect(root) AS roots
+    CALL apoc.path.subgraphNodes(roots, {{
+        relationshipFilter: $rel_filter, labelFilter: '+AccountEntry'
+    }}) YIELD node
+    WITH roots, collect(node) AS nodes
+    CALL {{
+        WITH nodes
+        UNWIND nodes AS a
+        MATCH {edge_pattern}
+        WITH a, b
+        ORDER BY a.id, b.id
+        RETURN collect([a.id, b.id]) AS edges
+    }}
+    RETURN [r IN roots | r.id] AS roots, [n IN nodes | n {{.id, .title, .desc, .tags}}] AS nodes, edges
+    """
+
+
+def forest_params(*, reverse: bool, roots_only: bool, limit: int | None, offset: int) -> dict:
+    return {
+        "roots_only": roots_only,
+        "rel_filter": "<RELATES_TO" if reverse else "RELATES_TO>",
+        "limit": limit,
+        "offset": offset,
+    }
+
+
+# 순서/중복은 호출 측(id 목록)이 정함 → 찾은 노드만 반환
+Q_TREE_NODES = """
+UNWIND $ids AS id
+MATCH (n:AccountEntry {id: id})
+RETURN n {.id, .title, .desc, .tags} AS n
+"""
+
+
+def tree_bounded_params(start_id: str, *, reverse: bool, max_depth: int | None, max_nodes: int | None) -> dict:
+    return {
+        "id": start_id,
+        "rel_filter": "<RELATES_TO" if reverse else "RELATES_TO>",
+        "max_level": -1 if max_depth is None else max_depth,
+        "limit": -1 if max_nodes is None else max_nodes + 1,
+        "max_nodes": max_nodes,
+    }
+
+
+# --- 결과 변환 ---
+def to_entries(rows) -> List[AccountEntryNode]:
+    return [AccountEntryNode.model_validate(dict(row["n"])) for row in rows]
+
+
+def to_page(rows, limit: int, total: int | None = None) -> AccountEntryPageDTO:
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = AccountEntryCursorDTO(created_at=rows[-1]["created_at"], id=rows[-1]["n"]["id"])
+    return AccountEntryPageDTO(items=to_entries(rows), next_cursor=next_cursor, total=total)
+
+
+def to_search_hits(rows) -> List[AccountEntrySearchHitDTO]:
+    return [
+        AccountEntrySearchHitDTO(node=AccountEntryNode.model_validate(dict(row["n"])), score=row["score"])
+        for row in rows
+    ]
+
+
+def to_tag_counts(rows) -> List[AccountEntryTagCountDTO]:
+    return [AccountEntryTagCountDTO(name=row["name"], count=row["cnt"]) for row in rows]
+
+
+def to_sheet(rows) -> List[AccountEntrySheetItemDTO]:
+    return [
+        AccountEntrySheetItemDTO.model_validate({
+            "node": dict(row["n"]),
+            "links": [{"kind": link["kind"], "node": dict(link["node"])} for link in row["links"]],
+        })
+        for row in rows
+    ]
+
+
+def import_rows(entries) -> dict[str, dict]:
+    # 같은 chunk 안의 중복 id는 마지막 행만 (OPTIONAL MATCH가 같은 UNWIND의 CREATE를 보지 못하므로)
+    return {e.id: {"id": e.id, "title": e.title, "desc": e.desc, "tags": e.tags} for e in entries}
+
+
+def to_export_entry(row) -> dict:
+    return {"type": "entry", "id": row["id"], "title": row["title"], "desc": row["desc"], "tags": row["tags"] or [],
+            "createdAt": row["created_at"], "updatedAt": row["updated_at"]}
+
+
+def to_export_relation(row) -> dict:
+    return {"type": "relation", "fromId": row["from_id"], "toId": row["to_id"], "kind": row["kind"],
+            "props": normalize_neo(row["props"] or {})}
+
+
+def to_relations(rows_out, rows_in) -> AccountEntryRelationsDTO:
+    # props는 결과 전체를 한 번에 정규화, 검증도 컨테이너 한 번으로
+    to_relation = lambda rows: [
+        {"kind": row["kind"], "from_id": row["from_id"], "to_id": row["to_id"], "props": props}
+        for row, props in zip(rows, normalize_neo_rows(rows))
+    ]
+    return AccountEntryRelationsDTO.model_validate(
+        {"outgoing": to_relation(rows_out), "incoming": to_relation(rows_in)})
+
+
+# 시작 노드가 하나도 없으면 subgraphNodes가 행을 내지 않음 → 빈 목록
+def to_forest(rec) -> List[AccountEntryTreeNodeDTO | None]:
+    if rec is None:
+        return []
+    nodes = {n["id"]: n for n in rec["nodes"]}
+    return build_account_entry_forest(rec["roots"], nodes, rec["edges"])
+
+
+def to_tree_bounded(start_id: str, rec) -> AccountEntryTreeResultDTO | None:
+    if rec is None:
+        return None
+    nodes = {n["id"]: n for n in rec["nodes"]}
+    return build_account_entry_tree(start_id, nodes, rec["edges"], truncated=rec["capped"])
+
+
+def to_tree_plan(start_id: str, rec) -> AccountEntryTreePlanDTO | None:
+    if rec is None:
+        return None
+    return plan_account_entry_tree(start_id, set(rec["ids"]), rec["edges"], truncated=rec["capped"])
+
+
+# 깊이 제한 없는 explore: 시작 노드가 없거나 나가는 간선이 없으면 None
+def to_path_tree(start_id: str, rec) -> AccountEntryTreeNodeDTO | None:
+    if rec is None or not rec["edges"]:
+        return None
+    nodes = {n["id"]: n for n in rec["nodes"]}
+    return build_account_entry_path_tree(start_id, nodes, rec["edges"])
+
+
+def to_path_plan(start_id: str, rec) -> AccountEntryTreePlanDTO | None:
+    if rec is None or not rec["edges"]:
+        return None
+    return plan_account_entry_path_tree(start_id, rec["edges"])
+
+
+def to_tree_nodes(ids: Sequence[str], rows) -> List[dict | None]:
+    found = {row["n"]["id"]: dict(row["n"]) for row in rows}
+    return [found.get(i) for i in ids]
+
+
+def to_reachable(entry_id: str, reverse: bool, rec) -> AccountEntryReachDTO | None:
+    if rec is None:
+        return None
+    return AccountEntryReachDTO(entry_id=entry_id, reverse=reverse, count=rec["cnt"], ids=list(rec["ids"]))
+
+
+# --- 관계 배치 link/unlink ---
+# 같은 op가 연속된 구간마다 kind별로 묶음 (구간 간 순서는 유지)
+def group_relation_ops(relation_ops: Sequence[AccountEntryRelationOpDTO]) \
+        -> List[tuple[RelationOp, dict[RelKind, list[dict]]]]:
+    runs: list[tuple[RelationOp, dict[RelKind, list[dict]]]] = []
+    for idx, o in enumerate(relation_ops):
+        if not runs or runs[-1][0] != o.op:
+            runs.append((o.op, {}))
+        row = {"idx": idx, "from_id": o.from_id, "to_id": o.to_id}
+        if o.op == RelationOp.LINK:
+            row["props"] = o.props.model_dump(exclude_none=True)
+        runs[-1][1].setdefault(o.kind, []).append(row)
+    return runs
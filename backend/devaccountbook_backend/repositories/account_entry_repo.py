@@ -1,13 +1,21 @@
 import uuid
-from typing import List
+from contextlib import nullcontext
+from typing import Iterator, List, Sequence
 
 from neo4j import Session
 
+from devaccountbook_backend.db.migrations import migrate_neo4j
 from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeCreateDTO, AccountEntryNodePatchDTO, \
-    AccountEntryRelationPropsDTO, AccountEntryRelationCreateDTO, AccountEntryRelationDTO, AccountEntryRelationDeleteDTO, \
-    AccountEntryRelationsDTO, AccountEntryTreeNodeDTO, convert_account_entry_tree_node
+    AccountEntryRelationPropsDTO, AccountEntryRelationCreateDTO, AccountEntryRelationDeleteDTO, \
+    AccountEntryRelationsDTO, AccountEntryTreeNodeDTO, AccountEntrySheetItemDTO, \
+    AccountEntryCursorDTO, AccountEntryPageDTO, AccountEntryRelationOpDTO, AccountEntryTreeResultDTO, \
+    AccountEntryReachDTO, AccountEntryTagCountDTO, AccountEntrySearchHitDTO, AccountEntryNodeImportDTO, \
+    AccountEntryTreePlanDTO
 from devaccountbook_backend.models.account_entry_domain import AccountEntryNode
-from devaccountbook_backend.repositories.normalize_neo import normalize_neo
+from devaccountbook_backend.repositories import account_entry_cypher as cypher
+from devaccountbook_backend.repositories.account_entry_repo_base import AccountEntryRepositoryBase
+from devaccountbook_backend.repositories.graph_index import AccountEntryGraphIndex
+from devaccountbook_backend.schemas.common_enum import RelationOp, TagMatch
 
 ALLOWED_KEYS = {"title", "desc", "tags"}
 
@@ -15,53 +23,131 @@ ALLOWED_KEYS = {"title", "desc", "tags"}
 # temp code
 
 
-class AccountEntryRepository:
-    def __init__(self, session: Session):
+class AccountEntryRepository(AccountEntryRepositoryBase):
+    # graph_index가 있으면 쓰기 직후 같은 변경을 반영하고, 트리/관계/도달 조회는 메모리에서 처리
+    def __init__(self, session: Session, graph_index: AccountEntryGraphIndex | None = None):
         self.s = session
+        self.graph_index = graph_index
 
-    def _ensure_constraints(self) -> None:
-        q = "CREATE CONSTRAINT IF NOT EXISTS FOR (n:AccountEntry) REQUIRE n.id IS UNIQUE"
-        self.s.execute_write(lambda tx: tx.run(q))
+    # 쓰기 트랜잭션과 인덱스 반영을 한 구간으로 (동시 쓰기도 인덱스에는 커밋 순서대로 반영)
+    def _index_write(self):
+        return nullcontext() if self.graph_index is None else self.graph_index.write_lock
 
+    # 스키마는 lifespan에서 migration으로 1회 적용. 테스트/스크립트용으로 같은 경로를 노출
     def bootstrap(self) -> None:
-        self._ensure_constraints()
+        migrate_neo4j(self.s)
 
     #  집계 함수
-    def get_entries(self, *, limit: int = 50, offset: int = 0) -> List[AccountEntryNode]:
-        q = """
-        MATCH (n:AccountEntry)
-        RETURN n
-        ORDER BY coalesce(n.createdAt, datetime({epochSeconds:0})) DESC
-        SKIP $offset
-        LIMIT $limit
-        """
-        rows = self.s.execute_read(lambda tx: list(tx.run(q, offset=offset, limit=limit)))
-        return [AccountEntryNode.model_validate(dict(row["n"])) for row in rows]
+    # tags가 있으면 해당 태그(any: 하나라도 / all: 모두)를 가진 엔트리만
+    def get_entries(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                    tag_match: TagMatch = TagMatch.ANY) -> List[AccountEntryNode]:
+        q, params = cypher.q_entries(tags, tag_match)
+        rows = self.s.execute_read(lambda tx: list(tx.run(q, offset=offset, limit=limit, **params)))
+        return cypher.to_entries(rows)
+
+    def get_entries_counted(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                            tag_match: TagMatch = TagMatch.ANY) -> AccountEntryPageDTO:
+        q, params = cypher.q_entries(tags, tag_match)
+        count_q, count_params = cypher.q_count(tags, tag_match)
+
+        def work(tx):
+            rows = list(tx.run(q, offset=offset, limit=limit, **params))
+            return rows, tx.run(count_q, **count_params).single()["cnt"]
+
+        rows, total = self.s.execute_read(work)
+        return AccountEntryPageDTO(items=cypher.to_entries(rows), total=total)
+
+    # keyset 페이지네이션: (createdAt DESC, id DESC) 기준으로 after 다음부터 조회
+    def get_entries_after(self, *, limit: int = 50, after: AccountEntryCursorDTO | None = None,
+                          tags: Sequence[str] = (), tag_match: TagMatch = TagMatch.ANY,
+                          with_total: bool = False) -> AccountEntryPageDTO:
+        q, params = cypher.q_entries_after(after, tags, tag_match)
+        count_q, count_params = cypher.q_count(tags, tag_match)
+
+        def work(tx):
+            rows = list(tx.run(q, limit=limit, **params))
+            return rows, tx.run(count_q, **count_params).single()["cnt"] if with_total else None
+
+        rows, total = self.s.execute_read(work)
+        return cypher.to_page(rows, limit, total)
+
+    def get_tag_counts(self, *, limit: int = 100) -> List[AccountEntryTagCountDTO]:
+        rows = self.s.execute_read(lambda tx: list(tx.run(cypher.Q_TAGS, limit=limit)))
+        return cypher.to_tag_counts(rows)
+
+    def search_entries(self, terms: Sequence[str], *, limit: int = 20,
+                       offset: int = 0) -> List[AccountEntrySearchHitDTO]:
+        if not terms:
+            return []
+        rows = self.s.execute_read(lambda tx: list(tx.run(
+            cypher.Q_SEARCH, query=cypher.lucene_query(terms), offset=offset, limit=limit)))
+        return cypher.to_search_hits(rows)
+
+    def get_sheet(self, *, limit: int = 50, offset: int = 0) -> List[AccountEntrySheetItemDTO]:
+        rows = self.s.execute_read(lambda tx: list(tx.run(cypher.Q_SHEET, offset=offset, limit=limit)))
+        return cypher.to_sheet(rows)
 
     def count_entries(self) -> int:
-        q = "MATCH (n:AccountEntry) RETURN count(n) AS cnt"
-        rec = self.s.execute_read(lambda tx: tx.run(q).single())
+        rec = self.s.execute_read(lambda tx: tx.run(cypher.Q_COUNT).single())
         return int(rec["cnt"])
 
     # CRUD
     def create_entry(self, account_entry_create: AccountEntryNodeCreateDTO) -> str:
         nid = str(uuid.uuid4())
-        q = """
-        CREATE (n:AccountEntry {id:$id, title:$title, desc:$desc, tags:$tags, createdAt:datetime()})
-        RETURN n.id AS id
-        """
-        rec = self.s.execute_write(lambda tx: tx.run(
-            q,
-            id=nid,
-            title=account_entry_create.title,
-            desc=account_entry_create.desc,
-            tags=account_entry_create.tags
-        ).single())
+        with self._index_write():
+            rec = self.s.execute_write(lambda tx: tx.run(
+                cypher.Q_CREATE,
+                id=nid,
+                title=account_entry_create.title,
+                desc=account_entry_create.desc,
+                tags=account_entry_create.tags
+            ).single())
+            if self.graph_index is not None:
+                self.graph_index.upsert_entry(nid, title=account_entry_create.title, desc=account_entry_create.desc,
+                                              tags=account_entry_create.tags)
         return rec["id"]
 
+    # 배치 생성: 하나의 쓰기 트랜잭션 안에서 chunk_size 단위 UNWIND, 입력 순서대로 id 반환
+    def create_entries(self, account_entry_creates: Sequence[AccountEntryNodeCreateDTO], *,
+                       chunk_size: int = 1000) -> List[str]:
+        rows = [
+            {"id": str(uuid.uuid4()), "title": c.title, "desc": c.desc, "tags": c.tags}
+            for c in account_entry_creates
+        ]
+
+        def work(tx):
+            for i in range(0, len(rows), chunk_size):
+                tx.run(cypher.Q_CREATE_MANY, rows=rows[i:i + chunk_size]).consume()
+
+        if rows:
+            with self._index_write():
+                self.s.execute_write(work)
+                if self.graph_index is not None:
+                    for row in rows:
+                        self.graph_index.upsert_entry(
+                            row["id"], title=row["title"], desc=row["desc"], tags=row["tags"])
+        return [row["id"] for row in rows]
+
+    def import_entries(self, entries: Sequence[AccountEntryNodeImportDTO], *, chunk_size: int = 1000) -> int:
+        rows = cypher.import_rows(entries)
+        batch = list(rows.values())
+
+        def work(tx):
+            created = []
+            for i in range(0, len(batch), chunk_size):
+                created += [rec["id"] for rec in tx.run(cypher.Q_IMPORT_MANY, rows=batch[i:i + chunk_size])]
+            return created
+
+        with self._index_write():
+            created = self.s.execute_write(work) if batch else []
+            if self.graph_index is not None:
+                for nid in created:
+                    row = rows[nid]
+                    self.graph_index.upsert_entry(nid, title=row["title"], desc=row["desc"], tags=row["tags"])
+        return len(created)
+
     def get_entry(self, account_entry_id: str) -> AccountEntryNode | None:
-        q = "MATCH (n:AccountEntry {id:$id}) RETURN n"
-        rec = self.s.execute_read(lambda tx: tx.run(q, id=account_entry_id).single())
+        rec = self.s.execute_read(lambda tx: tx.run(cypher.Q_GET, id=account_entry_id).single())
         if rec is None:
             return None
         else:
@@ -73,117 +159,174 @@ class AccountEntryRepository:
         props = account_entry_patch.model_dump(exclude_unset=True, exclude_none=True)
         if len(props.keys()) == 0:
             return False
-        q = """
-        MATCH (n:AccountEntry {id:$id})
-        SET n += $props, n.updatedAt = datetime()
-        RETURN n.id AS id
-        """
-        rec = self.s.execute_write(lambda tx: tx.run(q, id=account_entry_id, props=props).single())
+        with self._index_write():
+            rec = self.s.execute_write(lambda tx: tx.run(cypher.Q_UPDATE, id=account_entry_id, props=props).single())
+            if rec is not None and self.graph_index is not None:
+                self.graph_index.upsert_entry(account_entry_id, **props)
         return rec is not None
 
     def delete_entry(self, account_entry_id: str) -> bool:
-        q = "MATCH (n:AccountEntry {id:$id}) DETACH DELETE n"
-        rec = self.s.execute_write(lambda tx: tx.run(q, id=account_entry_id).single())
-        return True
+        with self._index_write():
+            summary = self.s.execute_write(lambda tx: tx.run(cypher.Q_DELETE, id=account_entry_id).consume())
+            deleted = summary.counters.nodes_deleted > 0
+            if deleted and self.graph_index is not None:
+                self.graph_index.remove_entry(account_entry_id)
+        return deleted
 
     # Relation
     def add_relation(
             self, relation_create: AccountEntryRelationCreateDTO
-    ) -> None:
-        # 관계 타입은 파라미터 바인딩 불가 → Enum 기반 f-string 삽입(화이트리스트)
-        q = f"""
-        MATCH (a:AccountEntry {{id:$from_id}}), (b:AccountEntry {{id:$to_id}})
-        MERGE (a)-[r:{relation_create.kind.value}]->(b)
-        ON CREATE SET r.createdAt = datetime()
-        SET r += $props
-        RETURN r
-        """
-        rec = self.s.execute_write(lambda tx: tx.run(
-            q, from_id=relation_create.from_id, to_id=relation_create.to_id,
-            props=AccountEntryRelationPropsDTO.model_dump(relation_create.props) or {}
-        ).single())
+    ) -> bool:
+        with self._index_write():
+            rec = self.s.execute_write(lambda tx: tx.run(
+                cypher.q_add_relation(relation_create.kind), from_id=relation_create.from_id,
+                to_id=relation_create.to_id, props=AccountEntryRelationPropsDTO.model_dump(relation_create.props) or {}
+            ).single())
+            if rec is not None and self.graph_index is not None:
+                self.graph_index.add_relation(
+                    relation_create.kind, relation_create.from_id, relation_create.to_id, dict(rec["r"]))
+        return rec is not None
+
+    # --- 관계 배치 link/unlink ---
+    # 같은 op가 연속된 구간마다 kind별로 묶어 UNWIND 한 번씩 실행 (구간 간 순서는 유지)
+    # 반환: 입력 순서대로 성공 여부 (link: 양 끝 노드 존재, unlink: 삭제된 관계 존재)
+    def apply_relation_ops(self, relation_ops: Sequence[AccountEntryRelationOpDTO], *,
+                           chunk_size: int = 1000) -> List[bool]:
+        runs = cypher.group_relation_ops(relation_ops)
+
+        def work(tx):
+            done = {}
+            for op, groups in runs:
+                for kind, rows in groups.items():
+                    q = cypher.q_relation_op(op, kind)
+                    for i in range(0, len(rows), chunk_size):
+                        done.update((rec["idx"], rec["props"]) for rec in tx.run(q, rows=rows[i:i + chunk_size]))
+            return done
+
+        with self._index_write():
+            done = self.s.execute_write(work) if runs else {}
+            if self.graph_index is not None:
+                for idx in sorted(done):
+                    o = relation_ops[idx]
+                    if o.op == RelationOp.LINK:
+                        self.graph_index.add_relation(o.kind, o.from_id, o.to_id, done[idx])
+                    else:
+                        self.graph_index.remove_relation(o.kind, o.from_id, o.to_id)
+        return [idx in done for idx in range(len(relation_ops))]
 
     # --- 관계 목록 조회 (outgoing / incoming) ---
     def get_relations(self, entry_id: str) -> AccountEntryRelationsDTO:
-        q_out = """
-        MATCH (a:AccountEntry {id:$id})-[r]->(b:AccountEntry)
-        RETURN type(r) AS kind, a.id AS from_id, b.id AS to_id, properties(r) AS props
-        ORDER BY kind, to_id
-        """
-        q_in = """
-        MATCH (a:AccountEntry)-[r]->(b:AccountEntry {id:$id})
-        RETURN type(r) AS kind, a.id AS from_id, b.id AS to_id, properties(r) AS props
-        ORDER BY kind, from_id
-        """
-        rows_out = self.s.execute_read(lambda tx: list(tx.run(q_out, id=entry_id)))
-        rows_in = self.s.execute_read(lambda tx: list(tx.run(q_in, id=entry_id)))
-
-        to_relation = lambda rows: [
-            AccountEntryRelationDTO.model_validate({
-                "kind": row["kind"],
-                "from_id": row["from_id"],
-                "to_id": row["to_id"],
-                "props": normalize_neo(row["props"] or {})
-            })
-            for row in rows
-        ]
-        return AccountEntryRelationsDTO.model_validate(
-            {"outgoing": to_relation(rows_out), "incoming": to_relation(rows_in)})
+        if self.graph_index is not None:
+            return self.graph_index.get_relations(entry_id)
+        rows_out = self.s.execute_read(lambda tx: list(tx.run(cypher.Q_RELATIONS_OUT, id=entry_id)))
+        rows_in = self.s.execute_read(lambda tx: list(tx.run(cypher.Q_RELATIONS_IN, id=entry_id)))
+        return cypher.to_relations(rows_out, rows_in)
 
     # --- 관계 삭제 ---
     def delete_relation(self, relation_delete: AccountEntryRelationDeleteDTO) -> int:
-        q = f"""
-        MATCH (a:AccountEntry {{id:$from_id}})-[r:{relation_delete.kind.value}]->(b:AccountEntry {{id:$to_id}})
-        DELETE r
-        RETURN count(*) AS cnt
-        """
-        rec = self.s.execute_write(lambda tx: tx.run(
-            q, from_id=relation_delete.from_id, to_id=relation_delete.to_id
-        ).single())
+        with self._index_write():
+            rec = self.s.execute_write(lambda tx: tx.run(
+                cypher.q_delete_relation(relation_delete.kind), from_id=relation_delete.from_id,
+                to_id=relation_delete.to_id
+            ).single())
+            if rec["cnt"] > 0 and self.graph_index is not None:
+                self.graph_index.remove_relation(relation_delete.kind, relation_delete.from_id, relation_delete.to_id)
         return rec["cnt"]
 
     # Function
+    # 깊이 제한 없는 explore: toJsonTree 모양 (공유 후손은 위치마다 펼침), 조립은 인덱스/Neo4j 모두 tree_builder
+    # 노드/간선은 subgraphNodes로 노드당 한 번만 읽음 (경로 수와 무관)
     def get_entry_tree(self, start_id) -> AccountEntryTreeNodeDTO | None:
-        q = Q_TREE = """
-        MATCH p = (root:AccountEntry {id:$id})-[:RELATES_TO*0..]->(n:AccountEntry)
-        WITH collect(p) AS paths
-        CALL apoc.paths.toJsonTree(paths) YIELD value
-        RETURN value
-        """
-        rec = self.s.execute_read(lambda tx: tx.run(Q_TREE, id=start_id).single())
-        # print(rec["value"])
-        # print(type(rec["value"]))
-        # return normalize_to_children(rec["value"]) if rec else None
-
-        if len(rec["value"].keys()) == 0:
-            return None
-        else:
-            return convert_account_entry_tree_node(rec["value"]) if rec else None
+        return self._path_tree(start_id, reverse=False)
 
     def get_entry_tree_reverse(self, start_id) -> AccountEntryTreeNodeDTO | None:
-        q = Q_TREE = """
-        MATCH p = (root:AccountEntry)-[:RELATES_TO*0..]->(n:AccountEntry{id:$id})
-        WITH collect(p) AS paths
-        CALL apoc.paths.toJsonTree(paths) YIELD value
-        RETURN value
-        """
-        rec = self.s.execute_read(lambda tx: tx.run(Q_TREE, id=start_id).single())
-        # print(rec["value"])
-        # print(type(rec["value"]))
-        # return normalize_to_children(rec["value"]) if rec else None
-
-        if len(rec["value"].keys()) == 0:
-            return None
-        else:
-            return convert_account_entry_tree_node(rec["value"]) if rec else None
+        return self._path_tree(start_id, reverse=True)
+
+    def _path_tree(self, start_id: str, *, reverse: bool) -> AccountEntryTreeNodeDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_path_tree(start_id, reverse=reverse)
+        params = cypher.tree_bounded_params(start_id, reverse=reverse, max_depth=None, max_nodes=None)
+        rec = self.s.execute_read(lambda tx: tx.run(cypher.q_tree_bounded(reverse), **params).single())
+        return cypher.to_path_tree(start_id, rec)
+
+    # bounded 탐색 (apoc.path.subgraphNodes BFS + tree_builder 조립)
+    # reverse=True면 들어오는 방향으로 탐색. 시작 노드가 없으면 None
+    def get_entry_tree_bounded(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                               max_nodes: int = 10000) -> AccountEntryTreeResultDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_tree(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        params = cypher.tree_bounded_params(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        rec = self.s.execute_read(lambda tx: tx.run(cypher.q_tree_bounded(reverse), **params).single())
+        return cypher.to_tree_bounded(start_id, rec)
+
+    def get_entry_tree_plan(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                            max_nodes: int = 10000) -> AccountEntryTreePlanDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_tree_plan(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        params = cypher.tree_bounded_params(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        rec = self.s.execute_read(lambda tx: tx.run(cypher.q_tree_bounded(reverse, ids_only=True), **params).single())
+        return cypher.to_tree_plan(start_id, rec)
+
+    def get_entry_path_plan(self, start_id: str, *, reverse: bool = False) -> AccountEntryTreePlanDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_path_plan(start_id, reverse=reverse)
+        params = cypher.tree_bounded_params(start_id, reverse=reverse, max_depth=None, max_nodes=None)
+        rec = self.s.execute_read(lambda tx: tx.run(cypher.q_tree_bounded(reverse, ids_only=True), **params).single())
+        return cypher.to_path_plan(start_id, rec)
+
+    def get_tree_nodes(self, ids: Sequence[str]) -> List[dict | None]:
+        if self.graph_index is not None:
+            return self.graph_index.get_nodes(ids)
+        rows = self.s.execute_read(lambda tx: list(tx.run(cypher.Q_TREE_NODES, ids=list(ids))))
+        return cypher.to_tree_nodes(ids, rows)
+
+    # 전체 트리 (forest) - 시작 노드 한 페이지에서 닿는 노드/간선을 한 번에 읽고 트리는 Python에서 조립
+    def _forest(self, *, reverse: bool, roots_only: bool, limit: int | None,
+                offset: int) -> List[AccountEntryTreeNodeDTO | None]:
+        query = cypher.q_forest(reverse, limited=limit is not None)
+        params = cypher.forest_params(reverse=reverse, roots_only=roots_only, limit=limit, offset=offset)
+        rec = self.s.execute_read(lambda tx: tx.run(query, **params).single())
+        return cypher.to_forest(rec)
+
+    def get_entry_forest(self, *, roots_only: bool = False, limit: int | None = None,
+                         offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return self._forest(reverse=False, roots_only=roots_only, limit=limit, offset=offset)
+
+    def get_entry_forest_reverse(self, *, roots_only: bool = False, limit: int | None = None,
+                                 offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return self._forest(reverse=True, roots_only=roots_only, limit=limit, offset=offset)
+
+    # 도달 가능성: graph_index(전이 폐쇄)가 있으면 메모리, 없으면 APOC 탐색
+    def get_reachable(self, entry_id: str, *, reverse: bool = False,
+                      limit: int | None = None) -> AccountEntryReachDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_reachable(entry_id, reverse=reverse, limit=limit)
+        params = cypher.reachable_params(entry_id, reverse=reverse, limit=limit)
+        rec = self.s.execute_read(lambda tx: tx.run(cypher.Q_REACHABLE, **params).single())
+        return cypher.to_reachable(entry_id, reverse, rec)
+
+    def is_reachable(self, from_id: str, to_id: str) -> bool:
+        if self.graph_index is not None:
+            return self.graph_index.reaches(from_id, to_id)
+        rec = self.s.execute_read(lambda tx: tx.run(cypher.Q_REACHES, from_id=from_id, to_id=to_id).single())
+        return rec is not None and rec["reachable"]
 
+    # execute_read는 결과를 다 받아야 끝나므로 명시적 트랜잭션으로 스트리밍 (드라이버가 fetch_size씩 가져옴)
+    # 소비자가 중간에 멈추면(연결 끊김) 제너레이터 종료와 함께 트랜잭션도 닫힘
+    def export_rows(self) -> Iterator[dict]:
+        with self.s.begin_transaction() as tx:
+            for row in tx.run(cypher.Q_EXPORT_ENTRIES):
+                yield cypher.to_export_entry(row)
+            for row in tx.run(cypher.Q_EXPORT_RELATIONS):
+                yield cypher.to_export_relation(row)
 
 
 # Depends 팩토리
 from fastapi import Depends
 from devaccountbook_backend.db.neo import get_neo4j_session
+from devaccountbook_backend.repositories.graph_index import get_graph_index
 
 
 def get_account_entry_repo(session: Session = Depends(get_neo4j_session)) -> AccountEntryRepository:
-    repo = AccountEntryRepository(session)
+    repo = AccountEntryRepository(session, get_graph_index())
     return repo
@@ -0,0 +1,126 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Sequence
+
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeCreateDTO, AccountEntryNodePatchDTO, \
+    AccountEntryRelationCreateDTO, AccountEntryRelationDeleteDTO, AccountEntryRelationsDTO, AccountEntryTreeNodeDTO, \
+    AccountEntrySheetItemDTO, AccountEntryCursorDTO, AccountEntryPageDTO, AccountEntryRelationOpDTO, \
+    AccountEntryTreeResultDTO, AccountEntryReachDTO, AccountEntryTagCountDTO, \
+    AccountEntrySearchHitDTO, AccountEntryNodeImportDTO, AccountEntryTreePlanDTO
+from devaccountbook_backend.models.account_entry_domain import AccountEntryNode
+from devaccountbook_backend.schemas.common_enum import TagMatch
+
+
+class AccountEntryRepositoryBase(ABC):
+    """저장소 백엔드 공통 인터페이스 (Neo4j: AccountEntryRepository, SQLite: SqliteAccountEntryRepository)."""
+
+    @abstractmethod
+    def bootstrap(self) -> None: ...
+
+    #  집계 함수
+    @abstractmethod
+    def get_entries(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                    tag_match: TagMatch = TagMatch.ANY) -> List[AccountEntryNode]: ...
+
+    # 목록 + 조건에 맞는 전체 수 (같은 읽기 트랜잭션)
+    @abstractmethod
+    def get_entries_counted(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                            tag_match: TagMatch = TagMatch.ANY) -> AccountEntryPageDTO: ...
+
+    @abstractmethod
+    def get_entries_after(self, *, limit: int = 50, after: AccountEntryCursorDTO | None = None,
+                          tags: Sequence[str] = (), tag_match: TagMatch = TagMatch.ANY,
+                          with_total: bool = False) -> AccountEntryPageDTO: ...
+
+    @abstractmethod
+    def get_tag_counts(self, *, limit: int = 100) -> List[AccountEntryTagCountDTO]: ...
+
+    # terms: utils.search_util.search_terms로 정리된 단어 (OR 검색, score 내림차순)
+    @abstractmethod
+    def search_entries(self, terms: Sequence[str], *, limit: int = 20,
+                       offset: int = 0) -> List[AccountEntrySearchHitDTO]: ...
+
+    @abstractmethod
+    def get_sheet(self, *, limit: int = 50, offset: int = 0) -> List[AccountEntrySheetItemDTO]: ...
+
+    @abstractmethod
+    def count_entries(self) -> int: ...
+
+    # CRUD
+    @abstractmethod
+    def create_entry(self, account_entry_create: AccountEntryNodeCreateDTO) -> str: ...
+
+    @abstractmethod
+    def create_entries(self, account_entry_creates: Sequence[AccountEntryNodeCreateDTO], *,
+                       chunk_size: int = 1000) -> List[str]: ...
+
+    # 가져오기: 지정한 id로 생성하되 이미 있는 id는 건너뜀, 새로 만든 수 반환
+    @abstractmethod
+    def import_entries(self, entries: Sequence[AccountEntryNodeImportDTO], *, chunk_size: int = 1000) -> int: ...
+
+    @abstractmethod
+    def get_entry(self, account_entry_id: str) -> AccountEntryNode | None: ...
+
+    @abstractmethod
+    def update_entry(self, account_entry_id: str, account_entry_patch: AccountEntryNodePatchDTO) -> bool: ...
+
+    @abstractmethod
+    def delete_entry(self, account_entry_id: str) -> bool: ...  # 없는 id면 False
+
+    # Relation
+    @abstractmethod
+    def add_relation(self, relation_create: AccountEntryRelationCreateDTO) -> bool: ...  # 양 끝 노드가 없으면 False
+
+    @abstractmethod
+    def apply_relation_ops(self, relation_ops: Sequence[AccountEntryRelationOpDTO], *,
+                           chunk_size: int = 1000) -> List[bool]: ...
+
+    @abstractmethod
+    def get_relations(self, entry_id: str) -> AccountEntryRelationsDTO: ...
+
+    @abstractmethod
+    def delete_relation(self, relation_delete: AccountEntryRelationDeleteDTO) -> int: ...
+
+    # Function
+    @abstractmethod
+    def get_entry_tree(self, start_id) -> AccountEntryTreeNodeDTO | None: ...
+
+    @abstractmethod
+    def get_entry_tree_reverse(self, start_id) -> AccountEntryTreeNodeDTO | None: ...
+
+    @abstractmethod
+    def get_entry_tree_bounded(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                               max_nodes: int = 10000) -> AccountEntryTreeResultDTO | None: ...
+
+    # 스트리밍 explore: 골격(bounded 탐색과 같은 모양)을 먼저 읽고, 노드 속성은 id 목록 단위로 따로 읽음
+    @abstractmethod
+    def get_entry_tree_plan(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                            max_nodes: int = 10000) -> AccountEntryTreePlanDTO | None: ...
+
+    # 깊이 제한 없는 스트리밍 explore: get_entry_tree와 같은 모양의 골격 (paths=True, 연결이 없으면 None)
+    @abstractmethod
+    def get_entry_path_plan(self, start_id: str, *, reverse: bool = False) -> AccountEntryTreePlanDTO | None: ...
+
+    # ids 순서대로 title/desc/tags (없는 id는 None)
+    @abstractmethod
+    def get_tree_nodes(self, ids: Sequence[str]) -> List[dict | None]: ...
+
+    # 시작 노드(최신순) offset부터 limit개의 트리 (limit=None이면 전부)
+    @abstractmethod
+    def get_entry_forest(self, *, roots_only: bool = False, limit: int | None = None,
+                         offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]: ...
+
+    @abstractmethod
+    def get_entry_forest_reverse(self, *, roots_only: bool = False, limit: int | None = None,
+                                 offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]: ...
+
+    # 도달 가능성 (RELATES_TO 후손/조상)
+    @abstractmethod
+    def get_reachable(self, entry_id: str, *, reverse: bool = False,
+                      limit: int | None = None) -> AccountEntryReachDTO | None: ...
+
+    @abstractmethod
+    def is_reachable(self, from_id: str, to_id: str) -> bool: ...
+
+    # 내보내기: 한 읽기 트랜잭션에서 엔트리 행 → 관계 행 순서로 스트리밍 (NDJSON 행 형태의 dict)
+    @abstractmethod
+    def export_rows(self) -> Iterator[dict]: ...
@@ -0,0 +1,335 @@
+import uuid
+from contextlib import asynccontextmanager, nullcontext
+from typing import AsyncIterator, List, Sequence
+
+from neo4j import AsyncSession, ResultSummary
+
+from devaccountbook_backend.db.migrations import migrate_neo4j_async
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeCreateDTO, AccountEntryNodePatchDTO, \
+    AccountEntryRelationPropsDTO, AccountEntryRelationCreateDTO, AccountEntryRelationDeleteDTO, \
+    AccountEntryRelationsDTO, AccountEntryTreeNodeDTO, AccountEntrySheetItemDTO, \
+    AccountEntryCursorDTO, AccountEntryPageDTO, AccountEntryRelationOpDTO, AccountEntryTreeResultDTO, \
+    AccountEntryReachDTO, AccountEntryTagCountDTO, AccountEntrySearchHitDTO, AccountEntryNodeImportDTO, \
+    AccountEntryTreePlanDTO
+from devaccountbook_backend.models.account_entry_domain import AccountEntryNode
+from devaccountbook_backend.repositories import account_entry_cypher as cypher
+from devaccountbook_backend.repositories.graph_index import AccountEntryGraphIndex
+from devaccountbook_backend.schemas.common_enum import RelationOp, TagMatch
+
+
+# 트랜잭션 함수 (AsyncSession.execute_read/execute_write에 인자와 함께 전달)
+async def _rows(tx, q: str, **params) -> list:
+    return [row async for row in await tx.run(q, **params)]
+
+
+async def _single(tx, q: str, **params):
+    return await (await tx.run(q, **params)).single()
+
+
+async def _consume(tx, q: str, **params) -> ResultSummary:
+    return await (await tx.run(q, **params)).consume()
+
+
+class AsyncAccountEntryRepository:
+    """
+    AccountEntryRepository의 비동기 버전 (neo4j.AsyncGraphDatabase).
+    - Cypher와 결과 변환은 account_entry_cypher를 공유하므로 동기 경로와 결과가 같음
+    - graph_index 처리도 동기 버전과 동일 (메모리 연산이라 이벤트 루프를 막지 않음)
+      쓰기 트랜잭션과 반영은 async_write_lock 안에서 → 반영 순서 = 커밋 순서
+    """
+
+    def __init__(self, session: AsyncSession, graph_index: AccountEntryGraphIndex | None = None):
+        self.s = session
+        self.graph_index = graph_index
+
+    def _index_write(self):
+        return nullcontext() if self.graph_index is None else self.graph_index.async_write_lock
+
+    async def bootstrap(self) -> None:
+        await migrate_neo4j_async(self.s)
+
+    #  집계 함수
+    async def get_entries(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                          tag_match: TagMatch = TagMatch.ANY) -> List[AccountEntryNode]:
+        q, params = cypher.q_entries(tags, tag_match)
+        rows = await self.s.execute_read(_rows, q, offset=offset, limit=limit, **params)
+        return cypher.to_entries(rows)
+
+    async def get_entries_counted(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                                  tag_match: TagMatch = TagMatch.ANY) -> AccountEntryPageDTO:
+        q, params = cypher.q_entries(tags, tag_match)
+        count_q, count_params = cypher.q_count(tags, tag_match)
+
+        async def work(tx):
+            rows = await _rows(tx, q, offset=offset, limit=limit, **params)
+            return rows, (await _single(tx, count_q, **count_params))["cnt"]
+
+        rows, total = await self.s.execute_read(work)
+        return AccountEntryPageDTO(items=cypher.to_entries(rows), total=total)
+
+    async def get_entries_after(self, *, limit: int = 50, after: AccountEntryCursorDTO | None = None,
+                                tags: Sequence[str] = (), tag_match: TagMatch = TagMatch.ANY,
+                                with_total: bool = False) -> AccountEntryPageDTO:
+        q, params = cypher.q_entries_after(after, tags, tag_match)
+        count_q, count_params = cypher.q_count(tags, tag_match)
+
+        async def work(tx):
+            rows = await _rows(tx, q, limit=limit, **params)
+            return rows, (await _single(tx, count_q, **count_params))["cnt"] if with_total else None
+
+        rows, total = await self.s.execute_read(work)
+        return cypher.to_page(rows, limit, total)
+
+    async def get_tag_counts(self, *, limit: int = 100) -> List[AccountEntryTagCountDTO]:
+        rows = await self.s.execute_read(_rows, cypher.Q_TAGS, limit=limit)
+        return cypher.to_tag_counts(rows)
+
+    async def search_entries(self, terms: Sequence[str], *, limit: int = 20,
+                             offset: int = 0) -> List[AccountEntrySearchHitDTO]:
+        if not terms:
+            return []
+        rows = await self.s.execute_read(_rows, cypher.Q_SEARCH, query=cypher.lucene_query(terms),
+                                         offset=offset, limit=limit)
+        return cypher.to_search_hits(rows)
+
+    async def get_sheet(self, *, limit: int = 50, offset: int = 0) -> List[AccountEntrySheetItemDTO]:
+        rows = await self.s.execute_read(_rows, cypher.Q_SHEET, offset=offset, limit=limit)
+        return cypher.to_sheet(rows)
+
+    async def count_entries(self) -> int:
+        rec = await self.s.execute_read(_single, cypher.Q_COUNT)
+        return int(rec["cnt"])
+
+    # CRUD
+    async def create_entry(self, account_entry_create: AccountEntryNodeCreateDTO) -> str:
+        nid = str(uuid.uuid4())
+        async with self._index_write():
+            rec = await self.s.execute_write(
+                _single, cypher.Q_CREATE, id=nid, title=account_entry_create.title, desc=account_entry_create.desc,
+                tags=account_entry_create.tags,
+            )
+            if self.graph_index is not None:
+                self.graph_index.upsert_entry(nid, title=account_entry_create.title, desc=account_entry_create.desc,
+                                              tags=account_entry_create.tags)
+        return rec["id"]
+
+    async def create_entries(self, account_entry_creates: Sequence[AccountEntryNodeCreateDTO], *,
+                             chunk_size: int = 1000) -> List[str]:
+        rows = [
+            {"id": str(uuid.uuid4()), "title": c.title, "desc": c.desc, "tags": c.tags}
+            for c in account_entry_creates
+        ]
+
+        async def work(tx):
+            for i in range(0, len(rows), chunk_size):
+                await _consume(tx, cypher.Q_CREATE_MANY, rows=rows[i:i + chunk_size])
+
+        if rows:
+            async with self._index_write():
+                await self.s.execute_write(work)
+                if self.graph_index is not None:
+                    for row in rows:
+                        self.graph_index.upsert_entry(
+                            row["id"], title=row["title"], desc=row["desc"], tags=row["tags"])
+        return [row["id"] for row in rows]
+
+    async def import_entries(self, entries: Sequence[AccountEntryNodeImportDTO], *, chunk_size: int = 1000) -> int:
+        rows = cypher.import_rows(entries)
+        batch = list(rows.values())
+
+        async def work(tx):
+            created = []
+            for i in range(0, len(batch), chunk_size):
+                created += [rec["id"] for rec in await _rows(tx, cypher.Q_IMPORT_MANY, rows=batch[i:i + chunk_size])]
+            return created
+
+        async with self._index_write():
+            created = await self.s.execute_write(work) if batch else []
+            if self.graph_index is not None:
+                for nid in created:
+                    row = rows[nid]
+                    self.graph_index.upsert_entry(nid, title=row["title"], desc=row["desc"], tags=row["tags"])
+        return len(created)
+
+    async def get_entry(self, account_entry_id: str) -> AccountEntryNode | None:
+        rec = await self.s.execute_read(_single, cypher.Q_GET, id=account_entry_id)
+        if rec is None:
+            return None
+        return AccountEntryNode.model_validate(dict(rec["n"]))
+
+    async def update_entry(self, account_entry_id: str, account_entry_patch: AccountEntryNodePatchDTO) -> bool:
+        props = account_entry_patch.model_dump(exclude_unset=True, exclude_none=True)
+        if len(props.keys()) == 0:
+            return False
+        async with self._index_write():
+            rec = await self.s.execute_write(_single, cypher.Q_UPDATE, id=account_entry_id, props=props)
+            if rec is not None and self.graph_index is not None:
+                self.graph_index.upsert_entry(account_entry_id, **props)
+        return rec is not None
+
+    async def delete_entry(self, account_entry_id: str) -> bool:
+        async with self._index_write():
+            summary = await self.s.execute_write(_consume, cypher.Q_DELETE, id=account_entry_id)
+            deleted = summary.counters.nodes_deleted > 0
+            if deleted and self.graph_index is not None:
+                self.graph_index.remove_entry(account_entry_id)
+        return deleted
+
+    # Relation
+    async def add_relation(self, relation_create: AccountEntryRelationCreateDTO) -> bool:
+        async with self._index_write():
+            rec = await self.s.execute_write(
+                _single, cypher.q_add_relation(relation_create.kind),
+                from_id=relation_create.from_id, to_id=relation_create.to_id,
+                props=AccountEntryRelationPropsDTO.model_dump(relation_create.props) or {},
+            )
+            if rec is not None and self.graph_index is not None:
+                self.graph_index.add_relation(
+                    relation_create.kind, relation_create.from_id, relation_create.to_id, dict(rec["r"]))
+        return rec is not None
+
+    async def apply_relation_ops(self, relation_ops: Sequence[AccountEntryRelationOpDTO], *,
+                                 chunk_size: int = 1000) -> List[bool]:
+        runs = cypher.group_relation_ops(relation_ops)
+
+        async def work(tx):
+            done = {}
+            for op, groups in runs:
+                for kind, rows in groups.items():
+                    q = cypher.q_relation_op(op, kind)
+                    for i in range(0, len(rows), chunk_size):
+                        recs = await _rows(tx, q, rows=rows[i:i + chunk_size])
+                        done.update((rec["idx"], rec["props"]) for rec in recs)
+            return done
+
+        async with self._index_write():
+            done = await self.s.execute_write(work) if runs else {}
+            if self.graph_index is not None:
+                for idx in sorted(done):
+                    o = relation_ops[idx]
+                    if o.op == RelationOp.LINK:
+                        self.graph_index.add_relation(o.kind, o.from_id, o.to_id, done[idx])
+                    else:
+                        self.graph_index.remove_relation(o.kind, o.from_id, o.to_id)
+        return [idx in done for idx in range(len(relation_ops))]
+
+    async def get_relations(self, entry_id: str) -> AccountEntryRelationsDTO:
+        if self.graph_index is not None:
+            return self.graph_index.get_relations(entry_id)
+
+        async def work(tx):
+            rows_out = await _rows(tx, cypher.Q_RELATIONS_OUT, id=entry_id)
+            return rows_out, await _rows(tx, cypher.Q_RELATIONS_IN, id=entry_id)
+
+        rows_out, rows_in = await self.s.execute_read(work)
+        return cypher.to_relations(rows_out, rows_in)
+
+    async def delete_relation(self, relation_delete: AccountEntryRelationDeleteDTO) -> int:
+        async with self._index_write():
+            rec = await self.s.execute_write(
+                _single, cypher.q_delete_relation(relation_delete.kind),
+                from_id=relation_delete.from_id, to_id=relation_delete.to_id,
+            )
+            if rec["cnt"] > 0 and self.graph_index is not None:
+                self.graph_index.remove_relation(relation_delete.kind, relation_delete.from_id, relation_delete.to_id)
+        return rec["cnt"]
+
+    # Function
+    async def get_entry_tree(self, start_id) -> AccountEntryTreeNodeDTO | None:
+        return await self._path_tree(start_id, reverse=False)
+
+    async def get_entry_tree_reverse(self, start_id) -> AccountEntryTreeNodeDTO | None:
+        return await self._path_tree(start_id, reverse=True)
+
+    async def _path_tree(self, start_id: str, *, reverse: bool) -> AccountEntryTreeNodeDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_path_tree(start_id, reverse=reverse)
+        params = cypher.tree_bounded_params(start_id, reverse=reverse, max_depth=None, max_nodes=None)
+        rec = await self.s.execute_read(_single, cypher.q_tree_bounded(reverse), **params)
+        return cypher.to_path_tree(start_id, rec)
+
+    async def get_entry_tree_bounded(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                                     max_nodes: int = 10000) -> AccountEntryTreeResultDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_tree(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        params = cypher.tree_bounded_params(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        rec = await self.s.execute_read(_single, cypher.q_tree_bounded(reverse), **params)
+        return cypher.to_tree_bounded(start_id, rec)
+
+    async def get_entry_tree_plan(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                                  max_nodes: int = 10000) -> AccountEntryTreePlanDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_tree_plan(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        params = cypher.tree_bounded_params(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        rec = await self.s.execute_read(_single, cypher.q_tree_bounded(reverse, ids_only=True), **params)
+        return cypher.to_tree_plan(start_id, rec)
+
+    async def get_entry_path_plan(self, start_id: str, *, reverse: bool = False) -> AccountEntryTreePlanDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_path_plan(start_id, reverse=reverse)
+        params = cypher.tree_bounded_params(start_id, reverse=reverse, max_depth=None, max_nodes=None)
+        rec = await self.s.execute_read(_single, cypher.q_tree_bounded(reverse, ids_only=True), **params)
+        return cypher.to_path_plan(start_id, rec)
+
+    async def get_tree_nodes(self, ids: Sequence[str]) -> List[dict | None]:
+        if self.graph_index is not None:
+            return self.graph_index.get_nodes(ids)
+        rows = await self.s.execute_read(_rows, cypher.Q_TREE_NODES, ids=list(ids))
+        return cypher.to_tree_nodes(ids, rows)
+
+    async def _forest(self, *, reverse: bool, roots_only: bool, limit: int | None,
+                      offset: int) -> List[AccountEntryTreeNodeDTO | None]:
+        params = cypher.forest_params(reverse=reverse, roots_only=roots_only, limit=limit, offset=offset)
+        rec = await self.s.execute_read(_single, cypher.q_forest(reverse, limited=limit is not None), **params)
+        return cypher.to_forest(rec)
+
+    async def get_entry_forest(self, *, roots_only: bool = False, limit: int | None = None,
+                               offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return await self._forest(reverse=False, roots_only=roots_only, limit=limit, offset=offset)
+
+    async def get_entry_forest_reverse(self, *, roots_only: bool = False, limit: int | None = None,
+                                       offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return await self._forest(reverse=True, roots_only=roots_only, limit=limit, offset=offset)
+
+    async def get_reachable(self, entry_id: str, *, reverse: bool = False,
+                            limit: int | None = None) -> AccountEntryReachDTO | None:
+        if self.graph_index is not None:
+            return self.graph_index.get_reachable(entry_id, reverse=reverse, limit=limit)
+        params = cypher.reachable_params(entry_id, reverse=reverse, limit=limit)
+        rec = await self.s.execute_read(_single, cypher.Q_REACHABLE, **params)
+        return cypher.to_reachable(entry_id, reverse, rec)
+
+    async def is_reachable(self, from_id: str, to_id: str) -> bool:
+        if self.graph_index is not None:
+            return self.graph_index.reaches(from_id, to_id)
+        rec = await self.s.execute_read(_single, cypher.Q_REACHES, from_id=from_id, to_id=to_id)
+        return rec is not None and rec["reachable"]
+
+    async def export_rows(self) -> AsyncIterator[dict]:
+        async with await self.s.begin_transaction() as tx:
+            async for row in await tx.run(cypher.Q_EXPORT_ENTRIES):
+                yield cypher.to_export_entry(row)
+            async for row in await tx.run(cypher.Q_EXPORT_RELATIONS):
+                yield cypher.to_export_relation(row)
+
+
+# Depends 팩토리
+from fastapi import Depends
+from devaccountbook_backend.db.async_driver import get_async_driver
+from devaccountbook_backend.db.neo import get_neo4j_async_session
+from devaccountbook_backend.repositories.graph_index import get_graph_index
+
+
+def get_async_account_entry_repo(
+        session: AsyncSession = Depends(get_neo4j_async_session)) -> AsyncAccountEntryRepository:
+    return AsyncAccountEntryRepository(session, get_graph_index())
+
+
+# 스트리밍 응답용: yield 의존성은 본문 전송 전에 정리되므로 본문 생성기 안에서 직접 열고 닫음
+def get_async_account_entry_repo_opener():
+    return asynccontextmanager(_open_async_repo)
+
+
+async def _open_async_repo() -> AsyncIterator[AsyncAccountEntryRepository]:
+    async with get_async_driver().session() as session:
+        yield AsyncAccountEntryRepository(session, get_graph_index())
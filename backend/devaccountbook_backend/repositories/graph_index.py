@@ -0,0 +1,298 @@
+import asyncio
+import threading
+from typing import Iterable, Optional, Sequence
+
+from neo4j import Session, AsyncSession
+
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryRelationDTO, AccountEntryRelationsDTO, \
+    AccountEntryTreeNodeDTO, AccountEntryTreeResultDTO, AccountEntryReachDTO, AccountEntryTreePlanDTO
+from devaccountbook_backend.repositories.normalize_neo import normalize_neo
+from devaccountbook_backend.repositories.reachability_index import ReachabilityIndex
+from devaccountbook_backend.repositories.tree_builder import build_account_entry_tree, bfs_order, \
+    plan_account_entry_tree, build_account_entry_path_tree, plan_account_entry_path_tree
+from devaccountbook_backend.schemas.common_enum import RelKind
+
+
+class AccountEntryGraphIndex:
+    """
+    AccountEntry 그래프의 메모리 사본 (원본은 Neo4j).
+    - 엔트리 id를 정수로 매핑하고 RelKind별 인접 리스트(out/in)를 유지
+    - AccountEntryRepository의 쓰기 직후 같은 변경을 반영 (단일 프로세스 기준)
+      저장소는 쓰기 트랜잭션과 반영을 write_lock(비동기는 async_write_lock) 안에서 → 반영 순서 = 커밋 순서
+    - reach=True면 RELATES_TO 전이 폐쇄(ReachabilityIndex)도 함께 유지 → 도달 여부/후손 수 O(1)
+    - 트리는 tree_builder 모양 (Neo4j 탐색과 같음) → 깊이 제한 없는 explore(경로 트리), bounded/plan 조회를 대신함
+    """
+
+    def __init__(self, reach: bool = True) -> None:
+        self._lock = threading.RLock()
+        self.write_lock = threading.Lock()
+        self.async_write_lock = asyncio.Lock()
+        self._reach_enabled = reach
+        self._reset()
+
+    def _reset(self) -> None:
+        self._index_of: dict[str, int] = {}
+        self._entry_ids: list[Optional[str]] = []
+        self._entries: list[Optional[dict]] = []
+        self._free: list[int] = []
+        self._out: dict[RelKind, list[list[int]]] = {k: [] for k in RelKind}
+        self._in: dict[RelKind, list[list[int]]] = {k: [] for k in RelKind}
+        self._rel_props: dict[tuple[RelKind, int, int], dict] = {}
+        self._reach: Optional[ReachabilityIndex[int]] = ReachabilityIndex() if self._reach_enabled else None
+
+    def __len__(self) -> int:
+        return len(self._index_of)
+
+    # --- 적재 ---
+    def load(self, entries: Iterable[dict], relations: Iterable[tuple[str, str, str, dict]]) -> None:
+        with self._lock:
+            self._reset()
+            for e in entries:
+                self.upsert_entry(e["id"], title=e.get("title"), desc=e.get("desc"), tags=e.get("tags"))
+            for kind, from_id, to_id, props in relations:
+                self._add_relation(RelKind(kind), from_id, to_id, props)
+            # 폐쇄는 간선을 모두 넣은 뒤 한 번에 계산
+            if self._reach is not None:
+                relates_to = self._out[RelKind.RELATES_TO]
+                self._reach.load((a, b) for a, bs in enumerate(relates_to) for b in bs)
+
+    # --- 쓰기 반영 ---
+    def upsert_entry(self, entry_id: str, **props) -> None:
+        with self._lock:
+            idx = self._index_of.get(entry_id)
+            if idx is None:
+                if self._free:
+                    idx = self._free.pop()
+                    self._entry_ids[idx] = entry_id
+                    self._entries[idx] = {}
+                else:
+                    idx = len(self._entry_ids)
+                    self._entry_ids.append(entry_id)
+                    self._entries.append({})
+                    for lists in (*self._out.values(), *self._in.values()):
+                        lists.append([])
+                self._index_of[entry_id] = idx
+                self._entries[idx] = {"title": None, "desc": None, "tags": []}
+            self._entries[idx].update({k: v for k, v in props.items() if k in ("title", "desc", "tags")})
+            if self._entries[idx]["tags"] is None:
+                self._entries[idx]["tags"] = []
+
+    def remove_entry(self, entry_id: str) -> None:
+        with self._lock:
+            idx = self._index_of.pop(entry_id, None)
+            if idx is None:
+                return
+            if self._reach is not None:
+                self._reach.remove_node(idx)
+            for kind in RelKind:
+                for other in self._out[kind][idx]:
+                    self._in[kind][other].remove(idx)
+                    self._rel_props.pop((kind, idx, other), None)
+                for other in self._in[kind][idx]:
+                    self._out[kind][other].remove(idx)
+                    self._rel_props.pop((kind, other, idx), None)
+                self._out[kind][idx] = []
+                self._in[kind][idx] = []
+            self._entry_ids[idx] = None
+            self._entries[idx] = None
+            self._free.append(idx)
+
+    def add_relation(self, kind: RelKind, from_id: str, to_id: str, props: Optional[dict] = None) -> None:
+        with self._lock:
+            added = self._add_relation(kind, from_id, to_id, props)
+            if added is not None and kind == RelKind.RELATES_TO and self._reach is not None:
+                self._reach.add_edge(*added)
+
+    def _add_relation(self, kind: RelKind, from_id: str, to_id: str,
+                      props: Optional[dict]) -> Optional[tuple[int, int]]:
+        # 새로 생긴 간선이면 (from, to) 정수 id
+        a, b = self._index_of.get(from_id), self._index_of.get(to_id)
+        if a is None or b is None:
+            return None
+        key = (kind, a, b)
+        new = key not in self._rel_props
+        if new:
+            self._out[kind][a].append(b)
+            self._in[kind][b].append(a)
+        self._rel_props[key] = normalize_neo(props or {})
+        return (a, b) if new else None
+
+    def remove_relation(self, kind: RelKind, from_id: str, to_id: str) -> None:
+        with self._lock:
+            a, b = self._index_of.get(from_id), self._index_of.get(to_id)
+            if a is None or b is None or self._rel_props.pop((kind, a, b), None) is None:
+                return
+            self._out[kind][a].remove(b)
+            self._in[kind][b].remove(a)
+            if kind == RelKind.RELATES_TO and self._reach is not None:
+                self._reach.remove_edge(a, b)
+
+    # --- 조회 ---
+    def has_entry(self, entry_id: str) -> bool:
+        return entry_id in self._index_of
+
+    def get_relations(self, entry_id: str) -> AccountEntryRelationsDTO:
+        with self._lock:
+            outgoing, incoming = [], []
+            idx = self._index_of.get(entry_id)
+            if idx is not None:
+                for kind in sorted(RelKind, key=lambda k: k.value):
+                    for b in sorted(self._out[kind][idx], key=lambda i: self._entry_ids[i]):
+                        outgoing.append(self._relation(kind, idx, b))
+                    for a in sorted(self._in[kind][idx], key=lambda i: self._entry_ids[i]):
+                        incoming.append(self._relation(kind, a, idx))
+            return AccountEntryRelationsDTO(outgoing=outgoing, incoming=incoming)
+
+    def _relation(self, kind: RelKind, a: int, b: int) -> AccountEntryRelationDTO:
+        return AccountEntryRelationDTO.model_validate({
+            "kind": kind,
+            "from_id": self._entry_ids[a],
+            "to_id": self._entry_ids[b],
+            "props": self._rel_props[(kind, a, b)],
+        })
+
+    def get_reachable(self, entry_id: str, *, reverse: bool = False,
+                      limit: int | None = None) -> AccountEntryReachDTO | None:
+        """RELATES_TO 후손(reverse면 조상) id. 폐쇄가 있으면 집합 그대로, 없으면 BFS."""
+        with self._lock:
+            idx = self._index_of.get(entry_id)
+            if idx is None:
+                return None
+            if self._reach is not None:
+                found = self._reach.ancestors(idx) if reverse else self._reach.descendants(idx)
+            else:
+                adjacency = (self._in if reverse else self._out)[RelKind.RELATES_TO]
+                found = set(bfs_order(idx, adjacency.__getitem__)[0][1:])
+            ids = sorted(self._entry_ids[i] for i in found)
+        return AccountEntryReachDTO(entry_id=entry_id, reverse=reverse, count=len(ids), ids=ids[:limit])
+
+    def reaches(self, from_id: str, to_id: str) -> bool:
+        with self._lock:
+            a, b = self._index_of.get(from_id), self._index_of.get(to_id)
+            if a is None or b is None:
+                return False
+            if self._reach is not None:
+                return self._reach.reaches(a, b)
+            order, _ = bfs_order(a, self._out[RelKind.RELATES_TO].__getitem__)
+            return b in order
+
+    def _tree_parts(self, start_id: str, *, reverse: bool, max_depth: int | None,
+                    max_nodes: int | None) -> tuple[dict[str, dict], list[tuple[str, str]], bool] | None:
+        with self._lock:
+            start = self._index_of.get(start_id)
+            if start is None:
+                return None
+            adjacency = (self._in if reverse else self._out)[RelKind.RELATES_TO]
+            order, capped = bfs_order(start, adjacency.__getitem__, max_depth=max_depth, max_nodes=max_nodes)
+            nodes = {self._entry_ids[i]: self._entries[i] for i in order}
+            edges = [
+                (self._entry_ids[a], self._entry_ids[b])
+                for a in order
+                for b in sorted(adjacency[a], key=lambda i: self._entry_ids[i])
+            ]
+        return nodes, edges, capped
+
+    def get_tree(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                 max_nodes: int | None = None) -> AccountEntryTreeResultDTO | None:
+        """RELATES_TO 방향(reverse면 역방향) BFS로 노드/간선을 모아 tree_builder로 조립."""
+        parts = self._tree_parts(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        if parts is None:
+            return None
+        nodes, edges, capped = parts
+        return build_account_entry_tree(start_id, nodes, edges, truncated=capped)
+
+    def get_tree_plan(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                      max_nodes: int | None = None) -> AccountEntryTreePlanDTO | None:
+        """get_tree와 같은 탐색의 골격 (스트리밍 explore)."""
+        parts = self._tree_parts(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        if parts is None:
+            return None
+        nodes, edges, capped = parts
+        return plan_account_entry_tree(start_id, nodes, edges, truncated=capped)
+
+    def _path_parts(self, start_id: str, *, reverse: bool) -> tuple[dict[str, dict], list[tuple[str, str]]] | None:
+        # 도달 가능한 노드/간선 전부, 시작 노드가 없거나 연결된 간선이 없으면 None
+        parts = self._tree_parts(start_id, reverse=reverse, max_depth=None, max_nodes=None)
+        if parts is None or not parts[1]:
+            return None
+        return parts[0], parts[1]
+
+    def get_path_tree(self, start_id: str, *, reverse: bool = False) -> AccountEntryTreeNodeDTO | None:
+        """깊이 제한 없는 explore (build_account_entry_path_tree 모양, 공유 후손은 위치마다 펼침)."""
+        parts = self._path_parts(start_id, reverse=reverse)
+        if parts is None:
+            return None
+        nodes, edges = parts
+        return build_account_entry_path_tree(start_id, nodes, edges)
+
+    def get_path_plan(self, start_id: str, *, reverse: bool = False) -> AccountEntryTreePlanDTO | None:
+        """get_path_tree의 골격 (스트리밍 explore)."""
+        parts = self._path_parts(start_id, reverse=reverse)
+        return None if parts is None else plan_account_entry_path_tree(start_id, parts[1])
+
+    def get_nodes(self, ids: Sequence[str]) -> list[dict | None]:
+        """id 순서대로 노드 속성 (없으면 None)."""
+        with self._lock:
+            return [self._entries[i] if (i := self._index_of.get(node_id)) is not None else None for node_id in ids]
+
+
+Q_INDEX_ENTRIES = "MATCH (n:AccountEntry) RETURN n.id AS id, n.title AS title, n.desc AS desc, n.tags AS tags"
+Q_INDEX_RELATIONS = """
+MATCH (a:AccountEntry)-[r]->(b:AccountEntry)
+RETURN type(r) AS kind, a.id AS from_id, b.id AS to_id, properties(r) AS props
+"""
+
+
+def _index_relation(row) -> Optional[tuple]:
+    if row["kind"] not in RelKind._value2member_map_:
+        return None
+    return row["kind"], row["from_id"], row["to_id"], row["props"]
+
+
+def load_graph_index(session: Session, index: AccountEntryGraphIndex) -> None:
+    def work(tx):
+        entries = [dict(row) for row in tx.run(Q_INDEX_ENTRIES)]
+        relations = [rel for rel in map(_index_relation, tx.run(Q_INDEX_RELATIONS)) if rel]
+        return entries, relations
+
+    entries, relations = session.execute_read(work)
+    index.load(entries, relations)
+
+
+async def load_graph_index_async(session: AsyncSession, index: AccountEntryGraphIndex) -> None:
+    async def work(tx):
+        entries = [dict(row) async for row in await tx.run(Q_INDEX_ENTRIES)]
+        relations = [rel async for row in await tx.run(Q_INDEX_RELATIONS) if (rel := _index_relation(row))]
+        return entries, relations
+
+    entries, relations = await session.execute_read(work)
+    index.load(entries, relations)
+
+
+graph_index = None  # type: Optional[AccountEntryGraphIndex]
+
+
+def init_graph_index(session: Session, reach: bool = True) -> AccountEntryGraphIndex:
+    global graph_index
+    index = AccountEntryGraphIndex(reach)
+    load_graph_index(session, index)
+    graph_index = index
+    return index
+
+
+async def init_graph_index_async(session: AsyncSession, reach: bool = True) -> AccountEntryGraphIndex:
+    global graph_index
+    index = AccountEntryGraphIndex(reach)
+    await load_graph_index_async(session, index)
+    graph_index = index
+    return index
+
+
+def close_graph_index():
+    global graph_index
+    graph_index = None
+
+
+def get_graph_index() -> Optional[AccountEntryGraphIndex]:
+    # 비활성화 상태면 None
+    return graph_index
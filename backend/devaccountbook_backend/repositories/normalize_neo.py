@@ -1,13 +1,101 @@
-# repositories/_normalize.py (새 파일로 두거나 repo 안에 함수로)
+# Neo4j 값 → Python 표준 타입 (관계 props / export 행)
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
 from neo4j.time import DateTime as NeoDateTime, Date as NeoDate, Time as NeoTime, Duration as NeoDuration
 
+_NEO_TEMPORAL = (NeoDateTime, NeoDate, NeoTime)
+_MISSING = object()
+
+# 타입별 변환 함수 캐시 (None = 이미 표준 타입이라 그대로)
+# 처음 보는 타입만 isinstance로 판정하고 이후에는 type(v) 한 번 조회
+_DISPATCH: Dict[type, Optional[Callable[[Any], Any]]] = {
+    str: None, int: None, float: None, bool: None, type(None): None, bytes: None,
+}
+
+
+def _to_native(v):
+    return v.to_native()
+
+
+def _duration(v: NeoDuration):
+    # Duration에는 to_native가 없음 → 월 단위가 없으면 timedelta, 있으면 ISO 문자열 (길이가 정해지지 않음)
+    if v.months:
+        return str(v)
+    return timedelta(days=v.days, seconds=v.seconds, microseconds=v.nanoseconds // 1000)
+
+
+def _resolve(t: type) -> Optional[Callable[[Any], Any]]:
+    if issubclass(t, NeoDuration):
+        fn = _duration
+    elif issubclass(t, _NEO_TEMPORAL):
+        fn = _to_native
+    elif issubclass(t, list):
+        fn = _normalize_list
+    elif issubclass(t, dict):
+        fn = _normalize_dict
+    else:
+        fn = None
+    _DISPATCH[t] = fn
+    return fn
+
+
+def _normalize_list(v: list) -> list:
+    get = _DISPATCH.get
+    out = None
+    for i, x in enumerate(v):
+        fn = get(type(x), _MISSING)
+        if fn is _MISSING:
+            fn = _resolve(type(x))
+        if fn is None:
+            continue
+        y = fn(x)
+        if y is not x:
+            if out is None:
+                out = list(v)
+            out[i] = y
+    return v if out is None else out
+
+
+def _normalize_dict(v: dict) -> dict:
+    # props는 보통 평평한 맵에 datetime 몇 개 → 바뀐 값이 있을 때만 복사
+    get = _DISPATCH.get
+    out = None
+    for k, x in v.items():
+        fn = get(type(x), _MISSING)
+        if fn is _MISSING:
+            fn = _resolve(type(x))
+        if fn is None:
+            continue
+        y = fn(x)
+        if y is not x:
+            if out is None:
+                out = dict(v)
+            out[k] = y
+    return v if out is None else out
+
 
 def normalize_neo(v):
-    # Neo4j temporal → Python 표준 타입
-    if isinstance(v, (NeoDateTime, NeoDate, NeoTime, NeoDuration)):
-        return v.to_native()
-    if isinstance(v, list):
-        return [normalize_neo(x) for x in v]
-    if isinstance(v, dict):
-        return {k: normalize_neo(x) for k, x in v.items()}
-    return v
+    """
+    Neo4j temporal → Python 표준 타입 (list/dict는 안쪽까지).
+    바꿀 값이 없으면 입력 객체를 그대로 반환하므로 결과를 수정하지 말 것.
+    """
+    fn = _DISPATCH.get(type(v), _MISSING)
+    if fn is _MISSING:
+        fn = _resolve(type(v))
+    return v if fn is None else fn(v)
+
+
+def normalize_neo_rows(rows: Iterable, key: str = "props") -> List[dict]:
+    """결과 행들의 row[key](없으면 {})를 한 번에 정규화."""
+    normalize = _normalize_dict
+    out = []
+    for row in rows:
+        v = row[key]
+        if not v:
+            out.append({})
+        elif type(v) is dict:
+            out.append(normalize(v))
+        else:
+            out.append(normalize_neo(v))
+    return out
@@ -0,0 +1,97 @@
+from collections import deque
+from typing import Generic, Hashable, Iterable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class ReachabilityIndex(Generic[K]):
+    """
+    RELATES_TO 전이 폐쇄 (노드별 후손/조상 집합).
+    - 간선 추가: 조상 x 후손 쌍만 더함 (증분)
+    - 간선/노드 삭제: 영향받는 조상(삭제 간선 시작점과 그 조상)만 후손 집합을 다시 계산
+    - 집합에는 길이 1 이상 경로로 닿는 노드만 들어감 (자기 자신은 cycle에 속할 때만)
+    - 메모리는 폐쇄 크기(도달 가능한 쌍 수)에 비례
+    잠금은 호출하는 쪽(AccountEntryGraphIndex)이 잡음.
+    """
+
+    def __init__(self) -> None:
+        self._out: dict[K, set[K]] = {}
+        self._desc: dict[K, set[K]] = {}
+        self._anc: dict[K, set[K]] = {}
+
+    def load(self, edges: Iterable[tuple[K, K]]) -> None:
+        self.__init__()
+        for a, b in edges:
+            self._out.setdefault(a, set()).add(b)
+        for a in list(self._out):
+            self._set_descendants(a, self._walk(a))
+
+    def add_edge(self, a: K, b: K) -> None:
+        out = self._out.setdefault(a, set())
+        if b in out:
+            return
+        out.add(b)
+        targets = self._desc.get(b, set()) | {b}
+        for x in self._anc.get(a, set()) | {a}:
+            desc = self._desc.setdefault(x, set())
+            for d in targets - desc:
+                desc.add(d)
+                self._anc.setdefault(d, set()).add(x)
+
+    def remove_edge(self, a: K, b: K) -> None:
+        out = self._out.get(a)
+        if not out or b not in out:
+            return
+        out.discard(b)
+        self._recompute(self._anc.get(a, set()) | {a})
+
+    def remove_node(self, x: K) -> None:
+        affected = self._anc.get(x, set()) - {x}
+        for d in self._desc.pop(x, set()):
+            self._anc[d].discard(x)
+        for a in self._anc.pop(x, set()):
+            if a != x:
+                self._desc[a].discard(x)
+        self._out.pop(x, None)
+        for out in self._out.values():
+            out.discard(x)
+        self._recompute(affected)
+
+    # --- 조회 (자기 자신 제외) ---
+    def descendants(self, x: K) -> set[K]:
+        return self._desc.get(x, set()) - {x}
+
+    def ancestors(self, x: K) -> set[K]:
+        return self._anc.get(x, set()) - {x}
+
+    def reaches(self, a: K, b: K) -> bool:
+        return a == b or b in self._desc.get(a, ())
+
+    def pair_count(self) -> int:
+        return sum(len(d) for d in self._desc.values())
+
+    def _walk(self, start: K) -> set[K]:
+        seen: set[K] = set()
+        queue = deque(self._out.get(start, ()))
+        while queue:
+            n = queue.popleft()
+            if n in seen:
+                continue
+            seen.add(n)
+            queue.extend(self._out.get(n, ()))
+        return seen
+
+    def _recompute(self, roots: Iterable[K]) -> None:
+        for x in list(roots):
+            self._set_descendants(x, self._walk(x))
+
+    def _set_descendants(self, x: K, new: set[K]) -> None:
+        old = self._desc.get(x, set())
+        for d in old - new:
+            self._anc[d].discard(x)
+        for d in new - old:
+            self._anc.setdefault(d, set()).add(x)
+        if new:
+            self._desc[x] = new
+        else:
+            self._desc.pop(x, None)
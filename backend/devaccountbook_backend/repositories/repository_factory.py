@@ -0,0 +1,25 @@
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Generator
+
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.db.driver import get_driver
+from devaccountbook_backend.db.sqlite import get_sqlite_connection
+from devaccountbook_backend.repositories.account_entry_repo import AccountEntryRepository
+from devaccountbook_backend.repositories.account_entry_repo_base import AccountEntryRepositoryBase
+from devaccountbook_backend.repositories.graph_index import get_graph_index
+from devaccountbook_backend.repositories.sqlite_account_entry_repo import SqliteAccountEntryRepository
+
+
+# Depends 팩토리: Settings.storage_backend에 따라 요청 단위 저장소 생성
+def get_account_entry_repository() -> Generator[AccountEntryRepositoryBase, None, None]:
+    if settings.storage_backend == "sqlite":
+        for conn in get_sqlite_connection():
+            yield SqliteAccountEntryRepository(conn)
+    else:
+        with get_driver().session() as session:  # type: ignore[attr-defined]
+            yield AccountEntryRepository(session, get_graph_index())
+
+
+# 스트리밍 응답용: yield 의존성은 본문 전송 전에 정리되므로 본문 생성기 안에서 직접 열고 닫음
+def get_account_entry_repository_opener() -> Callable[[], ContextManager[AccountEntryRepositoryBase]]:
+    return contextmanager(get_account_entry_repository)
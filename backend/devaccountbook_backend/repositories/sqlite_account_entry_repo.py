@@ -0,0 +1,604 @@
+import json
+import sqlite3
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, Sequence
+
+from devaccountbook_backend.db.migrations import migrate_sqlite
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeCreateDTO, AccountEntryNodePatchDTO, \
+    AccountEntryRelationCreateDTO, AccountEntryRelationDTO, AccountEntryRelationDeleteDTO, AccountEntryRelationsDTO, \
+    AccountEntryTreeNodeDTO, AccountEntrySheetItemDTO, AccountEntryCursorDTO, AccountEntryPageDTO, \
+    AccountEntryRelationOpDTO, AccountEntryTreeResultDTO, AccountEntryReachDTO, AccountEntryTagCountDTO, \
+    AccountEntrySearchHitDTO, AccountEntryNodeImportDTO, \
+    AccountEntryTreePlanDTO
+from devaccountbook_backend.models.account_entry_domain import AccountEntryNode
+from devaccountbook_backend.repositories.account_entry_repo_base import AccountEntryRepositoryBase
+from devaccountbook_backend.repositories.tree_builder import build_account_entry_tree, bfs_order, \
+    plan_account_entry_tree, build_account_entry_forest, build_account_entry_path_tree, \
+    plan_account_entry_path_tree
+from devaccountbook_backend.schemas.common_enum import RelKind, RelationOp, TagMatch
+
+# IN (...) 바인딩 변수 개수 제한 대비
+_IN_CHUNK = 900
+
+# 주어진 시작 노드들(JSON 배열)에서 길이 1 이상 RELATES_TO 경로로 닿는 (root, id) 쌍
+_REACH_FROM_ROOTS = """
+WITH RECURSIVE reach(root, id) AS (
+    SELECT from_id, to_id FROM account_entry_relation
+    WHERE kind = 'RELATES_TO' AND from_id IN (SELECT value FROM json_each(?))
+    UNION
+    SELECT reach.root, r.to_id FROM reach JOIN account_entry_relation r ON r.from_id = reach.id
+    WHERE r.kind = 'RELATES_TO'
+)
+SELECT root, id FROM reach
+"""
+
+
+def _now() -> str:
+    # 고정 길이 ISO 문자열 → 문자열 정렬 = 시간 정렬
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _json_default(v):
+    if isinstance(v, datetime):
+        return v.isoformat()
+    raise TypeError(f"not JSON serializable: {type(v)!r}")
+
+
+def _to_node(row: sqlite3.Row) -> AccountEntryNode:
+    return AccountEntryNode.model_validate({
+        "id": row["id"],
+        "title": row["title"],
+        "desc": row["description"],
+        "tags": json.loads(row["tags"]),
+        "createdAt": row["created_at"],
+        "updatedAt": row["updated_at"],
+    })
+
+
+def _where(conditions: Sequence[str]) -> str:
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+
+def _tree_props(row: sqlite3.Row) -> dict:
+    return {"id": row["id"], "title": row["title"], "desc": row["description"], "tags": json.loads(row["tags"])}
+
+
+class SqliteAccountEntryRepository(AccountEntryRepositoryBase):
+    """
+    SQLite 저장소 (로컬 단일 사용자용, 외부 서버 불필요).
+    - 엔트리/관계(kind, props)/태그를 테이블로 저장 (태그는 필터/집계용 account_entry_tag에도 정규화)
+    - 트리는 재귀 CTE로 도달 가능한 간선을 모은 뒤 tree_builder로 조립 (bounded는 Neo4j bounded 탐색,
+      깊이 제한 없는 explore는 apoc.paths.toJsonTree와 같은 형태)
+    - RELATES_TO 전이 폐쇄(account_entry_reach)를 관계 쓰기와 같은 트랜잭션에서 증분 갱신 (추가/삭제 모두)
+      → 도달 여부/후손·조상 목록과 깊이 제한 없는 트리는 재귀 없이 인덱스 조회
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.c = conn
+
+    @contextmanager
+    def _tx(self, mode: str = "DEFERRED"):
+        self.c.execute(f"BEGIN {mode}")
+        try:
+            yield
+        except BaseException:
+            self.c.execute("ROLLBACK")
+            raise
+        self.c.execute("COMMIT")
+
+    def _write(self):
+        return self._tx("IMMEDIATE")
+
+    def bootstrap(self) -> None:
+        migrate_sqlite(self.c)
+
+    #  집계 함수
+    # 태그 조건: account_entry_tag (tag, entry_id) 기본키로 후보 id를 찾음 (all이면 태그를 모두 가진 id만)
+    @staticmethod
+    def _tag_filter(tags: Sequence[str], tag_match: TagMatch) -> tuple[list[str], list]:
+        if not tags:
+            return [], []
+        distinct = sorted(set(tags))
+        sql = f"SELECT entry_id FROM account_entry_tag WHERE tag IN ({','.join('?' * len(distinct))})"
+        if tag_match == TagMatch.ALL:
+            return [f"id IN ({sql} GROUP BY entry_id HAVING count(*) = ?)"], [*distinct, len(distinct)]
+        return [f"id IN ({sql})"], distinct
+
+    def get_entries(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                    tag_match: TagMatch = TagMatch.ANY) -> List[AccountEntryNode]:
+        where, params = self._tag_filter(tags, tag_match)
+        rows = self.c.execute(
+            f"SELECT * FROM account_entry {_where(where)} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset)
+        ).fetchall()
+        return [_to_node(row) for row in rows]
+
+    def get_entries_counted(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                            tag_match: TagMatch = TagMatch.ANY) -> AccountEntryPageDTO:
+        with self._tx():
+            items = self.get_entries(limit=limit, offset=offset, tags=tags, tag_match=tag_match)
+            total = self._count(tags, tag_match)
+        return AccountEntryPageDTO(items=items, total=total)
+
+    def get_entries_after(self, *, limit: int = 50, after: AccountEntryCursorDTO | None = None,
+                          tags: Sequence[str] = (), tag_match: TagMatch = TagMatch.ANY,
+                          with_total: bool = False) -> AccountEntryPageDTO:
+        where, params = self._tag_filter(tags, tag_match)
+        if after is not None:
+            where.append("(created_at, id) < (?, ?)")
+            params.extend((after.created_at, after.id))
+        with self._tx():
+            rows = self.c.execute(
+                f"SELECT * FROM account_entry {_where(where)} ORDER BY created_at DESC, id DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+            total = self._count(tags, tag_match) if with_total else None
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = AccountEntryCursorDTO(created_at=rows[-1]["created_at"], id=rows[-1]["id"])
+        return AccountEntryPageDTO(items=[_to_node(row) for row in rows], next_cursor=next_cursor, total=total)
+
+    # 태그 조건이 없으면 카운터 행, 있으면 account_entry_tag 인덱스로 센다
+    def _count(self, tags: Sequence[str], tag_match: TagMatch) -> int:
+        if not tags:
+            return self.count_entries()
+        where, params = self._tag_filter(tags, tag_match)
+        return self.c.execute(f"SELECT count(*) FROM account_entry {_where(where)}", params).fetchone()[0]
+
+    def get_sheet(self, *, limit: int = 50, offset: int = 0) -> List[AccountEntrySheetItemDTO]:
+        with self._tx():
+            entries = self.get_entries(limit=limit, offset=offset)
+            links: dict[str, list[dict]] = {e.id: [] for e in entries}
+            for ids in self._chunks([e.id for e in entries]):
+                rows = self.c.execute(
+                    f"""
+                    SELECT r.from_id AS from_id, r.kind AS kind, e.*
+                    FROM account_entry_relation r JOIN account_entry e ON e.id = r.to_id
+                    WHERE r.from_id IN ({",".join("?" * len(ids))})
+                    ORDER BY r.from_id, r.kind, r.to_id
+                    """, ids).fetchall()
+                for row in rows:
+                    links[row["from_id"]].append({"kind": row["kind"], "node": _to_node(row)})
+        return [AccountEntrySheetItemDTO(node=e, links=links[e.id]) for e in entries]
+
+    def count_entries(self) -> int:
+        return self.c.execute("SELECT value FROM account_entry_counter WHERE name = 'entries'").fetchone()[0]
+
+    def get_tag_counts(self, *, limit: int = 100) -> List[AccountEntryTagCountDTO]:
+        rows = self.c.execute(
+            "SELECT tag, count(*) AS cnt FROM account_entry_tag GROUP BY tag ORDER BY cnt DESC, tag LIMIT ?",
+            (limit,)).fetchall()
+        return [AccountEntryTagCountDTO(name=row["tag"], count=row["cnt"]) for row in rows]
+
+    def search_entries(self, terms: Sequence[str], *, limit: int = 20,
+                       offset: int = 0) -> List[AccountEntrySearchHitDTO]:
+        # FTS5 접두어 OR 검색, bm25는 작을수록 관련도 높음 → score = -bm25
+        if not terms:
+            return []
+        match = " OR ".join(f'"{t}"*' for t in terms)
+        rows = self.c.execute(
+            """
+            SELECT e.*, -bm25(account_entry_fts) AS score
+            FROM account_entry_fts JOIN account_entry e ON e.rowid = account_entry_fts.rowid
+            WHERE account_entry_fts MATCH ?
+            ORDER BY bm25(account_entry_fts), e.id
+            LIMIT ? OFFSET ?
+            """, (match, limit, offset)).fetchall()
+        return [AccountEntrySearchHitDTO(node=_to_node(row), score=row["score"]) for row in rows]
+
+    # CRUD
+    def create_entry(self, account_entry_create: AccountEntryNodeCreateDTO) -> str:
+        return self.create_entries([account_entry_create])[0]
+
+    def create_entries(self, account_entry_creates: Sequence[AccountEntryNodeCreateDTO], *,
+                       chunk_size: int = 1000) -> List[str]:
+        now = _now()
+        rows = [
+            (str(uuid.uuid4()), c.title, c.desc, json.dumps(c.tags), now)
+            for c in account_entry_creates
+        ]
+        tag_rows = [(tag, row[0]) for row, c in zip(rows, account_entry_creates) for tag in set(c.tags)]
+        if rows:
+            with self._write():
+                for i in range(0, len(rows), chunk_size):
+                    self.c.executemany(
+                        "INSERT INTO account_entry (id, title, description, tags, created_at) VALUES (?, ?, ?, ?, ?)",
+                        rows[i:i + chunk_size])
+                self.c.executemany("INSERT INTO account_entry_tag (tag, entry_id) VALUES (?, ?)", tag_rows)
+        return [row[0] for row in rows]
+
+    def import_entries(self, entries: Sequence[AccountEntryNodeImportDTO], *, chunk_size: int = 1000) -> int:
+        by_id = {e.id: e for e in entries}
+        now = _now()
+        with self._write():
+            existing = set()
+            for ids in self._chunks(list(by_id)):
+                existing.update(row[0] for row in self.c.execute(
+                    f"SELECT id FROM account_entry WHERE id IN ({','.join('?' * len(ids))})", ids))
+            new = [e for nid, e in by_id.items() if nid not in existing]
+            rows = [(e.id, e.title, e.desc, json.dumps(e.tags), now) for e in new]
+            for i in range(0, len(rows), chunk_size):
+                self.c.executemany(
+                    "INSERT INTO account_entry (id, title, description, tags, created_at) VALUES (?, ?, ?, ?, ?)",
+                    rows[i:i + chunk_size])
+            self.c.executemany("INSERT INTO account_entry_tag (tag, entry_id) VALUES (?, ?)",
+                               [(tag, e.id) for e in new for tag in set(e.tags)])
+        return len(new)
+
+    def get_entry(self, account_entry_id: str) -> AccountEntryNode | None:
+        row = self.c.execute("SELECT * FROM account_entry WHERE id = ?", (account_entry_id,)).fetchone()
+        return _to_node(row) if row else None
+
+    def update_entry(self, account_entry_id: str, account_entry_patch: AccountEntryNodePatchDTO) -> bool:
+        props = account_entry_patch.model_dump(exclude_unset=True, exclude_none=True)
+        if len(props.keys()) == 0:
+            return False
+        columns = {"title": "title", "desc": "description", "tags": "tags"}
+        sets = [f"{columns[k]} = ?" for k in props]
+        values = [json.dumps(v) if k == "tags" else v for k, v in props.items()]
+        with self._write():
+            cur = self.c.execute(
+                f"UPDATE account_entry SET {', '.join(sets)}, updated_at = ? WHERE id = ?",
+                (*values, _now(), account_entry_id))
+            if cur.rowcount > 0 and "tags" in props:
+                self.c.execute("DELETE FROM account_entry_tag WHERE entry_id = ?", (account_entry_id,))
+                self.c.executemany("INSERT INTO account_entry_tag (tag, entry_id) VALUES (?, ?)",
+                                   [(tag, account_entry_id) for tag in set(props["tags"])])
+        return cur.rowcount > 0
+
+    def delete_entry(self, account_entry_id: str) -> bool:
+        # RELATES_TO 간선을 하나씩 끊으며 폐쇄를 증분 갱신 (나가는 쪽 먼저 → 들어오는 간선은 후손이 거의 없음)
+        # 나머지 관계/폐쇄 행은 ON DELETE CASCADE
+        with self._write():
+            for sql in ("SELECT from_id, to_id FROM account_entry_relation WHERE from_id = ? AND kind = 'RELATES_TO'",
+                        "SELECT from_id, to_id FROM account_entry_relation WHERE to_id = ? AND kind = 'RELATES_TO'"):
+                for from_id, to_id in self.c.execute(sql, (account_entry_id,)).fetchall():
+                    self._unlink(from_id, to_id, RelKind.RELATES_TO)
+            cnt = self.c.execute("DELETE FROM account_entry WHERE id = ?", (account_entry_id,)).rowcount
+        return cnt > 0
+
+    # Relation
+    def _link(self, from_id: str, to_id: str, kind: RelKind, props: dict) -> bool:
+        # MERGE + SET r += props 와 같은 동작 (None 값은 무시), 생성 시 createdAt 기록
+        found = self.c.execute(
+            "SELECT count(*) FROM account_entry WHERE id IN (?, ?)", (from_id, to_id)).fetchone()[0]
+        if found != len({from_id, to_id}):
+            return False
+        row = self.c.execute(
+            "SELECT props FROM account_entry_relation WHERE from_id = ? AND kind = ? AND to_id = ?",
+            (from_id, kind.value, to_id)).fetchone()
+        merged = json.loads(row["props"]) if row else {"createdAt": _now()}
+        merged.update({k: v for k, v in props.items() if v is not None})
+        self.c.execute(
+            "INSERT INTO account_entry_relation (from_id, kind, to_id, props) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (from_id, kind, to_id) DO UPDATE SET props = excluded.props",
+            (from_id, kind.value, to_id, json.dumps(merged, default=_json_default)))
+        if row is None and kind == RelKind.RELATES_TO:
+            self._reach_add(from_id, to_id)
+        return True
+
+    def _unlink(self, from_id: str, to_id: str, kind: RelKind) -> int:
+        cnt = self.c.execute(
+            "DELETE FROM account_entry_relation WHERE from_id = ? AND kind = ? AND to_id = ?",
+            (from_id, kind.value, to_id)).rowcount
+        if cnt > 0 and kind == RelKind.RELATES_TO:
+            self._reach_remove(from_id, to_id)
+        return cnt
+
+    # --- 전이 폐쇄 갱신 (호출하는 쪽의 쓰기 트랜잭션 안에서) ---
+    def _reach_add(self, from_id: str, to_id: str) -> None:
+        # (from의 조상 + from) x (to의 후손 + to)
+        self.c.execute(
+            """
+            INSERT OR IGNORE INTO account_entry_reach (ancestor, descendant)
+            SELECT a.id, d.id
+            FROM (SELECT ancestor AS id FROM account_entry_reach WHERE descendant = :from_id UNION SELECT :from_id) a,
+                 (SELECT descendant AS id FROM account_entry_reach WHERE ancestor = :to_id UNION SELECT :to_id) d
+            """, {"from_id": from_id, "to_id": to_id})
+
+    def _reach_remove(self, from_id: str, to_id: str) -> None:
+        # 간선 from → to를 지운 직후 (간선 행은 이미 삭제됨)
+        # A = from의 조상 + from 은 여전히 from에 닿으므로 잃을 수 있는 쌍은 A x L 뿐
+        # (L = to 쪽 노드 중 from이 남은 간선으로 더는 닿지 못하는 것)
+        # → A 중 to에 못 닿게 된 조상 x L 쌍만 지우고 그 안에서 다시 유도
+        # from을 지나는 순환이 있으면 폐쇄에 지운 간선이 섞여 있어 조상 전체를 다시 계산
+        params = {"from_id": from_id, "to_id": to_id}
+        cyclic = from_id == to_id or self.c.execute(
+            """
+            SELECT 1 FROM account_entry_reach WHERE ancestor = :to_id AND descendant = :from_id
+            UNION ALL
+            SELECT 1 FROM account_entry_relation r
+            WHERE r.from_id = :from_id AND r.kind = 'RELATES_TO'
+              AND (r.to_id = :from_id OR EXISTS (
+                  SELECT 1 FROM account_entry_reach x WHERE x.ancestor = r.to_id AND x.descendant = :from_id))
+            LIMIT 1
+            """, params).fetchone() is not None
+        ancestors = [from_id, *self._reach_ids(from_id, reverse=True)]
+        if cyclic:
+            self._reach_rebuild(ancestors)
+            return
+
+        lost = [row[0] for row in self.c.execute(
+            """
+            WITH d(id) AS (
+                SELECT :to_id UNION SELECT descendant FROM account_entry_reach WHERE ancestor = :to_id
+            ), w(id) AS (
+                SELECT to_id FROM account_entry_relation WHERE from_id = :from_id AND kind = 'RELATES_TO'
+            )
+            SELECT d.id FROM d
+            WHERE d.id NOT IN (SELECT id FROM w)
+              AND NOT EXISTS (
+                  SELECT 1 FROM w JOIN account_entry_reach x ON x.ancestor = w.id AND x.descendant = d.id)
+            """, params)]
+        if not lost:
+            return
+
+        # 남은 간선으로 여전히 to에 닿는 조상은 to의 후손 전부에 닿으므로 제외 (다이아몬드의 다른 쪽 가지 등)
+        # seed: to 또는 A 밖의 to 조상으로 바로 가는 A 노드, 이후 A 안에서 간선을 거꾸로 따라 전파
+        still = {row[0] for row in self.c.execute(
+            """
+            WITH RECURSIVE
+            a(id) AS (SELECT value FROM json_each(:a)),
+            x(id) AS (
+                SELECT :to_id
+                UNION
+                SELECT ancestor FROM account_entry_reach WHERE descendant = :to_id AND +ancestor NOT IN a
+            ),
+            s(id) AS (
+                SELECT e.from_id FROM x CROSS JOIN account_entry_relation e
+                WHERE e.to_id = x.id AND e.kind = 'RELATES_TO' AND +e.from_id IN a
+                UNION
+                SELECT e.from_id FROM s CROSS JOIN account_entry_relation e
+                WHERE e.to_id = s.id AND e.kind = 'RELATES_TO' AND +e.from_id IN a
+            )
+            SELECT id FROM s
+            """, {**params, "a": json.dumps(ancestors)})}
+        ancestors = [a for a in ancestors if a not in still]
+
+        sets = {"a": json.dumps(ancestors), "l": json.dumps(lost)}
+        self.c.execute(
+            """
+            DELETE FROM account_entry_reach
+            WHERE ancestor IN (SELECT value FROM json_each(:a)) AND descendant IN (SELECT value FROM json_each(:l))
+            """, sets)
+        # 남은 행 (x, d∈L)은 x가 from에 닿지 않으므로 지운 간선과 무관 → 그대로 근거로 사용
+        # +from_id: IN 목록을 인덱스 키로 쓰면 행마다 A 전체를 탐색하므로 필터로만 사용
+        self.c.execute(
+            """
+            INSERT OR IGNORE INTO account_entry_reach (ancestor, descendant)
+            WITH RECURSIVE
+            a(id) AS (SELECT value FROM json_each(:a)),
+            l(id) AS (SELECT value FROM json_each(:l)),
+            r(ancestor, descendant) AS (
+                SELECT e.from_id, e.to_id FROM l CROSS JOIN account_entry_relation e
+                WHERE e.to_id = l.id AND e.kind = 'RELATES_TO' AND +e.from_id IN a
+                UNION
+                SELECT e.from_id, x.descendant
+                FROM a CROSS JOIN account_entry_relation e CROSS JOIN l CROSS JOIN account_entry_reach x
+                WHERE e.from_id = a.id AND e.kind = 'RELATES_TO' AND x.ancestor = e.to_id AND x.descendant = l.id
+                UNION
+                SELECT e.from_id, r.descendant FROM r CROSS JOIN account_entry_relation e
+                WHERE e.to_id = r.ancestor AND e.kind = 'RELATES_TO' AND +e.from_id IN a
+            )
+            SELECT ancestor, descendant FROM r
+            """, sets)
+
+    def _reach_rebuild(self, roots: Sequence[str]) -> None:
+        # 순환이 끼어 증분 계산이 어려운 경우에만: 주어진 조상들의 후손 집합을 다시 계산
+        if not roots:
+            return
+        roots_json = json.dumps(list(set(roots)))
+        self.c.execute(
+            "DELETE FROM account_entry_reach WHERE ancestor IN (SELECT value FROM json_each(?))", (roots_json,))
+        self.c.execute(
+            f"INSERT OR IGNORE INTO account_entry_reach (ancestor, descendant) {_REACH_FROM_ROOTS}", (roots_json,))
+
+    def _reach_ids(self, entry_id: str, *, reverse: bool, limit: int | None = None) -> list[str]:
+        src, dst = ("descendant", "ancestor") if reverse else ("ancestor", "descendant")
+        rows = self.c.execute(
+            f"SELECT {dst} FROM account_entry_reach WHERE {src} = ? AND {dst} <> {src} ORDER BY {dst} LIMIT ?",
+            (entry_id, -1 if limit is None else limit)).fetchall()
+        return [row[0] for row in rows]
+
+    def add_relation(self, relation_create: AccountEntryRelationCreateDTO) -> bool:
+        with self._write():
+            return self._link(relation_create.from_id, relation_create.to_id, relation_create.kind,
+                              relation_create.props.model_dump())
+
+    def apply_relation_ops(self, relation_ops: Sequence[AccountEntryRelationOpDTO], *,
+                           chunk_size: int = 1000) -> List[bool]:
+        # 로컬 DB라 왕복 비용이 없으므로 입력 순서대로 한 트랜잭션에서 처리
+        oks = []
+        with self._write():
+            for o in relation_ops:
+                if o.op == RelationOp.LINK:
+                    oks.append(self._link(o.from_id, o.to_id, o.kind, o.props.model_dump()))
+                else:
+                    oks.append(self._unlink(o.from_id, o.to_id, o.kind) > 0)
+        return oks
+
+    def get_relations(self, entry_id: str) -> AccountEntryRelationsDTO:
+        with self._tx():
+            rows_out = self.c.execute(
+                "SELECT * FROM account_entry_relation WHERE from_id = ? ORDER BY kind, to_id", (entry_id,)).fetchall()
+            rows_in = self.c.execute(
+                "SELECT * FROM account_entry_relation WHERE to_id = ? ORDER BY kind, from_id", (entry_id,)).fetchall()
+
+        to_relation = lambda rows: [
+            AccountEntryRelationDTO.model_validate({
+                "kind": row["kind"],
+                "from_id": row["from_id"],
+                "to_id": row["to_id"],
+                "props": json.loads(row["props"]),
+            })
+            for row in rows
+        ]
+        return AccountEntryRelationsDTO(outgoing=to_relation(rows_out), incoming=to_relation(rows_in))
+
+    def delete_relation(self, relation_delete: AccountEntryRelationDeleteDTO) -> int:
+        with self._write():
+            return self._unlink(relation_delete.from_id, relation_delete.to_id, relation_delete.kind)
+
+    # Function
+    def _chunks(self, ids: Sequence[str]) -> Iterable[list[str]]:
+        for i in range(0, len(ids), _IN_CHUNK):
+            yield list(ids[i:i + _IN_CHUNK])
+
+    def _tree_nodes(self, ids: Sequence[str]) -> dict[str, dict]:
+        nodes = {}
+        for chunk in self._chunks(ids):
+            rows = self.c.execute(
+                f"SELECT * FROM account_entry WHERE id IN ({','.join('?' * len(chunk))})", chunk).fetchall()
+            nodes.update((row["id"], _tree_props(row)) for row in rows)
+        return nodes
+
+    def _reachable_edges(self, start_ids: Sequence[str], *, reverse: bool,
+                         max_depth: int | None) -> list[tuple[str, str]]:
+        # 재귀 CTE로 시작 노드들에서 도달 가능한 노드를 모으고, 그 노드들에서 나가는 RELATES_TO 간선을 반환
+        # (max_depth 밖으로 나가는 간선도 포함 → tree_builder가 truncated 판단)
+        # 깊이 제한이 없으면 재귀 대신 전이 폐쇄에서 도달 노드 조회
+        src, dst = ("to_id", "from_id") if reverse else ("from_id", "to_id")
+        if max_depth is None:
+            start, other = ("descendant", "ancestor") if reverse else ("ancestor", "descendant")
+            reach = f"""
+            reach(id) AS (
+                SELECT value FROM json_each(:ids)
+                UNION
+                SELECT {other} FROM account_entry_reach WHERE {start} IN (SELECT value FROM json_each(:ids))
+            )"""
+        else:
+            reach = f"""
+            reach(id, depth) AS (
+                SELECT value, 0 FROM json_each(:ids)
+                UNION
+                SELECT r.{dst}, reach.depth + 1 FROM account_entry_relation r JOIN reach ON r.{src} = reach.id
+                WHERE r.kind = 'RELATES_TO' AND reach.depth < :max_depth
+            )"""
+        rows = self.c.execute(f"""
+            WITH RECURSIVE {reach}
+            SELECT DISTINCT r.{src} AS parent, r.{dst} AS child
+            FROM account_entry_relation r
+            WHERE r.kind = 'RELATES_TO' AND r.{src} IN (SELECT id FROM reach)
+            ORDER BY parent, child
+            """, {"ids": json.dumps(list(start_ids)), "max_depth": max_depth}).fetchall()
+        return [(row["parent"], row["child"]) for row in rows]
+
+    def _tree_skeleton(self, start_id: str, *, reverse: bool, max_depth: int | None,
+                       max_nodes: int | None) -> tuple[list[str], list[tuple[str, str]], bool] | None:
+        # (BFS 방문 순서, 간선, 노드 상한 도달 여부). 호출 측 트랜잭션 안에서
+        if self.c.execute("SELECT 1 FROM account_entry WHERE id = ?", (start_id,)).fetchone() is None:
+            return None
+        edges = self._reachable_edges([start_id], reverse=reverse, max_depth=max_depth)
+        adjacency: dict[str, list[str]] = {}
+        for parent, child in edges:
+            adjacency.setdefault(parent, []).append(child)
+        order, capped = bfs_order(start_id, lambda i: adjacency.get(i, ()), max_depth=max_depth,
+                                  max_nodes=max_nodes)
+        return order, edges, capped
+
+    def _tree(self, start_id: str, *, reverse: bool, max_depth: int | None,
+              max_nodes: int | None) -> AccountEntryTreeResultDTO | None:
+        with self._tx():
+            skeleton = self._tree_skeleton(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+            if skeleton is None:
+                return None
+            order, edges, capped = skeleton
+            nodes = self._tree_nodes(order)
+        return build_account_entry_tree(start_id, nodes, edges, truncated=capped)
+
+    # Neo4j get_entry_tree와 같은 모양 (apoc.paths.toJsonTree 모양): 공유 후손은 위치마다 펼치고 cycle에서만 멈춤
+    # 시작 노드가 없거나 연결된 RELATES_TO가 없으면 None
+    def _path_tree(self, start_id: str, *, reverse: bool) -> AccountEntryTreeNodeDTO | None:
+        with self._tx():
+            edges = self._reachable_edges([start_id], reverse=reverse, max_depth=None)
+            if not edges:
+                return None
+            nodes = self._tree_nodes(list({start_id, *(i for edge in edges for i in edge)}))
+        return build_account_entry_path_tree(start_id, nodes, edges)
+
+    def get_entry_tree(self, start_id) -> AccountEntryTreeNodeDTO | None:
+        return self._path_tree(start_id, reverse=False)
+
+    def get_entry_tree_reverse(self, start_id) -> AccountEntryTreeNodeDTO | None:
+        return self._path_tree(start_id, reverse=True)
+
+    def get_entry_tree_bounded(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                               max_nodes: int = 10000) -> AccountEntryTreeResultDTO | None:
+        return self._tree(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+
+    def get_entry_tree_plan(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                            max_nodes: int = 10000) -> AccountEntryTreePlanDTO | None:
+        with self._tx():
+            skeleton = self._tree_skeleton(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes)
+        if skeleton is None:
+            return None
+        order, edges, capped = skeleton
+        return plan_account_entry_tree(start_id, set(order), edges, truncated=capped)
+
+    def get_entry_path_plan(self, start_id: str, *, reverse: bool = False) -> AccountEntryTreePlanDTO | None:
+        with self._tx():
+            edges = self._reachable_edges([start_id], reverse=reverse, max_depth=None)
+        return plan_account_entry_path_tree(start_id, edges) if edges else None
+
+    def get_tree_nodes(self, ids: Sequence[str]) -> List[dict | None]:
+        nodes = self._tree_nodes(list(dict.fromkeys(ids)))
+        return [nodes.get(i) for i in ids]
+
+    # 도달 가능성 (전이 폐쇄 조회, 자기 자신 제외)
+    def get_reachable(self, entry_id: str, *, reverse: bool = False,
+                      limit: int | None = None) -> AccountEntryReachDTO | None:
+        src = "descendant" if reverse else "ancestor"
+        with self._tx():
+            if self.c.execute("SELECT 1 FROM account_entry WHERE id = ?", (entry_id,)).fetchone() is None:
+                return None
+            # cycle에 속한 노드는 자기 자신도 폐쇄에 있으므로 제외
+            count = self.c.execute(
+                f"SELECT count(*) FROM account_entry_reach WHERE {src} = ? AND ancestor <> descendant",
+                (entry_id,)).fetchone()[0]
+            ids = self._reach_ids(entry_id, reverse=reverse, limit=limit)
+        return AccountEntryReachDTO(entry_id=entry_id, reverse=reverse, count=count, ids=ids)
+
+    def is_reachable(self, from_id: str, to_id: str) -> bool:
+        if from_id == to_id:
+            return self.c.execute("SELECT 1 FROM account_entry WHERE id = ?", (from_id,)).fetchone() is not None
+        return self.c.execute(
+            "SELECT 1 FROM account_entry_reach WHERE ancestor = ? AND descendant = ?", (from_id, to_id)
+        ).fetchone() is not None
+
+    # DEFERRED 트랜잭션 = 첫 읽기 시점 스냅샷 (WAL이라 내보내는 동안 쓰기도 막지 않음), 커서를 행 단위로 소비
+    def export_rows(self) -> Iterator[dict]:
+        with self._tx():
+            for row in self.c.execute("SELECT * FROM account_entry"):
+                yield {"type": "entry", "id": row["id"], "title": row["title"], "desc": row["description"],
+                       "tags": json.loads(row["tags"]), "createdAt": row["created_at"],
+                       "updatedAt": row["updated_at"]}
+            for row in self.c.execute("SELECT from_id, kind, to_id, props FROM account_entry_relation"):
+                yield {"type": "relation", "fromId": row["from_id"], "toId": row["to_id"], "kind": row["kind"],
+                       "props": json.loads(row["props"])}
+
+    # 시작 노드 한 페이지만 SQL로 고르고, 그 시작 노드들에서 닿는 노드/간선만 읽음 (Neo4j q_forest와 같은 방식)
+    # roots_only: 정방향은 들어오는, 역방향은 나가는 RELATES_TO가 없는 노드만 시작 노드로 사용
+    def _forest(self, *, reverse: bool, roots_only: bool, limit: int | None,
+                offset: int) -> List[AccountEntryTreeNodeDTO | None]:
+        parent_col = "from_id" if reverse else "to_id"
+        where = [f"""NOT EXISTS (SELECT 1 FROM account_entry_relation r
+                     WHERE r.{parent_col} = account_entry.id AND r.kind = 'RELATES_TO')"""] if roots_only else []
+        with self._tx():
+            root_ids = [row["id"] for row in self.c.execute(
+                f"SELECT id FROM account_entry {_where(where)} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset))]
+            if not root_ids:
+                return []
+            edges = self._reachable_edges(root_ids, reverse=reverse, max_depth=None)
+            nodes = self._tree_nodes(list({*root_ids, *(i for edge in edges for i in edge)}))
+        return build_account_entry_forest(root_ids, nodes, edges)
+
+    def get_entry_forest(self, *, roots_only: bool = False, limit: int | None = None,
+                         offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return self._forest(reverse=False, roots_only=roots_only, limit=limit, offset=offset)
+
+    def get_entry_forest_reverse(self, *, roots_only: bool = False, limit: int | None = None,
+                                 offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return self._forest(reverse=True, roots_only=roots_only, limit=limit, offset=offset)
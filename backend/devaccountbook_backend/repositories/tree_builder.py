@@ -0,0 +1,188 @@
+from collections import deque
+from typing import Callable, Collection, Hashable, Iterable, Iterator, Mapping, Optional, TypeVar
+
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryTreeResultDTO, AccountEntryTreePlanDTO, \
+    AccountEntryTreeNodeDTO, make_account_entry_tree_node
+
+K = TypeVar("K", bound=Hashable)
+
+
+def bfs_order(start: K, neighbors: Callable[[K], Iterable[K]], *, max_depth: int | None = None,
+              max_nodes: int | None = None) -> tuple[list[K], bool]:
+    """start에서 BFS 방문 순서와 노드 상한 도달 여부. 각 노드는 한 번만 방문."""
+    depth = {start: 0}
+    order = [start]
+    queue = deque([start])
+    capped = False
+    while queue and not capped:
+        a = queue.popleft()
+        if max_depth is not None and depth[a] >= max_depth:
+            continue
+        for b in neighbors(a):
+            if b in depth:
+                continue
+            if max_nodes is not None and len(order) >= max_nodes:
+                capped = True
+                break
+            depth[b] = depth[a] + 1
+            order.append(b)
+            queue.append(b)
+    return order, capped
+
+
+def plan_account_entry_tree(
+        root_id: str,
+        node_ids: Collection[str],
+        edges: Iterable[tuple[str, str]],
+        *,
+        truncated: bool = False,
+) -> AccountEntryTreePlanDTO:
+    """
+    노드 id/간선 집합으로 BFS 트리 골격을 정합니다. (재귀 없음)
+    - 각 노드는 최단 깊이에서 한 번만 펼침
+    - 현재 경로의 조상을 다시 가리키면 "cycle", 다른 곳에서 이미 펼친 노드면 "revisit" (자식 없음)
+    - 집합 밖 노드를 가리키는 간선이 있으면 잘린 것으로 보고 truncated=True
+    """
+    adjacency: dict[str, list[str]] = {}
+    for parent_id, child_id in edges:
+        if parent_id not in node_ids:
+            continue
+        if child_id not in node_ids:
+            truncated = True
+            continue
+        adjacency.setdefault(parent_id, []).append(child_id)
+
+    children: dict[str, list[tuple[str, Optional[str]]]] = {}
+    parent_of: dict[str, str | None] = {root_id: None}
+    queue = deque([root_id])
+    while queue:
+        node_id = queue.popleft()
+        for child_id in adjacency.get(node_id, []):
+            mark = None
+            if child_id in parent_of:
+                # 조상 체인을 거슬러 올라가며 cycle 여부 확인
+                ancestor = node_id
+                while ancestor is not None and ancestor != child_id:
+                    ancestor = parent_of[ancestor]
+                mark = "cycle" if ancestor == child_id else "revisit"
+            else:
+                parent_of[child_id] = node_id
+                queue.append(child_id)
+            children.setdefault(node_id, []).append((child_id, mark))
+
+    return AccountEntryTreePlanDTO.model_construct(
+        root_id=root_id, children=children, truncated=truncated, node_count=len(parent_of))
+
+
+def plan_account_entry_path_tree(root_id: str, edges: Iterable[tuple[str, str]]) -> AccountEntryTreePlanDTO:
+    """build_account_entry_path_tree 모양의 골격 (paths=True, children은 인접 리스트)."""
+    children: dict[str, list[tuple[str, Optional[str]]]] = {}
+    node_ids = {root_id}
+    for parent_id, child_id in edges:
+        children.setdefault(parent_id, []).append((child_id, None))
+        node_ids.add(child_id)
+    return AccountEntryTreePlanDTO.model_construct(
+        root_id=root_id, children=children, truncated=False, node_count=len(node_ids), paths=True)
+
+
+def walk_account_entry_tree(plan: AccountEntryTreePlanDTO) -> Iterator[tuple[str, Optional[str]] | None]:
+    """
+    골격을 깊이 우선(응답 JSON 순서)으로: 노드를 열 때 (id, mark), 그 노드의 자식을 다 낸 뒤 None.
+    plan.paths면 현재 경로의 조상을 다시 가리키는 자식만 "cycle"로 표시하고 나머지는 모두 펼침.
+    """
+    yield plan.root_id, None
+    path, on_path = [plan.root_id], {plan.root_id}
+    stack = [iter(plan.children.get(plan.root_id, ()))]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            on_path.discard(path.pop())
+            yield None
+            continue
+        child_id, mark = item
+        if plan.paths and child_id in on_path:
+            mark = "cycle"
+        yield child_id, mark
+        # 표시 노드는 펼치지 않음 → 닫을 때 조상 id를 경로에서 지우지 않도록 None
+        path.append(None if mark else child_id)
+        if mark is None:
+            on_path.add(child_id)
+        stack.append(iter(plan.children.get(child_id, ()) if mark is None else ()))
+
+
+def build_account_entry_tree(
+        root_id: str,
+        nodes: Mapping[str, Mapping],
+        edges: Iterable[tuple[str, str]],
+        *,
+        truncated: bool = False,
+) -> AccountEntryTreeResultDTO:
+    """노드/간선 집합으로 BFS 트리를 조립합니다. 모양은 plan_account_entry_tree와 같음."""
+    plan = plan_account_entry_tree(root_id, nodes, edges, truncated=truncated)
+    root = make_account_entry_tree_node(root_id, nodes[root_id])
+    stack = [root]
+    while stack:
+        dto = stack.pop()
+        for child_id, mark in plan.children.get(dto.id, ()):
+            child = make_account_entry_tree_node(child_id, nodes[child_id], cycle=mark == "cycle",
+                                                 revisit=mark == "revisit")
+            dto.children.append(child)
+            if mark is None:
+                stack.append(child)
+
+    return AccountEntryTreeResultDTO(tree=root, truncated=plan.truncated, node_count=plan.node_count)
+
+
+def _adjacency(edges: Iterable[tuple[str, str]]) -> dict[str, list[str]]:
+    adjacency: dict[str, list[str]] = {}
+    for parent_id, child_id in edges:
+        adjacency.setdefault(parent_id, []).append(child_id)
+    return adjacency
+
+
+def _path_tree(root_id: str, nodes: Mapping[str, Mapping],
+               adjacency: Mapping[str, list[str]]) -> AccountEntryTreeNodeDTO:
+    root = make_account_entry_tree_node(root_id, nodes[root_id])
+    on_path = {root_id}
+    stack = [(root, iter(adjacency.get(root_id, ())))]
+    while stack:
+        dto, children = stack[-1]
+        child_id = next(children, None)
+        if child_id is None:
+            stack.pop()
+            on_path.discard(dto.id)
+            continue
+        cycle = child_id in on_path
+        child = make_account_entry_tree_node(child_id, nodes[child_id], cycle=cycle)
+        dto.children.append(child)
+        if not cycle:
+            on_path.add(child_id)
+            stack.append((child, iter(adjacency.get(child_id, ()))))
+    return root
+
+
+def build_account_entry_path_tree(
+        root_id: str,
+        nodes: Mapping[str, Mapping],
+        edges: Iterable[tuple[str, str]],
+) -> AccountEntryTreeNodeDTO:
+    """
+    apoc.paths.toJsonTree와 같은 모양의 트리를 조립합니다. (재귀 없음)
+    - 공유 후손은 닿는 위치마다 펼침 (revisit 없음)
+    - 현재 경로의 조상을 다시 가리키면 "cycle" (자식 없음)
+    """
+    return _path_tree(root_id, nodes, _adjacency(edges))
+
+
+def build_account_entry_forest(
+        root_ids: Iterable[str],
+        nodes: Mapping[str, Mapping],
+        edges: Iterable[tuple[str, str]],
+) -> list[AccountEntryTreeNodeDTO | None]:
+    """
+    한 번 읽은 노드/간선(부모, 자식)으로 시작 노드마다 explore와 같은 트리를 조립합니다.
+    (build_account_entry_path_tree 모양, 연결된 간선이 없는 시작 노드는 explore처럼 None)
+    """
+    adjacency = _adjacency(edges)
+    return [_path_tree(root_id, nodes, adjacency) if root_id in adjacency else None for root_id in root_ids]
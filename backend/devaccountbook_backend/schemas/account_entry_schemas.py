@@ -18,6 +18,15 @@ class AccountEntryPatch(CamelModel):
     tags: Optional[List[str]] = None
 
 
+class AccountEntryBatchCreate(CamelModel):
+    items: List[AccountEntryCreate] = Field(min_length=1, max_length=10000)
+
+
+class AccountEntryBatchCreateOut(CamelModel):
+    """생성된 id (요청 items 순서와 동일)."""
+    ids: List[str]
+
+
 class AccountEntryOut(CamelModel):
     id: str
     title: str
@@ -27,7 +36,7 @@ class AccountEntryOut(CamelModel):
 
 from typing import Optional, List
 from pydantic import BaseModel
-from devaccountbook_backend.schemas.common_enum import RelKind
+from devaccountbook_backend.schemas.common_enum import RelKind, SheetRowKind, RelationOp, TagMatch, ImportFormat
 
 
 class RelationProps(CamelModel):
@@ -61,5 +70,104 @@ class RelationList(CamelModel):
     incoming: List[RelationOut] = Field(default_factory=list)
 
 
+class RelationBatchItem(CamelModel):
+    op: RelationOp
+    from_id: str
+    to_id: str
+    kind: RelKind
+    props: Optional[RelationProps] = None  # link에서만 사용
+
+
+class RelationBatch(CamelModel):
+    items: List[RelationBatchItem] = Field(min_length=1, max_length=10000)
+
+
+class RelationBatchItemResult(CamelModel):
+    """요청 items와 같은 순서. ok=False면 link는 노드 없음, unlink는 관계 없음."""
+    op: RelationOp
+    from_id: str
+    to_id: str
+    kind: RelKind
+    ok: bool
+
+
+class RelationBatchOut(CamelModel):
+    results: List[RelationBatchItemResult]
+
+
 class CountOut(CamelModel):
     total: int
+
+
+class SearchHighlightOut(CamelModel):
+    """검색어가 걸린 위치 [start, end). field=tags면 index는 tags 안의 위치."""
+    field: str
+    index: Optional[int] = None
+    start: int
+    end: int
+
+
+class AccountEntrySearchHitOut(AccountEntryOut):
+    score: float
+    highlights: List[SearchHighlightOut] = Field(default_factory=list)
+
+
+class TagCountOut(CamelModel):
+    name: str
+    count: int
+
+
+class ReachOut(CamelModel):
+    """RELATES_TO 후손 또는 조상 (자기 자신 제외). ids는 id 순으로 limit까지, count는 전체 수."""
+    entry_id: str
+    count: int
+    ids: List[str] = Field(default_factory=list)
+
+
+class ReachableOut(CamelModel):
+    from_id: str
+    to_id: str
+    reachable: bool
+
+
+class ImportErrorOut(CamelModel):
+    """건너뛴 행 (line은 업로드 기준 줄 번호 + line_offset)."""
+    line: int
+    message: str
+
+
+class ImportResultOut(CamelModel):
+    """
+    가져오기 결과. 같은 job으로 다시 보내면 같은 id가 만들어지므로
+    실패한 경우 마지막으로 끝난 위치(또는 처음)부터 재전송하면 이어서 진행됨.
+    errors는 앞쪽 일부만, error_count는 전체 수.
+    """
+    job: str
+    lines: int
+    entries_created: int
+    entries_existing: int
+    relations_linked: int
+    relations_failed: int
+    error_count: int
+    errors: List[ImportErrorOut] = Field(default_factory=list)
+    seconds: float
+    rows_per_sec: float
+
+
+class AccountEntryPageOut(CamelModel):
+    """페이지. next_cursor는 다음 요청의 after 값 (마지막 페이지면 None), total은 요청했을 때만."""
+    items: List[AccountEntryOut] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+class SheetRowOut(CamelModel):
+    """
+    시트 한 행.
+    - node 행: 엔트리 자체 (connected/kind 없음)
+    - linked 행: 엔트리에서 나가는 관계 하나와 연결된 엔트리
+    """
+    row_kind: SheetRowKind
+    node: AccountEntryOut
+    kind: Optional[RelKind] = None
+    connected: Optional[AccountEntryOut] = None
@@ -6,3 +6,23 @@ class RelKind(str, Enum):
     INFLUENCES = "INFLUENCES"
     BLOCKS = "BLOCKS"
     DUPLICATES = "DUPLICATES"
+
+
+class SheetRowKind(str, Enum):
+    NODE = "node"
+    LINKED = "linked"
+
+
+class TagMatch(str, Enum):
+    ANY = "any"
+    ALL = "all"
+
+
+class RelationOp(str, Enum):
+    LINK = "link"
+    UNLINK = "unlink"
+
+
+class ImportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -0,0 +1,148 @@
+import csv
+import json
+import logging
+import time
+import uuid
+from typing import List, Optional
+
+from pydantic import ValidationError
+
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeImportDTO, AccountEntryRelationCreateDTO, \
+    AccountEntryRelationOpDTO
+from devaccountbook_backend.schemas.account_entry_schemas import ImportErrorOut, ImportResultOut
+from devaccountbook_backend.schemas.common_enum import ImportFormat, RelationOp
+
+logger = logging.getLogger(__name__)
+
+# 결과에 담는 오류 행 수 (전체 수는 error_count)
+MAX_ERRORS = 100
+# CSV 열: type(entry|relation, 생략 시 entry), id, title, desc, tags(| 구분), fromId, toId, kind, note
+CSV_TAG_SEPARATOR = "|"
+
+
+def import_entry_id(job: str, external_id: str) -> str:
+    """외부 id → 엔트리 id. job마다 고정된 uuid5라 같은 job으로 재전송하면 같은 id."""
+    return str(uuid.uuid5(uuid.uuid5(uuid.NAMESPACE_URL, f"devaccountbook:import:{job}"), external_id))
+
+
+def _csv_row(header: List[str], values: List[str]) -> dict:
+    row = {k: v for k, v in zip(header, values) if v != ""}
+    if "tags" in row:
+        row["tags"] = [t for t in row["tags"].split(CSV_TAG_SEPARATOR) if t]
+    if "note" in row:
+        row["props"] = {"note": row.pop("note")}
+    return row
+
+
+def _error_message(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        err = e.errors()[0]
+        return f"{'.'.join(map(str, err['loc']))}: {err['msg']}"
+    return str(e)
+
+
+class AccountEntryImport:
+    """
+    업로드 한 건의 가져오기 상태 (저장소 쓰기는 서비스의 import_chunk가 담당).
+    - feed(line)로 한 줄씩 검증 → chunk_size 행이 모이면 True, take()로 꺼내 한 트랜잭션으로 기록
+    - 외부 id는 import_entry_id(job, id)로 매핑 (id 없는 엔트리는 줄 번호로) → 쓰기가 멱등이라
+      실패 후 같은 job으로 마지막 성공 위치(또는 처음)부터 다시 보내면 이어서 진행
+    - 관계는 같은 chunk나 앞 chunk의 엔트리만 참조 가능 (export.ndjson은 엔트리 → 관계 순)
+    - 메모리는 chunk 하나 크기
+    """
+
+    def __init__(self, job: str, fmt: ImportFormat = ImportFormat.NDJSON, *, chunk_size: int = 5000,
+                 line_offset: int = 0) -> None:
+        self.job = job
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.line = line_offset
+        self._header: Optional[List[str]] = None
+        self._entries: List[AccountEntryNodeImportDTO] = []
+        self._relations: List[AccountEntryRelationOpDTO] = []
+        self._lines = 0
+        self._rows = 0
+        self.entries_created = 0
+        self.entries_existing = 0
+        self.relations_linked = 0
+        self.relations_failed = 0
+        self.error_count = 0
+        self.errors: List[ImportErrorOut] = []
+        self._started = time.perf_counter()
+
+    def feed(self, line: bytes) -> bool:
+        self.line += 1
+        self._lines += 1
+        text = line.decode("utf-8-sig" if self._lines == 1 else "utf-8", errors="replace").strip()
+        if not text:
+            return False
+        try:
+            row = self._decode(text)
+            if row is not None:
+                self._add(row)
+        except (ValueError, ValidationError) as e:
+            self._error(_error_message(e))
+        return len(self._entries) + len(self._relations) >= self.chunk_size
+
+    def take(self) -> tuple[List[AccountEntryNodeImportDTO], List[AccountEntryRelationOpDTO]]:
+        chunk = self._entries, self._relations
+        self._entries, self._relations = [], []
+        return chunk
+
+    def record(self, entries: int, created: int, linked: List[bool]) -> None:
+        self.entries_created += created
+        self.entries_existing += entries - created
+        self.relations_linked += sum(linked)
+        self.relations_failed += len(linked) - sum(linked)
+        self._rows += entries + len(linked)
+        logger.info("import %s: line %d, %d rows (%.0f rows/s)", self.job, self.line, self._rows, self._rate())
+
+    def result(self) -> ImportResultOut:
+        return ImportResultOut(
+            job=self.job, lines=self._lines,
+            entries_created=self.entries_created, entries_existing=self.entries_existing,
+            relations_linked=self.relations_linked, relations_failed=self.relations_failed,
+            error_count=self.error_count, errors=self.errors,
+            seconds=round(time.perf_counter() - self._started, 3), rows_per_sec=round(self._rate(), 1),
+        )
+
+    def _rate(self) -> float:
+        return self._rows / max(time.perf_counter() - self._started, 1e-9)
+
+    def _decode(self, text: str) -> Optional[dict]:
+        if self.fmt == ImportFormat.CSV:
+            values = next(csv.reader([text]))
+            if self._header is None:
+                self._header = [h.strip() for h in values]
+                return None
+            return _csv_row(self._header, values)
+        row = json.loads(text)
+        if not isinstance(row, dict):
+            raise ValueError("row must be a JSON object")
+        return row
+
+    def _add(self, row: dict) -> None:
+        kind = row.get("type", "entry")
+        if kind == "entry":
+            external_id = row.get("id")
+            self._entries.append(AccountEntryNodeImportDTO.model_validate({
+                "id": import_entry_id(self.job, str(external_id) if external_id is not None else f"line:{self.line}"),
+                **{k: row[k] for k in ("title", "desc", "tags") if row.get(k) is not None},
+            }))
+        elif kind == "relation":
+            if row.get("fromId") is None or row.get("toId") is None:
+                raise ValueError("fromId and toId are required")
+            relation = AccountEntryRelationCreateDTO.model_validate({
+                "from_id": import_entry_id(self.job, str(row["fromId"])),
+                "to_id": import_entry_id(self.job, str(row["toId"])),
+                "kind": row.get("kind"),
+                "props": row.get("props") or {},
+            })
+            self._relations.append(AccountEntryRelationOpDTO(op=RelationOp.LINK, **dict(relation)))
+        else:
+            raise ValueError(f"unknown type: {kind}")
+
+    def _error(self, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(ImportErrorOut(line=self.line, message=message))
@@ -0,0 +1,126 @@
+# 스키마(요청/응답) ↔ DTO 변환 (AccountEntryService / AsyncAccountEntryService 공용)
+from typing import List, Sequence
+
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeCreateDTO, AccountEntryNodePatchDTO, \
+    AccountEntryRelationCreateDTO, AccountEntryRelationPropsDTO, AccountEntryCursorDTO, AccountEntryRelationOpDTO, \
+    AccountEntryPageDTO, AccountEntrySheetItemDTO, AccountEntryRelationsDTO, AccountEntryReachDTO, \
+    AccountEntryTagCountDTO, AccountEntrySearchHitDTO, AccountEntryRelationDTO
+from devaccountbook_backend.models.account_entry_domain import AccountEntryNode
+from devaccountbook_backend.schemas.account_entry_schemas import AccountEntryCreate, AccountEntryPatch, RelationCreate, \
+    AccountEntryOut, RelationList, SheetRowOut, SheetRowKind, AccountEntryPageOut, RelationBatchItem, \
+    RelationBatchOut, RelationBatchItemResult, ReachOut, TagCountOut, AccountEntrySearchHitOut, SearchHighlightOut, \
+    RelationOut, RelationProps
+from devaccountbook_backend.utils.cursor_util import encode_cursor, decode_cursor
+from devaccountbook_backend.utils.search_util import highlight_spans
+
+
+# 조회 응답: 저장소에서 한 번 검증된 값을 model_construct로 옮김 (model_dump → 재검증 왕복 없음)
+def to_out(account_entry: AccountEntryNode) -> AccountEntryOut:
+    return AccountEntryOut.model_construct(
+        id=account_entry.id, title=account_entry.title, desc=account_entry.desc, tags=account_entry.tags)
+
+
+def to_create_dto(p: AccountEntryCreate) -> AccountEntryNodeCreateDTO:
+    return AccountEntryNodeCreateDTO(title=p.title, desc=p.desc, tags=p.tags)
+
+
+def to_patch_dto(p: AccountEntryPatch) -> AccountEntryNodePatchDTO:
+    return AccountEntryNodePatchDTO.model_validate(p.model_dump(exclude_none=True))
+
+
+# 빈 문자열이면 첫 페이지(None). 잘못된 커서는 ValueError
+def to_cursor_dto(after: str) -> AccountEntryCursorDTO | None:
+    if not after:
+        return None
+    created_at, entry_id = decode_cursor(after)
+    return AccountEntryCursorDTO(created_at=created_at, id=entry_id)
+
+
+def to_page_out(page: AccountEntryPageDTO) -> AccountEntryPageOut:
+    return AccountEntryPageOut(
+        items=[to_out(item) for item in page.items],
+        next_cursor=encode_cursor(page.next_cursor.created_at, page.next_cursor.id) if page.next_cursor else None,
+        total=page.total,
+    )
+
+
+# 시트: node 행 + linked 행으로 평탄화
+def to_sheet_rows(items: Sequence[AccountEntrySheetItemDTO]) -> List[SheetRowOut]:
+    rows: List[SheetRowOut] = []
+    for item in items:
+        node = to_out(item.node)
+        rows.append(SheetRowOut(row_kind=SheetRowKind.NODE, node=node))
+        for link in item.links:
+            rows.append(SheetRowOut(
+                row_kind=SheetRowKind.LINKED,
+                node=node,
+                kind=link.kind,
+                connected=to_out(link.node),
+            ))
+    return rows
+
+
+def to_relation_create_dto(from_id: str, payload: RelationCreate) -> AccountEntryRelationCreateDTO:
+    if payload.props is None:
+        return AccountEntryRelationCreateDTO(from_id=from_id, to_id=payload.to_id, kind=payload.kind)
+    return AccountEntryRelationCreateDTO(
+        from_id=from_id,
+        to_id=payload.to_id,
+        kind=payload.kind,
+        props=AccountEntryRelationPropsDTO.model_validate(payload.props.model_dump()),
+    )
+
+
+def to_relation_out(relation: AccountEntryRelationDTO) -> RelationOut:
+    return RelationOut.model_construct(
+        from_id=relation.from_id, to_id=relation.to_id, kind=relation.kind,
+        props=RelationProps.model_construct(**relation.props.model_dump()))
+
+
+def to_relation_list(relations: AccountEntryRelationsDTO) -> RelationList:
+    return RelationList.model_construct(outgoing=[to_relation_out(r) for r in relations.outgoing],
+                                        incoming=[to_relation_out(r) for r in relations.incoming])
+
+
+# 검색 결과 + 검색어 위치 (저장소와 무관하게 같은 규칙으로 계산)
+def to_search_hit_out(hit: AccountEntrySearchHitDTO, terms: Sequence[str]) -> AccountEntrySearchHitOut:
+    node = hit.node
+    highlights = [
+        SearchHighlightOut(field=field, start=start, end=end)
+        for field, text in (("title", node.title), ("desc", node.desc))
+        for start, end in highlight_spans(text, terms)
+    ]
+    highlights += [
+        SearchHighlightOut(field="tags", index=i, start=start, end=end)
+        for i, tag in enumerate(node.tags)
+        for start, end in highlight_spans(tag, terms)
+    ]
+    return AccountEntrySearchHitOut.model_construct(id=node.id, title=node.title, desc=node.desc, tags=node.tags,
+                                                    score=hit.score, highlights=highlights)
+
+
+def to_tag_counts_out(tags: Sequence[AccountEntryTagCountDTO]) -> List[TagCountOut]:
+    return [TagCountOut(name=t.name, count=t.count) for t in tags]
+
+
+def to_reach_out(reach: AccountEntryReachDTO) -> ReachOut:
+    return ReachOut(entry_id=reach.entry_id, count=reach.count, ids=reach.ids)
+
+
+def to_relation_op_dtos(items: Sequence[RelationBatchItem]) -> List[AccountEntryRelationOpDTO]:
+    relation_ops = []
+    for item in items:
+        props = AccountEntryRelationPropsDTO()
+        if item.props is not None:
+            props = AccountEntryRelationPropsDTO.model_validate(item.props.model_dump())
+        relation_ops.append(AccountEntryRelationOpDTO(
+            op=item.op, from_id=item.from_id, to_id=item.to_id, kind=item.kind, props=props
+        ))
+    return relation_ops
+
+
+def to_relation_batch_out(items: Sequence[RelationBatchItem], oks: Sequence[bool]) -> RelationBatchOut:
+    return RelationBatchOut(results=[
+        RelationBatchItemResult(op=item.op, from_id=item.from_id, to_id=item.to_id, kind=item.kind, ok=ok)
+        for item, ok in zip(items, oks)
+    ])
@@ -1,83 +1,214 @@
-from typing import List
+from typing import Iterator, List, Sequence
 
 from fastapi import Depends
 
-from devaccountbook_backend.db.neo import get_neo4j_session
-from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeCreateDTO, AccountEntryNodePatchDTO, \
-    AccountEntryRelationCreateDTO, AccountEntryRelationDeleteDTO, AccountEntryRelationPropsDTO, AccountEntryTreeNodeDTO
-from devaccountbook_backend.repositories.account_entry_repo import AccountEntryRepository
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryRelationDeleteDTO, AccountEntryTreeNodeDTO, \
+    AccountEntryTreeResultDTO, AccountEntryTreePlanDTO
+from devaccountbook_backend.repositories.account_entry_repo_base import AccountEntryRepositoryBase
+from devaccountbook_backend.repositories.repository_factory import get_account_entry_repository
+from devaccountbook_backend.repositories.tree_builder import walk_account_entry_tree
 from devaccountbook_backend.schemas.account_entry_schemas import AccountEntryCreate, AccountEntryPatch, RelationCreate, \
-    RelKind, AccountEntryOut, RelationList
-
-
-class AccountEntryService:
-    def __init__(self, repo: AccountEntryRepository) -> None:
-        self.repo = repo
-        self.repo.bootstrap()
-
-    # 전체
-    def list(self, *, limit: int = 50, offset: int = 0) -> List[AccountEntryOut]:
-        account_entries = self.repo.get_entries(limit=limit, offset=offset)
-        return list(
-            map(lambda account_entry: AccountEntryOut.model_validate(account_entry.model_dump()), account_entries))
+    RelKind, AccountEntryOut, RelationList, SheetRowOut, AccountEntryPageOut, RelationBatchItem, RelationBatchOut, \
+    ReachOut, ReachableOut, TagCountOut, TagMatch, AccountEntrySearchHitOut
+from devaccountbook_backend.services import account_entry_mapper as mapper
+from devaccountbook_backend.services.account_entry_import import AccountEntryImport
+from devaccountbook_backend.services.account_entry_service_base import AccountEntryServiceBase
+from devaccountbook_backend.services.graph_cache import GraphVersionCache, get_graph_cache, tree_key, \
+    bounded_tree_key, forest_key, relations_key, reach_key, reaches_key, count_key
+from devaccountbook_backend.utils.ndjson_util import ndjson_chunks
+from devaccountbook_backend.utils.search_util import search_terms
+from devaccountbook_backend.utils.tree_json_util import tree_json_chunks
+
+
+class AccountEntryService(AccountEntryServiceBase):
+    repo: AccountEntryRepositoryBase
+
+    def __init__(self, repo: AccountEntryRepositoryBase, cache: GraphVersionCache | None = None) -> None:
+        super().__init__(repo, cache)
+
+    def _cached(self, key: tuple, load):
+        if self.cache is None:
+            return load()
+        return self.cache.get_or_load(key, load)
+
+    # 전체 (tags가 있으면 태그 필터: any=하나라도, all=모두)
+    def list(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+             tag_match: TagMatch = TagMatch.ANY) -> List[AccountEntryOut]:
+        account_entries = self.repo.get_entries(limit=limit, offset=offset, tags=tags, tag_match=tag_match)
+        return list(map(mapper.to_out, account_entries))
+
+    # keyset 페이지네이션 (after가 빈 문자열이면 첫 페이지). 잘못된 커서는 ValueError
+    # with_total이면 같은 트랜잭션에서 조건에 맞는 전체 수도 셈
+    def list_after(self, *, limit: int = 50, after: str = "", tags: Sequence[str] = (),
+                   tag_match: TagMatch = TagMatch.ANY, with_total: bool = False) -> AccountEntryPageOut:
+        page = self.repo.get_entries_after(limit=limit, after=mapper.to_cursor_dto(after), tags=tags,
+                                           tag_match=tag_match, with_total=with_total)
+        return mapper.to_page_out(page)
+
+    # offset 목록 + 조건에 맞는 전체 수 (같은 읽기 트랜잭션)
+    def list_counted(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                     tag_match: TagMatch = TagMatch.ANY) -> AccountEntryPageOut:
+        page = self.repo.get_entries_counted(limit=limit, offset=offset, tags=tags, tag_match=tag_match)
+        return mapper.to_page_out(page)
+
+    # 태그별 엔트리 수 (많은 순)
+    def tag_counts(self, *, limit: int = 100) -> List[TagCountOut]:
+        return mapper.to_tag_counts_out(self.repo.get_tag_counts(limit=limit))
+
+    # 검색 (title/desc/tags 전문 검색, 관련도 순)
+    def search(self, q: str, *, limit: int = 20, offset: int = 0) -> List[AccountEntrySearchHitOut]:
+        terms = search_terms(q)
+        hits = self.repo.search_entries(terms, limit=limit, offset=offset)
+        return [mapper.to_search_hit_out(hit, terms) for hit in hits]
+
+    # 시트: node 행 + linked 행으로 평탄화
+    def sheet(self, *, limit: int = 50, offset: int = 0) -> List[SheetRowOut]:
+        return mapper.to_sheet_rows(self.repo.get_sheet(limit=limit, offset=offset))
+
+    # 내보내기: 엔트리 → 관계 순 NDJSON (한 읽기 트랜잭션, 일정 크기 chunk로 스트리밍)
+    def export_ndjson(self) -> Iterator[bytes]:
+        return ndjson_chunks(self.repo.export_rows())
+
+    # 가져오기: job에 모인 chunk 하나를 기록 (엔트리 → 관계 순, 각각 한 쓰기 트랜잭션)
+    def import_chunk(self, job: AccountEntryImport) -> None:
+        entries, relation_ops = job.take()
+        created = self.repo.import_entries(entries, chunk_size=settings.batch_chunk_size) if entries else 0
+        linked = (self.repo.apply_relation_ops(relation_ops, chunk_size=settings.batch_chunk_size)
+                  if relation_ops else [])
+        if created or any(linked):
+            self._written()
+        job.record(len(entries), created, linked)
 
     def count(self) -> int:
-        return self.repo.count_entries()
+        return self._cached(count_key(), self.repo.count_entries)
 
     # CRUD
     def create(self, p: AccountEntryCreate) -> str:
-        return self.repo.create_entry(AccountEntryNodeCreateDTO(title=p.title, desc=p.desc, tags=p.tags))
+        new_id = self.repo.create_entry(mapper.to_create_dto(p))
+        self._written()
+        return new_id
+
+    def create_many(self, payloads: List[AccountEntryCreate]) -> List[str]:
+        ids = self.repo.create_entries(
+            [mapper.to_create_dto(p) for p in payloads],
+            chunk_size=settings.batch_chunk_size,
+        )
+        if ids:
+            self._written()
+        return ids
 
     def get(self, account_entry_id: str) -> AccountEntryOut | None:
         account_entry = self.repo.get_entry(account_entry_id)
         if account_entry is None:
             return None
         else:
-            return AccountEntryOut.model_validate(account_entry.model_dump())
+            return mapper.to_out(account_entry)
 
     def patch(self, account_entry_id: str, p: AccountEntryPatch) -> bool:
-        return self.repo.update_entry(account_entry_id,
-                                      AccountEntryNodePatchDTO.model_validate(p.model_dump(exclude_none=True)))
+        updated = self.repo.update_entry(account_entry_id, mapper.to_patch_dto(p))
+        if updated:
+            self._written()
+        return updated
 
     def delete(self, account_entry_id: str) -> bool:
-        return self.repo.delete_entry(account_entry_id)
+        deleted = self.repo.delete_entry(account_entry_id)
+        if deleted:
+            self._written()
+        return deleted
 
     # 관계 생성 (from_id -> to_id)
-    def link(self, from_id: str, payload: RelationCreate) -> None:
-        if payload.props is None:
-            return self.repo.add_relation(
-                AccountEntryRelationCreateDTO(
-                    from_id=from_id,
-                    to_id=payload.to_id,
-                    kind=payload.kind
-                )
-            )
-        else:
-            return self.repo.add_relation(
-                AccountEntryRelationCreateDTO(
-                    from_id=from_id,
-                    to_id=payload.to_id,
-                    kind=payload.kind,
-                    props=AccountEntryRelationPropsDTO.model_validate(payload.props.model_dump()),
-                )
-            )
+    def link(self, from_id: str, payload: RelationCreate) -> bool:
+        linked = self.repo.add_relation(mapper.to_relation_create_dto(from_id, payload))
+        if linked:
+            self._written()
+        return linked
 
     # 관계 목록 조회 (in/out 분리)
     def list_links(self, entry_id: str) -> RelationList:
-        return RelationList.model_validate(self.repo.get_relations(entry_id).model_dump())
+        return self._cached(relations_key(entry_id),
+                            lambda: mapper.to_relation_list(self.repo.get_relations(entry_id)))
 
     # 관계 삭제
     def unlink(self, from_id: str, to_id: str, kind: RelKind) -> int:
-        return self.repo.delete_relation(AccountEntryRelationDeleteDTO(
+        cnt = self.repo.delete_relation(AccountEntryRelationDeleteDTO(
             from_id=from_id, to_id=to_id, kind=kind
         ))
+        if cnt > 0:
+            self._written()
+        return cnt
+
+    # 관계 배치 link/unlink
+    def batch_links(self, items: List[RelationBatchItem]) -> RelationBatchOut:
+        oks = self.repo.apply_relation_ops(mapper.to_relation_op_dtos(items), chunk_size=settings.batch_chunk_size)
+        if any(oks):
+            self._written()
+        return mapper.to_relation_batch_out(items, oks)
 
     # 처음부터 끝까지 조회
     def get_start_to_end_node(self, start_id):
-        return self.repo.get_entry_tree(start_id)
+        return self._cached(tree_key(start_id, reverse=False), lambda: self.repo.get_entry_tree(start_id))
 
     def get_start_to_end_node_reverse(self, start_id):
-        return self.repo.get_entry_tree_reverse(start_id)
-
-def get_account_entry_service(session=Depends(get_neo4j_session)) -> AccountEntryService:
-    return AccountEntryService(AccountEntryRepository(session))
+        return self._cached(tree_key(start_id, reverse=True), lambda: self.repo.get_entry_tree_reverse(start_id))
+
+    # bounded 탐색 (깊이/노드 상한, cycle/revisit 표시)
+    def explore_bounded(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                        max_nodes: int | None = None) -> AccountEntryTreeResultDTO | None:
+        max_nodes = self._max_nodes(max_nodes)
+        return self._cached(
+            bounded_tree_key(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes),
+            lambda: self.repo.get_entry_tree_bounded(
+                start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes),
+        )
+
+    # 스트리밍 explore: 골격만 먼저 읽음 (404/잘림 여부를 본문 전에 결정, 캐시하지 않음)
+    # max_depth/max_nodes가 없으면 get_start_to_end_node와 같은 모양 (연결이 없으면 None), 있으면 explore_bounded와 같음
+    def explore_plan(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                     max_nodes: int | None = None) -> AccountEntryTreePlanDTO | None:
+        if not self._is_bounded(max_depth, max_nodes):
+            return self.repo.get_entry_path_plan(start_id, reverse=reverse)
+        return self.repo.get_entry_tree_plan(start_id, reverse=reverse, max_depth=max_depth,
+                                             max_nodes=self._max_nodes(max_nodes))
+
+    # 골격을 깊이 우선으로 걸으며 노드 속성을 batch_chunk_size개씩 읽어 JSON chunk로 (본문은 스트리밍 아닌 응답과 같음)
+    def explore_json_chunks(self, plan: AccountEntryTreePlanDTO) -> Iterator[bytes]:
+        return tree_json_chunks(walk_account_entry_tree(plan), self._tree_nodes(plan))
+
+    def _tree_nodes(self, plan: AccountEntryTreePlanDTO) -> Iterator[dict | None]:
+        for chunk in self._tree_node_batches(plan):
+            yield from self.repo.get_tree_nodes(chunk)
+
+    # 전체 트리: 시작 노드(최신순) 한 페이지씩
+    def get_forest(self, *, roots_only: bool = False, limit: int | None = None,
+                   offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return self._cached(forest_key(reverse=False, roots_only=roots_only, limit=limit, offset=offset),
+                            lambda: self.repo.get_entry_forest(roots_only=roots_only, limit=limit, offset=offset))
+
+    def get_forest_reverse(self, *, roots_only: bool = False, limit: int | None = None,
+                           offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return self._cached(forest_key(reverse=True, roots_only=roots_only, limit=limit, offset=offset),
+                            lambda: self.repo.get_entry_forest_reverse(roots_only=roots_only, limit=limit,
+                                                                       offset=offset))
+
+    # 도달 가능성 (RELATES_TO 후손/조상, 시작 노드가 없으면 None)
+    def descendants(self, entry_id: str, *, limit: int | None = None) -> ReachOut | None:
+        return self._reachable(entry_id, reverse=False, limit=limit)
+
+    def ancestors(self, entry_id: str, *, limit: int | None = None) -> ReachOut | None:
+        return self._reachable(entry_id, reverse=True, limit=limit)
+
+    def _reachable(self, entry_id: str, *, reverse: bool, limit: int | None) -> ReachOut | None:
+        reach = self._cached(reach_key(entry_id, reverse=reverse, limit=limit),
+                             lambda: self.repo.get_reachable(entry_id, reverse=reverse, limit=limit))
+        return mapper.to_reach_out(reach) if reach else None
+
+    # from_id에서 RELATES_TO를 따라 to_id에 닿는지 (같은 노드면 True)
+    def reaches(self, from_id: str, to_id: str) -> ReachableOut:
+        reachable = self._cached(reaches_key(from_id, to_id), lambda: self.repo.is_reachable(from_id, to_id))
+        return ReachableOut(from_id=from_id, to_id=to_id, reachable=reachable)
+
+
+def get_account_entry_service(
+        repo: AccountEntryRepositoryBase = Depends(get_account_entry_repository)) -> AccountEntryService:
+    return AccountEntryService(repo, get_graph_cache())
@@ -0,0 +1,57 @@
+from itertools import islice
+from typing import Iterator
+
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryTreePlanDTO
+from devaccountbook_backend.repositories.tree_builder import walk_account_entry_tree
+from devaccountbook_backend.services.graph_cache import GraphVersionCache, tree_key, bounded_tree_key, relations_key
+
+
+class AccountEntryServiceBase:
+    """
+    AccountEntryService / AsyncAccountEntryService 공통 (저장소 I/O가 없는 부분).
+    - 캐시 version 증가, 캐시 키 기준 ETag
+    - explore 인자 해석 (상한이 없으면 경로 트리, 있으면 bounded)과 스트리밍 노드 배치
+    저장소/캐시 호출(동기, await)은 각 서비스에서
+    """
+
+    def __init__(self, repo, cache: GraphVersionCache | None = None) -> None:
+        # 스키마(제약/인덱스)는 시작 시 migration으로 적용 → 요청 처리 중에는 DDL 없음
+        self.repo = repo
+        # 트리/관계 조회 캐시 (쓰기마다 version 증가 → 이전 결과 무효)
+        self.cache = cache
+
+    # 실제로 바뀐 쓰기 뒤에만 호출 (no-op/404 쓰기까지 캐시를 비우지 않도록)
+    def _written(self) -> None:
+        if self.cache is not None:
+            self.cache.bump()
+
+    # max_depth/max_nodes 중 하나라도 있으면 bounded 탐색 (max_nodes 기본값은 tree_max_nodes)
+    @staticmethod
+    def _is_bounded(max_depth: int | None, max_nodes: int | None) -> bool:
+        return max_depth is not None or max_nodes is not None
+
+    @staticmethod
+    def _max_nodes(max_nodes: int | None) -> int:
+        return settings.tree_max_nodes if max_nodes is None else max_nodes
+
+    # 캐시되는 조회의 현재 version 기준 ETag (캐시 비활성화면 None → 라우터가 본문 지문 사용)
+    # 스트리밍은 같은 인자의 스트리밍 아닌 응답과 본문이 같아서 같은 키
+    def explore_etag(self, start_id: str, *, reverse: bool = False, bounded: bool = False,
+                     max_depth: int | None = None, max_nodes: int | None = None) -> str | None:
+        if self.cache is None:
+            return None
+        if not bounded:
+            return self.cache.etag(tree_key(start_id, reverse=reverse))
+        return self.cache.etag(bounded_tree_key(start_id, reverse=reverse, max_depth=max_depth,
+                                                max_nodes=self._max_nodes(max_nodes)))
+
+    def list_links_etag(self, entry_id: str) -> str | None:
+        return None if self.cache is None else self.cache.etag(relations_key(entry_id))
+
+    # 골격을 깊이 우선으로 걸으며 여는 노드 id를 batch_chunk_size개씩 (노드 속성은 묶음마다 한 번 읽음)
+    @staticmethod
+    def _tree_node_batches(plan: AccountEntryTreePlanDTO) -> Iterator[list[str]]:
+        ids = (item[0] for item in walk_account_entry_tree(plan) if item is not None)
+        while chunk := list(islice(ids, settings.batch_chunk_size)):
+            yield chunk
@@ -0,0 +1,205 @@
+from typing import AsyncIterator, List, Sequence
+
+from fastapi import Depends
+
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryRelationDeleteDTO, AccountEntryTreeNodeDTO, \
+    AccountEntryTreeResultDTO, AccountEntryTreePlanDTO
+from devaccountbook_backend.repositories.async_account_entry_repo import AsyncAccountEntryRepository, \
+    get_async_account_entry_repo
+from devaccountbook_backend.repositories.tree_builder import walk_account_entry_tree
+from devaccountbook_backend.schemas.account_entry_schemas import AccountEntryCreate, AccountEntryPatch, RelationCreate, \
+    RelKind, AccountEntryOut, RelationList, SheetRowOut, AccountEntryPageOut, RelationBatchItem, RelationBatchOut, \
+    ReachOut, ReachableOut, TagCountOut, TagMatch, AccountEntrySearchHitOut
+from devaccountbook_backend.services import account_entry_mapper as mapper
+from devaccountbook_backend.services.account_entry_import import AccountEntryImport
+from devaccountbook_backend.services.account_entry_service_base import AccountEntryServiceBase
+from devaccountbook_backend.services.graph_cache import GraphVersionCache, get_graph_cache, tree_key, \
+    bounded_tree_key, forest_key, relations_key, reach_key, reaches_key, count_key
+from devaccountbook_backend.utils.ndjson_util import ndjson_chunks_async
+from devaccountbook_backend.utils.search_util import search_terms
+from devaccountbook_backend.utils.tree_json_util import tree_json_chunks_async
+
+
+class AsyncAccountEntryService(AccountEntryServiceBase):
+    # AccountEntryService와 같은 메서드/반환값, 저장소 호출만 await
+    repo: AsyncAccountEntryRepository
+
+    def __init__(self, repo: AsyncAccountEntryRepository, cache: GraphVersionCache | None = None) -> None:
+        super().__init__(repo, cache)
+
+    async def _cached(self, key: tuple, load):
+        if self.cache is None:
+            return await load()
+        return await self.cache.get_or_load_async(key, load)
+
+    # 전체
+    async def list(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                   tag_match: TagMatch = TagMatch.ANY) -> List[AccountEntryOut]:
+        entries = await self.repo.get_entries(limit=limit, offset=offset, tags=tags, tag_match=tag_match)
+        return [mapper.to_out(e) for e in entries]
+
+    # keyset 페이지네이션 (after가 빈 문자열이면 첫 페이지). 잘못된 커서는 ValueError
+    async def list_after(self, *, limit: int = 50, after: str = "", tags: Sequence[str] = (),
+                         tag_match: TagMatch = TagMatch.ANY, with_total: bool = False) -> AccountEntryPageOut:
+        page = await self.repo.get_entries_after(limit=limit, after=mapper.to_cursor_dto(after), tags=tags,
+                                                 tag_match=tag_match, with_total=with_total)
+        return mapper.to_page_out(page)
+
+    # offset 목록 + 조건에 맞는 전체 수 (같은 읽기 트랜잭션)
+    async def list_counted(self, *, limit: int = 50, offset: int = 0, tags: Sequence[str] = (),
+                           tag_match: TagMatch = TagMatch.ANY) -> AccountEntryPageOut:
+        page = await self.repo.get_entries_counted(limit=limit, offset=offset, tags=tags, tag_match=tag_match)
+        return mapper.to_page_out(page)
+
+    async def tag_counts(self, *, limit: int = 100) -> List[TagCountOut]:
+        return mapper.to_tag_counts_out(await self.repo.get_tag_counts(limit=limit))
+
+    async def search(self, q: str, *, limit: int = 20, offset: int = 0) -> List[AccountEntrySearchHitOut]:
+        terms = search_terms(q)
+        hits = await self.repo.search_entries(terms, limit=limit, offset=offset)
+        return [mapper.to_search_hit_out(hit, terms) for hit in hits]
+
+    async def sheet(self, *, limit: int = 50, offset: int = 0) -> List[SheetRowOut]:
+        return mapper.to_sheet_rows(await self.repo.get_sheet(limit=limit, offset=offset))
+
+    def export_ndjson(self) -> AsyncIterator[bytes]:
+        return ndjson_chunks_async(self.repo.export_rows())
+
+    # 가져오기: job에 모인 chunk 하나를 기록 (엔트리 → 관계 순, 각각 한 쓰기 트랜잭션)
+    async def import_chunk(self, job: AccountEntryImport) -> None:
+        entries, relation_ops = job.take()
+        created = await self.repo.import_entries(entries, chunk_size=settings.batch_chunk_size) if entries else 0
+        linked = (await self.repo.apply_relation_ops(relation_ops, chunk_size=settings.batch_chunk_size)
+                  if relation_ops else [])
+        if created or any(linked):
+            self._written()
+        job.record(len(entries), created, linked)
+
+    async def count(self) -> int:
+        return await self._cached(count_key(), self.repo.count_entries)
+
+    # CRUD
+    async def create(self, p: AccountEntryCreate) -> str:
+        new_id = await self.repo.create_entry(mapper.to_create_dto(p))
+        self._written()
+        return new_id
+
+    async def create_many(self, payloads: List[AccountEntryCreate]) -> List[str]:
+        ids = await self.repo.create_entries(
+            [mapper.to_create_dto(p) for p in payloads],
+            chunk_size=settings.batch_chunk_size,
+        )
+        if ids:
+            self._written()
+        return ids
+
+    async def get(self, account_entry_id: str) -> AccountEntryOut | None:
+        account_entry = await self.repo.get_entry(account_entry_id)
+        return None if account_entry is None else mapper.to_out(account_entry)
+
+    async def patch(self, account_entry_id: str, p: AccountEntryPatch) -> bool:
+        updated = await self.repo.update_entry(account_entry_id, mapper.to_patch_dto(p))
+        if updated:
+            self._written()
+        return updated
+
+    async def delete(self, account_entry_id: str) -> bool:
+        deleted = await self.repo.delete_entry(account_entry_id)
+        if deleted:
+            self._written()
+        return deleted
+
+    # 관계
+    async def link(self, from_id: str, payload: RelationCreate) -> bool:
+        linked = await self.repo.add_relation(mapper.to_relation_create_dto(from_id, payload))
+        if linked:
+            self._written()
+        return linked
+
+    async def list_links(self, entry_id: str) -> RelationList:
+        async def load():
+            return mapper.to_relation_list(await self.repo.get_relations(entry_id))
+
+        return await self._cached(relations_key(entry_id), load)
+
+    async def unlink(self, from_id: str, to_id: str, kind: RelKind) -> int:
+        cnt = await self.repo.delete_relation(AccountEntryRelationDeleteDTO(
+            from_id=from_id, to_id=to_id, kind=kind
+        ))
+        if cnt > 0:
+            self._written()
+        return cnt
+
+    async def batch_links(self, items: List[RelationBatchItem]) -> RelationBatchOut:
+        oks = await self.repo.apply_relation_ops(
+            mapper.to_relation_op_dtos(items), chunk_size=settings.batch_chunk_size)
+        if any(oks):
+            self._written()
+        return mapper.to_relation_batch_out(items, oks)
+
+    # 트리
+    async def get_start_to_end_node(self, start_id):
+        return await self._cached(tree_key(start_id, reverse=False), lambda: self.repo.get_entry_tree(start_id))
+
+    async def get_start_to_end_node_reverse(self, start_id):
+        return await self._cached(tree_key(start_id, reverse=True), lambda: self.repo.get_entry_tree_reverse(start_id))
+
+    async def explore_bounded(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                              max_nodes: int | None = None) -> AccountEntryTreeResultDTO | None:
+        max_nodes = self._max_nodes(max_nodes)
+        return await self._cached(
+            bounded_tree_key(start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes),
+            lambda: self.repo.get_entry_tree_bounded(
+                start_id, reverse=reverse, max_depth=max_depth, max_nodes=max_nodes),
+        )
+
+    # 스트리밍 explore: 골격만 먼저 읽음 (404/잘림 여부를 본문 전에 결정, 캐시하지 않음)
+    # max_depth/max_nodes가 없으면 get_start_to_end_node와 같은 모양 (연결이 없으면 None), 있으면 explore_bounded와 같음
+    async def explore_plan(self, start_id: str, *, reverse: bool = False, max_depth: int | None = None,
+                           max_nodes: int | None = None) -> AccountEntryTreePlanDTO | None:
+        if not self._is_bounded(max_depth, max_nodes):
+            return await self.repo.get_entry_path_plan(start_id, reverse=reverse)
+        return await self.repo.get_entry_tree_plan(start_id, reverse=reverse, max_depth=max_depth,
+                                                   max_nodes=self._max_nodes(max_nodes))
+
+    # 골격을 깊이 우선으로 걸으며 노드 속성을 batch_chunk_size개씩 읽어 JSON chunk로 (본문은 스트리밍 아닌 응답과 같음)
+    def explore_json_chunks(self, plan: AccountEntryTreePlanDTO) -> AsyncIterator[bytes]:
+        return tree_json_chunks_async(walk_account_entry_tree(plan), self._tree_nodes(plan))
+
+    async def _tree_nodes(self, plan: AccountEntryTreePlanDTO) -> AsyncIterator[dict | None]:
+        for chunk in self._tree_node_batches(plan):
+            for node in await self.repo.get_tree_nodes(chunk):
+                yield node
+
+    async def get_forest(self, *, roots_only: bool = False, limit: int | None = None,
+                         offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return await self._cached(forest_key(reverse=False, roots_only=roots_only, limit=limit, offset=offset),
+                                  lambda: self.repo.get_entry_forest(roots_only=roots_only, limit=limit,
+                                                                     offset=offset))
+
+    async def get_forest_reverse(self, *, roots_only: bool = False, limit: int | None = None,
+                                 offset: int = 0) -> List[AccountEntryTreeNodeDTO | None]:
+        return await self._cached(forest_key(reverse=True, roots_only=roots_only, limit=limit, offset=offset),
+                                  lambda: self.repo.get_entry_forest_reverse(roots_only=roots_only, limit=limit,
+                                                                             offset=offset))
+
+    async def descendants(self, entry_id: str, *, limit: int | None = None) -> ReachOut | None:
+        return await self._reachable(entry_id, reverse=False, limit=limit)
+
+    async def ancestors(self, entry_id: str, *, limit: int | None = None) -> ReachOut | None:
+        return await self._reachable(entry_id, reverse=True, limit=limit)
+
+    async def _reachable(self, entry_id: str, *, reverse: bool, limit: int | None) -> ReachOut | None:
+        reach = await self._cached(reach_key(entry_id, reverse=reverse, limit=limit),
+                                   lambda: self.repo.get_reachable(entry_id, reverse=reverse, limit=limit))
+        return mapper.to_reach_out(reach) if reach else None
+
+    async def reaches(self, from_id: str, to_id: str) -> ReachableOut:
+        reachable = await self._cached(reaches_key(from_id, to_id), lambda: self.repo.is_reachable(from_id, to_id))
+        return ReachableOut(from_id=from_id, to_id=to_id, reachable=reachable)
+
+
+def get_async_account_entry_service(
+        repo: AsyncAccountEntryRepository = Depends(get_async_account_entry_repo)) -> AsyncAccountEntryService:
+    return AsyncAccountEntryService(repo, get_graph_cache())
@@ -0,0 +1,134 @@
+import hashlib
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.core.metrics import register_collector
+
+_MISSING = object()
+# 프로세스마다 다른 값 → 재시작 후 같은 version 숫자로 ETag가 겹치지 않도록
+_EPOCH = uuid.uuid4().hex[:8]
+
+
+class GraphVersionCache:
+    """
+    트리/관계 조회 결과 LRU 캐시.
+    - 모든 쓰기가 version을 올림 → 키에 version이 들어가므로 이전 결과는 다시 쓰이지 않음
+    - 단일 프로세스 기준: 다른 프로세스의 쓰기는 반영되지 않음
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.max_size = max_size
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def bump(self) -> int:
+        # 쓰기 직후 호출. 이전 version 항목은 더 이상 조회되지 않으므로 바로 비움
+        with self._lock:
+            self.version += 1
+            self.evictions += len(self._entries)
+            self._entries.clear()
+            return self.version
+
+    def get_or_load(self, key: tuple, load: Callable[[], Any]) -> Any:
+        if self.max_size <= 0:
+            return load()
+        versioned, value = self._lookup(key)
+        if value is _MISSING:
+            value = load()
+            self._put(versioned, value)
+        return value
+
+    async def get_or_load_async(self, key: tuple, load: Callable[[], Awaitable[Any]]) -> Any:
+        if self.max_size <= 0:
+            return await load()
+        versioned, value = self._lookup(key)
+        if value is _MISSING:
+            value = await load()
+            self._put(versioned, value)
+        return value
+
+    def etag(self, key: tuple) -> Optional[str]:
+        # 현재 version 기준 응답 식별자 (캐시된 값과 같은 신선도). 캐시 비활성화면 None
+        if self.max_size <= 0:
+            return None
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+        return f'"g{_EPOCH}-{self.version}-{digest}"'
+
+    def _lookup(self, key: tuple) -> tuple[tuple, Any]:
+        with self._lock:
+            versioned = (self.version,) + key
+            value = self._entries.get(versioned, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(versioned)
+                self.hits += 1
+            return versioned, value
+
+    def _put(self, versioned: tuple, value: Any) -> None:
+        with self._lock:
+            # 조회 도중 쓰기가 있었으면 저장하지 않음
+            if versioned[0] != self.version:
+                return
+            self._entries[versioned] = value
+            self._entries.move_to_end(versioned)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def samples(self):
+        return [
+            ("graph_cache_hits_total", "counter", "Tree/relation reads served from memory", self.hits),
+            ("graph_cache_misses_total", "counter", "Tree/relation reads loaded from storage", self.misses),
+            ("graph_cache_evictions_total", "counter", "Entries dropped by LRU or graph writes", self.evictions),
+            ("graph_cache_entries", "gauge", "Entries currently cached", len(self)),
+            ("graph_cache_version", "gauge", "Graph write version", self.version),
+        ]
+
+
+# 캐시 키 (graph version은 GraphVersionCache가 앞에 붙임)
+def tree_key(start_id: str, *, reverse: bool) -> tuple:
+    return "tree", start_id, "reverse" if reverse else "forward"
+
+
+def bounded_tree_key(start_id: str, *, reverse: bool, max_depth: int | None, max_nodes: int) -> tuple:
+    return "tree_bounded", start_id, "reverse" if reverse else "forward", max_depth, max_nodes
+
+
+def forest_key(*, reverse: bool, roots_only: bool, limit: int | None, offset: int) -> tuple:
+    return "forest", None, "reverse" if reverse else "forward", roots_only, limit, offset
+
+
+def relations_key(entry_id: str) -> tuple:
+    return "relations", entry_id
+
+
+def reach_key(entry_id: str, *, reverse: bool, limit: int | None) -> tuple:
+    return "reach", entry_id, "reverse" if reverse else "forward", limit
+
+
+def reaches_key(from_id: str, to_id: str) -> tuple:
+    return "reaches", from_id, to_id
+
+
+def count_key() -> tuple:
+    return ("count",)
+
+
+graph_cache = GraphVersionCache(settings.graph_cache_size)
+register_collector(graph_cache.samples)
+
+
+def get_graph_cache() -> Optional[GraphVersionCache]:
+    # GRAPH_CACHE_SIZE=0이면 None (캐시 비활성화)
+    return graph_cache if graph_cache.max_size > 0 else None
@@ -13,8 +13,9 @@ from pydantic import BaseModel
 from devaccountbook_backend.api.v1.account_entries_router import router
 from devaccountbook_backend.schemas.account_entry_schemas import (
     AccountEntryCreate, AccountEntryPatch, AccountEntryOut,
-    RelationCreate, RelationList, RelKind
+    RelationCreate, RelationList, RelKind, AccountEntryPageOut, TagMatch
 )
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryTreeNodeDTO, AccountEntryTreeResultDTO
 from devaccountbook_backend.services.account_entry_service import get_account_entry_service
 
 
@@ -134,10 +135,28 @@ class FakeAccountEntryService:
         self.entries["e2"] = e2
 
     # list & count
-    def list(self, limit: int, offset: int):
-        items = list(self.entries.values())[offset: offset + limit]
+    def _tagged(self, tags, tag_match):
+        match = all if tag_match == TagMatch.ALL else any
+        return [e for e in self.entries.values() if not tags or match(t in e.tags for t in tags)]
+
+    def list(self, limit: int, offset: int, tags=(), tag_match=TagMatch.ANY):
+        items = self._tagged(tags, tag_match)[offset: offset + limit]
         return items
 
+    def list_counted(self, limit: int, offset: int, tags=(), tag_match=TagMatch.ANY):
+        tagged = self._tagged(tags, tag_match)
+        return AccountEntryPageOut(items=tagged[offset: offset + limit], total=len(tagged))
+
+    def list_after(self, limit: int, after: str, tags=(), tag_match=TagMatch.ANY, with_total=False):
+        # 가짜 커서: 다음 시작 인덱스 문자열
+        if after not in ("",) and not after.isdigit():
+            raise ValueError("invalid cursor")
+        start = int(after or 0)
+        tagged = self._tagged(tags, tag_match)
+        items = tagged[start: start + limit]
+        next_cursor = str(start + limit) if start + limit < len(self.entries) else None
+        return AccountEntryPageOut(items=items, next_cursor=next_cursor, total=len(tagged) if with_total else None)
+
     def count(self) -> int:
         return len(self.entries)
 
@@ -147,6 +166,9 @@ class FakeAccountEntryService:
         self.entries[new_id] = build_sample_model(AccountEntryOut, overrides={"id": new_id})
         return new_id
 
+    def create_many(self, payloads: List[AccountEntryCreate]) -> List[str]:
+        return [self.create(p) for p in payloads]
+
     def get(self, entry_id: str):
         return self.entries.get(entry_id)
 
@@ -168,6 +190,43 @@ class FakeAccountEntryService:
         # 예시 응답
         return {"start": start_id, "leaf_ids": ["leaf-1", "leaf-2"]}
 
+    # 가짜 graph version ETag (bounded 탐색만)
+    def explore_etag(self, start_id: str, reverse: bool = False, bounded: bool = False, max_depth=None,
+                     max_nodes=None):
+        return f'"v1-{start_id}-{reverse}-{max_depth}"' if bounded else None
+
+    def list_links_etag(self, entry_id: str):
+        return None
+
+    def explore_bounded(self, start_id: str, reverse: bool = False, max_depth=None, max_nodes=None):
+        if start_id not in self.entries:
+            return None
+        other = "e1" if reverse else "e2"
+        tree = AccountEntryTreeNodeDTO(id=start_id, title="sample")
+        if max_depth != 0:
+            tree.children.append(AccountEntryTreeNodeDTO(id=other, title="sample"))
+        return AccountEntryTreeResultDTO(tree=tree, truncated=max_depth == 0, node_count=len(tree.children) + 1)
+
+    def sheet(self, limit: int, offset: int):
+        rows = []
+        for entry in list(self.entries.values())[offset: offset + limit]:
+            rows.append({"row_kind": "node", "node": entry})
+            for to_id, kind, _ in self.links.get(entry.id, []):
+                rows.append({"row_kind": "linked", "node": entry, "kind": kind, "connected": self.entries[to_id]})
+        return rows
+
+    def get_forest(self, roots_only: bool = False, limit: int | None = None, offset: int = 0):
+        e1 = {"id": "e1", "title": "sample", "desc": None, "tags": [],
+              "children": [{"id": "e2", "title": "sample", "desc": None, "tags": [], "children": []}]}
+        forest = [e1] if roots_only else [e1, e1["children"][0]]
+        return forest[offset:][:limit]
+
+    def get_forest_reverse(self, roots_only: bool = False, limit: int | None = None, offset: int = 0):
+        e2 = {"id": "e2", "title": "sample", "desc": None, "tags": [],
+              "children": [{"id": "e1", "title": "sample", "desc": None, "tags": [], "children": []}]}
+        forest = [e2] if roots_only else [e2, e2["children"][0]]
+        return forest[offset:][:limit]
+
     # Relations
     def link(self, from_id: str, payload: RelationCreate):
         lst = self.links.setdefault(from_id, [])
@@ -220,6 +279,43 @@ def test_list_account_entries_ok(client: TestClient):
     assert len(data) >= 2  # e1, e2가 초기 데이터
 
 
+def test_list_account_entries_keyset(client: TestClient):
+    resp = client.get("/account-entries?limit=1&after=")
+    assert resp.status_code == 200
+    assert [e["id"] for e in resp.json()] == ["e1"]
+    cursor = resp.headers["X-Next-Cursor"]
+
+    resp = client.get(f"/account-entries?limit=1&after={cursor}")
+    assert resp.status_code == 200
+    assert [e["id"] for e in resp.json()] == ["e2"]
+    assert "X-Next-Cursor" not in resp.headers
+
+
+def test_list_account_entries_tag_filter(client: TestClient):
+    assert client.get("/account-entries?tag=__none__").json() == []
+    assert client.get("/account-entries?tag=__none__&after=").json() == []
+    assert client.get("/account-entries?tag=a&match=some").status_code == 422
+
+
+def test_list_account_entries_with_total(client: TestClient):
+    resp = client.get("/account-entries?limit=1")
+    assert "X-Total-Count" not in resp.headers
+
+    resp = client.get("/account-entries?limit=1&with_total=true")
+    assert len(resp.json()) == 1
+    assert resp.headers["X-Total-Count"] == "2"
+
+    resp = client.get("/account-entries?limit=1&after=&with_total=true")
+    assert resp.headers["X-Total-Count"] == "2"
+    assert resp.headers["X-Next-Cursor"] == "1"
+    assert client.get("/account-entries?tag=__none__&with_total=true").headers["X-Total-Count"] == "0"
+
+
+def test_list_account_entries_invalid_cursor_400(client: TestClient):
+    resp = client.get("/account-entries?after=broken")
+    assert resp.status_code == 400
+
+
 def test_count_account_entries_ok(client: TestClient):
     resp = client.get("/account-entries/count")
     assert resp.status_code == 200
@@ -232,6 +328,25 @@ def test_get_account_entry_ok(client: TestClient):
     assert resp.json()  # 형태 검증은 스키마에 맡김
 
 
+def test_get_account_entry_etag_304(client: TestClient):
+    first = client.get("/account-entries/e1")
+    etag = first.headers["ETag"]
+    resp = client.get("/account-entries/e1", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+
+    # 다른 엔트리는 본문 지문이 달라 200
+    assert client.get("/account-entries/e2", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_list_account_entries_etag_changes_after_write(client: TestClient):
+    etag = client.get("/account-entries").headers["ETag"]
+    assert client.get("/account-entries", headers={"If-None-Match": etag}).status_code == 304
+    client.post("/account-entries", json={"title": "new"})
+    assert client.get("/account-entries", headers={"If-None-Match": etag}).status_code == 200
+
+
 def test_get_account_entry_404(client: TestClient):
     resp = client.get("/account-entries/does-not-exist")
     assert resp.status_code == 404
@@ -245,6 +360,18 @@ def test_create_account_entry_ok(client: TestClient):
     assert resp.json()
 
 
+def test_create_account_entries_batch_ok(client: TestClient):
+    body = {"items": [{"title": "a"}, {"title": "b", "tags": ["x"]}]}
+    resp = client.post("/account-entries:batch", json=body)
+    assert resp.status_code == 201
+    assert resp.json()["ids"] == ["e3", "e4"]
+
+
+def test_create_account_entries_batch_empty_422(client: TestClient):
+    resp = client.post("/account-entries:batch", json={"items": []})
+    assert resp.status_code == 422
+
+
 def test_patch_account_entry_ok(client: TestClient):
     # non-empty body => True
     body = dump_model(build_sample_model(AccountEntryPatch))
@@ -283,6 +410,83 @@ def test_explore_start_leaf_ok(client: TestClient):
     assert isinstance(data.get("leaf_ids"), list)
 
 
+def test_sheet_ok(client: TestClient):
+    body = {"to_id": "e2", "kind": RelKind.RELATES_TO.value}
+    assert client.post("/account-entries/e1/relations", json=body).status_code == 201
+
+    resp = client.get("/account-entries/sheet?limit=50&offset=0")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [r["rowKind"] for r in data] == ["node", "linked", "node"]
+    assert data[1]["node"]["id"] == "e1"
+    assert data[1]["connected"]["id"] == "e2"
+    assert data[1]["kind"] == RelKind.RELATES_TO.value
+
+
+def test_sheet_paging(client: TestClient):
+    resp = client.get("/account-entries/sheet?limit=1&offset=1")
+    assert resp.status_code == 200
+    assert [r["node"]["id"] for r in resp.json()] == ["e2"]
+
+
+def test_forest_ok(client: TestClient):
+    resp = client.get("/account-entries/forest")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [t["id"] for t in data] == ["e1", "e2"]
+    assert data[0]["children"][0]["id"] == "e2"
+
+
+def test_forest_paging(client: TestClient):
+    resp = client.get("/account-entries/forest?limit=1&offset=1")
+    assert resp.status_code == 200
+    assert [t["id"] for t in resp.json()] == ["e2"]
+    assert client.get("/account-entries/forest?limit=0").status_code == 422
+
+
+def test_forest_roots_only_ok(client: TestClient):
+    resp = client.get("/account-entries/forest?roots_only=true")
+    assert resp.status_code == 200
+    assert [t["id"] for t in resp.json()] == ["e1"]
+
+
+def test_forest_reverse_ok(client: TestClient):
+    resp = client.get("/account-entries/forest-reverse?roots_only=true")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [t["id"] for t in data] == ["e2"]
+    assert data[0]["children"][0]["id"] == "e1"
+
+
+def test_explore_start_leaf_bounded_ok(client: TestClient):
+    resp = client.get("/account-entries/e1/explore-start-leaf?max_depth=3&max_nodes=100")
+    assert resp.status_code == 200
+    assert resp.headers["X-Tree-Truncated"] == "false"
+    data = resp.json()
+    assert data["id"] == "e1"
+    assert data["children"][0]["id"] == "e2"
+
+
+def test_explore_start_leaf_bounded_truncated(client: TestClient):
+    resp = client.get("/account-entries/e2/explore-start-leaf-reverse?max_depth=0")
+    assert resp.status_code == 200
+    assert resp.headers["X-Tree-Truncated"] == "true"
+    assert resp.json()["children"] == []
+
+
+def test_explore_start_leaf_bounded_version_etag_304(client: TestClient):
+    url = "/account-entries/e1/explore-start-leaf?max_depth=3"
+    etag = client.get(url).headers["ETag"]
+    assert etag == '"v1-e1-False-3"'
+    resp = client.get(url, headers={"If-None-Match": f'W/"x", {etag}'})
+    assert resp.status_code == 304
+
+
+def test_explore_start_leaf_bounded_404(client: TestClient):
+    resp = client.get("/account-entries/nope/explore-start-leaf?max_nodes=10")
+    assert resp.status_code == 404
+
+
 def test_create_relation_ok(client: TestClient):
     # RelKind enum의 첫 멤버 사용
     kind_value = list(RelKind)[0].value if hasattr(RelKind, "__members__") else list(RelKind)[0]
@@ -301,6 +505,9 @@ def test_list_relations_ok(client: TestClient):
     resp = client.get("/account-entries/e1/relations")
     assert resp.status_code == 200
     assert resp.json() is not None
+    assert resp.headers["Cache-Control"] == "no-cache"
+    assert client.get("/account-entries/e1/relations",
+                      headers={"If-None-Match": resp.headers["ETag"]}).status_code == 304
 
 
 def test_delete_relation_404_when_missing(client: TestClient):
@@ -0,0 +1,370 @@
+# 실제 서비스 + SQLite 저장소로 라우터 전체를 검증 (외부 서비스 불필요)
+import asyncio
+import io
+import json
+from contextlib import contextmanager
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from devaccountbook_backend.api.v1.account_entries_router import router as items_router
+from devaccountbook_backend.api.v1.export_router import router as export_router
+from devaccountbook_backend.api.v1.import_router import router as import_router
+from devaccountbook_backend.cli.import_file import run_import
+from devaccountbook_backend.cli.loadtest import parse_mix, percentile, prepare_state, run_load
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.api.v1.relations_router import router as relations_router
+from devaccountbook_backend.api.v1.tags_router import router as tags_router
+from devaccountbook_backend.db.migrations import migrate_sqlite
+from devaccountbook_backend.db.sqlite import connect_sqlite
+from devaccountbook_backend.repositories.repository_factory import get_account_entry_repository, \
+    get_account_entry_repository_opener
+from devaccountbook_backend.repositories.sqlite_account_entry_repo import SqliteAccountEntryRepository
+from devaccountbook_backend.services.graph_cache import graph_cache
+
+
+@pytest.fixture()
+def client(tmp_path):
+    path = str(tmp_path / "api.db")
+    conn = connect_sqlite(path)
+    migrate_sqlite(conn)
+    conn.close()
+
+    app = FastAPI()
+    app.include_router(items_router, prefix="/v1")
+    app.include_router(relations_router, prefix="/v1")
+    app.include_router(tags_router, prefix="/v1")
+    app.include_router(export_router, prefix="/v1")
+    app.include_router(import_router, prefix="/v1")
+
+    def _override():
+        conn = connect_sqlite(path)
+        try:
+            yield SqliteAccountEntryRepository(conn)
+        finally:
+            conn.close()
+
+    app.dependency_overrides[get_account_entry_repository] = _override
+    app.dependency_overrides[get_account_entry_repository_opener] = lambda: contextmanager(_override)
+    return TestClient(app)
+
+
+def _create(client: TestClient, title: str, **extra) -> str:
+    resp = client.post("/v1/account-entries", json={"title": title, **extra})
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+def test_crud(client: TestClient):
+    entry_id = _create(client, "first", desc="hello", tags=["t1"])
+
+    got = client.get(f"/v1/account-entries/{entry_id}").json()
+    assert got == {"id": entry_id, "title": "first", "desc": "hello", "tags": ["t1"]}
+
+    assert client.patch(f"/v1/account-entries/{entry_id}", json={"title": "after"}).json()["title"] == "after"
+    assert client.get("/v1/account-entries/count").json()["total"] == 1
+
+    assert client.delete(f"/v1/account-entries/{entry_id}").status_code == 204
+    assert client.get(f"/v1/account-entries/{entry_id}").status_code == 404
+
+
+def test_list_offset_and_keyset(client: TestClient):
+    ids = client.post("/v1/account-entries:batch",
+                      json={"items": [{"title": f"e{i}"} for i in range(5)]}).json()["ids"]
+
+    offset_ids = [e["id"] for e in client.get("/v1/account-entries?limit=5").json()]
+    assert set(offset_ids) == set(ids)
+
+    keyset_ids, after = [], ""
+    while after is not None:
+        resp = client.get(f"/v1/account-entries?limit=2&after={after}")
+        keyset_ids += [e["id"] for e in resp.json()]
+        after = resp.headers.get("X-Next-Cursor")
+    assert keyset_ids == offset_ids
+
+    resp = client.get("/v1/account-entries?limit=1&with_total=true")
+    assert resp.headers["X-Total-Count"] == "5"
+    # 전체 수만 바뀌어도 ETag가 달라짐 (304로 옛 X-Total-Count를 재사용하지 않도록)
+    first, etag = resp.json(), resp.headers["ETag"]
+    client.delete(f"/v1/account-entries/{offset_ids[-1]}")
+    resp = client.get("/v1/account-entries?limit=1&with_total=true", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json() == first
+    assert resp.headers["X-Total-Count"] == "4"
+    assert client.get("/v1/account-entries/count").json()["total"] == 4
+
+
+def test_relations_sheet_and_trees(client: TestClient):
+    a, b, c = (_create(client, t) for t in "ABC")
+    resp = client.post("/v1/relations:batch", json={"items": [
+        {"op": "link", "fromId": a, "toId": b, "kind": "RELATES_TO"},
+        {"op": "link", "fromId": b, "toId": c, "kind": "RELATES_TO"},
+        {"op": "link", "fromId": a, "toId": c, "kind": "BLOCKS", "props": {"note": "n"}},
+    ]})
+    assert [r["ok"] for r in resp.json()["results"]] == [True, True, True]
+
+    rels = client.get(f"/v1/account-entries/{a}/relations").json()
+    assert [(r["kind"], r["toId"]) for r in rels["outgoing"]] == [("BLOCKS", c), ("RELATES_TO", b)]
+    assert rels["outgoing"][0]["props"]["note"] == "n"
+
+    sheet = client.get("/v1/account-entries/sheet").json()
+    assert len([r for r in sheet if r["rowKind"] == "linked"]) == 3
+
+    tree = client.get(f"/v1/account-entries/{a}/explore-start-leaf").json()
+    assert tree["children"][0]["id"] == b
+    assert tree["children"][0]["children"][0]["id"] == c
+
+    resp = client.get(f"/v1/account-entries/{a}/explore-start-leaf?max_depth=1")
+    assert resp.headers["X-Tree-Truncated"] == "true"
+
+    roots = client.get("/v1/account-entries/forest?roots_only=true").json()
+    assert [t["id"] for t in roots] == [a]
+    leaves = client.get("/v1/account-entries/forest-reverse?roots_only=true").json()
+    assert [t["id"] for t in leaves] == [c]
+
+    assert client.delete(f"/v1/account-entries/{a}/relations/RELATES_TO/{b}").status_code == 204
+    assert client.delete(f"/v1/account-entries/{a}/relations/RELATES_TO/{b}").status_code == 404
+
+
+@pytest.mark.parametrize("cache_size", [0, 16])
+def test_explore_etag_follows_graph_writes(client: TestClient, monkeypatch, cache_size):
+    # 캐시가 꺼져 있으면 본문 지문, 켜져 있으면 graph version 기준 ETag → 둘 다 쓰기 후에는 200
+    monkeypatch.setattr(graph_cache, "max_size", cache_size)
+    a, b = (_create(client, t) for t in "AB")
+    url = f"/v1/account-entries/{a}/explore-start-leaf"
+
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    client.post(f"/v1/account-entries/{a}/relations", json={"toId": b, "kind": "RELATES_TO"})
+    resp = client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["children"][0]["id"] == b
+
+
+def test_deep_chain_tree_serializes(client: TestClient):
+    # 300단계 체인: 중첩 깊이가 pydantic-core 직렬화 한계를 넘음
+    depth = 300
+    lines = [json.dumps({"type": "entry", "id": str(i), "title": f"T{i}"}) for i in range(depth + 1)]
+    lines += [json.dumps({"type": "relation", "fromId": str(i), "toId": str(i + 1), "kind": "RELATES_TO"})
+              for i in range(depth)]
+    assert client.post("/v1/import?job=chain", content="\n".join(lines)).json()["relationsLinked"] == depth
+
+    roots = client.get("/v1/account-entries/forest?roots_only=true")
+    assert roots.status_code == 200
+    node, levels = roots.json()[0], 0
+    while node["children"]:
+        node, levels = node["children"][0], levels + 1
+    assert (levels, node["title"]) == (depth, f"T{depth}")
+
+    resp = client.get(f"/v1/account-entries/{roots.json()[0]['id']}/explore-start-leaf")
+    assert resp.status_code == 200 and resp.text.count('"children":[') == depth + 1
+
+
+def test_explore_stream_matches_bounded(client: TestClient, monkeypatch):
+    # 노드 속성을 2개씩 나눠 읽어도 본문은 bounded 탐색과 같음 (diamond → revisit, 되돌아가는 간선 → cycle)
+    monkeypatch.setattr(settings, "batch_chunk_size", 2)
+    a, b, c, d = (_create(client, t, tags=[t.lower()]) for t in "ABCD")
+    client.post("/v1/relations:batch", json={"items": [
+        {"op": "link", "fromId": x, "toId": y, "kind": "RELATES_TO"}
+        for x, y in [(a, b), (a, c), (b, d), (c, d), (d, a)]
+    ]})
+
+    for query in ("max_nodes=100", "max_depth=1"):
+        url = f"/v1/account-entries/{a}/explore-start-leaf?{query}"
+        bounded, streamed = client.get(url), client.get(url + "&stream=true")
+        assert streamed.status_code == 200
+        assert streamed.content == bounded.content
+        assert streamed.headers["X-Tree-Truncated"] == bounded.headers["X-Tree-Truncated"]
+
+    assert client.get("/v1/account-entries/nope/explore-start-leaf?max_depth=1&stream=true").status_code == 404
+
+
+def test_explore_stream_matches_unbounded(client: TestClient, monkeypatch):
+    # 상한 없이 stream=true: 같은 URL의 기본 응답과 본문이 같음 (d는 b, c 아래 모두 펼침, d -> a는 cycle)
+    monkeypatch.setattr(settings, "batch_chunk_size", 2)
+    a, b, c, d, x = (_create(client, t) for t in "ABCDX")
+    client.post("/v1/relations:batch", json={"items": [
+        {"op": "link", "fromId": p, "toId": q, "kind": "RELATES_TO"}
+        for p, q in [(a, b), (a, c), (b, d), (c, d), (d, a)]
+    ]})
+
+    for path in (f"{a}/explore-start-leaf", f"{d}/explore-start-leaf-reverse",
+                 f"{x}/explore-start-leaf", "nope/explore-start-leaf"):
+        url = f"/v1/account-entries/{path}"
+        plain, streamed = client.get(url), client.get(url + "?stream=true")
+        assert streamed.status_code == plain.status_code == 200
+        assert streamed.content == plain.content
+        assert "X-Tree-Truncated" not in streamed.headers
+
+    tree = client.get(f"/v1/account-entries/{a}/explore-start-leaf?stream=true").json()
+    assert [[n["id"] for n in mid["children"]] for mid in tree["children"]] == [[d], [d]]
+    assert client.get(f"/v1/account-entries/{x}/explore-start-leaf?stream=true").json() is None
+
+
+def test_reachability_endpoints(client: TestClient):
+    a, b, c = (_create(client, t) for t in "ABC")
+    client.post("/v1/relations:batch", json={"items": [
+        {"op": "link", "fromId": a, "toId": b, "kind": "RELATES_TO"},
+        {"op": "link", "fromId": b, "toId": c, "kind": "RELATES_TO"},
+    ]})
+
+    desc = client.get(f"/v1/account-entries/{a}/descendants").json()
+    assert desc == {"entryId": a, "count": 2, "ids": sorted([b, c])}
+    assert client.get(f"/v1/account-entries/{c}/ancestors?limit=1").json()["count"] == 2
+    assert client.get(f"/v1/account-entries/{a}/reaches/{c}").json()["reachable"] is True
+    assert client.get(f"/v1/account-entries/{c}/reaches/{a}").json()["reachable"] is False
+    assert client.get("/v1/account-entries/missing/descendants").status_code == 404
+
+    client.delete(f"/v1/account-entries/{b}/relations/RELATES_TO/{c}")
+    assert client.get(f"/v1/account-entries/{a}/reaches/{c}").json()["reachable"] is False
+
+
+def test_tag_filter_and_facets(client: TestClient):
+    a = _create(client, "A", tags=["x", "y"])
+    b = _create(client, "B", tags=["x"])
+    c = _create(client, "C", tags=["z"])
+
+    ids = lambda resp: sorted(e["id"] for e in resp.json())
+    assert ids(client.get("/v1/account-entries?tag=x")) == sorted([a, b])
+    assert ids(client.get("/v1/account-entries?tag=y&tag=z")) == sorted([a, c])
+    assert ids(client.get("/v1/account-entries?tag=x&tag=y&match=all")) == [a]
+    assert ids(client.get("/v1/account-entries?tag=x&after=&limit=1")) == [b]  # 최신순
+
+    assert client.get("/v1/tags").json() == [
+        {"name": "x", "count": 2}, {"name": "y", "count": 1}, {"name": "z", "count": 1}]
+
+    # 수정/삭제가 태그 인덱스에 반영
+    client.patch(f"/v1/account-entries/{b}", json={"tags": ["z"]})
+    client.delete(f"/v1/account-entries/{a}")
+    assert ids(client.get("/v1/account-entries?tag=x")) == []
+    assert client.get("/v1/tags").json() == [{"name": "z", "count": 2}]
+
+
+def test_search_ranked_with_highlights(client: TestClient):
+    a = _create(client, "Coffee beans", desc="monthly coffee coffee budget")
+    b = _create(client, "Lunch", desc="coffee after lunch")
+    c = _create(client, "Books", tags=["coffee-table"])
+    _create(client, "Rent")
+
+    hits = client.get("/v1/account-entries/search?q=coffee").json()
+    assert [h["id"] for h in hits][0] == a
+    assert {h["id"] for h in hits} == {a, b, c}
+    assert hits[0]["highlights"][0] == {"field": "title", "index": None, "start": 0, "end": 6}
+    assert client.get("/v1/account-entries/search?q=coffee&limit=1&offset=1").json()[0]["id"] == hits[1]["id"]
+
+    # 접두어 + 수정 반영
+    assert [h["id"] for h in client.get("/v1/account-entries/search?q=lun").json()] == [b]
+    client.patch(f"/v1/account-entries/{b}", json={"title": "Dinner", "desc": "tea"})
+    client.delete(f"/v1/account-entries/{c}")
+    assert [h["id"] for h in client.get("/v1/account-entries/search?q=coffee").json()] == [a]
+    assert client.get("/v1/account-entries/search?q=").status_code == 422
+
+
+def test_export_ndjson(client: TestClient):
+    a = _create(client, "A", desc="첫 줄", tags=["t"])
+    b = _create(client, "B")
+    client.post("/v1/relations:batch", json={"items": [
+        {"op": "link", "fromId": a, "toId": b, "kind": "BLOCKS", "props": {"note": "n"}},
+    ]})
+
+    resp = client.get("/v1/export.ndjson")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["type"] for r in rows] == ["entry", "entry", "relation"]
+    entries = {r["id"]: r for r in rows[:2]}
+    assert entries[a]["desc"] == "첫 줄" and entries[a]["tags"] == ["t"] and entries[a]["createdAt"]
+    assert rows[2]["fromId"] == a and rows[2]["toId"] == b and rows[2]["kind"] == "BLOCKS"
+    assert rows[2]["props"]["note"] == "n"
+
+
+def test_import_ndjson_is_idempotent_per_job(client: TestClient):
+    body = "\n".join([
+        '{"type":"entry","id":"1","title":"A","tags":["t"]}',
+        '{"type":"entry","id":"2","title":"B"}',
+        '{"type":"entry","id":"3"}',
+        '{"type":"relation","fromId":"1","toId":"2","kind":"RELATES_TO"}',
+        '{"type":"relation","fromId":"1","toId":"404","kind":"RELATES_TO"}',
+    ])
+    resp = client.post("/v1/import?job=j1&chunk_size=2", content=body)
+    assert resp.status_code == 200
+    result = resp.json()
+    assert (result["entriesCreated"], result["relationsLinked"], result["relationsFailed"]) == (2, 1, 1)
+    assert result["errors"] == [{"line": 3, "message": "title: Field required"}]
+
+    again = client.post("/v1/import?job=j1", content=body).json()
+    assert (again["entriesCreated"], again["entriesExisting"]) == (0, 2)
+    assert client.get("/v1/account-entries/count").json()["total"] == 2
+
+    resp = client.post("/v1/import?format=csv", content="title,tags\nC,x|y\n")
+    assert resp.json()["entriesCreated"] == 1
+    assert {t["name"] for t in client.get("/v1/tags").json()} == {"t", "x", "y"}
+
+
+def test_export_import_round_trip(client: TestClient):
+    a, b = _create(client, "A", tags=["t"]), _create(client, "B")
+    client.post("/v1/relations:batch", json={"items": [
+        {"op": "link", "fromId": a, "toId": b, "kind": "BLOCKS", "props": {"note": "n"}},
+    ]})
+    exported = client.get("/v1/export.ndjson").content
+
+    result = client.post("/v1/import?job=copy", content=exported).json()
+    assert (result["entriesCreated"], result["relationsLinked"], result["errorCount"]) == (2, 1, 0)
+    assert client.get("/v1/account-entries/count").json()["total"] == 4
+
+
+def test_import_cli_resumes_from_checkpoint(client: TestClient, tmp_path):
+    path = tmp_path / "ledger.ndjson"
+    path.write_text("".join(f'{{"type":"entry","id":"{i}","title":"T{i}"}}\n' for i in range(5))
+                    + '{"type":"relation","fromId":"0","toId":"4","kind":"RELATES_TO"}\n')
+    post, calls = client.post, []
+
+    def flaky_post(*args, **kwargs):
+        calls.append(kwargs["params"]["line_offset"])
+        if len(calls) == 2:
+            raise httpx.ConnectError("down")
+        return post(*args, **kwargs)
+
+    client.post = flaky_post
+    with pytest.raises(httpx.ConnectError):
+        run_import(client, str(path), batch_lines=2, retries=0, out=io.StringIO())
+    checkpoint = json.loads((tmp_path / "ledger.ndjson.import.json").read_text())
+    assert (checkpoint["line"], checkpoint["entriesCreated"]) == (2, 2)
+
+    summary = run_import(client, str(path), batch_lines=2, retries=0, out=io.StringIO())
+    assert calls == [0, 2, 2, 4]
+    assert (summary["job"], summary["entriesCreated"], summary["relationsLinked"]) == (checkpoint["job"], 5, 1)
+    assert not (tmp_path / "ledger.ndjson.import.json").exists()
+    assert client.get("/v1/account-entries/count").json()["total"] == 5
+
+
+def test_loadtest_reports_every_endpoint_in_mix(client: TestClient):
+    async def run():
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            state = await prepare_state(c, seed_entries=30, out=io.StringIO())
+            return state, await run_load(c, state, concurrency=3, duration=0.5, mix=parse_mix(
+                "list=1,get=1,relations=1,explore=1,search=1,create=1,patch=1,link=1"))
+
+    state, step = asyncio.run(run())
+    assert len(state.ids) > 30  # create로 추가된 id
+    assert set(step["endpoints"]) == {
+        "GET /account-entries", "GET /account-entries/{id}", "GET /account-entries/{id}/relations",
+        "GET /account-entries/{id}/explore-start-leaf", "GET /account-entries/search", "POST /account-entries",
+        "PATCH /account-entries/{id}", "POST /account-entries/{id}/relations"}
+    total = step["total"]
+    assert total["requests"] == sum(e["requests"] for e in step["endpoints"].values()) > 0
+    assert total["errors"] == 0 and total["error_rate"] == 0.0
+    assert total["p50_ms"] <= total["p95_ms"] <= total["p99_ms"] <= total["max_ms"]
+    assert client.get("/v1/account-entries/count").json()["total"] == len(state.ids)
+
+
+def test_loadtest_percentile_and_mix():
+    assert [percentile(list(range(1, 101)), q) for q in (50, 95, 99, 100)] == [50, 95, 99, 100]
+    assert percentile([], 50) == 0.0
+    assert parse_mix("list=3,get=0,search") == {"list": 3.0, "search": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("unknown=1")
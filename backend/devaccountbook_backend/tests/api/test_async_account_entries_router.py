@@ -0,0 +1,96 @@
+import uuid
+from typing import Dict, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from devaccountbook_backend.api.v1.async_account_entries_router import router
+from devaccountbook_backend.api.v1.async_relations_router import router as relations_router
+from devaccountbook_backend.schemas.account_entry_schemas import (
+    AccountEntryCreate, AccountEntryPatch, AccountEntryOut, RelationBatchItem, RelationBatchOut,
+    RelationBatchItemResult
+)
+from devaccountbook_backend.services.async_account_entry_service import get_async_account_entry_service
+
+
+class FakeAsyncAccountEntryService:
+    def __init__(self):
+        self.store: Dict[str, AccountEntryOut] = {}
+
+    async def list(self, *, limit: int = 50, offset: int = 0, tags=(), tag_match=None) -> List[AccountEntryOut]:
+        return list(self.store.values())[offset:offset + limit]
+
+    async def count(self) -> int:
+        return len(self.store)
+
+    async def create(self, p: AccountEntryCreate) -> str:
+        new_id = str(uuid.uuid4())
+        self.store[new_id] = AccountEntryOut(id=new_id, title=p.title, desc=p.desc, tags=p.tags)
+        return new_id
+
+    async def get(self, account_entry_id: str) -> AccountEntryOut | None:
+        return self.store.get(account_entry_id)
+
+    async def patch(self, account_entry_id: str, p: AccountEntryPatch) -> bool:
+        if account_entry_id not in self.store:
+            return False
+        data = p.model_dump(exclude_none=True)
+        if not data:
+            return False
+        self.store[account_entry_id] = self.store[account_entry_id].model_copy(update=data)
+        return True
+
+    async def delete(self, account_entry_id: str) -> bool:
+        return self.store.pop(account_entry_id, None) is not None
+
+    def explore_etag(self, start_id: str, **kwargs):
+        return None
+
+    async def explore_bounded(self, start_id: str, **kwargs):
+        return None
+
+    async def batch_links(self, items: List[RelationBatchItem]) -> RelationBatchOut:
+        return RelationBatchOut(results=[
+            RelationBatchItemResult(op=i.op, from_id=i.from_id, to_id=i.to_id, kind=i.kind, ok=True) for i in items
+        ])
+
+
+@pytest.fixture()
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    app.include_router(relations_router)
+    fake = FakeAsyncAccountEntryService()
+    app.dependency_overrides[get_async_account_entry_service] = lambda: fake
+    return TestClient(app)
+
+
+def test_crud_roundtrip(client: TestClient):
+    resp = client.post("/account-entries", json={"title": "t1", "tags": ["a"]})
+    assert resp.status_code == 201
+    new_id = resp.json()["id"]
+
+    assert client.get(f"/account-entries/{new_id}").json()["title"] == "t1"
+    assert client.patch(f"/account-entries/{new_id}", json={"title": "t2"}).json()["title"] == "t2"
+    assert [e["id"] for e in client.get("/account-entries").json()] == [new_id]
+    assert client.get("/account-entries/count").json() == {"total": 1}
+
+    assert client.delete(f"/account-entries/{new_id}").status_code == 204
+    assert client.get(f"/account-entries/{new_id}").status_code == 404
+
+
+def test_patch_no_fields_400(client: TestClient):
+    new_id = client.post("/account-entries", json={"title": "t1"}).json()["id"]
+    assert client.patch(f"/account-entries/{new_id}", json={}).status_code == 400
+
+
+def test_bounded_explore_not_found_404(client: TestClient):
+    assert client.get("/account-entries/missing/explore-start-leaf?max_depth=1").status_code == 404
+
+
+def test_batch_relations(client: TestClient):
+    body = {"items": [{"op": "link", "fromId": "a", "toId": "b", "kind": "RELATES_TO"}]}
+    resp = client.post("/relations:batch", json=body)
+    assert resp.status_code == 200
+    assert resp.json()["results"][0]["ok"] is True
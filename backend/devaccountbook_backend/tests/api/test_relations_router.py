@@ -0,0 +1,57 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from devaccountbook_backend.api.v1.relations_router import router
+from devaccountbook_backend.schemas.account_entry_schemas import (
+    RelationBatchItem, RelationBatchOut, RelationBatchItemResult, RelationOp
+)
+from devaccountbook_backend.services.account_entry_service import get_account_entry_service
+
+
+class FakeAccountEntryService:
+    def __init__(self):
+        self.edges: set[tuple[str, str, str]] = set()
+
+    def batch_links(self, items: list[RelationBatchItem]) -> RelationBatchOut:
+        results = []
+        for item in items:
+            key = (item.from_id, item.to_id, item.kind.value)
+            if item.op == RelationOp.LINK:
+                self.edges.add(key)
+                ok = True
+            else:
+                ok = key in self.edges
+                self.edges.discard(key)
+            results.append(RelationBatchItemResult(
+                op=item.op, from_id=item.from_id, to_id=item.to_id, kind=item.kind, ok=ok))
+        return RelationBatchOut(results=results)
+
+
+@pytest.fixture()
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    fake = FakeAccountEntryService()
+    app.dependency_overrides[get_account_entry_service] = lambda: fake
+    return TestClient(app)
+
+
+def test_batch_relations_ok(client: TestClient):
+    body = {"items": [
+        {"op": "link", "fromId": "a", "toId": "b", "kind": "RELATES_TO"},
+        {"op": "link", "fromId": "a", "toId": "c", "kind": "BLOCKS", "props": {"note": "n"}},
+        {"op": "unlink", "fromId": "a", "toId": "b", "kind": "RELATES_TO"},
+        {"op": "unlink", "fromId": "x", "toId": "y", "kind": "DUPLICATES"},
+    ]}
+    resp = client.post("/relations:batch", json=body)
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [r["ok"] for r in results] == [True, True, True, False]
+    assert results[1]["kind"] == "BLOCKS"
+
+
+def test_batch_relations_invalid_kind_422(client: TestClient):
+    body = {"items": [{"op": "link", "fromId": "a", "toId": "b", "kind": "NOPE"}]}
+    resp = client.post("/relations:batch", json=body)
+    assert resp.status_code == 422
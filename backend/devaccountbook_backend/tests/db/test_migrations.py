@@ -0,0 +1,88 @@
+import asyncio
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from devaccountbook_backend.db.migrations import Migration, NEO4J_MIGRATIONS, SQLITE_MIGRATIONS, migrate_neo4j, \
+    migrate_neo4j_async, migrate_sqlite
+from devaccountbook_backend.db.migrations.migration import pending
+from devaccountbook_backend.db.sqlite import connect_sqlite
+
+
+def _versions(conn) -> list[int]:
+    return [row["version"] for row in conn.execute("SELECT version FROM schema_migration ORDER BY version")]
+
+
+def test_pending_skips_applied_and_sorts():
+    ms = [Migration(version=v, description=str(v), statements=[]) for v in (3, 1, 2)]
+    assert [m.version for m in pending(ms, {2})] == [1, 3]
+
+
+def test_sqlite_migrations_apply_once(tmp_path):
+    conn = connect_sqlite(str(tmp_path / "m.db"))
+    try:
+        assert migrate_sqlite(conn) == [m.version for m in SQLITE_MIGRATIONS]
+        assert migrate_sqlite(conn) == []
+        assert _versions(conn) == [m.version for m in SQLITE_MIGRATIONS]
+        names = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"account_entry_created_at", "account_entry_updated_at"} <= names
+    finally:
+        conn.close()
+
+
+def test_sqlite_failed_migration_rolls_back(tmp_path):
+    conn = connect_sqlite(str(tmp_path / "m.db"))
+    broken = SQLITE_MIGRATIONS + [Migration(version=99, description="broken", statements=[
+        "CREATE TABLE t99 (x INTEGER)",
+        "NOT SQL",
+    ])]
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            migrate_sqlite(conn, broken)
+        assert 99 not in _versions(conn)
+        assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 't99'").fetchone() is None
+    finally:
+        conn.close()
+
+
+def test_sqlite_reach_migration_backfills_existing_relations(tmp_path):
+    conn = connect_sqlite(str(tmp_path / "m.db"))
+    try:
+        migrate_sqlite(conn, [m for m in SQLITE_MIGRATIONS if m.version < 3])
+        conn.executemany("INSERT INTO account_entry (id, title, created_at) VALUES (?, ?, '2025')",
+                         [(i, i) for i in "abc"])
+        conn.executemany("INSERT INTO account_entry_relation (from_id, kind, to_id) VALUES (?, ?, ?)",
+                         [("a", "RELATES_TO", "b"), ("b", "RELATES_TO", "c"), ("c", "BLOCKS", "a")])
+        conn.commit()
+
+        assert migrate_sqlite(conn) == [3, 4, 5, 6]
+        pairs = set(conn.execute("SELECT ancestor, descendant FROM account_entry_reach").fetchall())
+        assert {tuple(p) for p in pairs} == {("a", "b"), ("a", "c"), ("b", "c")}
+        # 카운터는 기존 행 수로 채워지고 이후 쓰기를 따라감
+        assert conn.execute("SELECT value FROM account_entry_counter").fetchone()[0] == 3
+        conn.execute("DELETE FROM account_entry WHERE id = 'c'")
+        assert conn.execute("SELECT value FROM account_entry_counter").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+
+def test_neo4j_tag_backfill_runs_batched_in_auto_commit():
+    backfill = next(st for st in next(m for m in NEO4J_MIGRATIONS if m.version == 4).statements if "MERGE" in st)
+    assert "IN TRANSACTIONS OF" in backfill
+
+    session = MagicMock()
+    session.execute_read.return_value = [{"version": v} for v in (1, 2, 3)]
+    assert migrate_neo4j(session) == [4, 5]
+    # 배치 backfill만 session.run(auto-commit), 나머지(DDL 2개 + 기록 2개)는 관리 트랜잭션
+    assert [c.args[0] for c in session.run.call_args_list] == [backfill]
+    assert session.execute_write.call_count == 4
+
+
+def test_neo4j_async_tag_backfill_runs_in_auto_commit():
+    session = AsyncMock()
+    session.execute_read.return_value = {1, 2, 3, 5}
+    assert asyncio.run(migrate_neo4j_async(session)) == [4]
+    assert session.run.await_count == 1
+    assert "IN TRANSACTIONS OF" in session.run.await_args.args[0]
+    assert session.execute_write.await_count == 2
@@ -0,0 +1,80 @@
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+from neo4j import GraphDatabase, AsyncGraphDatabase
+
+from devaccountbook_backend.core.metrics import render_metrics, register_collector, unregister_collector
+from devaccountbook_backend.db.pool_metrics import PoolMetrics, instrument_pool, pool_snapshot, pool_samples
+
+
+def _fake_driver(acquire):
+    connections = {"a:7687": deque([SimpleNamespace(in_use=True), SimpleNamespace(in_use=False)])}
+    pool = SimpleNamespace(acquire=acquire, connections=connections,
+                           pool_config=SimpleNamespace(max_connection_pool_size=5))
+    return SimpleNamespace(_pool=pool)
+
+
+def test_snapshot_counts_in_use_and_idle():
+    metrics = PoolMetrics()
+    driver = _fake_driver(lambda *a, **k: "conn")
+    assert instrument_pool(driver, metrics)
+
+    assert driver._pool.acquire() == "conn"
+    snap = pool_snapshot(driver, metrics)
+    assert (snap["in_use"], snap["idle"], snap["max_size"], snap["acquisitions"]) == (1, 1, 5, 1)
+
+
+def test_failed_acquire_is_counted():
+    def acquire(*args, **kwargs):
+        raise TimeoutError()
+
+    metrics = PoolMetrics()
+    driver = _fake_driver(acquire)
+    instrument_pool(driver, metrics)
+    with pytest.raises(TimeoutError):
+        driver._pool.acquire()
+    assert (metrics.acquisitions, metrics.acquire_failures) == (0, 1)
+
+
+def test_async_acquire_is_timed():
+    async def acquire(*args, **kwargs):
+        return "conn"
+
+    metrics = PoolMetrics()
+    driver = _fake_driver(acquire)
+    instrument_pool(driver, metrics)
+    assert asyncio.run(driver._pool.acquire()) == "conn"
+    assert metrics.acquisitions == 1
+
+
+def test_real_drivers_expose_pool_without_connecting():
+    # 드라이버 생성만으로는 접속하지 않음 → 서버 없이 내부 풀 구조 확인
+    driver = GraphDatabase.driver("bolt://localhost:7687", auth=("u", "p"), max_connection_pool_size=7)
+    try:
+        assert instrument_pool(driver, PoolMetrics())
+        snap = pool_snapshot(driver, PoolMetrics())
+        assert (snap["in_use"], snap["idle"], snap["max_size"]) == (0, 0, 7)
+    finally:
+        driver.close()
+
+    async def check_async():
+        async_driver = AsyncGraphDatabase.driver("bolt://localhost:7687", auth=("u", "p"))
+        try:
+            assert instrument_pool(async_driver, PoolMetrics())
+        finally:
+            await async_driver.close()
+
+    asyncio.run(check_async())
+
+
+def test_render_metrics_prometheus_format():
+    snap = pool_snapshot(_fake_driver(lambda: None), PoolMetrics())
+    collector = lambda: pool_samples(snap)
+    register_collector(collector)
+    try:
+        text = render_metrics()
+    finally:
+        unregister_collector(collector)
+    assert "# TYPE neo4j_pool_connections_in_use gauge\nneo4j_pool_connections_in_use 1\n" in text
@@ -1,4 +1,5 @@
 # tests/conftest.py
+import sqlite3
 from typing import Generator
 
 import pytest
@@ -7,7 +8,10 @@ from neo4j import Session
 from devaccountbook_backend.core.config import settings
 from devaccountbook_backend.db.driver import init_driver
 from devaccountbook_backend.db.neo import get_neo4j_session
+from devaccountbook_backend.db.sqlite import connect_sqlite
 from devaccountbook_backend.repositories.account_entry_repo import AccountEntryRepository
+from devaccountbook_backend.repositories.account_entry_repo_base import AccountEntryRepositoryBase
+from devaccountbook_backend.repositories.sqlite_account_entry_repo import SqliteAccountEntryRepository
 
 
 @pytest.fixture(scope="session")
@@ -30,7 +34,7 @@ def neo4j_session() -> Generator[Session, None, None]:
             pass
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def _cleanup_db(neo4j_session: Session):
     """
     각 테스트 전/후로 DB 깨끗하게 비우기.
@@ -41,11 +45,29 @@ def _cleanup_db(neo4j_session: Session):
 
 
 @pytest.fixture
-def repo(neo4j_session: Session) -> AccountEntryRepository:
+def sqlite_connection(tmp_path) -> Generator[sqlite3.Connection, None, None]:
+    """
+    테스트마다 새 SQLite 파일 (외부 서비스 불필요).
+    """
+    conn = connect_sqlite(str(tmp_path / "devaccountbook.db"))
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@pytest.fixture(params=["neo4j", "sqlite"])
+def repo(request) -> AccountEntryRepositoryBase:
     """
-    실제 세션으로 Repo 구성 + 제약 조건 부트스트랩.
+    저장소 백엔드별 Repo 구성 + 제약 조건/스키마 부트스트랩.
+    - neo4j: 실제 세션 (테스트 전후 DB 비움)
+    - sqlite: 임시 파일
     """
-    r = AccountEntryRepository(neo4j_session)
+    if request.param == "neo4j":
+        request.getfixturevalue("_cleanup_db")
+        r = AccountEntryRepository(request.getfixturevalue("neo4j_session"))
+    else:
+        r = SqliteAccountEntryRepository(request.getfixturevalue("sqlite_connection"))
     r.bootstrap()
     return r
 
@@ -1,8 +1,17 @@
 # tests/test_account_entry_repository_integration.py
+import json
+import random
+
+import pytest
+
 from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeCreateDTO, AccountEntryNodePatchDTO, \
-    AccountEntryRelationPropsDTO, AccountEntryRelationCreateDTO, AccountEntryRelationDeleteDTO
+    AccountEntryRelationPropsDTO, AccountEntryRelationCreateDTO, AccountEntryRelationDeleteDTO, \
+    AccountEntryRelationOpDTO, AccountEntryNodeImportDTO
 from devaccountbook_backend.repositories.account_entry_repo import AccountEntryRepository
-from devaccountbook_backend.schemas.account_entry_schemas import RelKind
+from devaccountbook_backend.repositories.graph_index import AccountEntryGraphIndex, load_graph_index
+from devaccountbook_backend.repositories.sqlite_account_entry_repo import SqliteAccountEntryRepository, \
+    _REACH_FROM_ROOTS
+from devaccountbook_backend.schemas.account_entry_schemas import RelKind, RelationOp, TagMatch
 
 
 def test_bootstrap(repo: AccountEntryRepository):
@@ -31,6 +40,17 @@ def test_create_and_get_and_count(repo: AccountEntryRepository):
     assert cnt == 1
 
 
+def test_create_entries_batch(repo: AccountEntryRepository):
+    creates = [AccountEntryNodeCreateDTO(title=f"t{i}", desc=None, tags=[f"g{i}"]) for i in range(25)]
+    ids = repo.create_entries(creates, chunk_size=10)
+
+    assert len(ids) == 25 and len(set(ids)) == 25
+    assert repo.count_entries() == 25
+    # 입력 순서대로 id 반환
+    assert [repo.get_entry(i).title for i in ids] == [c.title for c in creates]
+    assert repo.create_entries([]) == []
+
+
 def test_get_entries_paging(repo: AccountEntryRepository):
     ids = [repo.create_entry(
         AccountEntryNodeCreateDTO(
@@ -49,6 +69,38 @@ def test_get_entries_paging(repo: AccountEntryRepository):
     assert set(ids) == returned_ids
 
 
+def test_get_entries_after_keyset(repo: AccountEntryRepository):
+    ids = [repo.create_entry(AccountEntryNodeCreateDTO(title=f"title-{i}", desc=None, tags=[])) for i in range(5)]
+
+    page1 = repo.get_entries_after(limit=2)
+    page2 = repo.get_entries_after(limit=2, after=page1.next_cursor)
+    page3 = repo.get_entries_after(limit=2, after=page2.next_cursor)
+    assert [len(p.items) for p in (page1, page2, page3)] == [2, 2, 1]
+    assert page3.next_cursor is None
+
+    returned = [r.id for p in (page1, page2, page3) for r in p.items]
+    assert len(set(returned)) == 5
+    assert set(returned) == set(ids)
+    # 오프셋 모드와 같은 순서
+    assert returned == [r.id for r in repo.get_entries(limit=5, offset=0)]
+    assert page1.total is None
+    assert repo.get_entries_after(limit=2, after=page2.next_cursor, with_total=True).total == 5
+
+
+def test_get_entries_counted(repo: AccountEntryRepository):
+    a, b, c = repo.create_entries([
+        AccountEntryNodeCreateDTO(title="A", tags=["x"]),
+        AccountEntryNodeCreateDTO(title="B", tags=["x"]),
+        AccountEntryNodeCreateDTO(title="C", tags=[]),
+    ])
+    page = repo.get_entries_counted(limit=1)
+    assert len(page.items) == 1 and page.total == 3
+    assert repo.get_entries_counted(limit=1, tags=["x"]).total == 2
+    repo.delete_entry(a)
+    assert repo.get_entries_counted(limit=10, tags=["x"]).total == 1
+    assert repo.count_entries() == 2
+
+
 def test_update_entry(repo: AccountEntryRepository):
     new_id = repo.create_entry(AccountEntryNodeCreateDTO(title="old", desc="old-desc", tags=["x"]))
     ok_none = repo.update_entry(new_id, AccountEntryNodePatchDTO.model_validate({}))  # 빈 props → False
@@ -77,6 +129,7 @@ def test_delete_entry(repo: AccountEntryRepository):
 
     assert repo.get_entry(new_id) is None
     assert repo.count_entries() == 0
+    assert repo.delete_entry(new_id) is False  # 이미 없는 id
 
 
 def test_relations_add_get_delete(repo: AccountEntryRepository):
@@ -126,6 +179,28 @@ def test_relations_add_get_delete(repo: AccountEntryRepository):
     assert rels2.outgoing[0].to_id == c
 
 
+def test_apply_relation_ops(repo: AccountEntryRepository):
+    a, b, c = repo.create_entries([AccountEntryNodeCreateDTO(title=t) for t in "ABC"])
+    relation_ops = [
+        AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=a, to_id=b, kind=RelKind.RELATES_TO),
+        AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=a, to_id=c, kind=RelKind.BLOCKS,
+                                  props=AccountEntryRelationPropsDTO(note="n")),
+        AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=a, to_id="missing", kind=RelKind.RELATES_TO),
+        AccountEntryRelationOpDTO(op=RelationOp.UNLINK, from_id=a, to_id=b, kind=RelKind.RELATES_TO),
+        AccountEntryRelationOpDTO(op=RelationOp.UNLINK, from_id=b, to_id=c, kind=RelKind.RELATES_TO),
+        AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=b, to_id=c, kind=RelKind.RELATES_TO),
+    ]
+
+    oks = repo.apply_relation_ops(relation_ops, chunk_size=1)
+    assert oks == [True, True, False, True, False, True]
+
+    out_a = repo.get_relations(a).outgoing
+    assert [(r.kind, r.to_id) for r in out_a] == [(RelKind.BLOCKS, c)]
+    assert out_a[0].props.note == "n"
+    assert out_a[0].props.createdAt is not None
+    assert [r.to_id for r in repo.get_relations(b).outgoing] == [c]
+
+
 def test_get_entry_tree_with_apoc(repo: AccountEntryRepository):
     # 그래프: A -> B, A -> C
     a = repo.create_entry(AccountEntryNodeCreateDTO(title="A", desc="abcd", tags=[]))
@@ -139,3 +214,303 @@ def test_get_entry_tree_with_apoc(repo: AccountEntryRepository):
     tree = repo.get_entry_tree(a)
     # normalize_to_children 가 어떤 형태로 변환하든 최소한 값은 존재해야 함
     assert tree is not None
+
+
+def test_get_entry_tree_diamond_and_isolated(repo: AccountEntryRepository):
+    # 저장소와 무관하게 toJsonTree 모양: 공유 후손 d는 b, c 아래 모두 펼침
+    a, b, c, d, e, x = repo.create_entries([AccountEntryNodeCreateDTO(title=t) for t in "ABCDEX"])
+    for f, t in [(a, b), (a, c), (b, d), (c, d), (d, e)]:
+        repo.add_relation(AccountEntryRelationCreateDTO(from_id=f, to_id=t, kind=RelKind.RELATES_TO))
+
+    tree = repo.get_entry_tree(a)
+    assert sorted(child.id for child in tree.children) == sorted([b, c])
+    for child in tree.children:
+        assert [(n.id, n.revisit) for n in child.children] == [(d, False)]
+        assert [n.id for n in child.children[0].children] == [e]
+
+    reverse = repo.get_entry_tree_reverse(e)
+    assert [n.id for n in reverse.children] == [d]
+    assert sorted(n.id for n in reverse.children[0].children) == sorted([b, c])
+    assert all([n.id for n in mid.children] == [a] for mid in reverse.children[0].children)
+
+    # 연결이 없거나 없는 id면 None
+    for get_tree in (repo.get_entry_tree, repo.get_entry_tree_reverse):
+        assert get_tree(x) is None
+        assert get_tree("missing") is None
+
+    # 스트리밍 골격도 같은 모양 (인접 리스트, 연결이 없으면 None)
+    plan = repo.get_entry_path_plan(a)
+    assert plan.paths and plan.node_count == 5
+    assert sorted(child for child, _ in plan.children[a]) == sorted([b, c])
+    assert repo.get_entry_path_plan(e, reverse=True).node_count == 5
+    assert repo.get_entry_path_plan(x) is None and repo.get_entry_path_plan("missing") is None
+
+
+def test_get_entry_forest(repo: AccountEntryRepository):
+    # 그래프: A -> B -> C, D (고립)
+    a = repo.create_entry(AccountEntryNodeCreateDTO(title="A", desc=None, tags=[]))
+    b = repo.create_entry(AccountEntryNodeCreateDTO(title="B", desc=None, tags=[]))
+    c = repo.create_entry(AccountEntryNodeCreateDTO(title="C", desc=None, tags=[]))
+    d = repo.create_entry(AccountEntryNodeCreateDTO(title="D", desc=None, tags=[]))
+    assert repo.add_relation(AccountEntryRelationCreateDTO(from_id=a, to_id=b, kind=RelKind.RELATES_TO)) is True
+    assert repo.add_relation(AccountEntryRelationCreateDTO(from_id=b, to_id=c, kind=RelKind.RELATES_TO)) is True
+    assert repo.add_relation(AccountEntryRelationCreateDTO(from_id=b, to_id="missing",
+                                                           kind=RelKind.RELATES_TO)) is False
+
+    # 항목마다 explore와 같음: 나가는 RELATES_TO가 없는 c, d는 None
+    forest = repo.get_entry_forest()
+    assert [t.id if t else None for t in forest] == [None, None, b, a]
+
+    roots = repo.get_entry_forest(roots_only=True)
+    assert [t.id if t else None for t in roots] == [None, a]
+    tree_a = roots[1]
+    assert tree_a.children[0].id == b
+    assert tree_a.children[0].children[0].id == c
+
+    leaves = repo.get_entry_forest_reverse(roots_only=True)
+    assert [t.id if t else None for t in leaves] == [None, c]
+    tree_c = leaves[1]
+    assert tree_c.children[0].id == b
+    assert tree_c.children[0].children[0].id == a
+
+    # 시작 노드는 최신순 → 페이지로 나눠도 이어 붙이면 전체와 같음
+    pages = repo.get_entry_forest(limit=3) + repo.get_entry_forest(limit=3, offset=3)
+    assert pages == forest
+    assert [t.id for t in repo.get_entry_forest(roots_only=True, limit=1, offset=1)] == [a]
+    reverse_page = repo.get_entry_forest_reverse(roots_only=True, limit=1, offset=1)
+    assert reverse_page == [tree_c]
+    assert repo.get_entry_forest(offset=10) == []
+
+
+def test_get_entry_forest_matches_explore(repo: AccountEntryRepository):
+    # 다이아몬드 A -> B -> D, A -> C -> D 와 고립 X: forest = 엔트리마다 explore를 호출한 결과
+    a, b, c, d, x = repo.create_entries([AccountEntryNodeCreateDTO(title=t) for t in "ABCDX"])
+    for f, t in [(a, b), (a, c), (b, d), (c, d)]:
+        repo.add_relation(AccountEntryRelationCreateDTO(from_id=f, to_id=t, kind=RelKind.RELATES_TO))
+    ids = [e.id for e in repo.get_entries(limit=10)]
+
+    assert repo.get_entry_forest() == [repo.get_entry_tree(i) for i in ids]
+    assert repo.get_entry_forest_reverse() == [repo.get_entry_tree_reverse(i) for i in ids]
+    tree_a = repo.get_entry_forest()[ids.index(a)]
+    assert all([n.id for n in mid.children] == [d] for mid in tree_a.children)
+
+
+def test_get_sheet(repo: AccountEntryRepository):
+    a = repo.create_entry(AccountEntryNodeCreateDTO(title="A", desc=None, tags=[]))
+    b = repo.create_entry(AccountEntryNodeCreateDTO(title="B", desc=None, tags=[]))
+    c = repo.create_entry(AccountEntryNodeCreateDTO(title="C", desc=None, tags=[]))
+    repo.add_relation(AccountEntryRelationCreateDTO(from_id=a, to_id=b, kind=RelKind.RELATES_TO))
+    repo.add_relation(AccountEntryRelationCreateDTO(from_id=a, to_id=c, kind=RelKind.BLOCKS))
+
+    items = repo.get_sheet(limit=50, offset=0)
+    assert {i.node.id for i in items} == {a, b, c}
+    item_a = next(i for i in items if i.node.id == a)
+    assert [(l.kind, l.node.id) for l in item_a.links] == [(RelKind.BLOCKS, c), (RelKind.RELATES_TO, b)]
+    assert all(not i.links for i in items if i.node.id != a)
+
+    assert len(repo.get_sheet(limit=2, offset=0)) == 2
+    assert len(repo.get_sheet(limit=2, offset=2)) == 1
+
+
+def test_get_entry_tree_bounded(repo: AccountEntryRepository):
+    # a -> b -> d, a -> c -> d, d -> a (사이클)
+    a, b, c, d = repo.create_entries([AccountEntryNodeCreateDTO(title=t) for t in "ABCD"])
+    for x, y in [(a, b), (a, c), (b, d), (c, d), (d, a)]:
+        repo.add_relation(AccountEntryRelationCreateDTO(from_id=x, to_id=y, kind=RelKind.RELATES_TO))
+
+    result = repo.get_entry_tree_bounded(a)
+    assert result.truncated is False
+    assert result.node_count == 4
+    assert {n.id for n in result.tree.children} == {b, c}
+    d_nodes = [n.children[0] for n in result.tree.children]
+    assert sorted(n.revisit for n in d_nodes) == [False, True]
+    expanded_d = next(n for n in d_nodes if not n.revisit)
+    assert expanded_d.children[0].id == a and expanded_d.children[0].cycle
+
+    shallow = repo.get_entry_tree_bounded(a, max_depth=1)
+    assert shallow.truncated is True
+    assert all(n.children == [] for n in shallow.tree.children)
+
+    capped = repo.get_entry_tree_bounded(a, max_nodes=2)
+    assert capped.truncated is True
+    assert capped.node_count == 2
+
+    reverse = repo.get_entry_tree_bounded(d, reverse=True, max_depth=1)
+    assert {n.id for n in reverse.tree.children} == {b, c}
+
+    assert repo.get_entry_tree_bounded("missing") is None
+
+
+def test_get_entry_tree_plan_matches_bounded(repo: AccountEntryRepository):
+    a, b, c, d = repo.create_entries([AccountEntryNodeCreateDTO(title=t) for t in "ABCD"])
+    for x, y in [(a, b), (a, c), (b, d), (c, d), (d, a)]:
+        repo.add_relation(AccountEntryRelationCreateDTO(from_id=x, to_id=y, kind=RelKind.RELATES_TO))
+
+    plan = repo.get_entry_tree_plan(a, max_depth=1)
+    bounded = repo.get_entry_tree_bounded(a, max_depth=1)
+    assert (plan.truncated, plan.node_count) == (bounded.truncated, bounded.node_count)
+    assert [child for child, _ in plan.children[a]] == [n.id for n in bounded.tree.children]
+
+    nodes = repo.get_tree_nodes([d, "missing", a])
+    assert [n and n["title"] for n in nodes] == ["D", None, "A"]
+    assert repo.get_entry_tree_plan("missing") is None
+
+
+def test_tag_filter_and_counts(repo: AccountEntryRepository):
+    a, b, c = repo.create_entries([
+        AccountEntryNodeCreateDTO(title="A", tags=["x", "y"]),
+        AccountEntryNodeCreateDTO(title="B", tags=["x"]),
+        AccountEntryNodeCreateDTO(title="C", tags=["z"]),
+    ])
+    ids = lambda entries: sorted(e.id for e in entries)
+    assert ids(repo.get_entries(tags=["x"])) == sorted([a, b])
+    assert ids(repo.get_entries(tags=["x", "z"])) == sorted([a, b, c])
+    assert ids(repo.get_entries(tags=["x", "y"], tag_match=TagMatch.ALL)) == [a]
+    assert ids(repo.get_entries_after(tags=["y", "z"]).items) == sorted([a, c])
+
+    repo.update_entry(b, AccountEntryNodePatchDTO(tags=["y"]))
+    repo.delete_entry(c)
+    counts = {t.name: t.count for t in repo.get_tag_counts()}
+    assert counts == {"x": 1, "y": 2}
+    assert repo.get_tag_counts(limit=1)[0].name == "y"
+
+
+def test_import_entries_skips_existing_ids(repo: AccountEntryRepository):
+    rows = [AccountEntryNodeImportDTO(id=f"import-{i}", title=f"T{i}", tags=["imp"]) for i in range(3)]
+    assert repo.import_entries(rows[:2], chunk_size=1) == 2
+    assert repo.import_entries(rows, chunk_size=1) == 1
+    assert repo.get_entry("import-2").title == "T2"
+    assert repo.count_entries() == 3
+    assert {t.name: t.count for t in repo.get_tag_counts()} == {"imp": 3}
+
+
+def test_export_rows(repo: AccountEntryRepository):
+    a, b = repo.create_entries([
+        AccountEntryNodeCreateDTO(title="A", tags=["x"]),
+        AccountEntryNodeCreateDTO(title="B"),
+    ])
+    repo.add_relation(AccountEntryRelationCreateDTO(from_id=a, to_id=b, kind=RelKind.RELATES_TO,
+                                                    props=AccountEntryRelationPropsDTO(note="n")))
+    rows = list(repo.export_rows())
+    assert [r["type"] for r in rows] == ["entry", "entry", "relation"]
+    assert {r["id"]: r["tags"] for r in rows[:2]} == {a: ["x"], b: []}
+    assert (rows[2]["fromId"], rows[2]["toId"], rows[2]["kind"]) == (a, b, "RELATES_TO")
+    assert rows[2]["props"]["note"] == "n"
+
+
+def test_search_entries(repo: AccountEntryRepository):
+    a, b, _ = repo.create_entries([
+        AccountEntryNodeCreateDTO(title="Coffee beans", desc="coffee budget"),
+        AccountEntryNodeCreateDTO(title="Books", tags=["coffee"]),
+        AccountEntryNodeCreateDTO(title="Rent"),
+    ])
+    hits = repo.search_entries(["coffee"])
+    assert hits[0].node.id == a
+    assert {h.node.id for h in hits} == {a, b}
+    assert hits[0].score >= hits[-1].score
+    assert [h.node.id for h in repo.search_entries(["boo"])] == [b]
+    assert repo.search_entries([]) == []
+
+
+def test_reachability(repo: AccountEntryRepository):
+    # a -> b -> c -> a (사이클), b -> d
+    a, b, c, d = repo.create_entries([AccountEntryNodeCreateDTO(title=t) for t in "ABCD"])
+    for x, y in [(a, b), (b, c), (c, a), (b, d)]:
+        repo.add_relation(AccountEntryRelationCreateDTO(from_id=x, to_id=y, kind=RelKind.RELATES_TO))
+
+    found = repo.get_reachable(a)
+    assert found.count == 3
+    assert found.ids == sorted([b, c, d])
+    assert repo.get_reachable(a, limit=1).ids == sorted([b, c, d])[:1]
+    assert set(repo.get_reachable(d, reverse=True).ids) == {a, b, c}
+    assert repo.is_reachable(c, d) and repo.is_reachable(a, a)
+    assert not repo.is_reachable(d, a)
+    assert repo.get_reachable("missing") is None
+
+    repo.delete_relation(AccountEntryRelationDeleteDTO(from_id=c, to_id=a, kind=RelKind.RELATES_TO))
+    assert set(repo.get_reachable(c, reverse=True).ids) == {a, b}
+    assert repo.get_reachable(c).count == 0
+
+    # 중간 노드 삭제 → 거쳐 가던 도달도 사라짐
+    repo.delete_entry(b)
+    assert repo.get_reachable(a).count == 0
+    assert not repo.is_reachable(a, d)
+    assert repo.get_entry_tree_bounded(a).node_count == 1
+
+
+def test_sqlite_reach_closure_matches_recompute(sqlite_connection):
+    # 간선/노드 삭제는 증분 갱신 → 임의 쓰기 후 폐쇄가 처음부터 다시 계산한 것과 같아야 함 (사이클 포함)
+    repo = SqliteAccountEntryRepository(sqlite_connection)
+    repo.bootstrap()
+    rng = random.Random(7)
+    ids = repo.create_entries([AccountEntryNodeCreateDTO(title=f"N{i}") for i in range(14)])
+
+    def closure() -> set:
+        return set(map(tuple, sqlite_connection.execute("SELECT ancestor, descendant FROM account_entry_reach")))
+
+    def recompute() -> set:
+        roots = [r[0] for r in sqlite_connection.execute("SELECT id FROM account_entry")]
+        return set(map(tuple, sqlite_connection.execute(_REACH_FROM_ROOTS, (json.dumps(roots),))))
+
+    for step in range(300):
+        x, y = rng.choice(ids), rng.choice(ids)
+        roll = rng.random()
+        if roll < 0.55:
+            # 앞쪽 → 뒤쪽 간선 위주 (DAG), 가끔 역방향으로 사이클
+            if ids.index(x) > ids.index(y) and rng.random() < 0.8:
+                x, y = y, x
+            repo.add_relation(AccountEntryRelationCreateDTO(from_id=x, to_id=y, kind=RelKind.RELATES_TO))
+        elif roll < 0.95:
+            repo.delete_relation(AccountEntryRelationDeleteDTO(from_id=x, to_id=y, kind=RelKind.RELATES_TO))
+        else:
+            repo.delete_entry(x)
+            ids.remove(x)
+            ids.append(repo.create_entry(AccountEntryNodeCreateDTO(title=f"R{step}")))
+        assert closure() == recompute(), step
+
+
+def test_graph_index_diamond_matches_neo4j(repo: AccountEntryRepository):
+    # 인덱스를 켜도 explore 결과가 같아야 함 (공유 후손 d, 역방향도)
+    if not isinstance(repo, AccountEntryRepository):
+        pytest.skip("Neo4j 전용 (메모리 인덱스는 Neo4j 세션에서 적재)")
+    a, b, c, d = repo.create_entries([AccountEntryNodeCreateDTO(title=t) for t in "ABCD"])
+    for x, y in [(a, b), (a, c), (b, d), (c, d)]:
+        repo.add_relation(AccountEntryRelationCreateDTO(from_id=x, to_id=y, kind=RelKind.RELATES_TO))
+    index = AccountEntryGraphIndex()
+    load_graph_index(repo.s, index)
+    indexed = AccountEntryRepository(repo.s, index)
+
+    assert indexed.get_entry_tree(a) == repo.get_entry_tree(a)
+    assert indexed.get_entry_tree_reverse(d) == repo.get_entry_tree_reverse(d)
+    for start, reverse in ((a, False), (d, True)):
+        assert indexed.get_entry_tree_bounded(start, reverse=reverse) == repo.get_entry_tree_bounded(start,
+                                                                                                     reverse=reverse)
+        assert indexed.get_entry_tree_plan(start, reverse=reverse) == repo.get_entry_tree_plan(start, reverse=reverse)
+
+
+def test_graph_index_write_through(repo: AccountEntryRepository):
+    if not isinstance(repo, AccountEntryRepository):
+        pytest.skip("Neo4j 전용 (메모리 인덱스는 Neo4j 세션에서 적재)")
+    a = repo.create_entry(AccountEntryNodeCreateDTO(title="A", desc=None, tags=[]))
+    index = AccountEntryGraphIndex()
+    load_graph_index(repo.s, index)
+    indexed = AccountEntryRepository(repo.s, index)
+
+    b, c = indexed.create_entries([AccountEntryNodeCreateDTO(title="B"), AccountEntryNodeCreateDTO(title="C")])
+    indexed.add_relation(AccountEntryRelationCreateDTO(from_id=a, to_id=b, kind=RelKind.RELATES_TO,
+                                                       props=AccountEntryRelationPropsDTO(note="n")))
+    indexed.apply_relation_ops([
+        AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=b, to_id=c, kind=RelKind.RELATES_TO),
+    ])
+    indexed.update_entry(c, AccountEntryNodePatchDTO(title="C2"))
+
+    # 메모리 결과와 Neo4j 결과가 같아야 함
+    assert indexed.get_relations(a) == repo.get_relations(a)
+    tree = indexed.get_entry_tree(a)
+    assert tree.children[0].id == b
+    assert tree.children[0].children[0].title == "C2"
+
+    indexed.delete_relation(AccountEntryRelationDeleteDTO(from_id=a, to_id=b, kind=RelKind.RELATES_TO))
+    indexed.delete_entry(c)
+    assert indexed.get_relations(b) == repo.get_relations(b)
+    assert indexed.get_entry_tree(a) is None
@@ -0,0 +1,150 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from devaccountbook_backend.db.sqlite import connect_sqlite
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeImportDTO, AccountEntryRelationOpDTO
+from devaccountbook_backend.repositories.graph_index import AccountEntryGraphIndex
+from devaccountbook_backend.repositories.sqlite_account_entry_repo import SqliteAccountEntryRepository
+from devaccountbook_backend.schemas.common_enum import RelKind, RelationOp
+
+
+@pytest.fixture
+def index() -> AccountEntryGraphIndex:
+    # a -> b -> c, a -(BLOCKS)-> c
+    idx = AccountEntryGraphIndex()
+    idx.load(
+        [{"id": i, "title": i.upper(), "desc": None, "tags": None} for i in "abc"],
+        [("RELATES_TO", "a", "b", {}), ("RELATES_TO", "b", "c", {"note": "n"}), ("BLOCKS", "a", "c", {})],
+    )
+    return idx
+
+
+def test_load_and_relations(index):
+    assert len(index) == 3
+    rels = index.get_relations("a")
+    assert [(r.kind, r.to_id) for r in rels.outgoing] == [(RelKind.BLOCKS, "c"), (RelKind.RELATES_TO, "b")]
+    assert rels.incoming == []
+    assert index.get_relations("c").incoming[1].props.note == "n"
+
+
+def test_tree_and_reverse(index):
+    tree = index.get_tree("a").tree
+    assert tree.children[0].id == "b"
+    assert tree.children[0].children[0].id == "c"
+
+    reverse = index.get_tree("c", reverse=True).tree
+    assert reverse.children[0].id == "b"
+    assert reverse.children[0].children[0].id == "a"
+
+    assert index.get_tree("missing") is None
+
+
+def test_diamond_tree_matches_storage_bounded(tmp_path):
+    # a -> {b, c} -> d: 인덱스 트리는 저장소 bounded 탐색과 같은 모양 (d는 두 번째 위치에서 revisit)
+    edges = [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")]
+    idx = AccountEntryGraphIndex()
+    idx.load([{"id": i, "title": i.upper(), "desc": None, "tags": []} for i in "abcd"],
+             [("RELATES_TO", x, y, {}) for x, y in edges])
+    repo = SqliteAccountEntryRepository(connect_sqlite(str(tmp_path / "diamond.db")))
+    repo.bootstrap()
+    repo.import_entries([AccountEntryNodeImportDTO(id=i, title=i.upper()) for i in "abcd"])
+    repo.apply_relation_ops([AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=x, to_id=y,
+                                                       kind=RelKind.RELATES_TO) for x, y in edges])
+
+    for start, reverse in (("a", False), ("d", True)):
+        assert idx.get_tree(start, reverse=reverse) == repo.get_entry_tree_bounded(start, reverse=reverse)
+        assert idx.get_tree_plan(start, reverse=reverse) == repo.get_entry_tree_plan(start, reverse=reverse)
+    tree = idx.get_tree("a").tree
+    assert [(n.id, n.revisit) for n in tree.children[1].children] == [("d", True)]
+    repo.c.close()
+
+
+def test_diamond_path_tree_matches_storage(tmp_path):
+    # a -> {b, c} -> d -> a: 깊이 제한 없는 explore는 저장소 get_entry_tree와 같은 모양 (d는 b, c 아래 모두 펼침)
+    edges = [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "a")]
+    idx = AccountEntryGraphIndex()
+    idx.load([{"id": i, "title": i.upper(), "desc": None, "tags": []} for i in "abcdx"],
+             [("RELATES_TO", x, y, {}) for x, y in edges])
+    repo = SqliteAccountEntryRepository(connect_sqlite(str(tmp_path / "diamond.db")))
+    repo.bootstrap()
+    repo.import_entries([AccountEntryNodeImportDTO(id=i, title=i.upper()) for i in "abcdx"])
+    repo.apply_relation_ops([AccountEntryRelationOpDTO(op=RelationOp.LINK, from_id=x, to_id=y,
+                                                       kind=RelKind.RELATES_TO) for x, y in edges])
+
+    assert idx.get_path_tree("a") == repo.get_entry_tree("a")
+    assert idx.get_path_tree("d", reverse=True) == repo.get_entry_tree_reverse("d")
+    for start, reverse in (("a", False), ("d", True), ("x", False), ("missing", False)):
+        assert idx.get_path_plan(start, reverse=reverse) == repo.get_entry_path_plan(start, reverse=reverse)
+    tree = idx.get_path_tree("a")
+    assert [[(n.id, n.cycle) for n in b.children[0].children] for b in tree.children] == [[("a", True)]] * 2
+    assert idx.get_path_tree("x") is None
+    assert idx.get_path_tree("missing") is None
+    repo.c.close()
+
+
+def test_tree_bounds(index):
+    result = index.get_tree("a", max_depth=1)
+    assert result.truncated is True
+    assert result.tree.children[0].children == []
+
+    result = index.get_tree("a", max_nodes=1)
+    assert result.truncated is True
+    assert result.node_count == 1
+
+
+def test_writes_are_reflected(index):
+    index.upsert_entry("d", title="D", desc="dd", tags=["x"])
+    index.add_relation(RelKind.RELATES_TO, "c", "d", {"createdAt": datetime(2025, 1, 1, tzinfo=timezone.utc)})
+    assert index.get_tree("a").tree.children[0].children[0].children[0].id == "d"
+
+    index.upsert_entry("d", title="D2")
+    assert index.get_tree("d").tree.title == "D2"
+    assert index.get_tree("d").tree.tags == ["x"]
+
+    index.remove_relation(RelKind.RELATES_TO, "b", "c")
+    assert index.get_tree("a").tree.children[0].children == []
+
+    index.remove_entry("a")
+    assert index.get_relations("c").incoming == []
+    assert index.get_tree("b").tree.children == []
+
+    # 빈 슬롯 재사용
+    index.upsert_entry("e", title="E")
+    index.add_relation(RelKind.RELATES_TO, "e", "b")
+    assert index.get_relations("b").incoming[0].from_id == "e"
+
+
+def test_cycle_and_self_loop(index):
+    index.add_relation(RelKind.RELATES_TO, "c", "a")
+    index.add_relation(RelKind.RELATES_TO, "c", "c")
+    c = index.get_tree("a").tree.children[0].children[0]
+    assert {(n.id, n.cycle) for n in c.children} == {("a", True), ("c", True)}
+
+    index.remove_entry("c")
+    assert index.get_tree("a").tree.children[0].children == []
+
+
+@pytest.mark.parametrize("reach", [True, False])
+def test_reachability(reach):
+    # a -> b -> c -> a (사이클), c -> d
+    idx = AccountEntryGraphIndex(reach)
+    idx.load(
+        [{"id": i, "title": i.upper()} for i in "abcd"],
+        [("RELATES_TO", "a", "b", {}), ("RELATES_TO", "b", "c", {}), ("RELATES_TO", "c", "a", {}),
+         ("RELATES_TO", "c", "d", {}), ("BLOCKS", "d", "a", {})],
+    )
+    found = idx.get_reachable("a")
+    assert (found.count, found.ids) == (3, ["b", "c", "d"])
+    assert idx.get_reachable("d", reverse=True, limit=2).ids == ["a", "b"]
+    assert idx.reaches("b", "d") and not idx.reaches("d", "a")
+    assert idx.get_reachable("missing") is None
+
+    idx.remove_relation(RelKind.RELATES_TO, "b", "c")
+    assert idx.get_reachable("a").ids == ["b"]
+    assert idx.get_reachable("d", reverse=True).ids == ["c"]
+
+    idx.add_relation(RelKind.RELATES_TO, "b", "c")
+    idx.remove_entry("c")
+    assert idx.get_reachable("a").ids == ["b"]
+    assert not idx.reaches("a", "d")
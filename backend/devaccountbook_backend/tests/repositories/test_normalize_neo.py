@@ -0,0 +1,34 @@
+from datetime import date, datetime, timedelta
+
+from neo4j.time import Date, DateTime, Duration
+
+from devaccountbook_backend.repositories import account_entry_cypher as cypher
+from devaccountbook_backend.repositories.normalize_neo import normalize_neo, normalize_neo_rows
+
+
+def test_converts_temporal_values_in_nested_props():
+    props = {"note": "n", "createdAt": DateTime(2025, 1, 2, 3, 4, 5), "due": Date(2025, 2, 1),
+             "history": [Duration(days=1), Duration(months=1), {"at": DateTime(2025, 1, 1)}], "weight": 1.5}
+    out = normalize_neo(props)
+    assert out == {"note": "n", "createdAt": datetime(2025, 1, 2, 3, 4, 5), "due": date(2025, 2, 1),
+                   "history": [timedelta(days=1), "P1M", {"at": datetime(2025, 1, 1)}], "weight": 1.5}
+    # 입력은 그대로
+    assert isinstance(props["createdAt"], DateTime) and isinstance(props["history"][0], Duration)
+
+
+def test_native_values_are_returned_without_copy():
+    props = {"note": "n", "tags": ["a", "b"], "nested": {"k": 1}, "flag": True, "none": None}
+    assert normalize_neo(props) is props
+    assert normalize_neo("x") == "x"
+
+
+def test_rows_batch_and_relations():
+    rows = [{"kind": "RELATES_TO", "from_id": "a", "to_id": "b", "props": {"createdAt": DateTime(2025, 1, 1)}},
+            {"kind": "RELATES_TO", "from_id": "a", "to_id": "c", "props": None}]
+    assert normalize_neo_rows(rows) == [{"createdAt": datetime(2025, 1, 1)}, {}]
+
+    relations = cypher.to_relations(rows, rows[1:])
+    assert [r.to_id for r in relations.outgoing] == ["b", "c"]
+    assert relations.outgoing[0].props.createdAt == datetime(2025, 1, 1)
+    assert relations.incoming[0].props.model_dump(exclude_none=True) == {}
+    assert cypher.to_export_relation(rows[0])["props"] == {"createdAt": datetime(2025, 1, 1)}
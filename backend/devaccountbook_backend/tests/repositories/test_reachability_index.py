@@ -0,0 +1,75 @@
+import random
+from collections import deque
+
+from devaccountbook_backend.repositories.reachability_index import ReachabilityIndex
+
+
+def _bfs(edges: set[tuple[int, int]], start: int) -> set[int]:
+    out: dict[int, list[int]] = {}
+    for a, b in edges:
+        out.setdefault(a, []).append(b)
+    seen, queue = set(), deque(out.get(start, ()))
+    while queue:
+        n = queue.popleft()
+        if n not in seen:
+            seen.add(n)
+            queue.extend(out.get(n, ()))
+    return seen - {start}
+
+
+def test_add_and_remove_edges():
+    # 0 -> 1 -> 2, 0 -> 2
+    index = ReachabilityIndex()
+    index.load([(0, 1), (1, 2), (0, 2)])
+    assert index.descendants(0) == {1, 2}
+    assert index.ancestors(2) == {0, 1}
+    assert index.reaches(1, 2) and not index.reaches(2, 1)
+    assert index.reaches(2, 2)
+
+    # 다른 경로(0 -> 2)가 남아 있으면 도달 유지
+    index.remove_edge(1, 2)
+    assert index.descendants(0) == {1, 2}
+    assert index.ancestors(2) == {0}
+
+    index.add_edge(2, 3)
+    assert index.ancestors(3) == {0, 2}
+    assert index.pair_count() == 4
+
+
+def test_cycle_and_remove_node():
+    # 0 -> 1 -> 2 -> 0, 2 -> 3
+    index = ReachabilityIndex()
+    for a, b in [(0, 1), (1, 2), (2, 0), (2, 3)]:
+        index.add_edge(a, b)
+    assert index.descendants(1) == {0, 2, 3}
+    assert index.ancestors(3) == {0, 1, 2}
+
+    index.remove_node(2)
+    assert index.descendants(0) == {1}
+    assert index.ancestors(3) == set()
+    assert not index.reaches(1, 0)
+
+
+def test_matches_bfs_under_random_writes():
+    rng = random.Random(7)
+    index = ReachabilityIndex()
+    edges: set[tuple[int, int]] = set()
+    nodes = set(range(12))
+    for _ in range(400):
+        roll = rng.random()
+        if roll < 0.55:
+            a, b = rng.sample(sorted(nodes), 2)
+            edges.add((a, b))
+            index.add_edge(a, b)
+        elif roll < 0.95 and edges:
+            a, b = rng.choice(sorted(edges))
+            edges.discard((a, b))
+            index.remove_edge(a, b)
+        else:
+            x = rng.choice(sorted(nodes))
+            edges = {(a, b) for a, b in edges if x not in (a, b)}
+            index.remove_node(x)
+        for n in nodes:
+            expected = _bfs(edges, n)
+            assert index.descendants(n) == expected
+            assert all(n in index.ancestors(d) for d in expected)
@@ -0,0 +1,171 @@
+import asyncio
+
+from devaccountbook_backend.api.responses import FastJSONResponse, encode_tree
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryTreeNodeDTO, convert_account_entry_tree_node, \
+    make_account_entry_tree_node
+from devaccountbook_backend.repositories.tree_builder import build_account_entry_tree, plan_account_entry_tree, \
+    walk_account_entry_tree, build_account_entry_path_tree, build_account_entry_forest, plan_account_entry_path_tree
+from devaccountbook_backend.utils.tree_json_util import tree_json_chunks, tree_json_chunks_async
+
+
+def _nodes(*ids):
+    return {i: {"id": i, "title": i.upper(), "desc": None, "tags": []} for i in ids}
+
+
+def test_chain():
+    result = build_account_entry_tree("a", _nodes("a", "b", "c"), [("a", "b"), ("b", "c")])
+
+    assert result.truncated is False
+    assert result.node_count == 3
+    assert result.tree.children[0].id == "b"
+    assert result.tree.children[0].children[0].title == "C"
+
+
+def test_diamond_marks_revisit():
+    # a -> b -> d, a -> c -> d
+    result = build_account_entry_tree("a", _nodes("a", "b", "c", "d"),
+                                      [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")])
+
+    b, c = result.tree.children
+    assert b.children[0].id == "d" and not b.children[0].revisit
+    assert c.children[0].id == "d" and c.children[0].revisit
+    assert c.children[0].children == []
+    assert result.node_count == 4
+
+
+def test_cycle_marked():
+    # a -> b -> a
+    result = build_account_entry_tree("a", _nodes("a", "b"), [("a", "b"), ("b", "a")])
+
+    back = result.tree.children[0].children[0]
+    assert back.id == "a"
+    assert back.cycle is True and back.revisit is False
+
+
+def test_path_tree_expands_shared_descendants():
+    # toJsonTree 모양: d는 b, c 아래 모두 펼치고, d -> a 는 경로상의 조상이라 cycle
+    tree = build_account_entry_path_tree("a", _nodes("a", "b", "c", "d", "e"),
+                                         [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "a"), ("d", "e")])
+
+    for mid in tree.children:
+        d = mid.children[0]
+        assert d.id == "d" and not d.revisit
+        assert [(n.id, n.cycle) for n in d.children] == [("a", True), ("e", False)]
+        assert d.children[0].children == []
+
+
+def test_path_tree_isolated_root():
+    tree = build_account_entry_path_tree("a", _nodes("a"), [])
+
+    assert tree.id == "a" and tree.children == []
+
+def test_forest_same_as_path_tree_per_root():
+    edges = [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")]
+    forest = build_account_entry_forest(["a", "d", "b"], _nodes("a", "b", "c", "d"), edges)
+
+    assert forest[0] == build_account_entry_path_tree("a", _nodes("a", "b", "c", "d"), edges)
+    assert forest[1] is None
+    assert [n.id for n in forest[2].children] == ["d"]
+
+
+def test_path_plan_walk_matches_path_tree():
+    # 스트리밍 골격(paths=True)을 걸으며 쓴 JSON = 기본 explore 트리 JSON (공유 후손 펼침, 되돌아가는 간선은 cycle)
+    nodes = _nodes("a", "b", "c", "d")
+    edges = [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "a"), ("d", "d")]
+    plan = plan_account_entry_path_tree("a", edges)
+    walk = list(walk_account_entry_tree(plan))
+    body = b"".join(tree_json_chunks(walk, iter([nodes[i[0]] for i in walk if i is not None])))
+
+    assert body == FastJSONResponse(build_account_entry_path_tree("a", nodes, edges)).body
+    assert plan.node_count == 4
+
+
+def test_tree_json_chunks_async_matches_sync():
+    # 동기/비동기는 노드 속성을 읽는 방식만 다름 → 같은 chunk 경계, 같은 본문
+    nodes = _nodes("a", "b", "c", "d")
+    edges = [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")]
+    walk = list(walk_account_entry_tree(plan_account_entry_path_tree("a", edges)))
+    props = [nodes[i[0]] for i in walk if i is not None]
+
+    async def aprops():
+        for p in props:
+            yield p
+
+    async def run():
+        return [chunk async for chunk in tree_json_chunks_async(walk, aprops(), chunk_bytes=64)]
+
+    chunks = list(tree_json_chunks(walk, iter(props), chunk_bytes=64))
+    assert len(chunks) > 1
+    assert asyncio.run(run()) == chunks
+
+
+def test_edge_outside_set_truncates():
+    result = build_account_entry_tree("a", _nodes("a", "b"), [("a", "b"), ("b", "c")])
+
+    assert result.truncated is True
+    assert result.tree.children[0].children == []
+
+
+def test_shortest_depth_expansion():
+    # a -> b -> c, a -> c : c는 깊이 1에서 펼쳐지고 b 아래에서는 revisit
+    result = build_account_entry_tree("a", _nodes("a", "b", "c", "d"),
+                                      [("a", "b"), ("a", "c"), ("b", "c"), ("c", "d")])
+
+    b, c = result.tree.children
+    assert c.id == "c" and c.children[0].id == "d"
+    assert b.children[0].revisit is True
+
+
+def test_plan_walk_depth_first():
+    # a -> b -> d, a -> c -> d, d -> a
+    plan = plan_account_entry_tree("a", {"a", "b", "c", "d"},
+                                   [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "a")])
+
+    assert list(walk_account_entry_tree(plan)) == [
+        ("a", None), ("b", None), ("d", None), ("a", "cycle"), None, None, None,
+        ("c", None), ("d", "revisit"), None, None, None,
+    ]
+    assert plan.node_count == 4 and plan.truncated is False
+
+
+def test_tree_node_same_as_validated():
+    node = make_account_entry_tree_node("a", {"title": "A", "tags": ("t",)}, revisit=True)
+    expected = AccountEntryTreeNodeDTO(id="a", title="A", tags=["t"], revisit=True)
+
+    assert node == expected
+    assert node.model_dump() == expected.model_dump()
+    node.children.append(make_account_entry_tree_node("b", {"title": "B"}))
+    assert node.children[0].id == "b" and expected.children == []
+
+
+def test_json_tree_converted_in_order():
+    tree = convert_account_entry_tree_node({"id": "a", "title": "A", "relates_to": [
+        {"id": "b", "title": "B", "tags": ["t"], "relates_to": [{"id": "d", "title": "D"}]},
+        {"id": "c", "title": "C", "desc": "x"},
+    ]})
+
+    assert [c.id for c in tree.children] == ["b", "c"]
+    assert tree.children[0].children[0].id == "d"
+    assert tree.children[0].tags == ["t"] and tree.children[1].desc == "x"
+
+
+def test_deep_chain_without_recursion():
+    root = data = {"id": "0", "title": "T"}
+    for i in range(1, 20000):
+        data["relates_to"] = [{"id": str(i), "title": "T"}]
+        data = data["relates_to"][0]
+
+    body = encode_tree(convert_account_entry_tree_node(root))
+
+    assert body.count(b'"children":[') == 20000
+    assert body.endswith(b'"children":[],"cycle":false,"revisit":false}' + b'],"cycle":false,"revisit":false}' * 19999)
+
+
+def test_encode_tree_matches_default_response():
+    result = build_account_entry_tree("a", _nodes("a", "b", "c", "d"),
+                                      [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "a")])
+    forest = [result.tree, None, build_account_entry_tree("c", _nodes("c", "d"), [("c", "d")]).tree, None]
+
+    assert encode_tree(result.tree) == FastJSONResponse(result.tree).body
+    assert encode_tree(forest) == FastJSONResponse(forest).body
+    assert encode_tree([]) == b"[]" and encode_tree(None) == b"null"
@@ -1,15 +1,24 @@
 from unittest.mock import MagicMock
 
 import pytest
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from devaccountbook_backend.api.responses import FastJSONResponse
 
 from devaccountbook_backend.dtos.account_entry_dto import (
     AccountEntryNodeCreateDTO, AccountEntryNodePatchDTO,
-    AccountEntryRelationCreateDTO, AccountEntryRelationDeleteDTO
+    AccountEntryRelationCreateDTO, AccountEntryRelationDeleteDTO,
+    AccountEntrySheetItemDTO, AccountEntrySheetLinkDTO, AccountEntryCursorDTO, AccountEntryPageDTO,
+    AccountEntryRelationsDTO
 )
 from devaccountbook_backend.models.account_entry_domain import AccountEntryNode
 from devaccountbook_backend.schemas.account_entry_schemas import (
-    AccountEntryCreate, AccountEntryPatch, AccountEntryOut, RelationCreate, RelKind, RelationList
+    AccountEntryCreate, AccountEntryPatch, AccountEntryOut, RelationCreate, RelKind, RelationList, SheetRowKind,
+    RelationBatchItem, RelationOp, TagMatch, ImportFormat
 )
+from devaccountbook_backend.services import account_entry_mapper as mapper
+from devaccountbook_backend.services.account_entry_import import AccountEntryImport, import_entry_id
 from devaccountbook_backend.services.account_entry_service import AccountEntryService
 
 
@@ -25,6 +34,11 @@ def service(mock_repo):
     return AccountEntryService(mock_repo)
 
 
+def test_init_does_not_run_ddl(service, mock_repo):
+    # 스키마는 시작 시 migration에서만 적용
+    mock_repo.bootstrap.assert_not_called()
+
+
 def test_list_returns_account_entry_out(service, mock_repo):
     from datetime import datetime
     from datetime import timezone
@@ -37,7 +51,50 @@ def test_list_returns_account_entry_out(service, mock_repo):
 
     assert isinstance(result[0], AccountEntryOut)
     assert result[0].id == "1"
-    mock_repo.get_entries.assert_called_once_with(limit=10, offset=0)
+    mock_repo.get_entries.assert_called_once_with(limit=10, offset=0, tags=(), tag_match=TagMatch.ANY)
+
+
+def test_list_after_cursor_round_trip(service, mock_repo):
+    from datetime import datetime
+    from datetime import timezone
+    node = AccountEntryNode.model_validate({"id": "1", "title": "Entry 1", "createdAt": datetime.now(timezone.utc)})
+    cursor = AccountEntryCursorDTO(created_at="2025-01-01T00:00:00.123456789Z", id="1")
+    mock_repo.get_entries_after.return_value = AccountEntryPageDTO(items=[node], next_cursor=cursor)
+
+    first = service.list_after(limit=1, after="")
+    assert [x.id for x in first.items] == ["1"]
+    mock_repo.get_entries_after.assert_called_with(limit=1, after=None, tags=(), tag_match=TagMatch.ANY,
+                                                with_total=False)
+
+    service.list_after(limit=1, after=first.next_cursor)
+    mock_repo.get_entries_after.assert_called_with(limit=1, after=cursor, tags=(), tag_match=TagMatch.ANY,
+                                                with_total=False)
+
+
+def test_list_after_invalid_cursor(service, mock_repo):
+    with pytest.raises(ValueError):
+        service.list_after(limit=1, after="not-a-cursor")
+    mock_repo.get_entries_after.assert_not_called()
+
+
+def test_sheet_flattens_rows(service, mock_repo):
+    from datetime import datetime
+    from datetime import timezone
+    now = datetime.now(timezone.utc)
+    a = AccountEntryNode.model_validate({"id": "a", "title": "A", "createdAt": now})
+    b = AccountEntryNode.model_validate({"id": "b", "title": "B", "createdAt": now})
+    mock_repo.get_sheet.return_value = [
+        AccountEntrySheetItemDTO(node=a, links=[AccountEntrySheetLinkDTO(kind=RelKind.BLOCKS, node=b)]),
+        AccountEntrySheetItemDTO(node=b),
+    ]
+
+    rows = service.sheet(limit=10, offset=0)
+
+    assert [r.row_kind for r in rows] == [SheetRowKind.NODE, SheetRowKind.LINKED, SheetRowKind.NODE]
+    assert rows[1].node.id == "a"
+    assert rows[1].connected.id == "b"
+    assert rows[1].kind == RelKind.BLOCKS
+    mock_repo.get_sheet.assert_called_once_with(limit=10, offset=0)
 
 
 def test_count(service, mock_repo):
@@ -59,10 +116,20 @@ def test_create(service, mock_repo):
     assert isinstance(args[0], AccountEntryNodeCreateDTO)
 
 
+def test_create_many(service, mock_repo):
+    mock_repo.create_entries.return_value = ["a", "b"]
+
+    result = service.create_many([AccountEntryCreate(title="A"), AccountEntryCreate(title="B", tags=["t"])])
+
+    assert result == ["a", "b"]
+    args, kwargs = mock_repo.create_entries.call_args
+    assert [d.title for d in args[0]] == ["A", "B"]
+    assert all(isinstance(d, AccountEntryNodeCreateDTO) for d in args[0])
+    assert kwargs["chunk_size"] > 0
+
+
 def test_get(service, mock_repo):
-    mock_repo.get_entry.return_value.model_dump.return_value = {
-        "id": "1", "title": "test", "desc": None
-    }
+    mock_repo.get_entry.return_value = AccountEntryNode(id="1", title="test", createdAt="2025-01-01T00:00:00Z")
 
     result = service.get("1")
 
@@ -118,6 +185,22 @@ def test_list_links(service, mock_repo):
     mock_repo.get_relations.assert_called_once_with("1")
 
 
+def test_batch_links(service, mock_repo):
+    mock_repo.apply_relation_ops.return_value = [True, False]
+    items = [
+        RelationBatchItem(op=RelationOp.LINK, from_id="1", to_id="2", kind=RelKind.RELATES_TO, props={"note": "n"}),
+        RelationBatchItem(op=RelationOp.UNLINK, from_id="1", to_id="3", kind=RelKind.BLOCKS),
+    ]
+
+    result = service.batch_links(items)
+
+    assert [r.ok for r in result.results] == [True, False]
+    assert result.results[1].to_id == "3"
+    args, _ = mock_repo.apply_relation_ops.call_args
+    assert [o.op for o in args[0]] == [RelationOp.LINK, RelationOp.UNLINK]
+    assert args[0][0].props.note == "n"
+
+
 def test_unlink(service, mock_repo):
     mock_repo.delete_relation.return_value = 1
 
@@ -127,3 +210,108 @@ def test_unlink(service, mock_repo):
     mock_repo.delete_relation.assert_called_once()
     args, _ = mock_repo.delete_relation.call_args
     assert isinstance(args[0], AccountEntryRelationDeleteDTO)
+
+
+def test_get_forest(service, mock_repo):
+    mock_repo.get_entry_forest.return_value = []
+
+    assert service.get_forest(roots_only=True, limit=50) == []
+    mock_repo.get_entry_forest.assert_called_once_with(roots_only=True, limit=50, offset=0)
+
+
+def test_get_forest_reverse(service, mock_repo):
+    mock_repo.get_entry_forest_reverse.return_value = []
+
+    assert service.get_forest_reverse() == []
+    mock_repo.get_entry_forest_reverse.assert_called_once_with(roots_only=False, limit=None, offset=0)
+
+
+def test_explore_bounded_defaults_node_cap(service, mock_repo):
+    from devaccountbook_backend.core.config import settings
+    service.explore_bounded("1", reverse=True, max_depth=2)
+
+    mock_repo.get_entry_tree_bounded.assert_called_once_with(
+        "1", reverse=True, max_depth=2, max_nodes=settings.tree_max_nodes)
+
+
+def test_descendants_and_reaches(service, mock_repo):
+    from devaccountbook_backend.dtos.account_entry_dto import AccountEntryReachDTO
+    mock_repo.get_reachable.return_value = AccountEntryReachDTO(entry_id="1", count=3, ids=["2", "3"])
+    mock_repo.is_reachable.return_value = True
+
+    reach = service.descendants("1", limit=2)
+    assert (reach.entry_id, reach.count, reach.ids) == ("1", 3, ["2", "3"])
+    mock_repo.get_reachable.assert_called_once_with("1", reverse=False, limit=2)
+    assert service.reaches("1", "3").reachable is True
+
+    mock_repo.get_reachable.return_value = None
+    assert service.ancestors("missing") is None
+
+
+def test_search_terms_and_highlights(service, mock_repo):
+    from datetime import datetime, timezone
+    from devaccountbook_backend.dtos.account_entry_dto import AccountEntrySearchHitDTO
+    node = AccountEntryNode(id="1", title="Coffee beans", desc="coffee shop", tags=["cafe", "food"],
+                            createdAt=datetime.now(timezone.utc))
+    mock_repo.search_entries.return_value = [AccountEntrySearchHitDTO(node=node, score=1.5)]
+
+    hits = service.search("Coff* caf (coffee)", limit=5)
+    mock_repo.search_entries.assert_called_once_with(["coff", "caf", "coffee"], limit=5, offset=0)
+    assert hits[0].id == "1" and hits[0].score == 1.5
+    spans = [(h.field, h.index, h.start, h.end) for h in hits[0].highlights]
+    assert spans == [("title", None, 0, 6), ("desc", None, 0, 6), ("tags", 0, 0, 3)]
+
+
+def test_search_without_terms_skips_query(service, mock_repo):
+    mock_repo.search_entries.return_value = []
+    assert service.search("!!!") == []
+    mock_repo.search_entries.assert_called_once_with([], limit=20, offset=0)
+
+
+def test_import_chunk_maps_ids_and_collects_errors(service, mock_repo):
+    mock_repo.import_entries.return_value = 1
+    mock_repo.apply_relation_ops.return_value = [True]
+    job = AccountEntryImport("job-1", chunk_size=3, line_offset=10)
+    lines = [
+        b'{"type":"entry","id":"a","title":"A","tags":["t"]}',
+        b'',
+        b'{"type":"entry","title":""}',
+        b'{"type":"entry","id":"b"}',
+        b'not json',
+        b'{"type":"relation","fromId":"a","toId":"b","kind":"RELATES_TO","props":{"note":"n"}}',
+    ]
+    assert [job.feed(line) for line in lines] == [False, False, False, False, False, True]
+    service.import_chunk(job)
+
+    entries = mock_repo.import_entries.call_args.args[0]
+    assert [e.id for e in entries] == [import_entry_id("job-1", "a"), import_entry_id("job-1", "line:13")]
+    op = mock_repo.apply_relation_ops.call_args.args[0][0]
+    assert (op.from_id, op.to_id, op.props.note) == (entries[0].id, import_entry_id("job-1", "b"), "n")
+
+    result = job.result()
+    assert (result.entries_created, result.entries_existing, result.relations_linked) == (1, 1, 1)
+    assert result.error_count == 2
+    assert [(e.line, e.message.split(":")[0]) for e in result.errors] == [(14, "title"), (15, "Expecting value")]
+    # 같은 job이면 같은 id (재전송 시 멱등), job이 다르면 다른 id
+    assert import_entry_id("job-1", "a") == entries[0].id != import_entry_id("job-2", "a")
+
+
+def test_import_csv_rows():
+    job = AccountEntryImport("job-1", ImportFormat.CSV)
+    for line in [b"type,id,title,tags,fromId,toId,kind,note", b'entry,a,"A, first",x|y,,,,',
+                 b"relation,,,,a,b,BLOCKS,why"]:
+        job.feed(line)
+    (entry,), (op,) = job.take()
+    assert (entry.title, entry.tags) == ("A, first", ["x", "y"])
+    assert (op.kind, op.props.note) == (RelKind.BLOCKS, "why")
+
+
+def test_relation_list_fast_path_matches_validated_response():
+    relations = AccountEntryRelationsDTO.model_validate({"outgoing": [{
+        "from_id": "a", "to_id": "b", "kind": RelKind.BLOCKS,
+        "props": {"note": "n", "createdAt": "2025-01-02T03:04:05Z", "weight": 2},
+    }], "incoming": []})
+    fast = mapper.to_relation_list(relations)
+    validated = RelationList.model_validate(relations.model_dump())
+    assert FastJSONResponse(fast).body == JSONResponse(jsonable_encoder(validated)).body
+    assert fast.outgoing[0].props.weight == 2
@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from devaccountbook_backend.api.responses import TreeJSONResponse
+from devaccountbook_backend.core.config import settings
+from devaccountbook_backend.dtos.account_entry_dto import AccountEntryNodeCreateDTO, AccountEntryCursorDTO, \
+    AccountEntryPageDTO, AccountEntryRelationDeleteDTO
+from devaccountbook_backend.models.account_entry_domain import AccountEntryNode
+from devaccountbook_backend.repositories.tree_builder import build_account_entry_tree, plan_account_entry_tree
+from devaccountbook_backend.schemas.account_entry_schemas import AccountEntryCreate, AccountEntryOut, RelKind, \
+    RelationBatchItem, RelationOp, TagMatch
+from devaccountbook_backend.services.async_account_entry_service import AsyncAccountEntryService
+from devaccountbook_backend.utils.cursor_util import encode_cursor
+
+NOW = datetime.now(timezone.utc)
+
+
+def _service():
+    repo = AsyncMock()
+    return AsyncAccountEntryService(repo), repo
+
+
+def test_list_and_get():
+    service, repo = _service()
+    node = AccountEntryNode.model_validate({"id": "1", "title": "t", "tags": [], "createdAt": NOW})
+    repo.get_entries.return_value = [node]
+    repo.get_entry.return_value = node
+
+    assert asyncio.run(service.list(limit=10, offset=0)) == [AccountEntryOut(id="1", title="t", tags=[])]
+    assert asyncio.run(service.get("1")).id == "1"
+    repo.get_entries.assert_awaited_once_with(limit=10, offset=0, tags=(), tag_match=TagMatch.ANY)
+
+
+def test_get_missing_returns_none():
+    service, repo = _service()
+    repo.get_entry.return_value = None
+    assert asyncio.run(service.get("x")) is None
+
+
+def test_list_after_decodes_and_encodes_cursor():
+    service, repo = _service()
+    node = AccountEntryNode.model_validate({"id": "2", "title": "t", "tags": [], "createdAt": NOW})
+    repo.get_entries_after.return_value = AccountEntryPageDTO(
+        items=[node], next_cursor=AccountEntryCursorDTO(created_at="c2", id="2"))
+
+    page = asyncio.run(service.list_after(limit=1, after=encode_cursor("c1", "1")))
+
+    assert repo.get_entries_after.await_args.kwargs["after"] == AccountEntryCursorDTO(created_at="c1", id="1")
+    assert page.next_cursor == encode_cursor("c2", "2")
+
+
+def test_create_and_unlink_pass_dtos():
+    service, repo = _service()
+    repo.create_entry.return_value = "new"
+    repo.delete_relation.return_value = 1
+
+    assert asyncio.run(service.create(AccountEntryCreate(title="t"))) == "new"
+    repo.create_entry.assert_awaited_once_with(AccountEntryNodeCreateDTO(title="t", desc=None, tags=[]))
+    assert asyncio.run(service.unlink("a", "b", RelKind.BLOCKS)) == 1
+    repo.delete_relation.assert_awaited_once_with(
+        AccountEntryRelationDeleteDTO(from_id="a", to_id="b", kind=RelKind.BLOCKS))
+
+
+def test_batch_links_keeps_order():
+    service, repo = _service()
+    repo.apply_relation_ops.return_value = [True, False]
+    items = [
+        RelationBatchItem(op=RelationOp.LINK, from_id="a", to_id="b", kind=RelKind.RELATES_TO),
+        RelationBatchItem(op=RelationOp.UNLINK, from_id="a", to_id="c", kind=RelKind.RELATES_TO),
+    ]
+    out = asyncio.run(service.batch_links(items))
+    assert [(r.to_id, r.ok) for r in out.results] == [("b", True), ("c", False)]
+
+
+def test_explore_stream_reads_nodes_in_chunks(monkeypatch):
+    monkeypatch.setattr(settings, "batch_chunk_size", 2)
+    service, repo = _service()
+    nodes = {i: {"id": i, "title": i.upper(), "desc": None, "tags": []} for i in "abcd"}
+    edges = [("a", "b"), ("b", "c"), ("a", "d")]
+    repo.get_entry_tree_plan.return_value = plan_account_entry_tree("a", set(nodes), edges)
+    repo.get_tree_nodes.side_effect = lambda ids: [nodes[i] for i in ids]
+
+    async def run():
+        plan = await service.explore_plan("a", max_depth=3)
+        return b"".join([chunk async for chunk in service.explore_json_chunks(plan)])
+
+    body = asyncio.run(run())
+
+    assert body == TreeJSONResponse(build_account_entry_tree("a", nodes, edges).tree).body
+    assert [c.args[0] for c in repo.get_tree_nodes.await_args_list] == [["a", "b"], ["c", "d"]]
+    repo.get_entry_tree_plan.assert_awaited_once_with("a", reverse=False, max_depth=3,
+                                                      max_nodes=settings.tree_max_nodes)
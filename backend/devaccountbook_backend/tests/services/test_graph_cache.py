@@ -0,0 +1,120 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from devaccountbook_backend.services.account_entry_service import AccountEntryService
+from devaccountbook_backend.services.graph_cache import GraphVersionCache
+from devaccountbook_backend.schemas.account_entry_schemas import AccountEntryCreate, AccountEntryPatch, RelationCreate, \
+    RelationBatchItem, RelKind, RelationOp
+
+
+def test_hit_after_miss():
+    cache = GraphVersionCache(max_size=4)
+    load = MagicMock(return_value="tree")
+
+    assert cache.get_or_load(("tree", "a"), load) == "tree"
+    assert cache.get_or_load(("tree", "a"), load) == "tree"
+    assert load.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction():
+    cache = GraphVersionCache(max_size=2)
+    cache.get_or_load(("a",), lambda: 1)
+    cache.get_or_load(("b",), lambda: 2)
+    cache.get_or_load(("a",), lambda: 1)  # a가 최근 사용
+    cache.get_or_load(("c",), lambda: 3)  # b 제거
+
+    assert cache.evictions == 1
+    assert cache.get_or_load(("a",), lambda: "reloaded") == 1
+    assert cache.get_or_load(("b",), lambda: "reloaded") == "reloaded"
+
+
+def test_bump_invalidates():
+    cache = GraphVersionCache(max_size=4)
+    cache.get_or_load(("a",), lambda: "old")
+    cache.bump()
+    assert cache.get_or_load(("a",), lambda: "new") == "new"
+    assert cache.version == 1
+
+
+def test_write_during_load_is_not_stored():
+    cache = GraphVersionCache(max_size=4)
+
+    def load():
+        cache.bump()  # 조회 도중 쓰기
+        return "stale"
+
+    assert cache.get_or_load(("a",), load) == "stale"
+    assert len(cache) == 0
+
+
+def test_disabled_cache_always_loads():
+    cache = GraphVersionCache(max_size=0)
+    load = MagicMock(return_value="x")
+    cache.get_or_load(("a",), load)
+    cache.get_or_load(("a",), load)
+    assert load.call_count == 2
+
+
+def test_async_load():
+    cache = GraphVersionCache(max_size=4)
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return "tree"
+
+    async def run():
+        return [await cache.get_or_load_async(("a",), load) for _ in range(2)]
+
+    assert asyncio.run(run()) == ["tree", "tree"]
+    assert len(calls) == 1
+
+
+def test_service_writes_invalidate_tree_reads():
+    repo = MagicMock()
+    repo.get_entry_tree.return_value = "tree"
+    service = AccountEntryService(repo, GraphVersionCache(max_size=4))
+
+    service.get_start_to_end_node("a")
+    service.get_start_to_end_node("a")
+    assert repo.get_entry_tree.call_count == 1
+
+    service.create(AccountEntryCreate(title="t"))
+    service.get_start_to_end_node("a")
+    assert repo.get_entry_tree.call_count == 2
+
+    # 방향이 다르면 다른 키
+    service.get_start_to_end_node_reverse("a")
+    assert repo.get_entry_tree_reverse.call_count == 1
+
+
+def test_service_noop_writes_keep_cache():
+    repo = MagicMock()
+    repo.get_entry_tree.return_value = "tree"
+    repo.update_entry.return_value = False
+    repo.delete_entry.return_value = False
+    repo.add_relation.return_value = False
+    repo.delete_relation.return_value = 0
+    repo.apply_relation_ops.return_value = [False]
+    repo.create_entries.return_value = []
+    cache = GraphVersionCache(max_size=4)
+    service = AccountEntryService(repo, cache)
+
+    service.get_start_to_end_node("a")
+    # 없는 id/관계 대상 쓰기는 아무것도 바꾸지 않으므로 version 유지
+    service.patch("missing", AccountEntryPatch(title="t"))
+    service.delete("missing")
+    service.link("missing", RelationCreate(to_id="b", kind=RelKind.RELATES_TO))
+    service.unlink("a", "missing", RelKind.RELATES_TO)
+    service.batch_links([RelationBatchItem(op=RelationOp.LINK, from_id="a", to_id="missing",
+                                         kind=RelKind.RELATES_TO)])
+    service.create_many([])
+    service.get_start_to_end_node("a")
+
+    assert cache.version == 0
+    assert repo.get_entry_tree.call_count == 1
+
+    repo.delete_relation.return_value = 1
+    service.unlink("a", "b", RelKind.RELATES_TO)
+    assert cache.version == 1
@@ -0,0 +1,17 @@
+import base64
+import json
+
+
+def encode_cursor(created_at: str, entry_id: str) -> str:
+    raw = json.dumps({"c": created_at, "i": entry_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """잘못된 커서면 ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return str(data["c"]), str(data["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
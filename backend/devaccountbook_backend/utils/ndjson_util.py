@@ -0,0 +1,70 @@
+import json
+from datetime import date, time, timedelta
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# 업로드에서 개행 없이 이만큼 넘어가면 거부 (한 줄을 무한히 버퍼링하지 않도록)
+MAX_LINE_BYTES = 1024 * 1024
+# 행마다 send하면 1M 행에서 전송 호출만 수십 초 → 이 크기만큼 모아서 한 번에 보냄
+CHUNK_BYTES = 64 * 1024
+
+
+class LineTooLongError(ValueError):
+    pass
+
+
+def _default(v):
+    # normalize_neo 결과(datetime/date/time/timedelta)까지 처리
+    if isinstance(v, (date, time)):
+        return v.isoformat()
+    if isinstance(v, timedelta):
+        return v.total_seconds()
+    raise TypeError(f"not JSON serializable: {type(v)!r}")
+
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default).encode
+
+
+def ndjson_line(row: dict) -> bytes:
+    return (_encode(row) + "\n").encode()
+
+
+def ndjson_chunks(rows: Iterable[dict], chunk_bytes: int = CHUNK_BYTES) -> Iterator[bytes]:
+    """행을 NDJSON으로 인코딩해 chunk_bytes 단위로 묶어서 반환 (메모리는 chunk 하나 크기)."""
+    buf, size = [], 0
+    for row in rows:
+        line = ndjson_line(row)
+        buf.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield b"".join(buf)
+            buf, size = [], 0
+    if buf:
+        yield b"".join(buf)
+
+
+async def ndjson_chunks_async(rows: AsyncIterable[dict], chunk_bytes: int = CHUNK_BYTES) -> AsyncIterator[bytes]:
+    buf, size = [], 0
+    async for row in rows:
+        line = ndjson_line(row)
+        buf.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield b"".join(buf)
+            buf, size = [], 0
+    if buf:
+        yield b"".join(buf)
+
+
+async def aiter_lines(chunks: AsyncIterable[bytes], max_line_bytes: int = MAX_LINE_BYTES) -> AsyncIterator[bytes]:
+    """업로드 chunk를 줄 단위로 (끝의 개행 없는 줄 포함). 너무 긴 줄은 LineTooLongError."""
+    rest = b""
+    async for chunk in chunks:
+        lines = (rest + chunk).split(b"\n")
+        rest = lines.pop()
+        if len(rest) > max_line_bytes:
+            raise LineTooLongError(f"line longer than {max_line_bytes} bytes")
+        for line in lines:
+            yield line
+    if rest:
+        yield rest
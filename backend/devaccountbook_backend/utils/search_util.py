@@ -0,0 +1,35 @@
+import re
+from typing import Iterable, List, Optional
+
+_WORD = re.compile(r"\w+")
+# 검색어 단어 수 상한 (쿼리 크기 제한)
+MAX_TERMS = 10
+
+
+def search_terms(q: str) -> List[str]:
+    """
+    검색어 → 소문자 단어 목록 (입력 순서, 중복 제거).
+    특수문자는 버리므로 Lucene / FTS5 쿼리 문법과 충돌하지 않음.
+    """
+    terms = []
+    for word in _WORD.findall(q.lower()):
+        if word not in terms:
+            terms.append(word)
+    return terms[:MAX_TERMS]
+
+
+def highlight_spans(text: Optional[str], terms: Iterable[str]) -> List[tuple[int, int]]:
+    """단어 시작에서 term으로 시작하는 부분의 [start, end) 목록 (대소문자 무시, 겹치면 합침)."""
+    if not text:
+        return []
+    spans = []
+    for term in terms:
+        for m in re.finditer(rf"(?<!\w){re.escape(term)}", text, re.IGNORECASE):
+            spans.append((m.start(), m.end()))
+    merged: List[tuple[int, int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
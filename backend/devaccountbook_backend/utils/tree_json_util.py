@@ -0,0 +1,82 @@
+from typing import AsyncIterator, Iterable, Iterator, Mapping, Optional
+
+from pydantic_core import to_json
+
+from devaccountbook_backend.utils.ndjson_util import CHUNK_BYTES
+
+# AccountEntryTreeNodeDTO 직렬화와 같은 필드 순서: id, title, desc, tags, children, cycle, revisit
+_TAILS = {
+    mark: b'],"cycle":' + to_json(mark == "cycle") + b',"revisit":' + to_json(mark == "revisit") + b"}"
+    for mark in (None, "cycle", "revisit")
+}
+
+
+def tree_node_head(node_id: str, props: Mapping) -> bytes:
+    """노드 JSON의 앞부분 ('"children":['까지)."""
+    head = to_json({"id": node_id, "title": props.get("title"), "desc": props.get("desc"),
+                    "tags": list(props.get("tags") or ())})
+    return head[:-1] + b',"children":['
+
+
+def tree_node_tail(mark: Optional[str]) -> bytes:
+    """자식 목록을 닫고 cycle/revisit 표시를 붙여 노드를 닫는 부분."""
+    return _TAILS[mark]
+
+
+class TreeJSONWriter:
+    """
+    walk_account_entry_tree 항목 하나씩 → 트리 JSON 조각을 chunk_bytes 단위로 모음 (I/O 없음, 동기/비동기 공용).
+    write/finish가 chunk가 찼을 때만 bytes를 돌려줌. 메모리는 chunk 하나 + 열린 경로 깊이.
+    """
+
+    def __init__(self, chunk_bytes: int = CHUNK_BYTES) -> None:
+        self.chunk_bytes = chunk_bytes
+        self._buf: list[bytes] = []
+        self._size = 0
+        self._marks: list[Optional[str]] = []
+        self._after_close = False
+
+    # item이 노드를 열면 props는 그 노드 속성 (그 사이 삭제된 노드(None)는 id만), 닫으면(None) 무시
+    def write(self, item: tuple[str, Optional[str]] | None, props: Optional[Mapping] = None) -> Optional[bytes]:
+        if item is None:
+            part = _TAILS[self._marks.pop()]
+            self._after_close = True
+        else:
+            node_id, mark = item
+            part = tree_node_head(node_id, props or {})
+            if self._after_close:
+                part = b"," + part
+            self._marks.append(mark)
+            self._after_close = False
+        self._buf.append(part)
+        self._size += len(part)
+        return self.finish() if self._size >= self.chunk_bytes else None
+
+    def finish(self) -> Optional[bytes]:
+        if not self._buf:
+            return None
+        chunk = b"".join(self._buf)
+        self._buf, self._size = [], 0
+        return chunk
+
+
+# nodes: walk에서 노드를 열 때마다 하나씩 읽는 노드 속성 (두 함수는 읽는 방식만 다름)
+def tree_json_chunks(walk: Iterable[tuple[str, Optional[str]] | None], nodes: Iterator[Optional[Mapping]],
+                     chunk_bytes: int = CHUNK_BYTES) -> Iterator[bytes]:
+    writer = TreeJSONWriter(chunk_bytes)
+    for item in walk:
+        if chunk := writer.write(item, None if item is None else next(nodes)):
+            yield chunk
+    if chunk := writer.finish():
+        yield chunk
+
+
+async def tree_json_chunks_async(walk: Iterable[tuple[str, Optional[str]] | None],
+                                 nodes: AsyncIterator[Optional[Mapping]],
+                                 chunk_bytes: int = CHUNK_BYTES) -> AsyncIterator[bytes]:
+    writer = TreeJSONWriter(chunk_bytes)
+    for item in walk:
+        if chunk := writer.write(item, None if item is None else await anext(nodes)):
+            yield chunk
+    if chunk := writer.finish():
+        yield chunk
@@ -1,5 +1,5 @@
 import {http} from "../lib/fetch.ts";
-import type {AccountEntry, RelationList, RelationResponseDTO} from "../types/account-entry.ts";
+import type {AccountEntry, RelationList, RelationResponseDTO, SheetRow} from "../types/account-entry.ts";
 
 
 export const getAccountEntries = () => {
@@ -10,6 +10,14 @@ export const getAccountEntries = () => {
     return http<AccountEntry[]>(`http://127.0.0.1:8000/v1/account-entries?${params}`);
 }
 
+export const getAccountEntrySheet = () => {
+    const params = new URLSearchParams({
+        limit: "50",
+        offset: "0",
+    });
+    return http<SheetRow[]>(`http://127.0.0.1:8000/v1/account-entries/sheet?${params}`);
+}
+
 export const getAccountEntry = (id: string) => {
     return http<AccountEntry>(`http://127.0.0.1:8000/v1/account-entries/${id}`);
 }
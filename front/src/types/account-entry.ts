@@ -102,4 +102,12 @@ export type AccountEntryTree = {
     desc: string | null;
     tags: string[];
     children: AccountEntryTree[];
+};
+
+// 시트 행 (GET /v1/account-entries/sheet)
+export type SheetRow = {
+    rowKind: "node" | "linked";
+    node: AccountEntry;
+    kind: RelKind | null;
+    connected: AccountEntry | null;
 };
\ No newline at end of file